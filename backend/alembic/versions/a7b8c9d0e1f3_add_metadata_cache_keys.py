@@ -0,0 +1,62 @@
+"""add cache key columns to metadata_cache
+
+Revision ID: a7b8c9d0e1f3
+Revises: f6a7b8c9d0e2
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b8c9d0e1f3'
+down_revision: Union[str, None] = 'f6a7b8c9d0e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    columns = [col['name'] for col in inspector.get_columns('metadata_cache')]
+    indexes = {idx['name']: idx for idx in inspector.get_indexes('metadata_cache')}
+
+    # 캐시 키가 없는 기존 행은 조회될 수 없으므로 정리
+    if 'cache_key' not in columns:
+        op.execute("DELETE FROM metadata_cache")
+
+    for name, column in (
+        ('cache_key', sa.Column('cache_key', sa.String(64), nullable=True)),
+        ('version', sa.Column('version', sa.String(), nullable=True)),
+        ('provider', sa.Column('provider', sa.String(50), nullable=True)),
+        ('model', sa.Column('model', sa.String(100), nullable=True)),
+        ('prompt_hash', sa.Column('prompt_hash', sa.String(64), nullable=True)),
+        ('last_hit_at', sa.Column('last_hit_at', sa.DateTime(), nullable=True)),
+    ):
+        if name not in columns:
+            op.add_column('metadata_cache', column)
+
+    if 'ix_metadata_cache_cache_key' not in indexes:
+        op.create_index(op.f('ix_metadata_cache_cache_key'), 'metadata_cache', ['cache_key'], unique=True)
+
+    # 같은 소프트웨어가 제공자/모델/프롬프트별로 여러 행을 가질 수 있도록 unique 해제
+    software_index = indexes.get('ix_metadata_cache_software_name')
+    if software_index is not None and software_index.get('unique'):
+        op.drop_index(op.f('ix_metadata_cache_software_name'), table_name='metadata_cache')
+        op.create_index(op.f('ix_metadata_cache_software_name'), 'metadata_cache', ['software_name'], unique=False)
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM metadata_cache")
+    op.drop_index(op.f('ix_metadata_cache_software_name'), table_name='metadata_cache')
+    op.create_index(op.f('ix_metadata_cache_software_name'), 'metadata_cache', ['software_name'], unique=True)
+    op.drop_index(op.f('ix_metadata_cache_cache_key'), table_name='metadata_cache')
+    op.drop_column('metadata_cache', 'last_hit_at')
+    op.drop_column('metadata_cache', 'prompt_hash')
+    op.drop_column('metadata_cache', 'model')
+    op.drop_column('metadata_cache', 'provider')
+    op.drop_column('metadata_cache', 'version')
+    op.drop_column('metadata_cache', 'cache_key')
@@ -0,0 +1,48 @@
+"""add scan_directory_states table for incremental scans
+
+Revision ID: c3d4e5f6a7b9
+Revises: b2c3d4e5f6a8
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b9'
+down_revision: Union[str, None] = 'b2c3d4e5f6a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    # main.py의 Base.metadata.create_all()로 이미 생성된 배포 환경 대비
+    if 'scan_directory_states' in inspector.get_table_names():
+        return
+
+    op.create_table(
+        'scan_directory_states',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('dir_path', sa.String(), nullable=False),
+        sa.Column('mtime', sa.Float(), nullable=False),
+        sa.Column('entry_count', sa.Integer(), nullable=False),
+        sa.Column('child_hash', sa.String(64), nullable=False),
+        sa.Column('subdirs', sa.JSON(), nullable=False),
+        sa.Column('rules_hash', sa.String(64), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_scan_directory_states_id'), 'scan_directory_states', ['id'], unique=False)
+    op.create_index(op.f('ix_scan_directory_states_dir_path'), 'scan_directory_states', ['dir_path'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_scan_directory_states_dir_path'), table_name='scan_directory_states')
+    op.drop_index(op.f('ix_scan_directory_states_id'), table_name='scan_directory_states')
+    op.drop_table('scan_directory_states')
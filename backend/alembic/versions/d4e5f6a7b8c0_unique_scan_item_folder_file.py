@@ -0,0 +1,53 @@
+"""add unique index on filename_violations (folder_path, file_name)
+
+Revision ID: d4e5f6a7b8c0
+Revises: c3d4e5f6a7b9
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c0'
+down_revision: Union[str, None] = 'c3d4e5f6a7b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    existing = {idx['name'] for idx in inspector.get_indexes('filename_violations')}
+    if 'uq_filename_violations_folder_file' in existing:
+        return
+
+    # 기존 중복 행 정리: 매칭된(product_id 있는) 행을 우선 남기고, 그 외에는 가장 오래된 행만 유지
+    op.execute(
+        """
+        DELETE FROM filename_violations a
+        USING filename_violations b
+        WHERE a.folder_path = b.folder_path
+          AND a.file_name = b.file_name
+          AND a.id <> b.id
+          AND (
+            (a.product_id IS NULL AND b.product_id IS NOT NULL)
+            OR ((a.product_id IS NULL) = (b.product_id IS NULL) AND a.id > b.id)
+          )
+        """
+    )
+
+    op.create_index(
+        'uq_filename_violations_folder_file',
+        'filename_violations',
+        ['folder_path', 'file_name'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_filename_violations_folder_file', table_name='filename_violations')
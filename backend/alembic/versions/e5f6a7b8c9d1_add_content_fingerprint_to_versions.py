@@ -0,0 +1,32 @@
+"""add content_fingerprint to versions
+
+Revision ID: e5f6a7b8c9d1
+Revises: d4e5f6a7b8c0
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d1'
+down_revision: Union[str, None] = 'd4e5f6a7b8c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    columns = [col['name'] for col in inspector.get_columns('versions')]
+
+    # 기존 행은 NULL로 둔다 (스캔 중 이름 변경이 감지되면 그때 채워짐)
+    if 'content_fingerprint' not in columns:
+        op.add_column('versions', sa.Column('content_fingerprint', sa.String(40), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('versions', 'content_fingerprint')
@@ -0,0 +1,64 @@
+"""add scan_checkpoints tables for resumable scans
+
+Revision ID: f6a7b8c9d0e2
+Revises: e5f6a7b8c9d1
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e2'
+down_revision: Union[str, None] = 'e5f6a7b8c9d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    tables = inspector.get_table_names()
+
+    # main.py의 Base.metadata.create_all()로 이미 생성된 배포 환경 대비
+    if 'scan_checkpoints' not in tables:
+        op.create_table(
+            'scan_checkpoints',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('root_path', sa.String(), nullable=False),
+            sa.Column('full_rescan', sa.Boolean(), nullable=False),
+            sa.Column('rules_hash', sa.String(64), nullable=True),
+            sa.Column('pending_dirs', sa.JSON(), nullable=False),
+            sa.Column('results', sa.JSON(), nullable=False),
+            sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_scan_checkpoints_id'), 'scan_checkpoints', ['id'], unique=False)
+        op.create_index(op.f('ix_scan_checkpoints_root_path'), 'scan_checkpoints', ['root_path'], unique=True)
+
+    if 'scan_checkpoint_dirs' not in tables:
+        op.create_table(
+            'scan_checkpoint_dirs',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('checkpoint_id', sa.Integer(), nullable=False),
+            sa.Column('dir_path', sa.String(), nullable=False),
+            sa.Column('skipped', sa.Boolean(), nullable=False),
+            sa.Column('state', sa.JSON(), nullable=True),
+            sa.ForeignKeyConstraint(['checkpoint_id'], ['scan_checkpoints.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_scan_checkpoint_dirs_id'), 'scan_checkpoint_dirs', ['id'], unique=False)
+        op.create_index(op.f('ix_scan_checkpoint_dirs_checkpoint_id'), 'scan_checkpoint_dirs', ['checkpoint_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_scan_checkpoint_dirs_checkpoint_id'), table_name='scan_checkpoint_dirs')
+    op.drop_index(op.f('ix_scan_checkpoint_dirs_id'), table_name='scan_checkpoint_dirs')
+    op.drop_table('scan_checkpoint_dirs')
+    op.drop_index(op.f('ix_scan_checkpoints_root_path'), table_name='scan_checkpoints')
+    op.drop_index(op.f('ix_scan_checkpoints_id'), table_name='scan_checkpoints')
+    op.drop_table('scan_checkpoints')
@@ -3,7 +3,7 @@
 """
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from app.dependencies import get_current_admin_user
 from app.core.redis_cache import redis_cache
@@ -18,6 +18,8 @@ class CacheStatsResponse(BaseModel):
     total_keys: int
     memory_used: Optional[str] = None
     uptime_seconds: Optional[int] = None
+    generations: Optional[Dict[str, Optional[int]]] = None  # 네임스페이스별 캐시 세대 번호
+    tiers: Optional[Dict[str, Any]] = None  # L1(프로세스 내부)/L2(Redis) 적중 통계 (이 워커 기준)
 
 
 class ClearCacheRequest(BaseModel):
@@ -41,20 +43,25 @@ async def get_cache_stats(
             "redis_url": "N/A",
             "total_keys": 0,
             "memory_used": None,
-            "uptime_seconds": None
+            "uptime_seconds": None,
+            "tiers": redis_cache.tier_stats()
         }
 
     try:
         # Redis 정보 조회
-        info = redis_cache.client.info()
-        total_keys = redis_cache.client.dbsize()
+        pipe = redis_cache.async_client().pipeline(transaction=False)
+        pipe.info()
+        pipe.dbsize()
+        info, total_keys = await pipe.execute()
 
         return {
             "enabled": True,
             "redis_url": str(redis_cache.client.connection_pool.connection_kwargs.get('host', 'N/A')),
             "total_keys": total_keys,
             "memory_used": info.get('used_memory_human', 'N/A'),
-            "uptime_seconds": info.get('uptime_in_seconds', 0)
+            "uptime_seconds": info.get('uptime_in_seconds', 0),
+            "generations": await redis_cache.generations(),
+            "tiers": redis_cache.tier_stats()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"캐쉬 통계 조회 실패: {str(e)}")
@@ -24,7 +24,7 @@ from app.models.user import User
 from app.dependencies import get_current_admin_user
 from app.core.ai_metadata import AIMetadataGeneratorV2 as AIMetadataGenerator
 from app.core.parser import FilenameParser
-from app.core.classifier import classify_file
+from app.core.classifier import classify_file, reclassify_scan_items
 from app.api.config import load_config
 from app.core.redis_cache import invalidate_cache
 from app.core.auto_matcher import match_violations_to_products, find_similar_product
@@ -178,6 +178,24 @@ async def classify_scan_item(
     return {"success": True, "id": scan_item_id, "classification": request.classification}
 
 
+@router.post("/api/scan-items/reclassify")
+@router.post("/api/filename-violations/reclassify")
+def reclassify_scan_items_endpoint(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """자동 분류 상태인 스캔 항목 전체를 현재 키워드 목록으로 다시 분류한다.
+
+    app.core.keywords의 분류 키워드를 바꾼 뒤 호출한다. 수동으로 지정한 분류는 유지된다.
+    (동기 함수로 선언해 일괄 처리가 이벤트 루프를 막지 않도록 스레드풀에서 실행)
+    """
+    results = reclassify_scan_items(db)
+    log_activity(db, action="scan_items_reclassify", resource_type="scan_item",
+                 user_id=current_user.id, username=current_user.username,
+                 details={"total": results["total"], "changed": results["changed"]})
+    return results
+
+
 # ─────────────────────────────────────────────────────────────────
 # 중복 제품 검사 (AI 검색 전 사전 검사)
 # ─────────────────────────────────────────────────────────────────
@@ -307,6 +325,8 @@ async def _register_as_product(item: FilenameViolation, db: Session):
         api_key = metadata_config.get('geminiApiKey', '')
     elif ai_provider == 'claude':
         api_key = metadata_config.get('claudeApiKey', '')
+    elif ai_provider == 'mock':
+        api_key = 'mock'
     else:
         api_key = metadata_config.get('openaiApiKey', '') or metadata_config.get('apiKey', '')
 
@@ -893,6 +913,8 @@ async def generate_metadata_from_source(
         api_key = metadata_config.get('geminiApiKey', '')
     elif ai_provider == 'claude':
         api_key = metadata_config.get('claudeApiKey', '')
+    elif ai_provider == 'mock':
+        api_key = 'mock'
     else:
         api_key = metadata_config.get('openaiApiKey', '') or metadata_config.get('apiKey', '')
 
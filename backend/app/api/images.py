@@ -24,7 +24,7 @@ from app.schemas.image import (
 )
 from app.core.google_image_search import GoogleImageSearcher
 from app.core.icon_cache import IconCache
-from app.core.redis_cache import invalidate_cache
+from app.core.redis_cache import ainvalidate_product_cache
 from app.config import settings
 import json
 
@@ -490,7 +490,7 @@ async def upload_screenshot_file(
         product.screenshots = current_screenshots
         db.commit()
         # 캐시 무효화
-        invalidate_cache(["product_detail:*", "products_list:*", "products_recent:*"])
+        await ainvalidate_product_cache([product_id])
 
         return ImageUploadResponse(success=True, url=local_path)
 
@@ -568,7 +568,7 @@ async def download_screenshot_by_slot(
         product.screenshots = current_screenshots
         db.commit()
         # 캐시 무효화
-        invalidate_cache(["product_detail:*", "products_list:*", "products_recent:*"])
+        await ainvalidate_product_cache([product_id])
 
         return ImageUploadResponse(success=True, url=local_path)
 
@@ -622,7 +622,7 @@ async def download_logo_from_url(
                 db.commit()
                 logger.debug(f"Download Logo] DB updated for product {product_id}")
                 # 캐시 무효화 (product_detail 캐시가 stale 데이터 반환하는 문제 방지)
-                invalidate_cache(["product_detail:*", "products_list:*", "products_recent:*"])
+                await ainvalidate_product_cache([product_id])
             else:
                 logger.debug(f"Download Logo] Product {product_id} not found in DB (test mode), skipping DB update")
 
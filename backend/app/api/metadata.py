@@ -7,10 +7,15 @@ from typing import Optional, Dict, Any, List
 from sqlalchemy.orm import Session
 from app.dependencies import get_current_user, get_current_admin_user, get_db
 from app.core.ai_metadata import AIMetadataGeneratorV2 as AIMetadataGenerator
+from app.core.ai_transport import ai_transport
 from app.core.confidence import calculate_confidence_score, get_confidence_level, should_auto_register
 from app.core.parser import FilenameParser
 from app.api.config import load_config
 from app.models.product import Product
+from app.models.metadata_cache import MetadataCache
+from app.core.ai_metadata_cache import ai_metadata_cache
+from app.core.similarity_index import normalize_title
+from app.core.activity_logger import log_activity
 import logging
 logger = logging.getLogger(__name__)
 
@@ -70,6 +75,8 @@ async def test_metadata_generation(
             api_key = (metadata_config.get('openaiApiKey', '') or metadata_config.get('apiKey', '')).strip()
         elif ai_provider == 'claude':
             api_key = metadata_config.get('claudeApiKey', '').strip()
+        elif ai_provider == 'mock':
+            api_key = 'mock'
         else:
             api_key = ''
 
@@ -262,7 +269,6 @@ def build_extended_prompt(software_name: str, fields: Dict[str, bool]) -> str:
 
 async def query_ai_extended(generator: AIMetadataGenerator, prompt: str) -> Dict[str, Any]:
     """AI에게 확장 프롬프트 질의 (provider에 따라 다른 API 사용)"""
-    import httpx
     import json
 
     try:
@@ -270,7 +276,7 @@ async def query_ai_extended(generator: AIMetadataGenerator, prompt: str) -> Dict
 
         # OpenAI
         if generator.provider == 'openai':
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with ai_transport.session(timeout=30.0) as client:
                 response = await client.post(
                     "https://api.openai.com/v1/chat/completions",
                     headers={
@@ -307,7 +313,7 @@ async def query_ai_extended(generator: AIMetadataGenerator, prompt: str) -> Dict
         elif generator.provider == 'gemini':
             api_url = f"https://generativelanguage.googleapis.com/v1beta/models/{generator.model}:generateContent?key={generator.api_key}"
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with ai_transport.session(timeout=30.0) as client:
                 response = await client.post(
                     api_url,
                     headers={"Content-Type": "application/json"},
@@ -441,3 +447,120 @@ async def register_metadata(
             success=False,
             error=str(e)
         )
+
+
+# ─────────────────────────────────────────────────────────────────
+# AI 메타데이터 캐시 관리 (관리자 전용)
+# ─────────────────────────────────────────────────────────────────
+
+@router.get("/cache")
+async def list_metadata_cache(
+    search: Optional[str] = None,
+    provider: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 50,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin_user)
+):
+    """
+    AI 메타데이터 캐시 통계와 항목 목록 (관리자 전용)
+
+    Args:
+        search: 소프트웨어 이름 검색어
+        provider: AI 제공자 필터 (openai, gemini, claude)
+        skip, limit: 페이지네이션
+
+    Returns:
+        캐시 통계(summary), AI HTTP 연결 풀/지연 시간 통계(transport), 최근 사용 순 항목 목록
+    """
+    return {
+        "summary": ai_metadata_cache.summary(db),
+        "transport": ai_transport.stats(),
+        **ai_metadata_cache.list_entries(db, search=search, provider=provider, skip=skip, limit=min(limit, 500)),
+    }
+
+
+@router.get("/cache/{entry_id}")
+async def get_metadata_cache_entry(
+    entry_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin_user)
+):
+    """캐시 항목 상세 (저장된 메타데이터 포함, 관리자 전용)"""
+    entry = db.query(MetadataCache).filter(MetadataCache.id == entry_id).first()
+    if not entry:
+        raise HTTPException(status_code=404, detail="캐시 항목을 찾을 수 없습니다.")
+
+    return {
+        "id": entry.id,
+        "software_name": entry.software_name,
+        "version": entry.version,
+        "provider": entry.provider,
+        "model": entry.model,
+        "prompt_hash": entry.prompt_hash,
+        "source": entry.source,
+        "confidence_score": entry.confidence_score,
+        "hit_count": entry.hit_count,
+        "created_at": entry.created_at,
+        "updated_at": entry.updated_at,
+        "last_hit_at": entry.last_hit_at,
+        "metadata": entry.metadata_json,
+    }
+
+
+@router.delete("/cache/{entry_id}")
+async def delete_metadata_cache_entry(
+    entry_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin_user)
+):
+    """캐시 항목 하나 삭제 (다음 요청 때 AI로 다시 생성, 관리자 전용)"""
+    entry = db.query(MetadataCache).filter(MetadataCache.id == entry_id).first()
+    if not entry:
+        raise HTTPException(status_code=404, detail="캐시 항목을 찾을 수 없습니다.")
+
+    software_name = entry.software_name
+    db.delete(entry)
+    db.commit()
+
+    log_activity(db, action="metadata_cache_purge", resource_type="metadata_cache",
+                 resource_id=entry_id, resource_name=software_name,
+                 user_id=current_user.id, username=current_user.username)
+    return {"success": True, "deleted_count": 1}
+
+
+@router.delete("/cache")
+async def purge_metadata_cache(
+    expired_only: bool = False,
+    provider: Optional[str] = None,
+    software_name: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin_user)
+):
+    """
+    AI 메타데이터 캐시 삭제 (관리자 전용)
+
+    Args:
+        expired_only: True면 보관 기간(AI_METADATA_CACHE_TTL_DAYS)이 지난 항목만
+        provider: 해당 AI 제공자의 항목만
+        software_name: 해당 소프트웨어의 항목만 (캐시 키와 같은 방식으로 정규화해서 비교)
+
+    Returns:
+        삭제된 항목 수 (조건이 없으면 전체 삭제)
+    """
+    deleted_count = ai_metadata_cache.purge(
+        db,
+        expired_only=expired_only,
+        provider=provider,
+        software_name=normalize_title(software_name) if software_name else None,
+    )
+
+    log_activity(db, action="metadata_cache_purge", resource_type="metadata_cache",
+                 user_id=current_user.id, username=current_user.username,
+                 details={"expired_only": expired_only, "provider": provider,
+                          "software_name": software_name, "deleted_count": deleted_count})
+    return {
+        "success": True,
+        "message": f"{deleted_count}개의 캐시 항목이 삭제되었습니다.",
+        "deleted_count": deleted_count,
+    }
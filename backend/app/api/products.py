@@ -17,12 +17,17 @@ from app.dependencies import get_current_user, get_current_admin_user
 from app.core.ai_metadata import AIMetadataGeneratorV2 as AIMetadataGenerator
 from app.core.parser import FilenameParser
 from app.api.config import load_config
-from app.core.redis_cache import cache_response, invalidate_cache
+from app.core.redis_cache import cache_response, ainvalidate_cache, ainvalidate_product_cache
 from app.core.activity_logger import log_activity
+from app.core.file_reconciler import reconcile_versions
 from app.config import settings
 
 router = APIRouter()
 
+# 목록 검색/필터/정렬/카테고리 분류와 통계에 쓰이는 제품 필드
+# (바뀌면 제품이 들어가야 할 목록 페이지가 달라지므로 제품 단위 무효화로는 부족함)
+_LIST_FIELDS = ("title", "subtitle", "vendor", "category")
+
 
 def _validate_icon_url(product):
     """icon_url이 로컬 파일을 가리키는데 실제 파일이 없으면 None으로 설정"""
@@ -34,7 +39,7 @@ def _validate_icon_url(product):
 
 
 @router.get("/", response_model=ProductListResponse)
-@cache_response(prefix="products_list", ttl=300)
+@cache_response(prefix="products_list", ttl=300, hard_ttl=900)
 async def get_products(
     skip: int = 0,
     limit: int = 20,
@@ -130,7 +135,7 @@ async def get_recent_products(
 
 
 @router.get("/by-category", response_model=dict)
-@cache_response(prefix="products_by_category", ttl=300)
+@cache_response(prefix="products_by_category", ttl=300, hard_ttl=900)
 async def get_products_by_category(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
@@ -244,7 +249,7 @@ async def get_adjacent_products(
 
 
 @router.get("/stats/overview")
-@cache_response(prefix="stats_overview", ttl=60)
+@cache_response(prefix="stats_overview", ttl=60, hard_ttl=300)
 async def get_stats(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
@@ -282,7 +287,7 @@ async def get_stats(
 
 
 @router.get("/stats/categories")
-@cache_response(prefix="stats_categories", ttl=300)
+@cache_response(prefix="stats_categories", ttl=300, hard_ttl=900)
 async def get_category_stats(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
@@ -300,7 +305,7 @@ async def get_category_stats(
 
 
 @router.get("/stats/vendors")
-@cache_response(prefix="stats_vendors", ttl=300)
+@cache_response(prefix="stats_vendors", ttl=300, hard_ttl=900)
 async def get_vendor_stats(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
@@ -375,6 +380,12 @@ async def update_product(
             for link in update_dict["patch_links"]
         ]
 
+    # 목록 필터/정렬/분류에 쓰이는 필드가 실제로 바뀌는지 (캐시 무효화 범위 결정)
+    list_fields_changed = any(
+        getattr(product, field) != update_dict[field]
+        for field in _LIST_FIELDS if field in update_dict
+    )
+
     # 업데이트 적용
     for field, value in update_dict.items():
         setattr(product, field, value)
@@ -385,17 +396,20 @@ async def update_product(
     log_activity(db, action="product_update", resource_type="product", resource_id=product.id,
                  resource_name=product.title, user_id=current_user.id, username=current_user.username)
 
-    # 캐시 무효화
-    invalidate_cache([
-        "products_list:*",
-        "products_recent:*",
-        "products_by_category:*",
-        "product_detail:*",
-        "search_suggestions:*",
-        "stats_overview:*",
-        "stats_categories:*",
+    # 캐시 무효화 (제품이 들어갈 목록/검색 결과가 바뀌면 전체, 아니면 이 제품이 포함된 캐시만)
+    if list_fields_changed:
+        await ainvalidate_cache([
+            "products_list:*",
+            "products_recent:*",
+            "products_by_category:*",
+            "product_detail:*",
+            "search_suggestions:*",
+            "stats_overview:*",
+            "stats_categories:*",
             "stats_vendors:*"
-    ])
+        ])
+    else:
+        await ainvalidate_product_cache([product.id])
 
     return product
 
@@ -434,12 +448,8 @@ async def update_version(
     db.commit()
     db.refresh(version)
 
-    # 캐시 무효화 (제품 상세 정보 변경)
-    invalidate_cache([
-        "product_detail:*",
-        "products_list:*",
-        "products_recent:*"
-    ])
+    # 캐시 무효화 (이 제품이 포함된 상세/목록 캐시만)
+    await ainvalidate_product_cache([product_id])
 
     return {
         "message": "Version updated successfully",
@@ -493,6 +503,8 @@ async def regenerate_product_metadata(
         api_key = metadata_config.get('geminiApiKey', '')
     elif ai_provider == 'claude':
         api_key = metadata_config.get('claudeApiKey', '')
+    elif ai_provider == 'mock':
+        api_key = 'mock'
     else:
         api_key = metadata_config.get('openaiApiKey', '') or metadata_config.get('apiKey', '')
 
@@ -519,7 +531,8 @@ async def regenerate_product_metadata(
             model=ai_model
         )
 
-        metadata = await generator.generate_detailed_metadata(folder_name)
+        # 재생성 요청이므로 캐시를 건너뛰고 새로 생성 (결과는 캐시에 갱신)
+        metadata = await generator.generate_detailed_metadata(folder_name, use_cache=False)
 
         # Product 업데이트 (generate_detailed_metadata 반환 필드 매핑)
         if metadata:
@@ -542,7 +555,7 @@ async def regenerate_product_metadata(
         db.refresh(product)
 
         # 캐시 무효화
-        invalidate_cache([
+        await ainvalidate_cache([
             "products_list:*",
             "products_recent:*",
             "products_by_category:*",
@@ -610,7 +623,7 @@ async def merge_product_versions(
     db.commit()
     db.refresh(target)
 
-    invalidate_cache([
+    await ainvalidate_cache([
         "products_list:*",
         "products_recent:*",
         "products_by_category:*",
@@ -687,7 +700,7 @@ async def unregister_version(
 
         db.commit()
 
-        invalidate_cache([
+        await ainvalidate_cache([
             "products_list:*",
             "products_recent:*",
             "products_by_category:*",
@@ -723,49 +736,19 @@ async def cleanup_deleted_files(
     실제로 존재하지 않는 파일의 Version과 Product를 삭제합니다.
     """
     try:
-        # 모든 Version 조회
-        versions = db.query(Version).all()
-
-        deleted_version_ids = []
-        product_ids_to_check = set()
-
-        # 파일이 존재하지 않는 Version 찾기
-        for version in versions:
-            if not os.path.exists(version.file_path):
-                deleted_version_ids.append(version.id)
-                product_ids_to_check.add(version.product_id)
-
-        # Version 삭제
-        if deleted_version_ids:
-            db.query(Version).filter(Version.id.in_(deleted_version_ids)).delete(synchronize_session=False)
-
-        # Version이 없는 Product 삭제
-        deleted_product_ids = []
-        for product_id in product_ids_to_check:
-            version_count = db.query(Version).filter(Version.product_id == product_id).count()
-            if version_count == 0:
-                deleted_product_ids.append(product_id)
-
-        if deleted_product_ids:
-            # FilenameViolation 리셋 (CASCADE SET NULL 전에 먼저 실행 - 재스캔 가능하도록)
-            db.query(FilenameViolation).filter(
-                FilenameViolation.product_id.in_(deleted_product_ids)
-            ).update({
-                "is_resolved": False,
-                "product_id": None,
-                "version_id": None,
-                "violation_details": "스캔된 파일 (AI 매칭 대기중)"
-            }, synchronize_session=False)
-            # 외래키 제약 조건이 있는 관련 레코드 먼저 삭제
-            db.query(Attachment).filter(Attachment.product_id.in_(deleted_product_ids)).delete(synchronize_session=False)
-            db.query(Favorite).filter(Favorite.product_id.in_(deleted_product_ids)).delete(synchronize_session=False)
-            # Product 삭제 (ProductVideo, ShareLink는 ondelete=CASCADE로 자동 처리)
-            db.query(Product).filter(Product.id.in_(deleted_product_ids)).delete(synchronize_session=False)
+        # 모든 Version 경로를 병렬로 stat하여 사라진 파일 정리
+        version_rows = [
+            (row.id, row.product_id, row.file_path)
+            for row in db.query(Version.id, Version.product_id, Version.file_path)
+        ]
+        deleted_versions, deleted_product_ids = reconcile_versions(
+            db, version_rows, max_workers=settings.SCAN_WALK_WORKERS
+        )
 
         db.commit()
 
         # 캐시 무효화
-        invalidate_cache([
+        await ainvalidate_cache([
             "products_list:*",
             "products_recent:*",
             "products_by_category:*",
@@ -778,8 +761,8 @@ async def cleanup_deleted_files(
 
         return {
             "success": True,
-            "message": f"{len(deleted_version_ids)}개의 버전과 {len(deleted_product_ids)}개의 제품이 삭제되었습니다.",
-            "deleted_versions": len(deleted_version_ids),
+            "message": f"{deleted_versions}개의 버전과 {len(deleted_product_ids)}개의 제품이 삭제되었습니다.",
+            "deleted_versions": deleted_versions,
             "deleted_products": len(deleted_product_ids)
         }
 
@@ -833,7 +816,7 @@ async def delete_product(
                      resource_name=product_title, user_id=current_user.id, username=current_user.username)
 
         # 캐시 무효화
-        invalidate_cache([
+        await ainvalidate_cache([
             "products_list:*",
             "products_recent:*",
             "products_by_category:*",
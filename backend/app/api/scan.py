@@ -1,18 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Optional, List
 from pathlib import Path
 from datetime import datetime
+from types import SimpleNamespace
 import asyncio
 import os
 
-from app.database import get_db
+from app.database import get_db, SessionLocal
 from app.core.scanner import FileScanner
 from app.dependencies import get_current_admin_user
 from app.config import settings
 from app.models.setting import Setting
-from app.core.redis_cache import invalidate_cache
+from app.core.redis_cache import ainvalidate_cache
 from app.core.activity_logger import log_activity
 from app.models.filename_violation import FilenameViolation
 from app.models.product import Product
@@ -21,6 +23,7 @@ from app.core.ai_metadata import AIMetadataGeneratorV2 as AIMetadataGenerator
 from app.core.parser import FilenameParser
 from app.api.config import load_config
 from app.core.auto_matcher import match_violations_to_products
+from app.core.scan_jobs import scan_jobs, ScanJob
 
 router = APIRouter()
 
@@ -28,6 +31,7 @@ router = APIRouter()
 class ScanRequest(BaseModel):
     path: str
     use_ai: Optional[bool] = True  # Enable AI metadata generation
+    full_rescan: Optional[bool] = False  # 디렉토리 상태 인덱스를 무시하고 전체 재스캔
 
 
 class ScanResponse(BaseModel):
@@ -39,6 +43,14 @@ class ScanResponse(BaseModel):
     deleted_violations: Optional[int] = 0
     ai_generated: Optional[int] = 0
     icons_cached: Optional[int] = 0
+    scanned_folders: Optional[int] = 0
+    skipped_folders: Optional[int] = 0
+    duration_seconds: Optional[float] = 0.0
+    cancelled: Optional[bool] = False
+    # 중단된 이전 스캔의 체크포인트에서 이어서 진행했는지
+    resumed: Optional[bool] = False
+    # 자동 매칭의 파일명 명확성 판정 통계 (로컬 판정으로 생략한 AI 호출 수 등)
+    clarity: Optional[dict] = None
     errors: list
 
 
@@ -91,6 +103,9 @@ async def auto_match_scanned_files(db: Session) -> dict:
         api_key = metadata_config.get('openaiApiKey', '')
     elif ai_provider == 'claude':
         api_key = metadata_config.get('claudeApiKey', '')
+    elif ai_provider == 'mock':
+        # 오프라인 모의 제공자 (AI_MOCK_PROVIDER_ENABLED일 때만 동작, 키 불필요)
+        api_key = 'mock'
     else:
         return {"matched": 0, "failed": 0, "errors": [f"Unsupported AI provider: {ai_provider}"]}
 
@@ -130,37 +145,65 @@ async def start_scan(
     Args:
         path: Directory path to scan
         use_ai: Enable AI metadata generation (requires OpenAI API key)
+        full_rescan: 변경 없는 폴더도 건너뛰지 않고 전체 재스캔
     """
-    scanner = FileScanner(db, use_ai=request.use_ai)
-
     try:
-        # 스캔은 동기 파일시스템 I/O이므로 스레드로 실행해 이벤트 루프를
-        # 블로킹하지 않도록 함 (NAS 스캔 중에도 다른 API 요청이 응답 가능)
-        results = await asyncio.to_thread(scanner.scan_directory, request.path)
-
-        # 스캔 완료 후 마지막 스캔 시간을 Settings에 저장
-        last_scan_time = datetime.now().isoformat()
-        last_scan_setting = db.query(Setting).filter(
-            Setting.key == "last_scan_time"
-        ).first()
-
-        if last_scan_setting:
-            last_scan_setting.value = last_scan_time
-        else:
-            last_scan_setting = Setting(
-                key="last_scan_time",
-                value=last_scan_time,
-                description="마지막 스캔 완료 시간"
-            )
-            db.add(last_scan_setting)
+        return await _run_scan(db, request, current_user)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Scan failed: {str(e)}")
 
-        db.commit()
 
-        log_activity(db, action="scan", resource_type="scan", resource_name=request.path,
-                     user_id=current_user.id, username=current_user.username,
-                     details={"path": request.path, "use_ai": request.use_ai})
+async def _run_scan(db: Session, request: ScanRequest, current_user, job: Optional[ScanJob] = None) -> dict:
+    """
+    스캔 + 마지막 스캔 시간 기록 + 자동 매칭 + 캐시 무효화
+
+    /start(동기)와 /jobs(백그라운드 작업)가 공유한다. job이 있으면 진행 상황을
+    기록하고, 취소 요청 시 남은 폴더 순회와 자동 매칭을 건너뛴다.
+    """
+    scanner = FileScanner(
+        db,
+        use_ai=request.use_ai,
+        progress_callback=job.update_progress if job else None,
+        cancel_event=job.cancel_event if job else None,
+    )
+
+    # 스캔은 동기 파일시스템 I/O이므로 스레드로 실행해 이벤트 루프를
+    # 블로킹하지 않도록 함 (NAS 스캔 중에도 다른 API 요청이 응답 가능)
+    results = await asyncio.to_thread(
+        scanner.scan_directory, request.path, bool(request.full_rescan)
+    )
+
+    # 스캔 완료 후 마지막 스캔 시간을 Settings에 저장
+    last_scan_time = datetime.now().isoformat()
+    last_scan_setting = db.query(Setting).filter(
+        Setting.key == "last_scan_time"
+    ).first()
+
+    if last_scan_setting:
+        last_scan_setting.value = last_scan_time
+    else:
+        last_scan_setting = Setting(
+            key="last_scan_time",
+            value=last_scan_time,
+            description="마지막 스캔 완료 시간"
+        )
+        db.add(last_scan_setting)
 
-        # 스캔 완료 후 자동 매칭 수행
+    db.commit()
+
+    log_activity(db, action="scan", resource_type="scan", resource_name=request.path,
+                 user_id=current_user.id, username=current_user.username,
+                 details={"path": request.path, "use_ai": request.use_ai,
+                          "full_rescan": bool(request.full_rescan),
+                          "cancelled": results.get("cancelled", False),
+                          "resumed": results.get("resumed", False)})
+
+    # 스캔 완료 후 자동 매칭 수행 (취소된 스캔은 생략)
+    if not results.get("cancelled"):
+        if job:
+            job.set_phase("matching")
         match_results = await auto_match_scanned_files(db)
 
         # 매칭 결과를 results에 반영
@@ -168,6 +211,8 @@ async def start_scan(
             results["new_products"] = match_results["matched"]
         if match_results.get("errors"):
             results["errors"].extend(match_results["errors"])
+        if match_results.get("clarity"):
+            results["clarity"] = match_results["clarity"]
         # API 오류 정보 전달
         if match_results.get("api_error"):
             results["errors"].append(
@@ -175,21 +220,111 @@ async def start_scan(
                 f"{match_results['api_error'].get('message', 'AI API 오류')}"
             )
 
-        # 캐시 무효화 (새 제품이 추가되었을 수 있음)
-        invalidate_cache([
-            "products_list:*",
-            "products_recent:*",
-            "products_by_category:*",
-            "search_suggestions:*",
-            "stats_overview:*",
-            "stats_categories:*"
-        ])
-
-        return results
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Scan failed: {str(e)}")
+    # 캐시 무효화 (새 제품이 추가되었을 수 있음)
+    await ainvalidate_cache([
+        "products_list:*",
+        "products_recent:*",
+        "products_by_category:*",
+        "search_suggestions:*",
+        "stats_overview:*",
+        "stats_categories:*"
+    ])
+
+    return results
+
+
+@router.post("/jobs")
+async def create_scan_job(
+    request: ScanRequest,
+    current_user = Depends(get_current_admin_user)
+):
+    """
+    백그라운드 스캔 작업 시작 (관리자 전용)
+
+    바로 작업 ID를 반환하며, 진행 상황은 GET /jobs/{job_id} 또는
+    GET /jobs/{job_id}/events(SSE)로 확인한다.
+    """
+    if not os.path.exists(request.path):
+        raise HTTPException(status_code=400, detail=f"Path does not exist: {request.path}")
+
+    active = scan_jobs.find_active([request.path])
+    if active:
+        raise HTTPException(status_code=409, detail=f"Scan already running for this path (job {active.id})")
+
+    user = SimpleNamespace(id=current_user.id, username=current_user.username)
+
+    async def worker(job: ScanJob) -> dict:
+        # 요청 세션은 응답과 함께 닫히므로 작업 전용 세션 사용
+        db = SessionLocal()
+        try:
+            return await _run_scan(db, request, user, job)
+        finally:
+            db.close()
+
+    job = scan_jobs.submit(
+        "scan", [request.path], worker,
+        params={"use_ai": request.use_ai, "full_rescan": bool(request.full_rescan)}
+    )
+    return job.to_dict()
+
+
+@router.get("/jobs")
+async def list_scan_jobs(
+    current_user = Depends(get_current_admin_user)
+):
+    """스캔 작업 목록 (최신순, 관리자 전용)"""
+    return {"jobs": scan_jobs.list()}
+
+
+@router.get("/jobs/{job_id}")
+async def get_scan_job(
+    job_id: str,
+    current_user = Depends(get_current_admin_user)
+):
+    """스캔 작업 상태 조회 (관리자 전용)"""
+    job = scan_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Scan job not found")
+    return job.to_dict()
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_scan_job(
+    job_id: str,
+    current_user = Depends(get_current_admin_user)
+):
+    """
+    스캔 작업 진행 상황 스트림 (Server-Sent Events, 관리자 전용)
+
+    이벤트: progress (상태 변경 시), done (작업 종료 시 마지막 상태 후 스트림 종료)
+    """
+    job = scan_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Scan job not found")
+
+    return StreamingResponse(
+        scan_jobs.stream(job),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # nginx 등 역방향 프록시의 응답 버퍼링 비활성화
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+@router.post("/jobs/{job_id}/cancel")
+async def cancel_scan_job(
+    job_id: str,
+    current_user = Depends(get_current_admin_user)
+):
+    """스캔 작업 취소 요청 (관리자 전용)"""
+    job = scan_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Scan job not found")
+    if not scan_jobs.cancel(job_id):
+        raise HTTPException(status_code=409, detail=f"Scan job already {job.status}")
+    return job.to_dict()
 
 
 @router.post("/regenerate-metadata/{product_id}")
@@ -221,6 +356,8 @@ async def regenerate_metadata(
         api_key = metadata_config.get('geminiApiKey', '')
     elif ai_provider == 'claude':
         api_key = metadata_config.get('claudeApiKey', '')
+    elif ai_provider == 'mock':
+        api_key = 'mock'
     else:
         api_key = metadata_config.get('openaiApiKey', '') or metadata_config.get('apiKey', '')
 
@@ -242,7 +379,8 @@ async def regenerate_metadata(
         folder_name = product.folder_path.split('/')[-1]
 
         # Generate new metadata
-        metadata = await ai_generator.generate_detailed_metadata(folder_name)
+        # 재생성 요청이므로 캐시를 건너뛰고 새로 생성 (결과는 캐시에 갱신)
+        metadata = await ai_generator.generate_detailed_metadata(folder_name, use_cache=False)
 
         # Update product (generate_detailed_metadata 반환 필드 매핑)
         product.title = metadata.get('title', product.title)
@@ -492,6 +630,8 @@ async def test_ai_api(
         api_key = metadata_config.get('geminiApiKey', '')
     elif ai_provider == 'claude':
         api_key = metadata_config.get('claudeApiKey', '')
+    elif ai_provider == 'mock':
+        api_key = 'mock'
     else:
         api_key = metadata_config.get('openaiApiKey', '')
 
@@ -5,9 +5,13 @@ from typing import List, Optional
 
 from app.database import get_db
 from app.core.scheduler import scan_scheduler
+from app.core.fs_watcher import file_watcher
+from app.core.scan_jobs import scan_jobs
+from app.config import settings
 from app.models.setting import Setting
 from app.dependencies import get_current_admin_user
 import json
+import asyncio
 
 router = APIRouter()
 
@@ -26,6 +30,7 @@ class SchedulerStatusResponse(BaseModel):
     next_run_time: Optional[str]
     last_scan_time: Optional[str]
     last_scan_result: Optional[dict]
+    watcher: Optional[dict] = None
 
 
 @router.get("/status", response_model=SchedulerStatusResponse)
@@ -36,6 +41,7 @@ async def get_scheduler_status(
     스케줄러 상태 조회
     """
     status = scan_scheduler.get_status()
+    status["watcher"] = file_watcher.get_status()
     return status
 
 
@@ -64,6 +70,12 @@ async def start_scheduler(
             use_ai=config.use_ai
         )
 
+        # 스캔 경로가 바뀌었을 수 있으므로 파일 감시도 다시 시작
+        if settings.SCAN_WATCH_ENABLED:
+            file_watcher.debounce_seconds = settings.SCAN_WATCH_DEBOUNCE_SECONDS
+            file_watcher.on_overflow = scan_scheduler.schedule_resync_scan
+            await asyncio.to_thread(file_watcher.start, config.scan_paths)
+
         return {
             "success": True,
             "message": "Scheduler started successfully",
@@ -82,6 +94,7 @@ async def stop_scheduler(
     스케줄러 중지
     """
     try:
+        file_watcher.stop()
         scan_scheduler.stop()
         return {
             "success": True,
@@ -93,13 +106,38 @@ async def stop_scheduler(
 
 @router.post("/run-now")
 async def run_scheduler_now(
+    full_rescan: bool = False,
+    background: bool = False,
     current_user = Depends(get_current_admin_user)
 ):
     """
     즉시 스캔 실행 (스케줄 무시)
+
+    Args:
+        full_rescan: True면 변경 없는 폴더도 건너뛰지 않고 전체 재스캔
+        background: True면 스캔 작업 ID를 바로 반환하고 백그라운드에서 실행
+                    (진행 상황은 /api/scan/jobs/{job_id}/events로 스트리밍)
     """
+    if background:
+        active = scan_jobs.find_active(scan_scheduler.scan_paths)
+        if active:
+            raise HTTPException(status_code=409, detail=f"Scan already running (job {active.id})")
+
+        async def worker(job):
+            return await scan_scheduler.run_manual_scan(full_rescan=full_rescan, job=job)
+
+        job = scan_jobs.submit(
+            "scheduled", scan_scheduler.scan_paths, worker,
+            params={"full_rescan": full_rescan}
+        )
+        return {
+            "success": True,
+            "message": "Manual scan started",
+            "job": job.to_dict()
+        }
+
     try:
-        result = await scan_scheduler.run_manual_scan()
+        result = await scan_scheduler.run_manual_scan(full_rescan=full_rescan)
         return {
             "success": True,
             "message": "Manual scan completed",
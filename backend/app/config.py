@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List, Tuple
 
 
 class Settings(BaseSettings):
@@ -8,6 +8,12 @@ class Settings(BaseSettings):
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    # 연결 풀 크기와 명령/연결 타임아웃 (느린 Redis가 요청을 오래 붙잡지 않도록 짧게)
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 0.5
+    # 차단기 - 연속 실패가 이 횟수에 도달하면 캐시를 우회하고, 간격마다 백그라운드에서 재연결 확인
+    REDIS_BREAKER_FAILURE_THRESHOLD: int = 5
+    REDIS_BREAKER_PROBE_INTERVAL_SECONDS: float = 5.0
 
     # Security
     SECRET_KEY: str
@@ -43,6 +49,88 @@ class Settings(BaseSettings):
     SCAN_EXCLUSIONS_FILE: str = "/home/nuricom/project/myappStore/data/scan_exclusions.txt"
     VIDEOS_DIR: str = "/home/nuricom/project/myappStore/data/videos"
 
+    # Scan - 폴더 목록을 동시에 조회할 스레드 수 (NAS/네트워크 마운트는 8~16 권장)
+    SCAN_WALK_WORKERS: int = 8
+    # Scan - 같은 크기 파일이 여러 개일 때 앞/뒤 일부 내용 해시로 이름 변경 대상 구분
+    SCAN_RENAME_FINGERPRINT: bool = True
+    # Scan - inotify로 scanFolders 변경을 실시간 반영 (Linux 전용, 기본 비활성)
+    SCAN_WATCH_ENABLED: bool = False
+    SCAN_WATCH_DEBOUNCE_SECONDS: float = 3.0
+    # 감시 이벤트를 놓쳤을 때 증분 스캔을 예약할 지연 시간 (초)
+    SCAN_WATCH_RESYNC_DELAY_SECONDS: int = 60
+    # Scan - 스케줄 스캔에서 동시에 스캔할 경로(루트) 수 (같은 장치의 경로끼리는 순서대로)
+    SCAN_MAX_CONCURRENT_ROOTS: int = 3
+    # Scan - 진행 위치를 저장하는 주기 (폴더 수 또는 초, 먼저 도달하는 쪽). 중단된 스캔은 다음 스캔이 이어서 진행
+    SCAN_CHECKPOINT_ENABLED: bool = True
+    SCAN_CHECKPOINT_INTERVAL_FOLDERS: int = 500
+    SCAN_CHECKPOINT_INTERVAL_SECONDS: int = 60
+    # 이보다 오래된 체크포인트는 버리고 처음부터 스캔 (시간)
+    SCAN_CHECKPOINT_MAX_AGE_HOURS: int = 72
+
+    # Matching - 유사 제품 후보 인덱스를 DB에서 다시 만드는 주기 (초, 다른 워커의 제목 수정 반영)
+    SIMILARITY_INDEX_MAX_AGE_SECONDS: int = 600
+    # Matching - AI 메타데이터를 동시에 생성할 폴더 수 (DB 쓰기는 항상 하나씩)
+    AI_MATCH_CONCURRENCY: int = 4
+    # AI - 제공자별 분당 요청/토큰 한도 (AI_RATE_LIMITS에 없는 제공자는 기본값 사용)
+    AI_RATE_LIMIT_RPM: int = 60
+    AI_RATE_LIMIT_TPM: int = 100000
+    # AI - 제공자별 한도 "provider:RPM/TPM" (comma-separated, 예: "openai:500/200000,gemini:15/1000000")
+    AI_RATE_LIMITS: str = ""
+    # AI - 요청 종류별 예상 토큰 수 (TPM 버킷 차감용)
+    AI_METADATA_TOKEN_ESTIMATE: int = 3000
+    AI_CLARITY_TOKEN_ESTIMATE: int = 300
+    # AI - 파일명 명확성 판단을 요청 한 번에 묶을 폴더 수
+    AI_CLARITY_BATCH_SIZE: int = 40
+    # Matching - 파일명 명확성 로컬 사전 판정 (점수 >= CLEAR → 명확, < UNCLEAR → 불명확, 그 사이만 AI 판단)
+    CLARITY_PREFILTER_ENABLED: bool = True
+    CLARITY_CLEAR_THRESHOLD: float = 0.65
+    CLARITY_UNCLEAR_THRESHOLD: float = 0.1
+    # AI - 429(rate_limit) 재시도 횟수와 백오프 (초, 지수 증가 + 지터)
+    AI_RATE_LIMIT_MAX_RETRIES: int = 4
+    AI_RATE_LIMIT_BACKOFF_SECONDS: float = 2.0
+    AI_RATE_LIMIT_BACKOFF_MAX_SECONDS: float = 60.0
+    # AI - 제공자별 공유 HTTP 연결 풀 (keep-alive, h2 패키지가 있으면 HTTP/2)
+    AI_HTTP2_ENABLED: bool = True
+    AI_HTTP_MAX_CONNECTIONS: int = 20
+    AI_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    AI_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+    AI_HTTP_CONNECT_TIMEOUT_SECONDS: float = 10.0
+    # 이 시간(초)보다 오래 걸린 AI 요청은 경고 로그로 남김 (0이면 끔)
+    AI_HTTP_SLOW_REQUEST_SECONDS: float = 20.0
+    # AI - 생성된 메타데이터 영구 캐시 (metadata_cache 테이블, 보관 일수/최대 항목 수,
+    # 최대 항목 수 확인 주기 - 저장 N번마다 한 번)
+    AI_METADATA_CACHE_ENABLED: bool = True
+    AI_METADATA_CACHE_TTL_DAYS: int = 90
+    AI_METADATA_CACHE_MAX_ENTRIES: int = 20000
+    AI_METADATA_CACHE_EVICT_INTERVAL: int = 100
+    # AI - 오프라인 모의 제공자 (aiProvider="mock", 벤치마크/회귀 테스트용, 네트워크 사용 안 함)
+    AI_MOCK_PROVIDER_ENABLED: bool = False
+    AI_MOCK_SEED: int = 42
+    # 지연 시간 분포 (fixed: 항상 LATENCY_MS, uniform: LATENCY_MS ± SPREAD 비율, lognormal: 중앙값 LATENCY_MS, sigma SPREAD)
+    AI_MOCK_LATENCY_DISTRIBUTION: str = "lognormal"
+    AI_MOCK_LATENCY_MS: float = 800.0
+    AI_MOCK_LATENCY_SPREAD: float = 0.5
+    # 요청당 오류 확률 (429 rate_limit / 402 insufficient_quota / 500 server_error)
+    AI_MOCK_RATE_LIMIT_ERROR_RATE: float = 0.0
+    AI_MOCK_QUOTA_ERROR_RATE: float = 0.0
+    AI_MOCK_SERVER_ERROR_RATE: float = 0.0
+    # 서버 측 분당 요청/토큰 한도 (넘으면 429, 0이면 제한 없음)
+    AI_MOCK_SERVER_RPM: int = 0
+    AI_MOCK_SERVER_TPM: int = 0
+    # 요청 1건의 프롬프트/응답 토큰 수 (PROMPT_TOKENS가 0이면 프롬프트 글자 수 / 4)
+    AI_MOCK_PROMPT_TOKENS: int = 0
+    AI_MOCK_COMPLETION_TOKENS: int = 1200
+
+    # Cache - 워커별 프로세스 내부 LRU (Redis 앞단 L1, 무효화는 Redis pub/sub으로 전파)
+    CACHE_L1_ENABLED: bool = True
+    CACHE_L1_MAX_ENTRIES: int = 1000
+    CACHE_L1_MAX_BYTES: int = 32 * 1024 * 1024
+    CACHE_L1_TTL_SECONDS: int = 30
+    # Cache - 같은 키 동시 미스 합치기 (워커 간 채우기 잠금 유지 시간, 다른 워커 결과 대기 시간/확인 간격)
+    CACHE_LOCK_TTL_SECONDS: int = 10
+    CACHE_LOCK_WAIT_SECONDS: float = 5.0
+    CACHE_LOCK_POLL_INTERVAL_MS: int = 50
+
     # CORS - comma-separated string
     CORS_ORIGINS: str = "http://localhost:5900,http://localhost:3000"
 
@@ -66,6 +154,19 @@ class Settings(BaseSettings):
             return ["*"]
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()]
 
+    def get_ai_rate_limits(self) -> Dict[str, Tuple[int, int]]:
+        """Parse AI_RATE_LIMITS string into {provider: (requests/min, tokens/min)}"""
+        limits = {}
+        for entry in self.AI_RATE_LIMITS.split(","):
+            provider, _, values = entry.strip().partition(":")
+            rpm, _, tpm = values.partition("/")
+            if provider and rpm.strip().isdigit():
+                limits[provider.strip()] = (
+                    int(rpm),
+                    int(tpm) if tpm.strip().isdigit() else self.AI_RATE_LIMIT_TPM,
+                )
+        return limits
+
     def get_backend_url(self) -> str:
         """Get backend URL - use BACKEND_URL if set, otherwise auto-generate from HOST and PORT"""
         if self.BACKEND_URL and self.BACKEND_URL.strip():
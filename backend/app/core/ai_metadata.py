@@ -5,13 +5,24 @@ AI 전용 메타데이터 생성기 v2
 - 상세한 메타데이터 생성 (메타데이터 예제 수준)
 """
 import json
-from typing import Dict, Optional
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 import httpx
 from app.config import settings
 from app.core.parser import FilenameParser
+from app.core.similarity_index import normalize_title
+from app.core.confidence import calculate_confidence_score
+from app.core.ai_metadata_cache import ai_metadata_cache, build_cache_key, hash_text
+from app.core.ai_transport import ai_transport
+from app.core.ai_mock_provider import mock_llm, MOCK_PROVIDER, MOCK_MODEL
 import logging
 logger = logging.getLogger(__name__)
 
+# 기본 상세 메타데이터 프롬프트 버전 (_query_*_detailed 프롬프트를 바꾸면 올려서 기존 캐시 무효화)
+DETAILED_PROMPT_VERSION = "1"
+
+# 묶음 명확성 판단에서 잠시 후 같은 요청을 다시 보낼 오류 (그 밖의 오류는 묶음 전체를 명확으로 처리)
+RETRYABLE_CLARITY_ERRORS = {'rate_limit', 'server_error', 'timeout', 'connection_error'}
 
 
 class AIMetadataGeneratorV2:
@@ -23,7 +34,7 @@ class AIMetadataGeneratorV2:
     def __init__(self, provider: str = "openai", api_key: str = None, model: str = None):
         """
         Args:
-            provider: AI 제공자 ('openai', 'gemini', 'claude')
+            provider: AI 제공자 ('openai', 'gemini', 'claude', 'mock')
             api_key: API 키
             model: 모델명 (지정하지 않으면 최신 모델 사용)
         """
@@ -36,6 +47,9 @@ class AIMetadataGeneratorV2:
             self.api_key = settings.GEMINI_API_KEY
         elif self.provider == 'claude':
             self.api_key = settings.CLAUDE_API_KEY
+        elif self.provider == MOCK_PROVIDER:
+            # 모의 제공자는 키가 필요 없음 (빈 키 검사만 통과시킴)
+            self.api_key = MOCK_PROVIDER
         else:
             self.api_key = settings.OPENAI_API_KEY
 
@@ -48,6 +62,8 @@ class AIMetadataGeneratorV2:
         elif self.provider == 'claude':
             # Claude 5 세대 최고 성능 모델 (기본값)
             self.model = "claude-opus-5"
+        elif self.provider == MOCK_PROVIDER:
+            self.model = MOCK_MODEL
         else:
             # OpenAI GPT-4.5 이상
             self.model = "gpt-4o"  # gpt-4o는 GPT-4 Turbo 최신 버전
@@ -58,7 +74,9 @@ class AIMetadataGeneratorV2:
         self,
         filename: str,
         parent_folder: str = "",
-        custom_prompt: str = None
+        custom_prompt: str = None,
+        use_cache: bool = True,
+        before_request: Optional[Callable[[], Awaitable]] = None
     ) -> Dict:
         """
         상세한 메타데이터 생성
@@ -75,25 +93,56 @@ class AIMetadataGeneratorV2:
             filename: 파일명
             parent_folder: 상위 폴더명
             custom_prompt: 사용자 정의 프롬프트 (None이면 기본 프롬프트 사용)
+            use_cache: False면 캐시를 읽지 않고 새로 생성 (결과는 캐시에 저장, 재생성용)
+            before_request: 실제로 AI에 요청하기 직전에 기다릴 함수 (속도 제한용, 캐시 적중/폴백이면 호출하지 않음)
         """
         # 1단계: 파일명 파싱
         parsed = self.parser.parse(filename, parent_folder)
         parsed['raw_filename'] = filename
         parsed['raw_parent_folder'] = parent_folder
 
-        # 2단계: AI 질의
-        if self.api_key and self.api_key.strip():
-            if self.provider == 'openai':
-                metadata = await self._query_openai_detailed(parsed, custom_prompt)
-            elif self.provider == 'gemini':
-                metadata = await self._query_gemini_detailed(parsed, custom_prompt)
-            elif self.provider == 'claude':
-                metadata = await self._query_claude_detailed(parsed, custom_prompt)
-            else:
+        if not (self.api_key and self.api_key.strip()) or not self._is_supported_provider():
+            if self.api_key and self.api_key.strip():
                 logger.debug(f"Unknown provider: {self.provider}, falling back")
-                metadata = self._fallback_metadata(parsed)
+            return self._fallback_metadata(parsed)
+
+        # 2단계: 캐시 조회 (원본 파일명/폴더명은 키에 포함하지 않음)
+        cache_fields = {
+            'software_name': normalize_title(parsed['software_name']),
+            'version': f"{parsed.get('version') or ''}|{parsed.get('year') or ''}",
+            'provider': self.provider,
+            'model': self.model,
+            'prompt_hash': hash_text(custom_prompt or f"detailed:{DETAILED_PROMPT_VERSION}"),
+        }
+        cache_key = build_cache_key(**cache_fields)
+        if use_cache:
+            cached = await ai_metadata_cache.aget(cache_key)
+            if cached is not None:
+                logger.debug(f"AI metadata cache hit: {parsed['software_name']} ({self.provider}/{self.model})")
+                return cached
+
+        # 3단계: AI 질의
+        if before_request is not None:
+            await before_request()
+        if self.provider == 'openai':
+            metadata = await self._query_openai_detailed(parsed, custom_prompt)
+        elif self.provider == 'gemini':
+            metadata = await self._query_gemini_detailed(parsed, custom_prompt)
+        elif self.provider == MOCK_PROVIDER:
+            metadata = await self._query_mock(
+                custom_prompt or f"detailed:{DETAILED_PROMPT_VERSION} {filename} {parent_folder}", parsed
+            )
         else:
-            metadata = self._fallback_metadata(parsed)
+            metadata = await self._query_claude_detailed(parsed, custom_prompt)
+
+        # 4단계: 정상 응답만 캐시에 저장 (오류/폴백 결과는 다음에 다시 시도)
+        if self._is_cacheable(metadata, parsed):
+            await ai_metadata_cache.aput(
+                cache_key, metadata,
+                source='ai',
+                confidence_score=calculate_confidence_score(metadata, parsed),
+                **cache_fields
+            )
 
         return metadata
 
@@ -117,15 +166,49 @@ class AIMetadataGeneratorV2:
         if not (self.api_key and self.api_key.strip()):
             return self._fallback_metadata(parsed_info)
 
+        if not self._is_supported_provider():
+            logger.debug(f"Unknown provider: {self.provider}, falling back")
+            return self._fallback_metadata(parsed_info)
+
+        # 원문이 프롬프트에 그대로 들어가므로 프롬프트 전체 해시로 캐시 (같은 원문 재요청만 적중)
+        cache_fields = {
+            'software_name': normalize_title(filename_hint),
+            'version': '',
+            'provider': self.provider,
+            'model': self.model,
+            'prompt_hash': hash_text(prompt),
+        }
+        cache_key = build_cache_key(**cache_fields)
+        cached = await ai_metadata_cache.aget(cache_key)
+        if cached is not None:
+            logger.debug(f"AI metadata cache hit (source): {filename_hint} ({self.provider}/{self.model})")
+            return cached
+
         if self.provider == 'openai':
-            return await self._query_openai_from_source(prompt, parsed_info)
+            metadata = await self._query_openai_from_source(prompt, parsed_info)
         elif self.provider == 'gemini':
-            return await self._query_gemini_from_source(prompt, parsed_info)
-        elif self.provider == 'claude':
-            return await self._query_claude_from_source(prompt, parsed_info)
+            metadata = await self._query_gemini_from_source(prompt, parsed_info)
+        elif self.provider == MOCK_PROVIDER:
+            metadata = await self._query_mock(prompt, parsed_info)
         else:
-            logger.debug(f"Unknown provider: {self.provider}, falling back")
-            return self._fallback_metadata(parsed_info)
+            metadata = await self._query_claude_from_source(prompt, parsed_info)
+
+        if self._is_cacheable(metadata, parsed_info):
+            await ai_metadata_cache.aput(cache_key, metadata, source='source', **cache_fields)
+
+        return metadata
+
+    def _is_supported_provider(self) -> bool:
+        """요청을 보낼 수 있는 제공자인지 (mock은 AI_MOCK_PROVIDER_ENABLED일 때만)"""
+        if self.provider == MOCK_PROVIDER:
+            return mock_llm.enabled
+        return self.provider in ('openai', 'gemini', 'claude')
+
+    def _is_cacheable(self, metadata: Dict, parsed_info: Dict) -> bool:
+        """AI가 실제로 응답한 결과인지 (API 오류/예외로 만든 폴백 메타데이터는 캐시하지 않음)"""
+        if not metadata or metadata.get('ai_error'):
+            return False
+        return metadata != self._fallback_metadata(parsed_info)
 
     def _build_source_prompt(self, source_text: str, filename_hint: str) -> str:
         """소스 기반 생성용 공통 프롬프트 (3개 프로바이더가 동일하게 사용).
@@ -188,7 +271,7 @@ Return a JSON object with the following fields:
     async def _query_openai_from_source(self, prompt: str, parsed_info: Dict) -> Dict:
         """OpenAI로 소스 기반 메타데이터 생성"""
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with ai_transport.session(timeout=60.0) as client:
                 response = await client.post(
                     "https://api.openai.com/v1/chat/completions",
                     headers={
@@ -239,7 +322,7 @@ Return a JSON object with the following fields:
             api_url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={self.api_key}"
             system_instruction = "You are an expert software analyst. You extract metadata strictly from the source text the user provides - you never fabricate information the source doesn't contain."
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with ai_transport.session(timeout=60.0) as client:
                 response = await client.post(
                     api_url,
                     headers={"Content-Type": "application/json"},
@@ -287,7 +370,7 @@ Return a JSON object with the following fields:
     async def _query_claude_from_source(self, prompt: str, parsed_info: Dict) -> Dict:
         """Claude로 소스 기반 메타데이터 생성"""
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with ai_transport.session(timeout=60.0) as client:
                 response = await client.post(
                     "https://api.anthropic.com/v1/messages",
                     headers={
@@ -480,7 +563,7 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
 - Field names remain in English, but all VALUES must be in Korean"""
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with ai_transport.session(timeout=60.0) as client:
                 response = await client.post(
                     "https://api.openai.com/v1/chat/completions",
                     headers={
@@ -687,7 +770,7 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
             # System instruction을 별도로 추가
             system_instruction = "You are an expert software analyst. Provide comprehensive, accurate metadata about software applications in JSON format. Always include ALL required fields, even if you need to use empty strings or arrays for unknown information. Be thorough and detailed."
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with ai_transport.session(timeout=60.0) as client:
                 response = await client.post(
                     api_url,
                     headers={"Content-Type": "application/json"},
@@ -898,7 +981,7 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
 - Field names remain in English, but all VALUES must be in Korean"""
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with ai_transport.session(timeout=60.0) as client:
                 response = await client.post(
                     "https://api.anthropic.com/v1/messages",
                     headers={
@@ -1064,6 +1147,8 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
                 return await self._test_gemini_connection()
             elif self.provider == 'claude':
                 return await self._test_claude_connection()
+            elif self.provider == MOCK_PROVIDER and mock_llm.enabled:
+                return await self._test_mock_connection()
             else:
                 return {
                     'success': False,
@@ -1084,7 +1169,7 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
     async def _test_openai_connection(self) -> dict:
         """OpenAI API 연결 테스트"""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with ai_transport.session(timeout=30.0) as client:
                 # 간단한 테스트 요청
                 response = await client.post(
                     "https://api.openai.com/v1/chat/completions",
@@ -1139,7 +1224,7 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
         try:
             api_url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={self.api_key}"
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with ai_transport.session(timeout=30.0) as client:
                 response = await client.post(
                     api_url,
                     headers={"Content-Type": "application/json"},
@@ -1177,7 +1262,7 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
     async def _test_claude_connection(self) -> dict:
         """Claude API 연결 테스트"""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with ai_transport.session(timeout=30.0) as client:
                 response = await client.post(
                     "https://api.anthropic.com/v1/messages",
                     headers={
@@ -1290,6 +1375,10 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
                 return await self._judge_clarity_gemini(prompt)
             elif self.provider == 'claude':
                 return await self._judge_clarity_claude(prompt)
+            elif self.provider == MOCK_PROVIDER and mock_llm.enabled:
+                answer, error = await self._request_clarity_mock([(filename, parent_folder)])
+                verdicts = self._parse_clarity_batch_answer(answer, 1) if error is None else None
+                return verdicts is None or verdicts[0] is not False
             else:
                 # 알 수 없는 제공자는 기본값 True
                 return True
@@ -1298,10 +1387,268 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
             # 에러 시 안전하게 True 반환 (기존 동작 유지)
             return True
 
+    async def judge_filenames_clarity(
+        self,
+        items: List[Tuple[str, str]],
+        batch_size: Optional[int] = None,
+        before_request: Optional[Callable[[int], Awaitable]] = None,
+        backoff: Optional[Callable[[int], float]] = None
+    ) -> List[bool]:
+        """
+        여러 (파일명, 폴더명)의 명확성을 한 번의 AI 요청으로 묶어서 판단
+
+        is_filename_clear_for_matching과 판단 기준은 같고, batch_size개씩 번호를 붙인
+        목록을 보내 JSON 배열로 판정을 받는다.
+        - 요청 자체가 실패하면 (429/5xx/타임아웃) backoff가 준 시간만큼 쉬고 같은 묶음을
+          AI_RATE_LIMIT_MAX_RETRIES번까지 다시 보내고, 그래도 실패하면 묶음 전체를 명확으로 본다
+          (다른 오류나 backoff가 없으면 바로 명확으로 본다)
+        - 응답 전체를 해석할 수 없으면 묶음을 한 번 더 요청한다
+        - 해석한 응답에서 빠진 항목만 묶어서 한 번 더 요청하고, 그래도 빠진 항목만 한 건씩 다시 판단한다
+
+        Args:
+            items: (파일명, 부모 폴더명) 목록
+            batch_size: 요청 한 번에 넣을 항목 수 (None이면 AI_CLARITY_BATCH_SIZE)
+            before_request: AI 요청마다 직전에 기다릴 함수, 인자는 그 요청의 항목 수 (속도 제한용)
+            backoff: 재시도 횟수(0부터) → 다시 보내기 전까지 기다릴 초 (예: ProviderRateLimiter.backoff)
+
+        Returns:
+            items와 같은 순서의 판정 목록 (True: 명확, False: 불명확)
+        """
+        # API 키가 없으면 기본적으로 True 반환 (기존 동작 유지)
+        if not self.api_key or not self.api_key.strip() or not self._is_supported_provider():
+            return [True] * len(items)
+
+        batch_size = max(1, batch_size or settings.AI_CLARITY_BATCH_SIZE)
+        verdicts: List[bool] = []
+        for start in range(0, len(items), batch_size):
+            verdicts.extend(
+                await self._judge_clarity_batch(items[start:start + batch_size], before_request, backoff)
+            )
+        return verdicts
+
+    async def _judge_clarity_batch(
+        self,
+        items: List[Tuple[str, str]],
+        before_request: Optional[Callable[[int], Awaitable]] = None,
+        backoff: Optional[Callable[[int], float]] = None,
+        retry_missing: bool = True
+    ) -> List[bool]:
+        """항목 목록을 요청 한 번으로 판단 (응답에서 빠진 항목은 한 번 더 묶어서, 그래도 빠지면 한 건씩 재요청)"""
+        lines = []
+        for index, (filename, parent_folder) in enumerate(items, 1):
+            parsed = self.parser.parse(filename, parent_folder)
+            entry = {"id": index, "filename": filename, "parsed": parsed['software_name']}
+            if parent_folder:
+                entry["folder"] = parent_folder
+            if parsed.get('version'):
+                entry["version"] = parsed['version']
+            lines.append(json.dumps(entry, ensure_ascii=False))
+
+        prompt = f"""아래 각 줄은 소프트웨어 설치 파일 하나의 정보입니다 (JSON).
+
+{chr(10).join(lines)}
+
+각 파일명이 소프트웨어를 명확하게 식별할 수 있는지 판단해주세요.
+
+**명확한 파일명의 조건:**
+- 소프트웨어의 정확한 이름을 포함
+- 제조사나 브랜드명이 포함되어 있으면 더 좋음
+- 버전 정보가 있으면 더 명확함
+- 예: "Adobe Photoshop 2024 v25.0.iso", "Visual Studio Code 1.85.exe"
+
+**불명확한 파일명의 예:**
+- 너무 일반적인 이름: "setup.exe", "installer.zip", "patch.exe"
+- 의미 없는 숫자/문자 조합: "abc123.exe", "tmp_file.zip"
+- 파일명만으로는 어떤 소프트웨어인지 알 수 없는 경우
+
+모든 id에 대해 아래 형식의 JSON 배열로만 답변해주세요 (설명 없이):
+[{{"id": 1, "verdict": "CLEAR"}}, {{"id": 2, "verdict": "UNCLEAR"}}]"""
+
+        answer = await self._send_clarity_batch(items, prompt, before_request, backoff)
+        if answer is None:
+            # API 오류 시 안전하게 True (단건 판단과 동일), 항목별로 다시 묻지 않는다
+            return [True] * len(items)
+
+        verdicts = self._parse_clarity_batch_answer(answer, len(items))
+        if verdicts is None:
+            if not retry_missing:
+                return [True] * len(items)
+            logger.debug(f"Clarity batch answer unparseable ({len(items)} items), retrying batch once")
+            return await self._judge_clarity_batch(items, before_request, backoff, retry_missing=False)
+
+        missing = [i for i, verdict in enumerate(verdicts) if verdict is None]
+        if missing and retry_missing and len(missing) > 1:
+            logger.debug(f"Clarity batch answer incomplete ({len(missing)}/{len(items)} missing), retrying missing items")
+            retried = await self._judge_clarity_batch(
+                [items[i] for i in missing], before_request, backoff, retry_missing=False
+            )
+            for i, verdict in zip(missing, retried):
+                verdicts[i] = verdict
+        elif missing:
+            logger.debug(f"Clarity batch answer incomplete ({len(missing)}/{len(items)} missing), falling back per item")
+            for i in missing:
+                filename, parent_folder = items[i]
+                if before_request is not None:
+                    await before_request(1)
+                verdicts[i] = await self.is_filename_clear_for_matching(filename, parent_folder)
+        return verdicts
+
+    async def _send_clarity_batch(
+        self,
+        items: List[Tuple[str, str]],
+        prompt: str,
+        before_request: Optional[Callable[[int], Awaitable]],
+        backoff: Optional[Callable[[int], float]]
+    ) -> Optional[str]:
+        """
+        묶음 요청 전송, 재시도할 수 있는 오류(429/5xx/타임아웃)는 backoff 후 같은 묶음을 다시 보냄
+
+        Returns:
+            응답 텍스트 (재시도를 모두 쓰거나 재시도할 수 없는 오류면 None)
+        """
+        max_retries = max(0, settings.AI_RATE_LIMIT_MAX_RETRIES) if backoff is not None else 0
+        for attempt in range(max_retries + 1):
+            if before_request is not None:
+                await before_request(len(items))
+            if self.provider == MOCK_PROVIDER:
+                answer, error = await self._request_clarity_mock(items)
+            else:
+                answer, error = await self._request_clarity_batch(prompt, max_tokens=40 + 15 * len(items))
+            if error is None:
+                return answer
+
+            if error['type'] not in RETRYABLE_CLARITY_ERRORS or attempt == max_retries:
+                logger.debug(f"{self.provider} clarity batch gave up: {error['type']}")
+                return None
+            delay = backoff(attempt)
+            logger.info(
+                f"AI clarity batch {error['type']} ({self.provider}), "
+                f"retry {attempt + 1}/{max_retries} in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    def _parse_clarity_batch_answer(self, answer: str, count: int) -> Optional[List[Optional[bool]]]:
+        """JSON 배열 응답 → 항목별 판정 (빠졌거나 해석할 수 없는 항목은 None, 배열이 없으면 None)"""
+        verdicts: List[Optional[bool]] = [None] * count
+        try:
+            text = self._extract_json(answer)
+            start, end = text.find('['), text.rfind(']')
+            parsed = json.loads(text[start:end + 1]) if start >= 0 and end > start else None
+        except (json.JSONDecodeError, ValueError):
+            parsed = None
+
+        if not isinstance(parsed, list):
+            return None
+
+        for position, entry in enumerate(parsed):
+            if isinstance(entry, dict):
+                index, verdict = entry.get('id'), entry.get('verdict')
+            else:
+                # id 없이 판정만 순서대로 온 경우
+                index, verdict = position + 1, entry
+            if isinstance(index, str) and index.isdigit():
+                index = int(index)
+            if isinstance(index, int) and 1 <= index <= count and isinstance(verdict, str):
+                verdicts[index - 1] = self._parse_clarity_answer(verdict)
+        return verdicts
+
+    @staticmethod
+    def _parse_clarity_answer(answer: str) -> Optional[bool]:
+        """CLEAR/UNCLEAR 답변 해석 ("UNCLEAR"에도 "CLEAR"가 들어 있으므로 UNCLEAR를 먼저 확인)"""
+        answer = answer.strip().upper()
+        if 'UNCLEAR' in answer:
+            return False
+        if 'CLEAR' in answer:
+            return True
+        return None
+
+    async def _request_clarity_batch(self, prompt: str, max_tokens: int) -> Tuple[Optional[str], Optional[Dict]]:
+        """
+        묶음 명확성 판단 요청을 보내고 (응답 텍스트, 오류) 반환
+
+        HTTP/전송 실패는 (None, _parse_api_error 형식의 오류), 200 응답은 (텍스트, None)으로
+        구분한다. 200인데 본문에 답이 없으면 빈 텍스트 (해석할 수 없는 응답으로 처리).
+        """
+        system = "You are a software filename analyzer. Answer only with a JSON array of CLEAR/UNCLEAR verdicts."
+        try:
+            async with ai_transport.session(timeout=60.0) as client:
+                if self.provider == 'openai':
+                    response = await client.post(
+                        "https://api.openai.com/v1/chat/completions",
+                        headers={
+                            "Authorization": f"Bearer {self.api_key}",
+                            "Content-Type": "application/json"
+                        },
+                        json={
+                            "model": self.model,
+                            "messages": [
+                                {"role": "system", "content": system},
+                                {"role": "user", "content": prompt}
+                            ],
+                            "temperature": 0.1,
+                            "max_tokens": max_tokens
+                        }
+                    )
+                    if response.status_code == 200:
+                        return response.json()['choices'][0]['message']['content'], None
+
+                elif self.provider == 'gemini':
+                    response = await client.post(
+                        f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={self.api_key}",
+                        headers={"Content-Type": "application/json"},
+                        json={
+                            "contents": [{"parts": [{"text": f"{system}\n\n{prompt}"}]}],
+                            "generationConfig": {
+                                "temperature": 0.1,
+                                "maxOutputTokens": max_tokens,
+                                "responseMimeType": "application/json"
+                            }
+                        }
+                    )
+                    if response.status_code == 200:
+                        result = response.json()
+                        if result.get('candidates'):
+                            return result['candidates'][0]['content']['parts'][0]['text'], None
+                        return '', None
+
+                else:
+                    response = await client.post(
+                        "https://api.anthropic.com/v1/messages",
+                        headers={
+                            "x-api-key": self.api_key,
+                            "anthropic-version": "2023-06-01",
+                            "content-type": "application/json"
+                        },
+                        json={
+                            "model": self.model,
+                            "max_tokens": max_tokens,
+                            **self._claude_thinking_disabled_param(),
+                            "system": system,
+                            "messages": [{"role": "user", "content": prompt}]
+                        }
+                    )
+                    if response.status_code == 200:
+                        return next(
+                            (b['text'] for b in response.json().get('content', []) if b.get('type') == 'text'),
+                            ''
+                        ), None
+
+                logger.debug(f"{self.provider} clarity batch failed: {response.status_code}")
+                return None, self._parse_api_error(response.status_code, response.text, self.provider)
+        except httpx.TimeoutException as e:
+            logger.debug(f"{self.provider} clarity batch timeout: {e}")
+            return None, {'type': 'timeout', 'code': 0, 'provider': self.provider}
+        except httpx.TransportError as e:
+            logger.debug(f"{self.provider} clarity batch connection error: {e}")
+            return None, {'type': 'connection_error', 'code': 0, 'provider': self.provider}
+        except Exception as e:
+            logger.debug(f"{self.provider} clarity batch error: {e}")
+            return None, {'type': 'unknown_error', 'code': 0, 'provider': self.provider}
+
     async def _judge_clarity_openai(self, prompt: str) -> bool:
         """OpenAI로 파일명 명확성 판단"""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with ai_transport.session(timeout=30.0) as client:
                 response = await client.post(
                     "https://api.openai.com/v1/chat/completions",
                     headers={
@@ -1328,7 +1675,7 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
                 if response.status_code == 200:
                     result = response.json()
                     answer = result['choices'][0]['message']['content'].strip().upper()
-                    is_clear = 'CLEAR' in answer
+                    is_clear = self._parse_clarity_answer(answer) is not False
                     logger.debug(f"파일명 명확성 판단 (OpenAI): {answer} → {is_clear}")
                     return is_clear
                 else:
@@ -1343,7 +1690,7 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
         try:
             api_url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={self.api_key}"
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with ai_transport.session(timeout=30.0) as client:
                 response = await client.post(
                     api_url,
                     headers={"Content-Type": "application/json"},
@@ -1362,7 +1709,7 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
                     result = response.json()
                     if 'candidates' in result and len(result['candidates']) > 0:
                         answer = result['candidates'][0]['content']['parts'][0]['text'].strip().upper()
-                        is_clear = 'CLEAR' in answer
+                        is_clear = self._parse_clarity_answer(answer) is not False
                         logger.debug(f"파일명 명확성 판단 (Gemini): {answer} → {is_clear}")
                         return is_clear
                     else:
@@ -1378,7 +1725,7 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
     async def _judge_clarity_claude(self, prompt: str) -> bool:
         """Claude로 파일명 명확성 판단"""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with ai_transport.session(timeout=30.0) as client:
                 response = await client.post(
                     "https://api.anthropic.com/v1/messages",
                     headers={
@@ -1401,7 +1748,7 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
                         (b['text'] for b in result.get('content', []) if b.get('type') == 'text'),
                         ''
                     ).strip().upper()
-                    is_clear = 'CLEAR' in answer
+                    is_clear = self._parse_clarity_answer(answer) is not False
                     logger.debug(f"파일명 명확성 판단 (Claude): {answer} → {is_clear}")
                     return is_clear
                 else:
@@ -1411,6 +1758,52 @@ Return a JSON object with the following fields. ALL fields are REQUIRED - use em
             logger.debug(f"Claude clarity check error: {e}")
             return True
 
+    async def _query_mock(self, prompt: str, parsed_info: Dict) -> Dict:
+        """오프라인 모의 제공자로 메타데이터 생성 (지연/오류는 AI_MOCK_* 설정)"""
+        response = await mock_llm.complete(
+            prompt,
+            lambda: json.dumps(mock_llm.detailed_metadata(parsed_info), ensure_ascii=False)
+        )
+        if response.status_code == 200:
+            metadata = json.loads(response.text)
+            metadata['ai_raw_response'] = response.text
+            metadata['ai_provider'] = MOCK_PROVIDER
+            return metadata
+
+        error_info = self._parse_api_error(response.status_code, response.text, MOCK_PROVIDER)
+        logger.debug(f"Mock API error: {error_info['type']}")
+        fallback = self._fallback_metadata(parsed_info)
+        fallback['ai_error'] = error_info
+        return fallback
+
+    async def _request_clarity_mock(self, items: List[Tuple[str, str]]) -> Tuple[Optional[str], Optional[Dict]]:
+        """모의 제공자의 묶음 명확성 판단 응답 ((응답 텍스트, 오류), _request_clarity_batch와 동일)"""
+        prompt = "\n".join(f"{filename} {parent_folder}" for filename, parent_folder in items)
+        response = await mock_llm.complete(prompt, lambda: mock_llm.clarity_answer(items))
+        if response.status_code != 200:
+            logger.debug(f"mock clarity batch failed: {response.status_code}")
+            return None, self._parse_api_error(response.status_code, response.text, MOCK_PROVIDER)
+        return response.text, None
+
+    async def _test_mock_connection(self) -> dict:
+        """모의 제공자 연결 테스트 (설정된 지연/오류 확률 그대로 적용)"""
+        response = await mock_llm.complete("Hi", lambda: "OK")
+        if response.status_code == 200:
+            return {
+                'success': True,
+                'provider': MOCK_PROVIDER,
+                'model': self.model,
+                'message': 'API 연결 성공 (모의 제공자)'
+            }
+        error_info = self._parse_api_error(response.status_code, response.text, MOCK_PROVIDER)
+        return {
+            'success': False,
+            'provider': MOCK_PROVIDER,
+            'model': self.model,
+            'message': error_info['message'],
+            'error': error_info
+        }
+
     def _fallback_metadata(self, parsed_info: Dict) -> Dict:
         """AI 실패 시 기본 메타데이터"""
         software_name = parsed_info['software_name']
@@ -0,0 +1,281 @@
+"""
+AI 메타데이터 영구 캐시 (metadata_cache 테이블)
+
+AIMetadataGeneratorV2.generate_detailed_metadata / generate_metadata_from_source 앞에서
+read-through / write-through로 동작한다. 제품을 삭제 후 다시 스캔하거나, 같은 소프트웨어가
+다른 폴더에 또 있을 때 같은 질의를 AI에 다시 보내지 않는다.
+
+- 키: 정규화 이름 + 버전 + 제공자/모델 + 프롬프트 해시의 SHA-256
+  (원본 파일명/폴더명은 키에 넣지 않음 - 다른 폴더의 같은 소프트웨어도 적중)
+- ai_error가 있거나 기본(폴백) 메타데이터인 결과는 저장하지 않음
+- AI_METADATA_CACHE_TTL_DAYS가 지난 항목은 조회 시 삭제
+- AI_METADATA_CACHE_MAX_ENTRIES를 넘으면 가장 오래 사용되지 않은 항목부터 삭제
+  (COUNT는 저장 AI_METADATA_CACHE_EVICT_INTERVAL번마다 한 번만 실행)
+
+생성기에는 DB 세션이 없으므로 조회/저장마다 짧은 세션을 따로 연다.
+DB 조회가 이벤트 루프를 막지 않도록 비동기 코드에서는 aget()/aput()으로 작업 스레드에서 실행한다.
+"""
+import copy
+import asyncio
+import hashlib
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+
+from app.database import SessionLocal
+from app.models.metadata_cache import MetadataCache
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def build_cache_key(software_name: str, version: str, provider: str, model: str, prompt_hash: str) -> str:
+    """
+    캐시 키 생성
+
+    Args:
+        software_name: 정규화된 소프트웨어 이름
+        version: 버전/연도 ("버전|연도")
+        provider: AI 제공자
+        model: AI 모델명
+        prompt_hash: 프롬프트(템플릿) 해시
+    """
+    return hash_text("\x1f".join([software_name, version or "", provider or "", model or "", prompt_hash or ""]))
+
+
+class AIMetadataCacheStore:
+    """metadata_cache 테이블 기반 AI 메타데이터 캐시"""
+
+    def __init__(self):
+        # 프로세스 시작 이후 조회 통계 (관리자 화면용)
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evicted": 0}
+        # 마지막 최대 항목 수 확인 이후 저장 횟수 (작업 스레드에서 동시에 저장할 수 있어 잠금 사용)
+        self._puts_since_evict = 0
+        self._evict_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return settings.AI_METADATA_CACHE_ENABLED
+
+    def _expired_before(self) -> datetime:
+        return datetime.utcnow() - timedelta(days=settings.AI_METADATA_CACHE_TTL_DAYS)
+
+    async def aget(self, cache_key: str) -> Optional[Dict]:
+        """get()을 작업 스레드에서 실행 (비동기 코드용)"""
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get, cache_key)
+
+    async def aput(self, cache_key: str, metadata: Dict, **fields):
+        """put()을 작업 스레드에서 실행 (비동기 코드용)"""
+        if not self.enabled:
+            return
+        await asyncio.to_thread(self.put, cache_key, metadata, **fields)
+
+    def get(self, cache_key: str) -> Optional[Dict]:
+        """캐시된 메타데이터 (없거나 만료됐으면 None, 적중 시 hit_count 증가)"""
+        if not self.enabled:
+            return None
+
+        db = SessionLocal()
+        try:
+            entry = db.query(MetadataCache).filter(MetadataCache.cache_key == cache_key).first()
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            if entry.updated_at < self._expired_before():
+                db.delete(entry)
+                db.commit()
+                self.stats["misses"] += 1
+                self.stats["evicted"] += 1
+                return None
+
+            entry.hit_count = (entry.hit_count or 0) + 1
+            entry.last_hit_at = datetime.utcnow()
+            metadata = copy.deepcopy(entry.metadata_json)
+            db.commit()
+            self.stats["hits"] += 1
+            return metadata
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"AI metadata cache lookup failed: {e}")
+            return None
+        finally:
+            db.close()
+
+    def put(
+        self,
+        cache_key: str,
+        metadata: Dict,
+        software_name: str,
+        version: str,
+        provider: str,
+        model: str,
+        prompt_hash: str,
+        source: str = "ai",
+        confidence_score: float = 0.0
+    ):
+        """메타데이터 저장 (같은 키가 있으면 덮어씀)"""
+        if not self.enabled:
+            return
+
+        db = SessionLocal()
+        try:
+            values = {
+                "software_name": software_name,
+                "version": version,
+                "provider": provider,
+                "model": model,
+                "prompt_hash": prompt_hash,
+                "metadata_json": metadata,
+                "source": source,
+                "confidence_score": confidence_score,
+                "updated_at": datetime.utcnow(),
+            }
+            entry = db.query(MetadataCache).filter(MetadataCache.cache_key == cache_key).first()
+            if entry is None:
+                db.add(MetadataCache(cache_key=cache_key, hit_count=0, **values))
+            else:
+                for field, value in values.items():
+                    setattr(entry, field, value)
+            try:
+                db.commit()
+            except IntegrityError:
+                # 다른 요청이 같은 키를 먼저 저장한 경우 → 그 행을 갱신
+                db.rollback()
+                db.query(MetadataCache).filter(MetadataCache.cache_key == cache_key).update(values)
+                db.commit()
+
+            self.stats["stores"] += 1
+            if self._evict_due():
+                self._evict_overflow(db)
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"AI metadata cache store failed: {e}")
+        finally:
+            db.close()
+
+    def _evict_due(self) -> bool:
+        """저장 AI_METADATA_CACHE_EVICT_INTERVAL번마다 True (최대 항목 수를 그만큼 넘을 수 있음)"""
+        with self._evict_lock:
+            self._puts_since_evict += 1
+            if self._puts_since_evict < max(1, settings.AI_METADATA_CACHE_EVICT_INTERVAL):
+                return False
+            self._puts_since_evict = 0
+            return True
+
+    def _evict_overflow(self, db):
+        """최대 항목 수를 넘은 만큼 가장 오래 사용되지 않은 항목부터 삭제"""
+        overflow = db.query(func.count(MetadataCache.id)).scalar() - settings.AI_METADATA_CACHE_MAX_ENTRIES
+        if overflow <= 0:
+            return
+
+        last_used = func.coalesce(MetadataCache.last_hit_at, MetadataCache.updated_at)
+        ids = [
+            row[0] for row in
+            db.query(MetadataCache.id).order_by(last_used.asc(), MetadataCache.id.asc()).limit(overflow).all()
+        ]
+        db.query(MetadataCache).filter(MetadataCache.id.in_(ids)).delete(synchronize_session=False)
+        db.commit()
+        self.stats["evicted"] += len(ids)
+        logger.info(f"AI metadata cache evicted {len(ids)} least recently used entries")
+
+    # ------------------------------------------------------------------
+    # 관리자 조회 / 삭제
+    # ------------------------------------------------------------------
+
+    def summary(self, db) -> Dict:
+        """저장된 항목 통계"""
+        total, hits = db.query(func.count(MetadataCache.id), func.coalesce(func.sum(MetadataCache.hit_count), 0)).one()
+        expired = db.query(func.count(MetadataCache.id)).filter(
+            MetadataCache.updated_at < self._expired_before()
+        ).scalar()
+        by_provider = {
+            f"{provider or 'unknown'}/{model or 'unknown'}": count
+            for provider, model, count in db.query(
+                MetadataCache.provider, MetadataCache.model, func.count(MetadataCache.id)
+            ).group_by(MetadataCache.provider, MetadataCache.model).all()
+        }
+        return {
+            "enabled": self.enabled,
+            "entries": total,
+            "total_hits": int(hits),
+            "expired_entries": expired,
+            "ttl_days": settings.AI_METADATA_CACHE_TTL_DAYS,
+            "max_entries": settings.AI_METADATA_CACHE_MAX_ENTRIES,
+            "by_model": by_provider,
+            "process_stats": dict(self.stats),
+        }
+
+    def list_entries(
+        self,
+        db,
+        search: Optional[str] = None,
+        provider: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 50
+    ) -> Dict:
+        """항목 목록 (메타데이터 본문 제외, 최근 사용 순)"""
+        query = db.query(MetadataCache)
+        if search:
+            query = query.filter(MetadataCache.software_name.ilike(f"%{search}%"))
+        if provider:
+            query = query.filter(MetadataCache.provider == provider)
+
+        total = query.count()
+        last_used = func.coalesce(MetadataCache.last_hit_at, MetadataCache.updated_at)
+        entries: List[MetadataCache] = query.order_by(last_used.desc()).offset(skip).limit(limit).all()
+        expired_before = self._expired_before()
+        return {
+            "total": total,
+            "items": [
+                {
+                    "id": entry.id,
+                    "software_name": entry.software_name,
+                    "version": entry.version,
+                    "provider": entry.provider,
+                    "model": entry.model,
+                    "source": entry.source,
+                    "title": (entry.metadata_json or {}).get("title"),
+                    "confidence_score": entry.confidence_score,
+                    "hit_count": entry.hit_count,
+                    "created_at": entry.created_at,
+                    "updated_at": entry.updated_at,
+                    "last_hit_at": entry.last_hit_at,
+                    "expired": entry.updated_at < expired_before,
+                }
+                for entry in entries
+            ],
+        }
+
+    def purge(
+        self,
+        db,
+        expired_only: bool = False,
+        provider: Optional[str] = None,
+        software_name: Optional[str] = None
+    ) -> int:
+        """조건에 맞는 항목 삭제 (조건이 없으면 전체), 삭제된 개수 반환"""
+        query = db.query(MetadataCache)
+        if expired_only:
+            query = query.filter(MetadataCache.updated_at < self._expired_before())
+        if provider:
+            query = query.filter(MetadataCache.provider == provider)
+        if software_name:
+            query = query.filter(MetadataCache.software_name == software_name)
+        deleted = query.delete(synchronize_session=False)
+        db.commit()
+        return deleted
+
+
+# 전역 캐시 인스턴스
+ai_metadata_cache = AIMetadataCacheStore()
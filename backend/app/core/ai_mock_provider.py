@@ -0,0 +1,222 @@
+"""
+오프라인 모의(mock) AI 제공자
+
+실제 API 키나 네트워크 없이 match_violations_to_products와 /api/metadata/* 경로의
+처리량, 속도 제한, 재시도 동작을 측정/회귀 테스트하기 위한 가짜 LLM.
+AI_MOCK_PROVIDER_ENABLED가 켜져 있을 때 메타데이터 설정의 aiProvider를 "mock"으로
+지정하면 AIMetadataGeneratorV2가 HTTP 요청 대신 이 모듈을 호출한다.
+
+- 응답: 같은 입력이면 항상 같은 메타데이터 (_fallback_metadata와 같은 스키마, 값은 이름 해시로 결정)
+- 지연 시간: AI_MOCK_LATENCY_DISTRIBUTION (fixed / uniform / lognormal)
+- 오류: AI_MOCK_*_ERROR_RATE 확률로 429(rate_limit), 402(insufficient_quota), 500(server_error)
+- 서버 측 한도: AI_MOCK_SERVER_RPM/TPM을 넘으면 429 (최근 60초 기준, 0이면 제한 없음)
+- 토큰 수: AI_MOCK_PROMPT_TOKENS(0이면 프롬프트 글자 수 / 4) + AI_MOCK_COMPLETION_TOKENS (통계에 누적)
+
+오류/지연 난수는 AI_MOCK_SEED로 초기화한 난수 생성기에서 뽑으므로 요청 순서가 같으면
+실행마다 같은 결과가 나온다 (동시 실행에서는 요청이 시작되는 순서에 따라 달라질 수 있음).
+"""
+import json
+import time
+import random
+import asyncio
+import hashlib
+import logging
+from collections import deque
+from typing import Callable, Dict, List, Tuple
+
+from app.config import settings
+from app.core.clarity_prefilter import score_filename_clarity, CLARITY_UNCLEAR
+
+logger = logging.getLogger(__name__)
+
+MOCK_PROVIDER = "mock"
+MOCK_MODEL = "mock-1"
+
+_CATEGORIES = ["Utility", "Graphics", "Development", "Office", "Multimedia", "Security", "Network", "System"]
+_LICENSES = ["Commercial", "Freeware", "Open Source", "Shareware", "Subscription"]
+_FORMATS = ["ZIP", "PDF", "PNG", "JPG", "MP4", "DOCX", "XLSX", "JSON", "XML", "ISO"]
+_FEATURES = [
+    "빠른 시작과 가벼운 리소스 사용",
+    "다국어 사용자 인터페이스",
+    "플러그인/확장 기능 지원",
+    "일괄 처리 및 자동화",
+    "클라우드 동기화",
+    "고해상도 디스플레이 지원",
+    "명령줄 인터페이스 제공",
+    "자동 업데이트",
+]
+
+
+class MockResponse:
+    """HTTP 응답 흉내 (status_code, text, 토큰 사용량)"""
+
+    def __init__(self, status_code: int, text: str, prompt_tokens: int = 0, completion_tokens: int = 0):
+        self.status_code = status_code
+        self.text = text
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+
+
+class MockLLMProvider:
+    """설정값에 따라 지연/오류/토큰 사용량을 흉내 내는 결정적 가짜 LLM"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """난수 생성기, 서버 측 한도 창, 통계 초기화 (벤치마크 실행마다 호출)"""
+        self._rng = random.Random(settings.AI_MOCK_SEED)
+        # 최근 60초 요청 (시각, 토큰 수)
+        self._window: deque = deque()
+        self.stats = {
+            "requests": 0,
+            "ok": 0,
+            "rate_limited": 0,
+            "quota_errors": 0,
+            "server_errors": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "latency_seconds": 0.0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return settings.AI_MOCK_PROVIDER_ENABLED
+
+    # ------------------------------------------------------------------
+    # 요청 흉내
+    # ------------------------------------------------------------------
+
+    def _latency(self) -> float:
+        """설정된 분포에서 지연 시간 (초)"""
+        base = max(settings.AI_MOCK_LATENCY_MS, 0.0) / 1000.0
+        spread = max(settings.AI_MOCK_LATENCY_SPREAD, 0.0)
+        distribution = settings.AI_MOCK_LATENCY_DISTRIBUTION.lower()
+        if distribution == "uniform":
+            return max(0.0, self._rng.uniform(base * (1 - spread), base * (1 + spread)))
+        if distribution == "lognormal":
+            # base는 중앙값, spread는 로그 표준편차
+            return self._rng.lognormvariate(0.0, spread) * base if base else 0.0
+        return base
+
+    def _over_server_limit(self, now: float, tokens: int) -> bool:
+        """최근 60초 요청/토큰이 서버 측 한도를 넘는지 (넘지 않으면 이번 요청을 창에 기록)"""
+        while self._window and now - self._window[0][0] >= 60.0:
+            self._window.popleft()
+
+        rpm, tpm = settings.AI_MOCK_SERVER_RPM, settings.AI_MOCK_SERVER_TPM
+        if rpm and len(self._window) + 1 > rpm:
+            return True
+        if tpm and sum(used for _, used in self._window) + tokens > tpm:
+            return True
+        self._window.append((now, tokens))
+        return False
+
+    async def complete(self, prompt: str, build_body: Callable[[], str]) -> MockResponse:
+        """
+        요청 하나를 흉내 낸다 (지연 후 응답 또는 오류)
+
+        Args:
+            prompt: 요청 프롬프트 (토큰 수 계산용)
+            build_body: 정상 응답 본문을 만드는 함수
+        """
+        prompt_tokens = settings.AI_MOCK_PROMPT_TOKENS or max(1, len(prompt or "") // 4)
+        completion_tokens = max(0, settings.AI_MOCK_COMPLETION_TOKENS)
+
+        # 오류 여부와 지연 시간은 요청을 받는 시점에 정한다 (완료 순서와 무관하게 요청 순서로 결정)
+        roll = self._rng.random()
+        latency = self._latency()
+        over_limit = self._over_server_limit(time.monotonic(), prompt_tokens + completion_tokens)
+
+        self.stats["requests"] += 1
+        self.stats["latency_seconds"] += latency
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        rate_limit = settings.AI_MOCK_RATE_LIMIT_ERROR_RATE
+        quota = settings.AI_MOCK_QUOTA_ERROR_RATE
+        server = settings.AI_MOCK_SERVER_ERROR_RATE
+        if over_limit or roll < rate_limit:
+            self.stats["rate_limited"] += 1
+            return MockResponse(429, json.dumps({"error": {
+                "type": "rate_limit_exceeded", "message": "Mock rate limit exceeded"
+            }}))
+        if roll < rate_limit + quota:
+            self.stats["quota_errors"] += 1
+            return MockResponse(402, json.dumps({"error": {
+                "type": "insufficient_quota", "message": "Mock quota exhausted"
+            }}))
+        if roll < rate_limit + quota + server:
+            self.stats["server_errors"] += 1
+            return MockResponse(500, json.dumps({"error": {
+                "type": "server_error", "message": "Mock server error"
+            }}))
+
+        self.stats["ok"] += 1
+        self.stats["prompt_tokens"] += prompt_tokens
+        self.stats["completion_tokens"] += completion_tokens
+        return MockResponse(200, build_body(), prompt_tokens, completion_tokens)
+
+    # ------------------------------------------------------------------
+    # 결정적 응답 본문
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def detailed_metadata(parsed_info: Dict) -> Dict:
+        """파싱 결과로 만드는 상세 메타데이터 (같은 이름/버전이면 항상 같은 값)"""
+        software_name = parsed_info.get('software_name') or 'Unknown'
+        version = parsed_info.get('version') or ''
+        year = parsed_info.get('year') or ''
+        digest = hashlib.sha256(f"{software_name}|{version}|{year}".encode("utf-8")).digest()
+
+        developer = parsed_info.get('vendor') or software_name.split()[0]
+        features = [_FEATURES[(digest[i] + i) % len(_FEATURES)] for i in range(3 + digest[0] % 3)]
+        formats = [_FORMATS[(digest[8 + i] + i) % len(_FORMATS)] for i in range(2 + digest[1] % 3)]
+
+        return {
+            'title': software_name,
+            'subtitle': f"{developer} {_CATEGORIES[digest[2] % len(_CATEGORIES)]} 소프트웨어",
+            'version': version,
+            'release_year': year,
+            'platform': 'Windows',
+            'developer': developer,
+            'category': _CATEGORIES[digest[2] % len(_CATEGORIES)],
+            'official_website': f"https://example.com/{digest.hex()[:12]}",
+            'license_type': _LICENSES[digest[3] % len(_LICENSES)],
+            'language': '다국어',
+            'description_short': f"{software_name} - 모의 제공자가 생성한 설명",
+            'description_detailed': f"{software_name}{f' {version}' if version else ''}에 대한 모의 상세 설명입니다.",
+            'features': list(dict.fromkeys(features)),
+            'supported_formats': list(dict.fromkeys(formats)),
+            'system_requirements': {
+                'os': 'Windows 10 이상',
+                'cpu': f"{2 + digest[4] % 3}GHz 이상",
+                'ram': f"{4 * (1 + digest[5] % 4)}GB",
+                'disk_space': f"{1 + digest[6] % 20}GB",
+                'gpu': '',
+                'additional': ''
+            },
+            'installation_info': {
+                'installer_type': 'exe',
+                'file_size': f"{50 + digest[7]}MB",
+                'internet_required': 'No'
+            },
+            'release_notes': ''
+        }
+
+    @staticmethod
+    def clarity_answer(items: List[Tuple[str, str]]) -> str:
+        """묶음 명확성 판단 응답 (로컬 규칙에서 unclear인 항목만 UNCLEAR)"""
+        return json.dumps([
+            {
+                "id": index,
+                "verdict": "UNCLEAR"
+                if score_filename_clarity(filename, parent_folder)["verdict"] == CLARITY_UNCLEAR
+                else "CLEAR",
+            }
+            for index, (filename, parent_folder) in enumerate(items, 1)
+        ])
+
+
+# 전역 모의 제공자 인스턴스
+mock_llm = MockLLMProvider()
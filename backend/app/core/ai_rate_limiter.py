@@ -0,0 +1,108 @@
+"""
+AI 제공자별 호출 속도 제한
+
+자동 매칭은 여러 폴더의 AI 메타데이터를 동시에 생성한다. 제공자(openai/gemini/claude)마다
+분당 요청 수(RPM)와 분당 토큰 수(TPM) 한도가 있으므로, 제공자별 토큰 버킷 두 개를
+모두 통과해야 요청을 보낸다. 429(rate_limit)를 받으면 지터가 들어간 지수 백오프만큼
+같은 제공자의 모든 요청을 잠시 멈춘다.
+
+- 버킷은 프로세스 안에서 제공자별로 하나씩 공유 (동시에 실행되는 매칭 작업끼리도 한도 공유)
+- 응답의 실제 토큰 사용량은 알 수 없으므로 요청 종류별 예상 토큰 수로 차감
+- 단일 이벤트 루프 안에서 확인과 차감 사이에 await가 없으므로 별도 잠금이 필요 없음
+"""
+import time
+import random
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """분당 refill_per_minute만큼 채워지는 토큰 버킷 (최대 capacity)"""
+
+    def __init__(self, refill_per_minute: float, capacity: Optional[float] = None):
+        self.rate = max(refill_per_minute, 1e-6) / 60.0
+        self.capacity = capacity if capacity is not None else max(refill_per_minute, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount만큼 꺼내려면 기다려야 하는 시간 (초, 0이면 바로 가능)"""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float):
+        self.tokens -= min(amount, self.capacity)
+
+
+class ProviderRateLimiter:
+    """한 AI 제공자의 RPM/TPM 버킷과 429 백오프 상태"""
+
+    def __init__(self, provider: str, requests_per_minute: int, tokens_per_minute: int):
+        self.provider = provider
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self._paused_until = 0.0
+        self.stats = {"acquired": 0, "waited_seconds": 0.0, "rate_limited": 0}
+
+    async def acquire(self, estimated_tokens: int = 0):
+        """요청 1건 + estimated_tokens 토큰을 쓸 수 있을 때까지 대기 후 차감"""
+        started = time.monotonic()
+        while True:
+            now = time.monotonic()
+            wait = max(
+                self._paused_until - now,
+                self.requests.wait_time(1, now),
+                self.tokens.wait_time(estimated_tokens, now),
+            )
+            if wait <= 0:
+                self.requests.consume(1)
+                self.tokens.consume(estimated_tokens)
+                self.stats["acquired"] += 1
+                self.stats["waited_seconds"] += now - started
+                return
+            await asyncio.sleep(wait)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        429 응답 후 재시도까지 기다릴 시간 (지수 백오프 + 지터)
+        같은 제공자의 다른 요청도 이 시간 동안 보내지 않는다.
+
+        Args:
+            attempt: 0부터 시작하는 재시도 횟수
+        """
+        ceiling = min(
+            settings.AI_RATE_LIMIT_BACKOFF_MAX_SECONDS,
+            settings.AI_RATE_LIMIT_BACKOFF_SECONDS * (2 ** attempt),
+        )
+        delay = random.uniform(ceiling / 2, ceiling)
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        self.stats["rate_limited"] += 1
+        return delay
+
+
+# 제공자 → 속도 제한기 (프로세스 전역)
+_limiters: Dict[str, ProviderRateLimiter] = {}
+
+
+def get_rate_limiter(provider: str) -> ProviderRateLimiter:
+    """제공자별 속도 제한기 (처음 요청 시 설정값으로 생성)"""
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        rpm, tpm = settings.get_ai_rate_limits().get(
+            provider, (settings.AI_RATE_LIMIT_RPM, settings.AI_RATE_LIMIT_TPM)
+        )
+        limiter = _limiters[provider] = ProviderRateLimiter(provider, rpm, tpm)
+        logger.info(f"AI rate limiter created: {provider} ({rpm} req/min, {tpm} tokens/min)")
+    return limiter
@@ -0,0 +1,208 @@
+"""
+AI 제공자 HTTP 전송 계층
+
+AIMetadataGeneratorV2는 예전에 요청마다 httpx.AsyncClient를 새로 만들어서
+LLM 호출마다 TCP + TLS 핸드셰이크를 다시 했다. 이 모듈은 제공자 base URL
+(scheme + host)마다 오래 유지되는 AsyncClient 하나를 두고 연결을 재사용한다.
+
+- keep-alive 연결 풀, 연결 수/유지 시간/연결 타임아웃은 AI_HTTP_* 설정
+- h2 패키지가 설치되어 있고 AI_HTTP2_ENABLED면 HTTP/2 사용 (OpenAI/Gemini/Claude 모두 지원)
+- 읽기 타임아웃은 호출마다 지정 (메타데이터 60초, 판단/연결 테스트 30초 등 기존 값 유지)
+- 호출마다 지연 시간을 add_latency_hook()으로 등록한 콜백에 전달
+  (앱은 시작 시 log_slow_request를 등록, host별 누적 통계는 stats() → 관리자 메타데이터 캐시 API)
+- 앱 시작/종료 이벤트에서 start()/aclose() (스크립트 등 앱 밖에서는 처음 사용할 때 생성)
+
+AsyncClient는 생성된 이벤트 루프에 묶이므로, 다른 루프에서 사용하면 클라이언트를 새로 만든다.
+"""
+import time
+import asyncio
+import logging
+import importlib.util
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class _TransportSession:
+    """기존 `async with httpx.AsyncClient(timeout=...) as client:` 블록을 대신하는 핸들"""
+
+    def __init__(self, transport: "AIHttpTransport", timeout: float):
+        self._transport = transport
+        self._timeout = timeout
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self._transport.request("POST", url, timeout=self._timeout, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self._transport.request("GET", url, timeout=self._timeout, **kwargs)
+
+
+class AIHttpTransport:
+    """제공자 base URL별 공유 AsyncClient 풀"""
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._latency_hooks: List[Callable[[Dict], None]] = []
+        # host → {"requests", "errors", "total_seconds", "max_seconds"}
+        self._stats: Dict[str, Dict] = {}
+
+    def _new_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=settings.AI_HTTP2_ENABLED and _H2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=settings.AI_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.AI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.AI_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            timeout=httpx.Timeout(60.0, connect=settings.AI_HTTP_CONNECT_TIMEOUT_SECONDS),
+        )
+
+    def _client_for(self, url: httpx.URL) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # 이전 루프의 클라이언트는 그 루프와 함께 정리되므로 참조만 버린다
+            self._clients = {}
+            self._loop = loop
+
+        base_url = f"{url.scheme}://{url.netloc.decode('ascii')}"
+        client = self._clients.get(base_url)
+        if client is None or client.is_closed:
+            client = self._clients[base_url] = self._new_client()
+            logger.debug(f"AI HTTP client created: {base_url} (http2={settings.AI_HTTP2_ENABLED and _H2_AVAILABLE})")
+        return client
+
+    async def request(self, method: str, url: str, timeout: float = 60.0, **kwargs) -> httpx.Response:
+        """공유 클라이언트로 요청 (timeout은 읽기/쓰기/풀 대기 시간, 연결 타임아웃은 설정값)"""
+        parsed = httpx.URL(url)
+        client = self._client_for(parsed)
+        started = time.perf_counter()
+        status_code = None
+        error = None
+        try:
+            response = await client.request(
+                method, parsed,
+                timeout=httpx.Timeout(timeout, connect=settings.AI_HTTP_CONNECT_TIMEOUT_SECONDS),
+                **kwargs
+            )
+            status_code = response.status_code
+            return response
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._record(method, parsed, status_code, time.perf_counter() - started, error)
+
+    @asynccontextmanager
+    async def session(self, timeout: float = 60.0):
+        """
+        호출 단위 핸들 (블록을 벗어나도 연결은 닫지 않고 풀에 남김)
+
+        Args:
+            timeout: 이 블록 안의 요청에 적용할 타임아웃 (초)
+        """
+        yield _TransportSession(self, timeout)
+
+    # ------------------------------------------------------------------
+    # 지연 시간 훅 / 통계
+    # ------------------------------------------------------------------
+
+    def add_latency_hook(self, hook: Callable[[Dict], None]):
+        """
+        요청이 끝날 때마다 호출될 콜백 등록
+
+        콜백 인자: {"host", "path", "method", "status_code", "elapsed", "error"}
+        (Gemini처럼 쿼리 문자열에 API 키가 들어가는 경우가 있어 URL 전체는 전달하지 않음)
+        """
+        self._latency_hooks.append(hook)
+
+    def remove_latency_hook(self, hook: Callable[[Dict], None]):
+        if hook in self._latency_hooks:
+            self._latency_hooks.remove(hook)
+
+    def _record(self, method: str, url: httpx.URL, status_code: Optional[int], elapsed: float, error: Optional[Exception]):
+        host = url.host
+        stats = self._stats.setdefault(host, {"requests": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+        stats["requests"] += 1
+        stats["total_seconds"] += elapsed
+        stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+        if error is not None or (status_code is not None and status_code >= 400):
+            stats["errors"] += 1
+
+        if not self._latency_hooks:
+            return
+        event = {
+            "host": host,
+            "path": url.path,
+            "method": method,
+            "status_code": status_code,
+            "elapsed": elapsed,
+            "error": type(error).__name__ if error is not None else None,
+        }
+        for hook in list(self._latency_hooks):
+            try:
+                hook(event)
+            except Exception as e:
+                logger.debug(f"AI latency hook failed: {e}")
+
+    def stats(self) -> Dict:
+        """연결 풀 설정, 열려 있는 클라이언트, host별 요청 수/오류 수/평균·최대 지연 시간 (관리자 통계용)"""
+        return {
+            "http2": settings.AI_HTTP2_ENABLED and _H2_AVAILABLE,
+            "max_connections": settings.AI_HTTP_MAX_CONNECTIONS,
+            "max_keepalive_connections": settings.AI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            "keepalive_expiry_seconds": settings.AI_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            "clients": sorted(base_url for base_url, client in self._clients.items() if not client.is_closed),
+            "hosts": {
+                host: {
+                    **values,
+                    "avg_seconds": values["total_seconds"] / values["requests"] if values["requests"] else 0.0,
+                }
+                for host, values in self._stats.items()
+            },
+        }
+
+    # ------------------------------------------------------------------
+    # 수명 관리 (main.py 시작/종료 이벤트)
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        """앱 시작 시 현재 이벤트 루프에 연결 (클라이언트는 처음 요청할 때 생성)"""
+        self._loop = asyncio.get_running_loop()
+        self._clients = {}
+        logger.info(
+            f"AI HTTP transport ready (http2={'on' if settings.AI_HTTP2_ENABLED and _H2_AVAILABLE else 'off'}, "
+            f"max_connections={settings.AI_HTTP_MAX_CONNECTIONS})"
+        )
+
+    async def aclose(self):
+        """앱 종료 시 모든 연결 닫기"""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"AI HTTP client close failed: {e}")
+
+
+def log_slow_request(event: Dict):
+    """지연 시간 훅: AI_HTTP_SLOW_REQUEST_SECONDS보다 오래 걸린 요청은 경고, 나머지는 debug 로그"""
+    message = (
+        f"AI HTTP {event['method']} {event['host']}{event['path']} → "
+        f"{event['status_code'] or event['error']} in {event['elapsed']:.2f}s"
+    )
+    if 0 < settings.AI_HTTP_SLOW_REQUEST_SECONDS <= event["elapsed"]:
+        logger.warning(f"Slow {message}")
+    else:
+        logger.debug(message)
+
+
+# 전역 전송 계층 인스턴스
+ai_transport = AIHttpTransport()
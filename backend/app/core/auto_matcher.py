@@ -15,7 +15,12 @@ from app.models.product import Product
 from app.models.version import Version
 from app.core.ai_metadata import AIMetadataGeneratorV2 as AIMetadataGenerator
 from app.core.parser import FilenameParser
-from app.core.redis_cache import invalidate_cache
+from app.core.redis_cache import ainvalidate_cache
+from app.core.ai_rate_limiter import ProviderRateLimiter, get_rate_limiter
+from app.core.clarity_prefilter import CLARITY_ASK_AI, CLARITY_CLEAR, CLARITY_UNCLEAR, prefilter_clarity
+from app.core.dir_walker import content_fingerprint
+from app.core.similarity_index import normalize_title, product_similarity_index
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -99,31 +104,6 @@ def get_product_version_signature(product: Product) -> Optional[str]:
     return None
 
 
-def normalize_title(title: str) -> str:
-    """
-    제품 타이틀을 정규화하여 비교 가능하도록 만듦
-
-    Args:
-        title: 원본 타이틀
-
-    Returns:
-        정규화된 타이틀 (소문자, 불필요한 공백/특수문자 제거)
-    """
-    if not title:
-        return ""
-
-    # 소문자 변환
-    normalized = title.lower()
-
-    # 특수문자 제거 (단어 구분을 위한 공백은 유지)
-    normalized = re.sub(r'[^\w\s가-힣]', ' ', normalized)
-
-    # 여러 공백을 하나로
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
-
-    return normalized
-
-
 def calculate_similarity(str1: str, str2: str) -> float:
     """
     두 문자열의 유사도 계산 (0.0 ~ 1.0)
@@ -162,13 +142,21 @@ def find_similar_product(
     # 입력 타이틀에서 버전/연도 추출
     title_version = extract_version_from_title(title)
 
-    # 모든 제품 가져오기 (추후 최적화 가능)
-    all_products = db.query(Product).all()
+    vendor_normalized = normalize_title(vendor) if vendor else None
+
+    # 후보 인덱스로 임계값에 도달할 수 있는 제품만 가져오기
+    # (제조사 일치 보너스 0.1을 받을 수 있으면 그만큼 낮은 유사도까지 후보에 포함)
+    min_ratio = similarity_threshold - 0.1 if vendor else similarity_threshold
+    candidate_ids = product_similarity_index.candidates(db, normalized_title, min_ratio)
+    if not candidate_ids:
+        return None
+
+    candidates = db.query(Product).filter(Product.id.in_(candidate_ids)).order_by(Product.id).all()
 
     best_match = None
     best_similarity = 0.0
 
-    for product in all_products:
+    for product in candidates:
         # 버전/연도 비교: 둘 다 버전이 있고, 같은 종류(연도 vs 연도, 점버전 vs
         # 점버전)인데 값이 다르면 다른 제품으로 판단. release_year 컬럼은 항상
         # 연도만 담고 있어 후보 쪽이 점버전("25.0")을 반환하면 종류가 달라지므로
@@ -189,7 +177,6 @@ def find_similar_product(
 
         # 제조사가 제공되고 일치하면 유사도 보너스
         if vendor and product.vendor:
-            vendor_normalized = normalize_title(vendor)
             product_vendor_normalized = normalize_title(product.vendor)
 
             if vendor_normalized == product_vendor_normalized:
@@ -207,6 +194,517 @@ def find_similar_product(
     return None
 
 
+def _plan_folder(
+    db: Session,
+    parser: FilenameParser,
+    folder_path: str,
+    provided_metadata: Optional[Dict]
+) -> dict:
+    """
+    폴더 하나의 매칭 대상 결정 (DB 조회만, AI 호출 없음)
+
+    Returns:
+        {
+            "product": 기존/유사 Product 또는 None (None이면 새 제품 생성 필요),
+            "existing": folder_path가 같은 기존 제품인지,
+            "is_duplicate", "duplicate_reason": 유사 제품으로 판단된 경우,
+            "folder_name", "software_name", "search_title"
+        }
+    """
+    plan = {
+        "product": None,
+        "existing": False,
+        "is_duplicate": False,
+        "duplicate_reason": None,
+        "folder_name": os.path.basename(folder_path),
+        "software_name": None,
+        "search_title": None,
+    }
+
+    # ===== 1단계: 기존 제품 확인 (AI 호출 전에 먼저 체크) =====
+    # folder_path로 정확한 매칭
+    existing_product = db.query(Product).filter(
+        Product.folder_path == folder_path
+    ).first()
+
+    if existing_product:
+        # 이미 등록된 폴더 → AI 호출 없이 Version만 추가
+        plan["product"] = existing_product
+        plan["existing"] = True
+        logger.info(f"기존 제품 발견 (folder_path): {existing_product.title} - {folder_path}")
+        return plan
+
+    # ===== 2단계: 폴더명 파싱 및 유사 제품 검색 (AI 호출 전) =====
+    parsed_info = parser.parse(plan["folder_name"])
+    software_name = parsed_info.get('software_name', plan["folder_name"])
+
+    # 연도/버전 정보를 소프트웨어명에 포함 (예: "MS Office" → "MS Office 2003")
+    # 버전별 제품 구분을 위해 필수 (Office 2003 vs Office 2007 등)
+    if parsed_info.get('year'):
+        year = parsed_info['year']
+        if year not in software_name:
+            software_name = f"{software_name} {year}"
+
+    # 유사 제품 검색 (자동/수동 매칭 모두 적용)
+    search_title = software_name
+    if provided_metadata and provided_metadata.get('title'):
+        search_title = provided_metadata['title']
+
+    plan["software_name"] = software_name
+    plan["search_title"] = search_title
+    _apply_similar_product(db, plan, provided_metadata)
+    return plan
+
+
+def _apply_similar_product(db: Session, plan: dict, provided_metadata: Optional[Dict]):
+    """유사 제품이 있으면 plan을 중복(기존 제품에 Version만 추가)으로 표시"""
+    similar_product = find_similar_product(
+        db,
+        plan["search_title"],
+        provided_metadata.get('vendor') if provided_metadata else None
+    )
+
+    if similar_product:
+        # 유사 제품 발견 → AI 호출 없이 Version만 추가
+        plan["product"] = similar_product
+        plan["is_duplicate"] = True
+        plan["duplicate_reason"] = f"'{similar_product.title}' 제품과 유사하여 중복으로 판단되었습니다."
+        logger.info(f"유사 제품 발견: {plan['search_title']} → {similar_product.title}")
+
+
+def _map_ai_metadata(ai_metadata: Dict) -> Dict:
+    """AI 메타데이터 필드명 → Product 모델 필드명 매핑"""
+    return {
+        **ai_metadata,
+        # AI: description_short → Product: description
+        'description': ai_metadata.get('description_short') or ai_metadata.get('description', ''),
+        # AI: developer → Product: vendor
+        'vendor': ai_metadata.get('developer') or ai_metadata.get('vendor', ''),
+        # AI: description_detailed → Product: detailed_description
+        'detailed_description': ai_metadata.get('description_detailed') or ai_metadata.get('detailed_description')
+    }
+
+
+def _write_folder(
+    db: Session,
+    parser: FilenameParser,
+    results: dict,
+    folder_path: str,
+    violations_list: List[FilenameViolation],
+    plan: dict,
+    metadata: Optional[Dict],
+    provided_metadata: Optional[Dict]
+):
+    """
+    폴더 하나의 Product/Version 생성 및 커밋 (DB 쓰기는 이 함수에서만)
+
+    Args:
+        plan: _plan_folder() 결과
+        metadata: 새 제품 생성에 쓸 메타데이터 (plan["product"]가 None일 때)
+        provided_metadata: 수동 매칭의 사용자 제공 메타데이터
+    """
+    try:
+        product = plan["product"]
+        software_name = plan["software_name"]
+
+        if product is None:
+            # ===== 5단계: 새 Product 생성 =====
+            # 포터블 여부 감지 (parser의 포괄적 키워드 사용)
+            is_portable = False
+            if violations_list:
+                first_filename = violations_list[0].file_name
+                is_portable = FilenameParser._is_portable(first_filename, folder_path)
+
+            # release_year: AI가 응답한 release_year 필드를 최우선으로 쓰고,
+            # 없거나 형식이 잘못됐으면 title → folder_path 정규식 추출로 폴백
+            final_title = metadata.get('title', software_name)
+            release_year = (
+                FilenameParser.parse_ai_release_year(metadata.get('release_year'))
+                or FilenameParser.extract_release_year(final_title, folder_path)
+            )
+
+            if provided_metadata:
+                # 사용자 제공 메타데이터로 생성 (상세 필드 포함)
+                product = Product(
+                    title=metadata.get('title', software_name),
+                    subtitle=metadata.get('subtitle'),
+                    description=metadata.get('description', f"{software_name} 소프트웨어"),
+                    vendor=metadata.get('vendor', ''),
+                    category=metadata.get('category', 'Utility'),
+                    official_website=metadata.get('official_website'),
+                    license_type=metadata.get('license_type'),
+                    platform=metadata.get('platform'),
+                    detailed_description=metadata.get('detailed_description'),
+                    features=metadata.get('features'),
+                    system_requirements=metadata.get('system_requirements'),
+                    supported_formats=metadata.get('supported_formats'),
+                    installation_info=metadata.get('installation_info'),
+                    release_notes=metadata.get('release_notes'),
+                    release_date=metadata.get('release_date'),
+                    release_year=release_year,
+                    icon_url=metadata.get('icon_url', ''),
+                    screenshots=metadata.get('screenshots'),
+                    folder_path=folder_path,
+                    is_portable=is_portable
+                )
+            else:
+                # 자동 생성 메타데이터로 생성 (기본 필드만)
+                product = Product(
+                    title=metadata.get('title', software_name),
+                    description=metadata.get('description', f"{software_name} 소프트웨어"),
+                    vendor=metadata.get('vendor', ''),
+                    release_year=release_year,
+                    category=metadata.get('category', 'Utility'),
+                    icon_url=metadata.get('icon_url', ''),
+                    folder_path=folder_path,
+                    is_portable=is_portable
+                )
+
+            db.add(product)
+            db.flush()  # Get product ID
+
+        # 수동 매칭: 기존 제품(folder_path 일치, 비중복)의 메타데이터 업데이트
+        if plan["existing"] and provided_metadata and not plan["is_duplicate"]:
+            metadata = provided_metadata
+            if metadata.get('title'):
+                product.title = metadata['title']
+                if not product.release_year:
+                    product.release_year = (
+                        FilenameParser.parse_ai_release_year(metadata.get('release_year'))
+                        or FilenameParser.extract_release_year(product.title, product.folder_path)
+                    )
+            if metadata.get('subtitle'):
+                product.subtitle = metadata['subtitle']
+            if metadata.get('description'):
+                product.description = metadata['description']
+            if metadata.get('vendor'):
+                product.vendor = metadata['vendor']
+            if metadata.get('category'):
+                product.category = metadata['category']
+            if metadata.get('official_website'):
+                product.official_website = metadata['official_website']
+            if metadata.get('license_type'):
+                product.license_type = metadata['license_type']
+            if metadata.get('platform'):
+                product.platform = metadata['platform']
+            if metadata.get('detailed_description'):
+                product.detailed_description = metadata['detailed_description']
+            if metadata.get('features'):
+                product.features = metadata['features']
+            if metadata.get('system_requirements'):
+                product.system_requirements = metadata['system_requirements']
+            if metadata.get('supported_formats'):
+                product.supported_formats = metadata['supported_formats']
+            if metadata.get('installation_info'):
+                product.installation_info = metadata['installation_info']
+            if metadata.get('release_notes'):
+                product.release_notes = metadata['release_notes']
+            if metadata.get('release_date'):
+                product.release_date = metadata['release_date']
+            if metadata.get('icon_url'):
+                product.icon_url = metadata['icon_url']
+            if metadata.get('screenshots'):
+                product.screenshots = metadata['screenshots']
+
+        # Version 생성
+        matched = 0
+        for violation in violations_list:
+            file_path_str = os.path.join(violation.folder_path, violation.file_name)
+
+            # 이미 Version이 있는지 확인
+            existing_version = db.query(Version).filter(
+                Version.file_path == file_path_str
+            ).first()
+
+            if not existing_version:
+                # Version 생성
+                parsed = parser.parse(violation.file_name)
+                version_name = parsed.get('version', 'Unknown')
+                version_portable = FilenameParser._is_portable(violation.file_name, file_path_str)
+
+                # 파일 크기 가져오기 (+ 파일명 변경 감지용 내용 지문)
+                file_size = 0
+                fingerprint = None
+                if os.path.exists(file_path_str):
+                    file_size = os.path.getsize(file_path_str)
+                    if settings.SCAN_RENAME_FINGERPRINT:
+                        fingerprint = content_fingerprint(file_path_str)
+
+                version = Version(
+                    product_id=product.id,
+                    file_name=violation.file_name,
+                    file_path=file_path_str,
+                    file_size=file_size,
+                    content_fingerprint=fingerprint,
+                    version_name=version_name,
+                    is_portable=version_portable
+                )
+
+                db.add(version)
+                db.flush()  # Get version ID
+
+                # Violation에 매칭 정보 저장
+                violation.product_id = product.id
+                violation.version_id = version.id
+            else:
+                # 기존 Version이 있으면 해당 정보 연결
+                violation.product_id = existing_version.product_id
+                violation.version_id = existing_version.id
+
+            # Violation을 해결됨으로 표시
+            violation.is_resolved = True
+            matched += 1
+
+        db.commit()
+        db.refresh(product)
+        results["matched"] += matched
+
+        # 생성/업데이트된 Product 정보 추가
+        product_info = {
+            "id": product.id,
+            "title": product.title,
+            "description": product.description,
+            "vendor": product.vendor,
+            "category": product.category,
+            "icon_url": product.icon_url,
+            "folder_path": product.folder_path
+        }
+
+        results["products"].append(product_info)
+
+        # 중복 제품인 경우 duplicates에도 추가
+        if plan["is_duplicate"]:
+            results["duplicates"].append({
+                **product_info,
+                "reason": plan["duplicate_reason"],
+                "original_folder": folder_path
+            })
+
+    except Exception as e:
+        db.rollback()
+        results["failed"] += len(violations_list)
+        results["errors"].append(f"Failed to process {folder_path}: {str(e)}")
+
+
+async def _generate_metadata_with_retry(
+    generator: AIMetadataGenerator,
+    limiter: ProviderRateLimiter,
+    software_name: str
+) -> Dict:
+    """
+    속도 제한을 지키며 AI 메타데이터 생성, rate_limit(429) 응답은 백오프 후 재시도
+    (메타데이터 캐시에서 바로 답한 폴더는 한도를 소모하지 않음)
+
+    Returns:
+        generate_detailed_metadata() 결과 (재시도를 모두 써도 429면 마지막 ai_error 포함 결과)
+    """
+    max_retries = max(0, settings.AI_RATE_LIMIT_MAX_RETRIES)
+    for attempt in range(max_retries + 1):
+        # 캐시 적중 시에는 요청/토큰 한도를 쓰지 않도록 실제 AI 요청 직전에만 대기
+        ai_metadata = await generator.generate_detailed_metadata(
+            software_name,
+            before_request=lambda: limiter.acquire(settings.AI_METADATA_TOKEN_ESTIMATE)
+        )
+
+        error = ai_metadata.get('ai_error') or {}
+        if error.get('type') != 'rate_limit' or attempt == max_retries:
+            return ai_metadata
+
+        delay = limiter.backoff(attempt)
+        logger.info(
+            f"AI rate limited ({limiter.provider}) for '{software_name}', "
+            f"retry {attempt + 1}/{max_retries} in {delay:.1f}s"
+        )
+        await asyncio.sleep(delay)
+
+
+async def _filter_clear_jobs(
+    generator: AIMetadataGenerator,
+    limiter: ProviderRateLimiter,
+    semaphore: asyncio.Semaphore,
+    results: dict,
+    jobs: list
+) -> list:
+    """
+    대기 중인 폴더들의 대표 파일명 명확성을 판단해 명확한 폴더만 반환
+
+    - 로컬 규칙(clarity_prefilter)으로 분명한 폴더는 AI 없이 clear/unclear 결정
+    - 나머지(ask_ai)만 AI_CLARITY_BATCH_SIZE개씩 묶어서 AI 요청 한 번으로 판단
+    - 판정 통계는 results["clarity"]에 기록 (ai_skipped: AI 판단을 생략한 폴더 수)
+
+    Args:
+        jobs: (folder_path, violations_list, plan) 목록
+
+    Returns:
+        명확한 폴더의 jobs (순서 유지). 불명확한 폴더는 검색된 목록에 남김 (스킵)
+    """
+    local_verdicts = prefilter_clarity(
+        [(violations_list[0].file_name, plan["folder_name"]) for _, violations_list, plan in jobs]
+    )
+    ask_ai = [i for i, verdict in enumerate(local_verdicts) if verdict == CLARITY_ASK_AI]
+
+    batch_size = max(1, settings.AI_CLARITY_BATCH_SIZE)
+    batches = [ask_ai[start:start + batch_size] for start in range(0, len(ask_ai), batch_size)]
+    ai_requests = 0
+
+    async def before_request(count: int):
+        # 요청마다 (재시도, 빠진 항목 재요청, 한 건씩 판단 포함) 공통 지시문 + 항목당 약 50토큰
+        nonlocal ai_requests
+        ai_requests += 1
+        await limiter.acquire(settings.AI_CLARITY_TOKEN_ESTIMATE + 50 * count)
+
+    async def judge(batch: List[int]) -> List[bool]:
+        items = [(jobs[i][1][0].file_name, jobs[i][2]["folder_name"]) for i in batch]
+        async with semaphore:
+            try:
+                return await generator.judge_filenames_clarity(
+                    items,
+                    batch_size=batch_size,
+                    before_request=before_request,
+                    backoff=limiter.backoff
+                )
+            except Exception as e:
+                # AI 판단 실패 시 안전하게 계속 진행
+                for i in batch:
+                    results["errors"].append(f"Clarity check failed for {jobs[i][0]}: {str(e)}")
+                return [True] * len(batch)
+
+    is_clear = [verdict == CLARITY_CLEAR for verdict in local_verdicts]
+    for batch, batch_verdicts in zip(batches, await asyncio.gather(*(judge(batch) for batch in batches))):
+        for i, verdict in zip(batch, batch_verdicts):
+            is_clear[i] = verdict
+
+    clear_jobs = [job for job, clear in zip(jobs, is_clear) if clear]
+
+    results["clarity"] = {
+        "folders": len(jobs),
+        "local_clear": local_verdicts.count(CLARITY_CLEAR),
+        "local_unclear": local_verdicts.count(CLARITY_UNCLEAR),
+        "ai_judged": len(ask_ai),
+        "ai_batches": len(batches),
+        "ai_requests": ai_requests,
+        "ai_skipped": len(jobs) - len(ask_ai),
+        "clear": len(clear_jobs),
+    }
+    logger.info(
+        f"Filename clarity: {len(clear_jobs)}/{len(jobs)} folders clear "
+        f"(local {len(jobs) - len(ask_ai)}, AI {len(ask_ai)} in {len(batches)} batches, {ai_requests} requests)"
+    )
+    return clear_jobs
+
+
+async def _match_with_ai(
+    db: Session,
+    parser: FilenameParser,
+    generator: AIMetadataGenerator,
+    results: dict,
+    jobs: list,
+    skip_clarity_check: bool,
+    provided_metadata: Optional[Dict]
+) -> Optional[Dict]:
+    """
+    새 제품이 필요한 폴더들의 AI 호출을 동시에 실행하고, 끝나는 순서대로 하나씩 DB에 기록
+
+    - 명확성 검사는 모든 폴더를 AI_CLARITY_BATCH_SIZE개씩 묶어 먼저 판단 (_filter_clear_jobs)
+    - 메타데이터 생성은 AI_MATCH_CONCURRENCY개까지 동시에, 제공자별 RPM/TPM 한도 안에서 실행
+    - DB 쓰기는 이 코루틴에서만 순서대로 실행 (Session은 동시 사용 불가)
+    - 치명적 API 오류(FATAL_API_ERRORS)가 나면 실행 중/대기 중인 AI 호출을 모두 취소
+
+    Args:
+        jobs: (folder_path, violations_list, plan) 목록
+
+    Returns:
+        치명적 API 오류 정보 (없으면 None)
+    """
+    limiter = get_rate_limiter(generator.provider)
+    semaphore = asyncio.Semaphore(max(1, settings.AI_MATCH_CONCURRENCY))
+
+    # ===== 3단계: 파일명 명확성 검사 (자동 매칭에만, 여러 폴더를 묶어서 AI 호출) =====
+    if not skip_clarity_check:
+        jobs = await _filter_clear_jobs(generator, limiter, semaphore, results, jobs)
+
+    async def prepare(folder_path: str, violations_list: List[FilenameViolation], plan: dict) -> dict:
+        async with semaphore:
+            outcome = {"ai_metadata": None}
+
+            # ===== 4단계: 새 제품 - 메타데이터 준비 =====
+            if provided_metadata:
+                # 수동 매칭: 사용자가 제공한 메타데이터 사용 (AI 호출 없음)
+                return outcome
+
+            # 자동 매칭: AI로 메타데이터 생성
+            outcome["ai_metadata"] = await _generate_metadata_with_retry(
+                generator, limiter, plan["software_name"]
+            )
+            return outcome
+
+    pending = {
+        asyncio.create_task(prepare(folder_path, violations_list, plan)): (folder_path, violations_list, plan)
+        for folder_path, violations_list, plan in jobs
+    }
+    api_error_info = None
+
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                folder_path, violations_list, plan = pending.pop(task)
+
+                # API 오류(rate_limit, quota 등)가 발생했으면 나머지 폴더 건너뛰기
+                if api_error_info is not None:
+                    results["failed"] += len(violations_list)
+                    results["errors"].append(
+                        f"Skipped {folder_path}: API 오류로 인해 건너뜀 ({api_error_info.get('message', '')})"
+                    )
+                    continue
+
+                if task.exception() is not None:
+                    results["failed"] += len(violations_list)
+                    results["errors"].append(f"Failed to process {folder_path}: {str(task.exception())}")
+                    continue
+
+                outcome = task.result()
+                ai_metadata = outcome["ai_metadata"] or {}
+
+                # AI 오류 확인 (rate_limit 재시도 소진, quota 초과 등)
+                if ai_metadata.get('ai_error'):
+                    error_type = ai_metadata['ai_error'].get('type', '')
+                    error_msg = ai_metadata['ai_error'].get('message', '')
+
+                    if error_type in FATAL_API_ERRORS:
+                        # 치명적 API 오류: 현재 폴더 건너뛰고 실행 중인 호출까지 모두 중단
+                        api_error_info = ai_metadata['ai_error']
+                        results["failed"] += len(violations_list)
+                        results["errors"].append(
+                            f"AI API 오류 ({error_type}): {error_msg}"
+                        )
+                        logger.warning(f"AI API fatal error ({error_type}): {error_msg} - stopping remaining matches")
+                        for other in pending:
+                            other.cancel()
+                        continue
+
+                # AI 호출 동안 같은 실행에서 먼저 기록된 제품이 있을 수 있으므로 유사 제품 재확인
+                try:
+                    _apply_similar_product(db, plan, provided_metadata)
+                except Exception as e:
+                    db.rollback()
+                    results["failed"] += len(violations_list)
+                    results["errors"].append(f"Failed to process {folder_path}: {str(e)}")
+                    continue
+
+                metadata = provided_metadata or _map_ai_metadata(ai_metadata)
+                _write_folder(
+                    db, parser, results, folder_path, violations_list, plan,
+                    metadata, provided_metadata
+                )
+    finally:
+        # 요청 취소 등으로 중단되면 남은 AI 호출도 정리
+        for task in pending:
+            task.cancel()
+
+    return api_error_info
+
+
 async def match_violations_to_products(
     db: Session,
     violations: List[FilenameViolation],
@@ -219,6 +717,9 @@ async def match_violations_to_products(
     """
     Violation들을 Product/Version으로 매칭하는 통합 함수
 
+    기존/유사 제품으로 처리되는 폴더는 바로 기록하고, 새 제품이 필요한 폴더는
+    AI 호출을 동시에 실행한 뒤 끝나는 순서대로 하나씩 기록한다 (_match_with_ai).
+
     Args:
         db: Database session
         violations: 매칭할 Violation 목록
@@ -272,298 +773,40 @@ async def match_violations_to_products(
             folder_groups[violation.folder_path] = []
         folder_groups[violation.folder_path].append(violation)
 
-    # 3단계: Product 생성 및 Version 매칭
-    api_error_occurred = False  # API 오류 발생 시 나머지 폴더 건너뛰기
-    api_error_info = None
-
+    # 3단계: 기존/유사 제품이 있거나 수동 매칭(메타데이터 제공)인 폴더는 바로 기록,
+    #        AI 호출(명확성 검사/메타데이터 생성)이 필요한 폴더는 모아서 동시 처리
+    ai_jobs = []
     for folder_path, violations_list in folder_groups.items():
-        # API 오류(rate_limit, quota 등)가 발생했으면 나머지 폴더 건너뛰기
-        if api_error_occurred:
-            results["failed"] += len(violations_list)
-            results["errors"].append(
-                f"Skipped {folder_path}: API 오류로 인해 건너뜀 ({api_error_info.get('message', '')})"
-            )
-            continue
-
         try:
-            # ===== 1단계: 기존 제품 확인 (AI 호출 전에 먼저 체크) =====
-            # folder_path로 정확한 매칭
-            existing_product = db.query(Product).filter(
-                Product.folder_path == folder_path
-            ).first()
-
-            # 중복 제품 플래그
-            is_duplicate = False
-            duplicate_reason = None
-            metadata = None
-
-            if existing_product:
-                # 이미 등록된 폴더 → AI 호출 없이 Version만 추가
-                product = existing_product
-                logger.info(f"기존 제품 발견 (folder_path): {product.title} - {folder_path}")
-            else:
-                # ===== 2단계: 폴더명 파싱 및 유사 제품 검색 (AI 호출 전) =====
-                folder_name = os.path.basename(folder_path)
-                parsed_info = parser.parse(folder_name)
-                software_name = parsed_info.get('software_name', folder_name)
-
-                # 연도/버전 정보를 소프트웨어명에 포함 (예: "MS Office" → "MS Office 2003")
-                # 버전별 제품 구분을 위해 필수 (Office 2003 vs Office 2007 등)
-                if parsed_info.get('year'):
-                    year = parsed_info['year']
-                    if year not in software_name:
-                        software_name = f"{software_name} {year}"
-
-                # 유사 제품 검색 (자동/수동 매칭 모두 적용)
-                search_title = software_name
-                if provided_metadata and provided_metadata.get('title'):
-                    search_title = provided_metadata['title']
-
-                similar_product = find_similar_product(
-                    db,
-                    search_title,
-                    provided_metadata.get('vendor') if provided_metadata else None
-                )
-
-                if similar_product:
-                    # 유사 제품 발견 → AI 호출 없이 Version만 추가
-                    product = similar_product
-                    is_duplicate = True
-                    duplicate_reason = f"'{similar_product.title}' 제품과 유사하여 중복으로 판단되었습니다."
-                    logger.info(f"유사 제품 발견: {search_title} → {similar_product.title}")
-                else:
-                    # ===== 3단계: 파일명 명확성 검사 (자동 매칭에만, AI 호출) =====
-                    if not skip_clarity_check:
-                        sample_filename = violations_list[0].file_name
-                        try:
-                            is_clear = await generator.is_filename_clear_for_matching(
-                                sample_filename,
-                                folder_name
-                            )
-                            if not is_clear:
-                                # 불명확한 파일명은 검색된 목록에 남김 (스킵)
-                                continue
-                        except Exception as e:
-                            # AI 판단 실패 시 안전하게 계속 진행
-                            results["errors"].append(f"Clarity check failed for {folder_path}: {str(e)}")
-
-                    # ===== 4단계: 새 제품 - 메타데이터 준비 =====
-                    if provided_metadata:
-                        # 수동 매칭: 사용자가 제공한 메타데이터 사용
-                        metadata = provided_metadata
-                    else:
-                        # 자동 매칭: AI로 메타데이터 생성
-                        ai_metadata = await generator.generate_detailed_metadata(software_name)
-
-                        # AI 오류 확인 (rate_limit, quota 초과 등)
-                        if ai_metadata.get('ai_error'):
-                            error_type = ai_metadata['ai_error'].get('type', '')
-                            error_msg = ai_metadata['ai_error'].get('message', '')
-
-                            if error_type in FATAL_API_ERRORS:
-                                # 치명적 API 오류: 현재 폴더 건너뛰고 나머지도 중단
-                                api_error_occurred = True
-                                api_error_info = ai_metadata['ai_error']
-                                results["failed"] += len(violations_list)
-                                results["errors"].append(
-                                    f"AI API 오류 ({error_type}): {error_msg}"
-                                )
-                                logger.warning(f"AI API fatal error ({error_type}): {error_msg} - stopping remaining matches")
-                                continue
-
-                        # API 호출 간 짧은 딜레이 (rate limit 방지)
-                        await asyncio.sleep(0.5)
-
-                        # AI 메타데이터 필드명 → Product 모델 필드명 매핑
-                        metadata = {
-                            **ai_metadata,
-                            # AI: description_short → Product: description
-                            'description': ai_metadata.get('description_short') or ai_metadata.get('description', ''),
-                            # AI: developer → Product: vendor
-                            'vendor': ai_metadata.get('developer') or ai_metadata.get('vendor', ''),
-                            # AI: description_detailed → Product: detailed_description
-                            'detailed_description': ai_metadata.get('description_detailed') or ai_metadata.get('detailed_description')
-                        }
-
-                    # ===== 5단계: 새 Product 생성 =====
-                    # 포터블 여부 감지 (parser의 포괄적 키워드 사용)
-                    is_portable = False
-                    if violations_list:
-                        first_filename = violations_list[0].file_name
-                        is_portable = FilenameParser._is_portable(first_filename, folder_path)
-
-                    # release_year: AI가 응답한 release_year 필드를 최우선으로 쓰고,
-                    # 없거나 형식이 잘못됐으면 title → folder_path 정규식 추출로 폴백
-                    final_title = metadata.get('title', software_name)
-                    release_year = (
-                        FilenameParser.parse_ai_release_year(metadata.get('release_year'))
-                        or FilenameParser.extract_release_year(final_title, folder_path)
-                    )
-
-                    if provided_metadata:
-                        # 사용자 제공 메타데이터로 생성 (상세 필드 포함)
-                        product = Product(
-                            title=metadata.get('title', software_name),
-                            subtitle=metadata.get('subtitle'),
-                            description=metadata.get('description', f"{software_name} 소프트웨어"),
-                            vendor=metadata.get('vendor', ''),
-                            category=metadata.get('category', 'Utility'),
-                            official_website=metadata.get('official_website'),
-                            license_type=metadata.get('license_type'),
-                            platform=metadata.get('platform'),
-                            detailed_description=metadata.get('detailed_description'),
-                            features=metadata.get('features'),
-                            system_requirements=metadata.get('system_requirements'),
-                            supported_formats=metadata.get('supported_formats'),
-                            installation_info=metadata.get('installation_info'),
-                            release_notes=metadata.get('release_notes'),
-                            release_date=metadata.get('release_date'),
-                            release_year=release_year,
-                            icon_url=metadata.get('icon_url', ''),
-                            screenshots=metadata.get('screenshots'),
-                            folder_path=folder_path,
-                            is_portable=is_portable
-                        )
-                    else:
-                        # 자동 생성 메타데이터로 생성 (기본 필드만)
-                        product = Product(
-                            title=metadata.get('title', software_name),
-                            description=metadata.get('description', f"{software_name} 소프트웨어"),
-                            vendor=metadata.get('vendor', ''),
-                            release_year=release_year,
-                            category=metadata.get('category', 'Utility'),
-                            icon_url=metadata.get('icon_url', ''),
-                            folder_path=folder_path,
-                            is_portable=is_portable
-                        )
-
-                    db.add(product)
-                    db.flush()  # Get product ID
-
-            # 수동 매칭: 기존 제품(folder_path 일치, 비중복)의 메타데이터 업데이트
-            if existing_product and provided_metadata and not is_duplicate:
-                if metadata is None:
-                    metadata = provided_metadata
-                if metadata.get('title'):
-                    product.title = metadata['title']
-                    if not product.release_year:
-                        product.release_year = (
-                            FilenameParser.parse_ai_release_year(metadata.get('release_year'))
-                            or FilenameParser.extract_release_year(product.title, product.folder_path)
-                        )
-                if metadata.get('subtitle'):
-                    product.subtitle = metadata['subtitle']
-                if metadata.get('description'):
-                    product.description = metadata['description']
-                if metadata.get('vendor'):
-                    product.vendor = metadata['vendor']
-                if metadata.get('category'):
-                    product.category = metadata['category']
-                if metadata.get('official_website'):
-                    product.official_website = metadata['official_website']
-                if metadata.get('license_type'):
-                    product.license_type = metadata['license_type']
-                if metadata.get('platform'):
-                    product.platform = metadata['platform']
-                if metadata.get('detailed_description'):
-                    product.detailed_description = metadata['detailed_description']
-                if metadata.get('features'):
-                    product.features = metadata['features']
-                if metadata.get('system_requirements'):
-                    product.system_requirements = metadata['system_requirements']
-                if metadata.get('supported_formats'):
-                    product.supported_formats = metadata['supported_formats']
-                if metadata.get('installation_info'):
-                    product.installation_info = metadata['installation_info']
-                if metadata.get('release_notes'):
-                    product.release_notes = metadata['release_notes']
-                if metadata.get('release_date'):
-                    product.release_date = metadata['release_date']
-                if metadata.get('icon_url'):
-                    product.icon_url = metadata['icon_url']
-                if metadata.get('screenshots'):
-                    product.screenshots = metadata['screenshots']
-
-            # Version 생성
-            for violation in violations_list:
-                file_path_str = os.path.join(violation.folder_path, violation.file_name)
-
-                # 이미 Version이 있는지 확인
-                existing_version = db.query(Version).filter(
-                    Version.file_path == file_path_str
-                ).first()
-
-                if not existing_version:
-                    # Version 생성
-                    parsed = parser.parse(violation.file_name)
-                    version_name = parsed.get('version', 'Unknown')
-                    version_portable = FilenameParser._is_portable(violation.file_name, file_path_str)
-
-                    # 파일 크기 가져오기
-                    file_size = 0
-                    if os.path.exists(file_path_str):
-                        file_size = os.path.getsize(file_path_str)
-
-                    version = Version(
-                        product_id=product.id,
-                        file_name=violation.file_name,
-                        file_path=file_path_str,
-                        file_size=file_size,
-                        version_name=version_name,
-                        is_portable=version_portable
-                    )
-
-                    db.add(version)
-                    db.flush()  # Get version ID
-
-                    # Violation에 매칭 정보 저장
-                    violation.product_id = product.id
-                    violation.version_id = version.id
-                else:
-                    # 기존 Version이 있으면 해당 정보 연결
-                    violation.product_id = existing_version.product_id
-                    violation.version_id = existing_version.id
-
-                # Violation을 해결됨으로 표시
-                violation.is_resolved = True
-                results["matched"] += 1
-
-            db.commit()
-            db.refresh(product)
-
-            # 생성/업데이트된 Product 정보 추가
-            product_info = {
-                "id": product.id,
-                "title": product.title,
-                "description": product.description,
-                "vendor": product.vendor,
-                "category": product.category,
-                "icon_url": product.icon_url,
-                "folder_path": product.folder_path
-            }
-
-            results["products"].append(product_info)
-
-            # 중복 제품인 경우 duplicates에도 추가
-            if is_duplicate:
-                results["duplicates"].append({
-                    **product_info,
-                    "reason": duplicate_reason,
-                    "original_folder": folder_path
-                })
-
+            plan = _plan_folder(db, parser, folder_path, provided_metadata)
         except Exception as e:
             db.rollback()
             results["failed"] += len(violations_list)
             results["errors"].append(f"Failed to process {folder_path}: {str(e)}")
+            continue
+
+        if plan["product"] is None and not (provided_metadata and skip_clarity_check):
+            ai_jobs.append((folder_path, violations_list, plan))
+            continue
+
+        _write_folder(
+            db, parser, results, folder_path, violations_list, plan,
+            provided_metadata, provided_metadata
+        )
+
+    api_error_info = None
+    if ai_jobs:
+        api_error_info = await _match_with_ai(
+            db, parser, generator, results, ai_jobs, skip_clarity_check, provided_metadata
+        )
 
     # API 오류 정보를 결과에 포함
-    if api_error_occurred and api_error_info:
+    if api_error_info:
         results["api_error"] = api_error_info
 
     # 캐시 무효화 (매칭이 완료되면 항상 실행)
     if results["matched"] > 0:
-        invalidate_cache([
+        await ainvalidate_cache([
             "products_list:*",
             "products_recent:*",
             "products_by_category:*",
@@ -0,0 +1,74 @@
+"""
+연속 실패 횟수 기반 차단기 (circuit breaker)
+
+외부 의존성(Redis 등) 호출이 연속으로 failure_threshold번 실패하면 열림(open) 상태가 되어
+호출하는 쪽이 의존성을 우회한다. 열린 동안에는 호출하지 않으므로 다시 닫는 것은
+사용하는 쪽의 백그라운드 확인(probe)이 reset()으로 한다.
+여러 스레드(요청 이벤트 루프, 파일 감시 스레드 등)에서 함께 사용할 수 있다.
+"""
+import time
+import threading
+from typing import Dict, Optional
+
+
+class CircuitBreaker:
+    """closed(정상) ↔ open(우회) 두 상태 차단기"""
+
+    def __init__(self, failure_threshold: int):
+        self.failure_threshold = max(1, failure_threshold)
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self.trips = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._opened_at is None
+
+    def record_success(self):
+        self._failures = 0
+
+    def record_failure(self) -> bool:
+        """
+        실패 1회 기록
+
+        Returns:
+            이번 실패로 열렸는지 여부
+        """
+        with self._lock:
+            self._failures += 1
+            if self._opened_at is None and self._failures >= self.failure_threshold:
+                return self._open()
+            return False
+
+    def trip(self) -> bool:
+        """실패 횟수와 관계없이 바로 열기 (시작 시 연결 실패 등)"""
+        with self._lock:
+            return self._open() if self._opened_at is None else False
+
+    def _open(self) -> bool:
+        self._opened_at = time.monotonic()
+        self.trips += 1
+        return True
+
+    def reset(self) -> bool:
+        """
+        닫기 (백그라운드 확인이 성공했을 때)
+
+        Returns:
+            열려 있다가 닫혔는지 여부
+        """
+        with self._lock:
+            was_open = self._opened_at is not None
+            self._opened_at = None
+            self._failures = 0
+            return was_open
+
+    def stats(self) -> Dict:
+        opened_at = self._opened_at
+        return {
+            "state": "closed" if opened_at is None else "open",
+            "consecutive_failures": self._failures,
+            "open_seconds": round(time.monotonic() - opened_at, 1) if opened_at is not None else None,
+            "trips": self.trips,
+        }
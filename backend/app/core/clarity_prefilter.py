@@ -0,0 +1,83 @@
+"""
+파일명 명확성 로컬 사전 판정
+
+자동 매칭은 새 제품 후보 폴더마다 AI에게 파일명이 명확한지(CLEAR/UNCLEAR) 묻는다.
+대부분은 AI 없이도 답이 분명하다:
+  - "Adobe Photoshop 2024 v25.0.iso" → 알려진 제조사 + 연도 + 버전 → 명확
+  - "setup.exe" (폴더명 없음)         → 일반명사뿐 → 불명확
+이 모듈은 FilenameParser 파싱 결과와 confidence.py의 규칙 기반 신호로 점수를 매겨
+clear / unclear / ask_ai 중 하나를 돌려주고, 중간 구간(ask_ai)만 AI에게 보낸다.
+
+점수 (0.0 ~ 1.0):
+  - confidence.calculate_confidence_score(): 알려진 제조사 0.5 + 연도 0.35 + 구체적인 이름 0.15
+  - 버전 번호 +0.15, 에디션 단어(EDITION_WORDS) +0.1
+  - CLARITY_CLEAR_THRESHOLD 이상 → clear, CLARITY_UNCLEAR_THRESHOLD 미만 → unclear
+  - 이름이 일반명사/3자 이하뿐이면 점수와 관계없이 unclear
+"""
+from typing import Dict, List, Tuple
+
+from app.core.parser import FilenameParser
+from app.core.confidence import calculate_confidence_score, _is_specific_name
+from app.config import settings
+
+CLARITY_CLEAR = "clear"
+CLARITY_UNCLEAR = "unclear"
+CLARITY_ASK_AI = "ask_ai"
+
+
+def score_filename_clarity(filename: str, parent_folder: str = "") -> Dict:
+    """
+    파일명(+부모 폴더명)이 소프트웨어를 식별하기에 충분한지 로컬 규칙으로 판정
+
+    Args:
+        filename: 파일명
+        parent_folder: 부모 폴더명
+
+    Returns:
+        {
+            "verdict": "clear" | "unclear" | "ask_ai",
+            "score": float,
+            "signals": list  # 점수에 반영된 신호 (디버그/로그용)
+        }
+    """
+    parsed = FilenameParser.parse(filename, parent_folder)
+    software_name = parsed.get('software_name') or ''
+
+    if software_name == 'Unknown' or not _is_specific_name({}, parsed):
+        return {"verdict": CLARITY_UNCLEAR, "score": 0.0, "signals": ["generic_name"]}
+
+    signals = []
+    score = calculate_confidence_score({}, parsed)
+    if parsed.get('vendor'):
+        signals.append("known_vendor")
+    if parsed.get('year'):
+        signals.append("year")
+
+    if parsed.get('version'):
+        score += 0.15
+        signals.append("version")
+
+    words = {word.lower() for word in software_name.split()}
+    if words & FilenameParser.EDITION_WORDS:
+        score += 0.1
+        signals.append("edition")
+
+    score = round(min(score, 1.0), 3)
+    if score >= settings.CLARITY_CLEAR_THRESHOLD:
+        verdict = CLARITY_CLEAR
+    elif score < settings.CLARITY_UNCLEAR_THRESHOLD:
+        verdict = CLARITY_UNCLEAR
+    else:
+        verdict = CLARITY_ASK_AI
+
+    return {"verdict": verdict, "score": score, "signals": signals}
+
+
+def prefilter_clarity(items: List[Tuple[str, str]]) -> List[str]:
+    """
+    여러 (파일명, 부모 폴더명)의 판정 목록 (입력 순서)
+    CLARITY_PREFILTER_ENABLED가 꺼져 있으면 모두 ask_ai
+    """
+    if not settings.CLARITY_PREFILTER_ENABLED:
+        return [CLARITY_ASK_AI] * len(items)
+    return [score_filename_clarity(filename, parent_folder)["verdict"] for filename, parent_folder in items]
@@ -18,28 +18,27 @@
 """
 
 import re
+import os
+import time
+import logging
 from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
 
-from app.core.keywords import PATCH_KEYWORDS as _PATCH_KEYWORDS
+from sqlalchemy.orm import Session
 
-# ------------------------------------------------------------------
-# 키워드 정의
-# ------------------------------------------------------------------
+from app.core.keywords import CLASSIFICATION_KEYWORDS
+from app.core.keyword_matcher import KeywordMatcher
+from app.models.filename_violation import FilenameViolation
 
-_LANGPACK_KEYWORDS = {
-    "lang", "language", "locale", "translation", "multilingual", "multi_lang",
-    "langpack", "kor_patch", "korpatch", "언어팩",
-    "ko_kr", "en_us", "ja_jp", "zh_cn", "zh_tw", "de_de", "fr_fr",
-}
+logger = logging.getLogger(__name__)
 
-_MANUAL_KEYWORDS = {
-    "manual", "guide", "readme", "read_me", "help", "doc", "documentation",
-    "tutorial", "handbook", "reference", "instructions",
-}
+# ------------------------------------------------------------------
+# 키워드 정의 (app.core.keywords.CLASSIFICATION_KEYWORDS)
+# ------------------------------------------------------------------
 
-_UPDATE_KEYWORDS = {
-    "update", "upgrade", "service_pack", "cumulative", "rollup", "release", "build",
-}
+# 분류 키워드 그룹 전체를 한 번만 컴파일해 둔 매처
+# 그룹 이름: "patch" | "language_pack" | "manual" | "update"
+_MATCHER = KeywordMatcher(CLASSIFICATION_KEYWORDS)
 
 # 메뉴얼 전용 확장자 (패치/업데이트 키워드가 없을 때 메뉴얼로 분류)
 _MANUAL_EXTENSIONS = {".pdf", ".doc", ".docx", ".chm", ".txt"}
@@ -74,38 +73,42 @@ def classify_file(file_name: str, folder_name: str = "") -> str:
         "product" | "patch" | "language_pack" | "manual" | "update"
     """
     name_lower = file_name.lower()
-    folder_lower = folder_name.lower()
+    # 파일명 + 폴더명을 합쳐 모든 키워드 그룹을 한 번에 검색
+    combined = f"{name_lower} {folder_name.lower()}"
+    hits = _MATCHER.scan(combined)
+    # 동봉 표현은 패치 키워드가 있을 때만 의미가 있음
+    bundled = "patch" in hits and _is_bundled_patch_mention(name_lower)
+    return _classify(file_name, combined, hits, bundled)
 
-    # 파일명 + 폴더명을 합쳐 키워드를 한 번에 검색
-    combined = f"{name_lower} {folder_lower}"
 
-    ext = Path(file_name).suffix.lower()
+def _classify(file_name: str, combined: str, hits: Dict[str, str], bundled: bool) -> str:
+    """키워드 검색 결과(hits: {그룹: 키워드})로 분류 규칙 적용"""
+    # "+ Fix", "with Keygen"처럼 연결어를 통해 패치/크랙이 동봉되었다는
+    # 표현인 경우에는 패치 규칙을 건너뛰고 아래 규칙들을 계속 평가한다
+    # (예: "Autodesk Maya v2026 + Fix (macOS).zip"은 patch가 아니라 product).
+    has_patch = "patch" in hits and not bundled
 
     # ── 규칙 1: 메뉴얼 전용 확장자 ──────────────────────────────────
     # .pdf/.doc/.docx/.chm/.txt 이면서 patch/update 키워드가 없으면 메뉴얼
-    if ext in _MANUAL_EXTENSIONS:
-        has_patch = _has_core_patch_signal(combined, name_lower)
-        has_update = _contains_any(combined, _UPDATE_KEYWORDS) or bool(_SP_PATTERN.search(combined))
+    if os.path.splitext(file_name)[1].lower() in _MANUAL_EXTENSIONS:
+        has_update = "update" in hits or bool(_SP_PATTERN.search(combined))
         if not has_patch and not has_update:
             return "manual"
 
     # ── 규칙 2: 패치 키워드 ─────────────────────────────────────────
-    # "+ Fix", "with Keygen"처럼 연결어를 통해 패치/크랙이 동봉되었다는
-    # 표현인 경우에는 이 규칙을 건너뛰고 아래 규칙들을 계속 평가한다
-    # (예: "Autodesk Maya v2026 + Fix (macOS).zip"은 patch가 아니라 product).
-    if _has_core_patch_signal(combined, name_lower):
+    if has_patch:
         return "patch"
 
     # ── 규칙 3: 언어팩 키워드 ───────────────────────────────────────
-    if _contains_any(combined, _LANGPACK_KEYWORDS):
+    if "language_pack" in hits:
         return "language_pack"
 
     # ── 규칙 4: 메뉴얼 키워드 ───────────────────────────────────────
-    if _contains_any(combined, _MANUAL_KEYWORDS):
+    if "manual" in hits:
         return "manual"
 
     # ── 규칙 5: 업데이트 키워드 / sp 패턴 ───────────────────────────
-    if _contains_any(combined, _UPDATE_KEYWORDS):
+    if "update" in hits:
         return "update"
     if _SP_PATTERN.search(combined):
         return "update"
@@ -114,14 +117,6 @@ def classify_file(file_name: str, folder_name: str = "") -> str:
     return "product"
 
 
-def _contains_any(text: str, keywords: set) -> bool:
-    """text 내에 keywords 중 하나라도 포함되어 있으면 True."""
-    for kw in keywords:
-        if kw in text:
-            return True
-    return False
-
-
 def _is_bundled_patch_mention(name_lower: str) -> bool:
     """파일명이 '+Fix', 'with Keygen'처럼 연결어를 통한 패치 동봉 표현을
     포함하는지 확인. 폴더명이 아니라 파일명만 검사한다 — 그렇지 않으면
@@ -130,9 +125,114 @@ def _is_bundled_patch_mention(name_lower: str) -> bool:
     return bool(_CONNECTOR_PATCH_PATTERN.search(name_lower))
 
 
-def _has_core_patch_signal(combined: str, name_lower: str) -> bool:
-    """패치 키워드가 존재하고, 그것이 연결어를 통한 동봉 표현이 아닌
-    핵심 키워드인 경우에만 True."""
-    if not _contains_any(combined, _PATCH_KEYWORDS):
-        return False
-    return not _is_bundled_patch_mention(name_lower)
+# ------------------------------------------------------------------
+# 태그 / 일괄 분류
+# ------------------------------------------------------------------
+
+def tag_file(file_name: str, folder_name: str = "") -> Dict:
+    """분류 결과와 함께 파일명+폴더명에서 찾은 키워드 그룹을 반환.
+
+    Returns:
+        {
+            "classification": str,          # classify_file()과 동일
+            "keywords": {그룹: 키워드},      # 예: {"patch": "keygen", "update": "build"}
+            "bundled_patch": bool,          # "+ Fix", "with Keygen" 같은 동봉 표현 여부
+        }
+    """
+    name_lower = file_name.lower()
+    combined = f"{name_lower} {folder_name.lower()}"
+    # 분류와 태그 모두 같은 한 번의 키워드 검색 결과에서 만든다
+    hits = _MATCHER.scan(combined)
+    bundled = _is_bundled_patch_mention(name_lower)
+    return {
+        "classification": _classify(file_name, combined, hits, bundled),
+        "keywords": hits,
+        "bundled_patch": bundled,
+    }
+
+
+def classify_many(items: Iterable[Tuple[str, str]]) -> List[str]:
+    """(파일명, 폴더명) 목록을 한 번에 분류 (같은 조합은 한 번만 계산, 입력 순서 유지)"""
+    seen: Dict[Tuple[str, str], str] = {}
+    results = []
+    for key in items:
+        classification = seen.get(key)
+        if classification is None:
+            classification = classify_file(*key)
+            seen[key] = classification
+        results.append(classification)
+    return results
+
+
+def reclassify_scan_items(db: Session, chunk_size: int = 5000) -> Dict:
+    """자동 분류 상태인 스캔 항목 전체의 분류를 다시 계산 (키워드 목록 변경 후 사용).
+
+    사용자가 직접 바꾼 분류(classification_auto=False)는 건드리지 않는다.
+    ORM 객체를 만들지 않고 필요한 컬럼만 id 순으로 chunk_size개씩 읽어 분류하고,
+    값이 바뀐 행만 bulk UPDATE한 뒤 마지막에 한 번 커밋한다.
+
+    Returns:
+        {"total": 검사한 항목 수, "changed": 분류가 바뀐 항목 수,
+         "changes": {"이전→새 분류": 개수}, "duration_seconds": float}
+    """
+    started = time.time()
+    results = {"total": 0, "changed": 0, "changes": {}, "duration_seconds": 0.0}
+    folder_names: Dict[str, str] = {}
+    memo: Dict[Tuple[str, str], str] = {}
+    last_id = 0
+
+    try:
+        while True:
+            rows = (
+                db.query(
+                    FilenameViolation.id,
+                    FilenameViolation.folder_path,
+                    FilenameViolation.file_name,
+                    FilenameViolation.classification,
+                )
+                .filter(
+                    FilenameViolation.classification_auto.is_(True),
+                    FilenameViolation.id > last_id,
+                )
+                .order_by(FilenameViolation.id)
+                .limit(chunk_size)
+                .all()
+            )
+            if not rows:
+                break
+
+            updates = []
+            for item_id, folder_path, file_name, current in rows:
+                folder_name = folder_names.get(folder_path)
+                if folder_name is None:
+                    folder_name = Path(folder_path).name
+                    folder_names[folder_path] = folder_name
+
+                key = (file_name, folder_name)
+                classification = memo.get(key)
+                if classification is None:
+                    classification = classify_file(file_name, folder_name)
+                    memo[key] = classification
+
+                if classification != current:
+                    updates.append({"id": item_id, "classification": classification})
+                    change = f"{current}→{classification}"
+                    results["changes"][change] = results["changes"].get(change, 0) + 1
+
+            if updates:
+                db.bulk_update_mappings(FilenameViolation, updates)
+            results["total"] += len(rows)
+            results["changed"] += len(updates)
+            last_id = rows[-1][0]
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    results["duration_seconds"] = round(time.time() - started, 2)
+    logger.info(
+        f"Reclassified scan items: {results['changed']}/{results['total']} changed "
+        f"in {results['duration_seconds']}s"
+    )
+    return results
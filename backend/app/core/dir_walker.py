@@ -0,0 +1,196 @@
+"""
+병렬 디렉토리 워커 (os.scandir 기반)
+
+SMB/NFS로 마운트된 라이브러리에서는 폴더 하나를 읽을 때마다 네트워크
+왕복이 발생하므로, Path.iterdir() + is_dir()/is_file()을 폴더 단위로
+직렬 호출하면 전체 스캔 시간이 왕복 횟수에 비례해 늘어난다.
+
+이 모듈은 폴더 목록 조회만 스레드 풀에서 병렬로 수행하고, 결과는 호출한
+스레드로 하나씩 돌려준다. DB 세션은 스레드 간에 공유할 수 없으므로 모든
+DB 작업은 결과를 받는 쪽(FileScanner, 단일 writer)에서만 수행해야 한다.
+"""
+import os
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 기본 동시 목록 조회 수 (로컬 디스크는 2~4, 네트워크 마운트는 8~16 정도가 적당)
+DEFAULT_WALK_WORKERS = 8
+
+# content_fingerprint()가 파일 앞/뒤에서 읽는 바이트 수
+FINGERPRINT_CHUNK_SIZE = 8 * 1024
+
+
+def list_directory(
+    dir_path: str,
+    skip_check: Optional[Callable[[str, float], Optional[List[str]]]] = None
+) -> Dict:
+    """
+    폴더 하나를 os.scandir로 읽어 하위 폴더/파일 이름을 분리
+
+    DirEntry.is_dir()/is_file()은 readdir 결과에 포함된 타입 정보를 재사용하므로
+    대부분의 파일시스템에서 항목별 stat 호출이 발생하지 않는다. 심볼릭 링크는
+    기존 Path.is_dir()/is_file()과 동일하게 링크 대상을 기준으로 판단한다.
+
+    Args:
+        dir_path: 읽을 폴더 경로 (절대 경로)
+        skip_check: (폴더 경로, mtime)을 받아 목록 조회를 생략해도 되면 저장된
+                    하위 폴더 이름 목록을, 아니면 None을 반환하는 콜백
+                    (증분 스캔용, 워커 스레드에서 호출되므로 읽기 전용이어야 함)
+
+    Returns:
+        {
+            "path": str,
+            "mtime": float,
+            "skipped": bool,     # skip_check로 목록 조회를 생략했는지
+            "subdirs": [str],    # 하위 폴더 이름
+            "files": [str],      # 파일 이름 (skipped면 빈 목록)
+            "error": Exception | None,
+            "missing": bool,     # 폴더가 사라졌거나 폴더가 아님
+        }
+    """
+    listing = {
+        "path": dir_path,
+        "mtime": 0.0,
+        "skipped": False,
+        "subdirs": [],
+        "files": [],
+        "error": None,
+        "missing": False,
+    }
+
+    try:
+        listing["mtime"] = os.stat(dir_path).st_mtime
+    except (FileNotFoundError, NotADirectoryError):
+        listing["missing"] = True
+        return listing
+    except Exception as e:
+        listing["error"] = e
+        return listing
+
+    if skip_check is not None:
+        stored_subdirs = skip_check(dir_path, listing["mtime"])
+        if stored_subdirs is not None:
+            listing["skipped"] = True
+            listing["subdirs"] = list(stored_subdirs)
+            return listing
+
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        listing["subdirs"].append(entry.name)
+                    elif entry.is_file():
+                        listing["files"].append(entry.name)
+                except OSError:
+                    # 깨진 링크 등 타입을 확인할 수 없는 항목은 기존처럼 무시
+                    continue
+    except NotADirectoryError:
+        listing["missing"] = True
+    except Exception as e:
+        listing["error"] = e
+
+    return listing
+
+
+def content_fingerprint(file_path: str, chunk_size: int = FINGERPRINT_CHUNK_SIZE) -> Optional[str]:
+    """
+    파일 크기 + 앞/뒤 chunk_size 바이트의 SHA-1 (저비용 내용 지문)
+
+    전체 해시 대신 파일당 최대 두 번의 짧은 읽기만 하므로 네트워크 마운트에서도
+    부담이 작다. 같은 크기의 분할 압축 파일처럼 크기만으로 구분되지 않는 파일을
+    식별하는 용도이며, 읽을 수 없으면 None을 반환한다.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            digest = hashlib.sha1(str(size).encode())
+            digest.update(f.read(chunk_size))
+            if size > chunk_size * 2:
+                f.seek(-chunk_size, os.SEEK_END)
+                digest.update(f.read(chunk_size))
+            elif size > chunk_size:
+                digest.update(f.read())
+        return digest.hexdigest()
+    except OSError as e:
+        logger.debug(f"Could not fingerprint {file_path}: {e}")
+        return None
+
+
+class ParallelDirectoryWalker:
+    """
+    스레드 풀로 하위 폴더를 동시에 읽어 들이는 디렉토리 워커
+
+    walk()는 폴더 목록을 완료되는 순서대로 yield한다. 호출자가 한 폴더의
+    결과를 처리하는 동안에도 워커 스레드는 다른 폴더를 계속 읽는다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WALK_WORKERS,
+        is_excluded_dir: Optional[Callable[[str], bool]] = None,
+        skip_check: Optional[Callable[[str, float], Optional[List[str]]]] = None
+    ):
+        """
+        Args:
+            max_workers: 동시에 목록을 조회할 최대 스레드 수 (1 이상)
+            is_excluded_dir: 폴더 전체 경로를 받아 제외 여부를 반환 (제외된 폴더는 읽지 않음)
+            skip_check: list_directory()의 skip_check와 동일
+        """
+        self.max_workers = max(1, int(max_workers or 1))
+        self.is_excluded_dir = is_excluded_dir
+        self.skip_check = skip_check
+
+    def walk(self, root: str, start_dirs: Optional[List[str]] = None) -> Iterator[Dict]:
+        """
+        root 아래 모든 폴더를 순회하며 list_directory() 결과를 yield
+
+        제외 대상 폴더와 사라진 폴더는 yield하지 않는다. root는 절대 경로로
+        전달해야 한다 (결과 경로가 그대로 DB의 folder_path가 됨).
+
+        Args:
+            root: 스캔 루트 폴더
+            start_dirs: 지정하면 root 대신 이 폴더들부터 내려간다
+                        (체크포인트에서 재개할 때 남은 폴더 목록)
+        """
+        root = os.fspath(root)
+        if self._is_excluded(root):
+            logger.debug(f"Skipping excluded folder: {root}")
+            return
+
+        if start_dirs is None:
+            start_dirs = [root]
+        start_dirs = [os.fspath(path) for path in start_dirs if not self._is_excluded(os.fspath(path))]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scan-walker") as executor:
+            pending = {executor.submit(list_directory, path, self.skip_check) for path in start_dirs}
+
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        listing = future.result()
+                        if listing["missing"]:
+                            continue
+
+                        for name in listing["subdirs"]:
+                            child = os.path.join(listing["path"], name)
+                            if self._is_excluded(child):
+                                # 제외된 하위 트리는 목록 조회 없이 통째로 건너뜀
+                                continue
+                            pending.add(executor.submit(list_directory, child, self.skip_check))
+
+                        yield listing
+            finally:
+                # 호출자가 순회를 중단하면(스캔 취소 등) 아직 시작하지 않은 목록 조회는 버림
+                for future in pending:
+                    future.cancel()
+
+    def _is_excluded(self, dir_path: str) -> bool:
+        if self.is_excluded_dir is None:
+            return False
+        return self.is_excluded_dir(dir_path.rstrip(os.sep) or dir_path)
@@ -0,0 +1,250 @@
+"""
+삭제된 파일 정리 (Version/Product/스캔 항목 ↔ 파일시스템 대조)
+
+스캔 직후에는 워커가 이미 본 경로 Set이 있으므로, DB 경로와 메모리에서
+차집합을 구하고 워커가 보지 못한 경로만 stat한다. 독립 실행되는
+/cleanup-deleted 엔드포인트는 본 경로가 없으므로 전체 경로를 스레드 풀로
+병렬 stat한다 (NAS 마운트에서 stat 왕복이 전체 시간을 좌우함).
+"""
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.product import Product
+from app.models.version import Version
+from app.models.filename_violation import FilenameViolation
+from app.models.attachment import Attachment
+from app.models.favorite import Favorite
+from app.core.dir_walker import DEFAULT_WALK_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+def _is_missing(path: str) -> bool:
+    """
+    파일이 확실히 사라졌는지 확인
+
+    권한 오류, 마운트 일시 장애 등은 삭제로 보지 않는다 (잘못 지우는 것보다
+    다음 스캔에서 다시 확인하는 편이 안전).
+    """
+    try:
+        os.stat(path)
+        return False
+    except (FileNotFoundError, NotADirectoryError):
+        return True
+    except OSError as e:
+        logger.warning(f"Could not stat {path}: {e}")
+        return False
+
+
+def find_missing_paths(
+    paths: Iterable[str],
+    seen_paths: Optional[Set[str]] = None,
+    is_skipped: Optional[Callable[[str], bool]] = None,
+    max_workers: int = DEFAULT_WALK_WORKERS
+) -> Set[str]:
+    """
+    paths 중 파일시스템에서 사라진 경로만 반환
+
+    Args:
+        paths: DB에 저장된 파일 경로들
+        seen_paths: 방금 스캔에서 워커가 확인한 경로 (여기 있으면 stat 생략)
+        is_skipped: 경로를 받아 확인 대상에서 뺄지 반환 (증분 스캔에서 건너뛴 폴더 등)
+        max_workers: 병렬 stat 스레드 수
+
+    Returns:
+        사라진 경로 Set
+    """
+    to_check = []
+    for path in set(paths):
+        if not path:
+            continue
+        if seen_paths is not None and path in seen_paths:
+            continue
+        if is_skipped is not None and is_skipped(path):
+            continue
+        to_check.append(path)
+
+    if not to_check:
+        return set()
+
+    workers = max(1, min(int(max_workers or 1), len(to_check)))
+    if workers == 1:
+        return {path for path in to_check if _is_missing(path)}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan-stat") as executor:
+        flags = executor.map(_is_missing, to_check)
+        return {path for path, missing in zip(to_check, flags) if missing}
+
+
+def find_empty_products(db: Session, product_ids: Iterable[int]) -> List[int]:
+    """product_ids 중 Version이 하나도 남지 않은 Product ID (GROUP BY 한 번으로 확인)"""
+    product_ids = {pid for pid in product_ids if pid is not None}
+    if not product_ids:
+        return []
+
+    remaining = {
+        row.product_id
+        for row in db.query(Version.product_id).filter(
+            Version.product_id.in_(product_ids)
+        ).group_by(Version.product_id)
+    }
+    return sorted(product_ids - remaining)
+
+
+def delete_products(db: Session, product_ids: List[int]):
+    """
+    Product와 외래키로 묶인 레코드 정리 (커밋은 호출자 책임)
+
+    연결된 스캔 항목은 재매칭할 수 있도록 미해결 상태로 되돌린다.
+    """
+    if not product_ids:
+        return
+
+    # FilenameViolation 리셋 (CASCADE SET NULL 전에 먼저 실행 - 재스캔 가능하도록)
+    db.query(FilenameViolation).filter(
+        FilenameViolation.product_id.in_(product_ids)
+    ).update({
+        "is_resolved": False,
+        "product_id": None,
+        "version_id": None,
+        "violation_details": "스캔된 파일 (AI 매칭 대기중)"
+    }, synchronize_session=False)
+    # 외래키 제약 조건이 있는 관련 레코드 먼저 삭제
+    db.query(Attachment).filter(Attachment.product_id.in_(product_ids)).delete(synchronize_session=False)
+    db.query(Favorite).filter(Favorite.product_id.in_(product_ids)).delete(synchronize_session=False)
+    # Product 삭제 (ProductVideo, ShareLink는 ondelete=CASCADE로 자동 처리)
+    db.query(Product).filter(Product.id.in_(product_ids)).delete(synchronize_session=False)
+
+
+def reconcile_versions(
+    db: Session,
+    version_rows: List[Tuple[int, int, str]],
+    seen_paths: Optional[Set[str]] = None,
+    is_skipped: Optional[Callable[[str], bool]] = None,
+    max_workers: int = DEFAULT_WALK_WORKERS
+) -> Tuple[int, List[int]]:
+    """
+    파일이 사라진 Version과, 그 결과 Version이 없어진 Product 삭제
+
+    Args:
+        db: DB 세션 (커밋은 호출자 책임)
+        version_rows: (version_id, product_id, file_path) 목록
+        seen_paths, is_skipped, max_workers: find_missing_paths()와 동일
+
+    Returns:
+        (삭제된 Version 수, 삭제된 Product ID 목록)
+    """
+    missing = find_missing_paths(
+        (file_path for _, _, file_path in version_rows),
+        seen_paths=seen_paths,
+        is_skipped=is_skipped,
+        max_workers=max_workers,
+    )
+    if not missing:
+        return 0, []
+
+    deleted_version_ids = []
+    product_ids_to_check = set()
+    for version_id, product_id, file_path in version_rows:
+        if file_path in missing:
+            logger.info(f"Deleted file detected: {file_path}")
+            deleted_version_ids.append(version_id)
+            product_ids_to_check.add(product_id)
+
+    for i in range(0, len(deleted_version_ids), 1000):
+        db.query(Version).filter(
+            Version.id.in_(deleted_version_ids[i:i + 1000])
+        ).delete(synchronize_session=False)
+
+    deleted_product_ids = find_empty_products(db, product_ids_to_check)
+    delete_products(db, deleted_product_ids)
+
+    return len(deleted_version_ids), deleted_product_ids
+
+
+def reconcile_unmatched_items(
+    db: Session,
+    base_path: str,
+    seen_paths: Optional[Set[str]] = None,
+    is_skipped: Optional[Callable[[str], bool]] = None,
+    max_workers: int = DEFAULT_WALK_WORKERS
+) -> int:
+    """
+    product_id가 NULL인 스캔 항목 중 실제 파일이 없는 것 삭제
+
+    Returns:
+        삭제된 스캔 항목 수
+    """
+    rows = db.query(
+        FilenameViolation.id,
+        FilenameViolation.folder_path,
+        FilenameViolation.file_name,
+    ).filter(
+        FilenameViolation.product_id.is_(None),
+        FilenameViolation.folder_path.like(f"{base_path}%")
+    ).all()
+
+    return _delete_missing_items(db, rows, seen_paths, is_skipped, max_workers)
+
+
+def reconcile_unmatched_files(
+    db: Session,
+    file_paths: List[str],
+    max_workers: int = DEFAULT_WALK_WORKERS
+) -> int:
+    """
+    지정한 파일 경로들의 미매칭 스캔 항목 중 실제 파일이 없는 것 삭제 (파일 감시용)
+
+    Returns:
+        삭제된 스캔 항목 수
+    """
+    if not file_paths:
+        return 0
+
+    rows = db.query(
+        FilenameViolation.id,
+        FilenameViolation.folder_path,
+        FilenameViolation.file_name,
+    ).filter(
+        FilenameViolation.product_id.is_(None),
+        FilenameViolation.folder_path.in_({os.path.dirname(path) for path in file_paths}),
+        FilenameViolation.file_name.in_({os.path.basename(path) for path in file_paths})
+    ).all()
+
+    wanted = set(file_paths)
+    rows = [row for row in rows if os.path.join(row.folder_path, row.file_name) in wanted]
+    return _delete_missing_items(db, rows, None, None, max_workers)
+
+
+def _delete_missing_items(
+    db: Session,
+    rows: List,
+    seen_paths: Optional[Set[str]],
+    is_skipped: Optional[Callable[[str], bool]],
+    max_workers: int
+) -> int:
+    """(id, folder_path, file_name) 행 중 파일이 사라진 스캔 항목 삭제"""
+    paths = {row.id: os.path.join(row.folder_path, row.file_name) for row in rows}
+    missing = find_missing_paths(
+        paths.values(),
+        seen_paths=seen_paths,
+        is_skipped=is_skipped,
+        max_workers=max_workers,
+    )
+    if not missing:
+        return 0
+
+    deleted_ids = [item_id for item_id, path in paths.items() if path in missing]
+    for path in sorted(missing):
+        logger.info(f"Deleted unmatched violation (file gone): {path}")
+
+    for i in range(0, len(deleted_ids), 1000):
+        db.query(FilenameViolation).filter(
+            FilenameViolation.id.in_(deleted_ids[i:i + 1000])
+        ).delete(synchronize_session=False)
+
+    return len(deleted_ids)
@@ -0,0 +1,506 @@
+"""
+실시간 파일 감시 (Linux inotify)
+
+scanFolders 아래의 모든 폴더에 inotify watch를 걸고, 들어온 이벤트를 짧은
+debounce 동안 모아(같은 파일의 생성→수정→이름 변경 등은 하나로 병합) 한 번에
+FileScanner.apply_file_changes()로 반영한다. 새로 생긴 폴더만 scan_directory()로
+하위 트리를 스캔하므로 전체 라이브러리를 다시 순회하지 않는다.
+
+이벤트 큐 오버플로(IN_Q_OVERFLOW)나 watch 개수 한도(fs.inotify.max_user_watches)
+초과로 일부 변경을 놓쳤을 수 있으면, 스케줄러에 증분 스캔을 예약해 맞춘다.
+
+외부 패키지 없이 ctypes로 libc의 inotify를 직접 호출한다. Linux가 아니거나
+inotify를 쓸 수 없으면 감시는 비활성화되고 기존 cron 스캔만 동작한다.
+"""
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+    | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def _load_libc():
+    """inotify를 지원하는 libc 핸들 (지원하지 않으면 None)"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class WatchLimitReached(Exception):
+    """fs.inotify.max_user_watches 한도 초과"""
+    pass
+
+
+class FileWatcherService:
+    """
+    scanFolders를 inotify로 감시하고 변경을 카탈로그에 반영하는 백그라운드 서비스
+
+    스레드 두 개로 동작한다.
+      - reader: inotify fd에서 이벤트를 읽어 대기 중인 변경 목록에 병합
+      - applier: 마지막 이벤트 후 debounce_seconds가 지나면 변경을 DB에 반영
+    DB 작업은 applier 스레드에서만 수행한다.
+    """
+
+    # 이벤트가 계속 들어와도 이 시간이 지나면 모인 변경을 반영
+    MAX_BATCH_DELAY = 30.0
+
+    def __init__(self, debounce_seconds: float = 3.0,
+                 on_overflow: Optional[Callable[[str], None]] = None):
+        """
+        Args:
+            debounce_seconds: 마지막 이벤트 후 반영까지 기다릴 시간 (초)
+            on_overflow: 이벤트를 놓쳤을 때 호출할 콜백 (사유 문자열을 받음)
+        """
+        self.debounce_seconds = debounce_seconds
+        self.on_overflow = on_overflow
+        self.roots: List[str] = []
+        self.is_running = False
+        self.last_applied_at: Optional[datetime] = None
+        self.last_result: Optional[dict] = None
+        self.last_error: Optional[str] = None
+        self.overflow_count = 0
+
+        self._libc = None
+        self._fd = -1
+        self._wd_paths: Dict[int, str] = {}
+        self._path_wds: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._scanner = None
+        self._reset_pending()
+
+    @property
+    def available(self) -> bool:
+        """현재 플랫폼에서 inotify를 사용할 수 있는지"""
+        if self._libc is None:
+            self._libc = _load_libc()
+        return self._libc is not None
+
+    def start(self, paths: List[str]) -> bool:
+        """
+        감시 시작 (이미 실행 중이면 다시 시작)
+
+        Args:
+            paths: 감시할 루트 폴더 목록 (scanFolders)
+
+        Returns:
+            감시를 시작했으면 True
+        """
+        self.stop()
+
+        if not self.available:
+            logger.warning("File watcher disabled: inotify is not available on this platform")
+            return False
+
+        from app.core.scanner import FileScanner
+
+        # 스캔 예외 규칙만 사용 (DB 작업은 applier에서 새 세션으로)
+        self._scanner = FileScanner(None, use_ai=False)
+        self.roots = [os.fspath(os.path.abspath(path)) for path in paths if os.path.isdir(path)]
+        if not self.roots:
+            logger.warning(f"File watcher not started: no existing scan folders in {paths}")
+            return False
+
+        fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            logger.error(f"inotify_init1 failed: {os.strerror(err)}")
+            return False
+        self._fd = fd
+        self._stop.clear()
+        self._reset_pending()
+
+        try:
+            for root in self.roots:
+                self._watch_tree(root)
+        except WatchLimitReached:
+            self._handle_overflow("watch limit reached while adding scan folders")
+
+        self._threads = [
+            threading.Thread(target=self._read_loop, name="fs-watcher-reader", daemon=True),
+            threading.Thread(target=self._apply_loop, name="fs-watcher-applier", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+        self.is_running = True
+        logger.info(f"✓ File watcher started: {len(self._wd_paths)} folders under {self.roots}")
+        return True
+
+    def stop(self):
+        """감시 중지 (대기 중인 변경은 버림 - 다음 스캔에서 맞춰짐)"""
+        if not self.is_running and self._fd < 0:
+            return
+
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._wd_paths.clear()
+        self._path_wds.clear()
+        self.is_running = False
+        logger.info("✓ File watcher stopped")
+
+    def get_status(self) -> dict:
+        """감시 상태 조회"""
+        with self._lock:
+            pending = (len(self._created) + len(self._deleted) + len(self._renamed)
+                       + len(self._created_dirs) + len(self._deleted_dirs) + len(self._renamed_dirs))
+        return {
+            "available": self.available,
+            "is_running": self.is_running,
+            "roots": self.roots,
+            "watched_folders": len(self._wd_paths),
+            "pending_changes": pending,
+            "overflow_count": self.overflow_count,
+            "last_applied_at": self.last_applied_at.isoformat() if self.last_applied_at else None,
+            "last_result": self.last_result,
+            "last_error": self.last_error,
+        }
+
+    # ── watch 관리 ────────────────────────────────────────────
+
+    def _add_watch(self, dir_path: str):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dir_path), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                raise WatchLimitReached(dir_path)
+            logger.warning(f"Could not watch {dir_path}: {os.strerror(err)}")
+            return
+        self._wd_paths[wd] = dir_path
+        self._path_wds[dir_path] = wd
+
+    def _watch_tree(self, root: str):
+        """root와 하위 폴더 전체에 watch 추가 (예외 폴더는 내려가지 않음)"""
+        stack = [root]
+        while stack:
+            dir_path = stack.pop()
+            if dir_path in self._path_wds:
+                continue
+            self._add_watch(dir_path)
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir() and not self._scanner._is_excluded_dir(entry.path):
+                                stack.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.debug(f"Could not list {dir_path} for watching: {e}")
+
+    def _forget_tree(self, dir_path: str, remove_watch: bool):
+        """dir_path와 하위 폴더의 watch 기록 제거"""
+        prefix = dir_path + os.sep
+        for path in [p for p in self._path_wds if p == dir_path or p.startswith(prefix)]:
+            wd = self._path_wds.pop(path)
+            self._wd_paths.pop(wd, None)
+            if remove_watch:
+                self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _move_tree(self, old_dir: str, new_dir: str):
+        """폴더 이동 시 watch 경로 갱신 (inotify watch는 inode 기준이라 그대로 유지됨)"""
+        prefix = old_dir + os.sep
+        for path in [p for p in self._path_wds if p == old_dir or p.startswith(prefix)]:
+            wd = self._path_wds.pop(path)
+            new_path = new_dir + path[len(old_dir):]
+            self._path_wds[new_path] = wd
+            self._wd_paths[wd] = new_path
+
+    # ── 이벤트 수집 ───────────────────────────────────────────
+
+    def _reset_pending(self):
+        self._created: Dict[str, None] = {}
+        self._deleted = set()
+        self._renamed: List[tuple] = []
+        self._created_dirs = set()
+        self._deleted_dirs = set()
+        self._renamed_dirs: List[tuple] = []
+        # cookie → (이전 경로, 폴더 여부, 수신 시각): 짝이 되는 IN_MOVED_TO 대기
+        self._moved_from: Dict[int, tuple] = {}
+        self._first_event_at: Optional[float] = None
+        self._last_event_at: Optional[float] = None
+
+    def _read_loop(self):
+        while not self._stop.is_set():
+            try:
+                ready, _, _ = select.select([self._fd], [], [], 1.0)
+                if not ready:
+                    continue
+                data = os.read(self._fd, 64 * 1024)
+            except (BlockingIOError, InterruptedError):
+                continue
+            except OSError as e:
+                if self._stop.is_set():
+                    break
+                logger.error(f"File watcher read error: {e}")
+                self.last_error = str(e)
+                time.sleep(1)
+                continue
+
+            with self._lock:
+                offset = 0
+                while offset + _EVENT_HEADER.size <= len(data):
+                    wd, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                    offset += _EVENT_HEADER.size
+                    name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                    offset += length
+                    try:
+                        self._handle_event(wd, mask, cookie, name)
+                    except WatchLimitReached:
+                        self._handle_overflow("watch limit reached for new folders")
+                    except Exception as e:
+                        logger.warning(f"File watcher event error: {e}")
+
+    def _handle_event(self, wd: int, mask: int, cookie: int, name: str):
+        """이벤트 하나를 대기 중인 변경 목록에 병합 (_lock 안에서 호출)"""
+        if mask & IN_Q_OVERFLOW:
+            self._handle_overflow("inotify event queue overflow")
+            return
+
+        if mask & IN_IGNORED:
+            path = self._wd_paths.pop(wd, None)
+            if path is not None and self._path_wds.get(path) == wd:
+                self._path_wds.pop(path, None)
+            return
+
+        parent = self._wd_paths.get(wd)
+        if parent is None:
+            return
+
+        if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+            # 감시 루트 자체가 사라짐 - 하위 항목은 부모 폴더 이벤트로 처리됨
+            if parent in self.roots:
+                self._deleted_dirs.add(parent)
+                self._touch()
+            return
+
+        if not name:
+            return
+
+        path = os.path.join(parent, name)
+        is_dir = bool(mask & IN_ISDIR)
+
+        if is_dir and self._scanner._is_excluded_dir(path):
+            return
+        if not is_dir and self._scanner._is_excluded_file(name):
+            # 예외 파일로 이름이 바뀐 경우는 삭제로 취급
+            if mask & IN_MOVED_TO:
+                self._file_gone(path)
+                self._touch()
+            return
+
+        if mask & IN_MOVED_FROM:
+            self._moved_from[cookie] = (path, is_dir, time.monotonic())
+        elif mask & IN_MOVED_TO:
+            source = self._moved_from.pop(cookie, None) if cookie else None
+            if source is not None and source[1] == is_dir:
+                if is_dir:
+                    self._dir_renamed(source[0], path)
+                else:
+                    self._file_renamed(source[0], path)
+            elif is_dir:
+                self._dir_created(path)
+            else:
+                self._file_created(path)
+        elif mask & IN_CREATE:
+            # 파일은 쓰기가 끝난 IN_CLOSE_WRITE에서 처리
+            if is_dir:
+                self._dir_created(path)
+        elif mask & IN_CLOSE_WRITE:
+            self._file_created(path)
+        elif mask & IN_DELETE:
+            if is_dir:
+                self._dir_gone(path)
+            else:
+                self._file_gone(path)
+        else:
+            return
+
+        self._touch()
+
+    def _touch(self):
+        now = time.monotonic()
+        if self._first_event_at is None:
+            self._first_event_at = now
+        self._last_event_at = now
+
+    def _file_created(self, path: str):
+        self._deleted.discard(path)
+        self._created[path] = None
+
+    def _file_gone(self, path: str):
+        if path in self._created:
+            # 반영 전에 생겼다 사라진 파일 - DB에 기록이 없을 수 있으므로 삭제로도 확인
+            self._created.pop(path)
+        self._deleted.add(path)
+
+    def _file_renamed(self, old_path: str, new_path: str):
+        if old_path in self._created:
+            # 아직 반영하지 않은 새 파일의 이름 변경 → 새 이름으로 생성
+            self._created.pop(old_path)
+            self._file_created(new_path)
+            return
+        self._renamed.append((old_path, new_path))
+
+    def _dir_created(self, path: str):
+        self._deleted_dirs.discard(path)
+        self._created_dirs.add(path)
+        self._watch_tree(path)
+
+    def _dir_gone(self, path: str, remove_watch: bool = False):
+        self._created_dirs.discard(path)
+        self._deleted_dirs.add(path)
+        self._forget_tree(path, remove_watch=remove_watch)
+
+    def _dir_renamed(self, old_path: str, new_path: str):
+        self._move_tree(old_path, new_path)
+        if old_path in self._created_dirs:
+            self._created_dirs.discard(old_path)
+            self._created_dirs.add(new_path)
+            return
+        self._renamed_dirs.append((old_path, new_path))
+
+    def _expire_moved_from(self, now: float):
+        """짝(IN_MOVED_TO)이 오지 않은 IN_MOVED_FROM → 감시 범위 밖으로 이동 = 삭제"""
+        for cookie, (path, is_dir, received_at) in list(self._moved_from.items()):
+            if now - received_at < 1.0:
+                continue
+            del self._moved_from[cookie]
+            if is_dir:
+                # 감시 범위 밖으로 옮겨진 폴더의 watch는 커널이 유지하므로 직접 해제
+                self._dir_gone(path, remove_watch=True)
+            else:
+                self._file_gone(path)
+
+    def _handle_overflow(self, reason: str):
+        """이벤트를 놓쳤을 수 있음 → 대기 중인 변경을 버리고 증분 스캔 예약 (_lock 안에서 호출)"""
+        self.overflow_count += 1
+        logger.warning(f"File watcher overflow ({reason}); falling back to incremental scan")
+        self._reset_pending()
+        if self.on_overflow is not None:
+            try:
+                self.on_overflow(reason)
+            except Exception as e:
+                logger.error(f"File watcher overflow callback failed: {e}")
+
+    # ── 변경 반영 ─────────────────────────────────────────────
+
+    def _apply_loop(self):
+        while not self._stop.wait(0.5):
+            with self._lock:
+                now = time.monotonic()
+                self._expire_moved_from(now)
+                if self._last_event_at is None:
+                    continue
+                quiet = now - self._last_event_at >= self.debounce_seconds
+                overdue = now - self._first_event_at >= self.MAX_BATCH_DELAY
+                # 이동 이벤트의 짝을 기다리는 중이면 반영을 미룸 (_expire_moved_from이 1초 후 정리)
+                if not (quiet or overdue) or self._moved_from:
+                    continue
+
+                changes = {
+                    "created": list(self._created),
+                    "deleted": sorted(self._deleted),
+                    "renamed": list(self._renamed),
+                    "deleted_dirs": sorted(self._deleted_dirs),
+                    "renamed_dirs": list(self._renamed_dirs),
+                }
+                created_dirs = sorted(self._created_dirs)
+                self._reset_pending()
+
+            self._apply(changes, created_dirs)
+
+    def _apply(self, changes: dict, created_dirs: List[str]):
+        from app.database import SessionLocal
+        from app.core.scanner import FileScanner
+        from app.core.redis_cache import invalidate_cache
+
+        db = SessionLocal()
+        try:
+            scanner = FileScanner(db, use_ai=False)
+            results = scanner.apply_file_changes(**changes)
+
+            # 새 폴더는 하위 트리만 스캔 (상위 폴더 안에 포함된 폴더는 중복 스캔하지 않음)
+            for dir_path in created_dirs:
+                if any(dir_path.startswith(other + os.sep) for other in created_dirs):
+                    continue
+                if not os.path.isdir(dir_path):
+                    continue
+                dir_results = FileScanner(db, use_ai=False).scan_directory(dir_path)
+                for key in ("new_products", "new_versions", "scanned_files"):
+                    results[key] = results.get(key, 0) + dir_results.get(key, 0)
+                results["errors"].extend(dir_results.get("errors", []))
+
+            self.last_applied_at = datetime.now()
+            self.last_result = results
+            self.last_error = results["errors"][-1] if results["errors"] else None
+            logger.info(
+                f"File watcher applied changes: +{results.get('new_products', 0)} items, "
+                f"-{results.get('deleted_violations', 0) + results.get('deleted_versions', 0)} removed, "
+                f"{results.get('renamed_files', 0)} renamed, {len(created_dirs)} new folders"
+            )
+
+            invalidate_cache([
+                "products_list:*",
+                "products_recent:*",
+                "products_by_category:*",
+                "product_detail:*",
+                "search_suggestions:*",
+                "stats_overview:*",
+                "stats_categories:*"
+            ])
+        except Exception as e:
+            logger.error(f"File watcher failed to apply changes: {e}", exc_info=True)
+            self.last_error = str(e)
+            db.rollback()
+        finally:
+            db.close()
+
+
+# 전역 파일 감시 인스턴스
+file_watcher = FileWatcherService()
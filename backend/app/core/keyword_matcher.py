@@ -0,0 +1,98 @@
+"""
+다중 키워드 매처
+
+classifier.py는 파일명+폴더명에 키워드 그룹(패치/언어팩/메뉴얼/업데이트) 중 어떤 그룹의
+키워드가 부분 문자열로 들어 있는지를, parser.py는 단어 하나가 노이즈/에디션/제조사
+단어인지를 확인한다. 이 모듈은 모든 그룹의 키워드를 대안(|) 정규식 하나로 컴파일하고
+키워드 → 그룹 표를 두어, 텍스트를 한 번 훑으면서 모든 그룹의 키워드를 함께 찾는다.
+
+- 매치를 찾으면 그 다음 글자부터 다시 검색해 겹치는 키워드도 놓치지 않는다
+  (예: "kor_patch" 안의 "patch", 키워드가 없는 구간은 정규식 엔진이 C 수준에서 건너뜀)
+- 같은 위치에서 시작하는 더 짧은 키워드(가장 긴 키워드의 접두사)의 그룹도 표에 미리 합쳐 둔다
+- 그룹별 판정은 `any(kw in text for kw in keywords)`와 같고, 그룹별로 보고되는 키워드는
+  가장 먼저 나온 위치에서 시작하는 그 그룹의 가장 긴 키워드 (예: "keygen"과 "key"면 "keygen")
+
+CPython에서는 순수 파이썬 Aho-Corasick(문자 단위 루프)이 C로 구현된 정규식 검색보다
+느리므로, 정규식 대안을 다중 패턴 매처로 사용한다.
+"""
+import re
+from typing import Dict, FrozenSet, Iterable, Optional, Pattern
+
+# 키워드가 없는 그룹용 (어떤 텍스트에도 매치되지 않음)
+_NEVER = re.compile(r"(?!)")
+
+
+class KeywordMatcher:
+    """여러 키워드 그룹을 한 번에 찾는 매처 (읽기 전용, 스레드 간 공유 가능)"""
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        """
+        Args:
+            groups: {그룹 이름: 키워드 목록} (키워드는 소문자, 검사할 텍스트도 소문자로 전달)
+        """
+        self.groups = {name: frozenset(kw for kw in keywords if kw) for name, keywords in groups.items()}
+
+        # 키워드 → 속한 그룹 (단어 단위 조회용)
+        token_groups: Dict[str, set] = {}
+        for name, keywords in self.groups.items():
+            for keyword in keywords:
+                token_groups.setdefault(keyword, set()).add(name)
+        self._token_groups: Dict[str, FrozenSet[str]] = {
+            keyword: frozenset(names) for keyword, names in token_groups.items()
+        }
+
+        # 정규식이 보고한 키워드 → {그룹: 같은 위치에서 시작하는 그 그룹의 가장 긴 키워드}
+        self._hits: Dict[str, Dict[str, str]] = {}
+        for longest in token_groups:
+            hits: Dict[str, str] = {}
+            for keyword, names in token_groups.items():
+                if longest.startswith(keyword):
+                    for name in names:
+                        if len(keyword) > len(hits.get(name, "")):
+                            hits[name] = keyword
+            self._hits[longest] = hits
+
+        self._pattern = self._compile(token_groups)
+        self._group_patterns: Dict[str, Pattern] = {}
+
+    @staticmethod
+    def _compile(keywords: Iterable[str]) -> Optional[Pattern]:
+        # 긴 키워드를 먼저 두어 각 위치에서 가장 긴 키워드가 보고되도록 함
+        ordered = sorted(keywords, key=lambda kw: (-len(kw), kw))
+        if not ordered:
+            return None
+        return re.compile("|".join(re.escape(kw) for kw in ordered))
+
+    def scan(self, text: str) -> Dict[str, str]:
+        """
+        text를 한 번 훑어 {그룹 이름: 처음 나온 키워드}를 반환 (매치된 그룹만 포함)
+        """
+        found: Dict[str, str] = {}
+        if self._pattern is None:
+            return found
+        search = self._pattern.search
+        match = search(text)
+        while match:
+            for name, keyword in self._hits[match.group()].items():
+                if name not in found:
+                    found[name] = keyword
+            if len(found) == len(self.groups):
+                break
+            # 같은 위치 다음 글자부터 다시 검색 (겹치는 키워드 포함)
+            match = search(text, match.start() + 1)
+        return found
+
+    def matches(self, text: str, group: str) -> bool:
+        """
+        text에 group의 키워드가 하나라도 들어 있는지
+        한 그룹만 확인할 때는 다른 그룹 키워드에서 멈추지 않도록 그 그룹 키워드만으로 만든
+        정규식을 쓴다 (처음 사용할 때 컴파일).
+        """
+        pattern = self._group_patterns.get(group)
+        if pattern is None:
+            pattern = self._group_patterns[group] = self._compile(self.groups[group]) or _NEVER
+        return pattern.search(text) is not None
+
+    def token_groups(self, token: str) -> FrozenSet[str]:
+        """단어 전체가 키워드인 그룹들 (예: "pro" → {"edition"}, 키워드가 아니면 빈 집합)"""
+        return self._token_groups.get(token, frozenset())
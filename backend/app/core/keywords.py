@@ -4,6 +4,9 @@
 parser.py의 NOISE_WORDS와 classifier.py의 _PATCH_KEYWORDS가 각자 별도로
 관리되면서 "fix" 같은 키워드가 classifier에는 있지만 parser에는 없는 등
 불일치가 생겼다. 패치/크랙 관련 키워드는 이 모듈에서 한 곳으로 관리한다.
+
+분류 키워드(CLASSIFICATION_KEYWORDS)를 바꾼 뒤에는 기존 스캔 항목의 자동 분류를
+다시 계산해야 한다 (POST /api/scan-items/reclassify).
 """
 
 # 패치, 크랙, 키젠 등 정품 인증 우회 관련 핵심 키워드
@@ -11,3 +14,29 @@ PATCH_KEYWORDS = frozenset({
     "patch", "hotfix", "fix", "crack", "keygen", "keygenerator",
     "serial", "key", "reg", "loader", "activator", "unlocker", "bypass",
 })
+
+# 언어팩, 번역팩
+LANGPACK_KEYWORDS = frozenset({
+    "lang", "language", "locale", "translation", "multilingual", "multi_lang",
+    "langpack", "kor_patch", "korpatch", "언어팩",
+    "ko_kr", "en_us", "ja_jp", "zh_cn", "zh_tw", "de_de", "fr_fr",
+})
+
+# 메뉴얼, 설명서, 가이드
+MANUAL_KEYWORDS = frozenset({
+    "manual", "guide", "readme", "read_me", "help", "doc", "documentation",
+    "tutorial", "handbook", "reference", "instructions",
+})
+
+# 업데이트, 서비스팩
+UPDATE_KEYWORDS = frozenset({
+    "update", "upgrade", "service_pack", "cumulative", "rollup", "release", "build",
+})
+
+# classifier.py가 파일명+폴더명에서 부분 문자열로 찾는 키워드 그룹 (분류값 → 키워드)
+CLASSIFICATION_KEYWORDS = {
+    "patch": PATCH_KEYWORDS,
+    "language_pack": LANGPACK_KEYWORDS,
+    "manual": MANUAL_KEYWORDS,
+    "update": UPDATE_KEYWORDS,
+}
@@ -0,0 +1,94 @@
+"""
+프로세스 내부 LRU 캐시 (Redis 앞단 L1)
+
+uvicorn 워커마다 하나씩 두고, RedisCache가 Redis(L2) 조회 전에 먼저 확인한다.
+- 항목 수(max_entries)와 직렬화 크기 합계(max_bytes)를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+- 항목마다 만료 시각 (L2 TTL보다 짧게 잡아 무효화 메시지를 놓쳐도 오래된 값이 오래 남지 않음)
+- 값은 역직렬화된 객체를 그대로 공유하므로 꺼낸 쪽에서 수정하면 안 된다
+"""
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class LocalLRUCache:
+    """크기/TTL 제한이 있는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # key → (만료 시각, 값, 크기)
+        self._entries: "OrderedDict[str, Tuple[float, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """값 (없거나 만료됐으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: float, size: int):
+        """
+        값 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 유지 시간 (초)
+            size: 직렬화 크기 (바이트, 전체 크기 제한용)
+        """
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (time.monotonic() + ttl, value, size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._pop(oldest)
+                self.evictions += 1
+
+    def _pop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        with self._lock:
+            deleted = 0
+            for key in keys:
+                if key in self._entries:
+                    self._pop(key)
+                    deleted += 1
+            return deleted
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                self._pop(key)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+            }
@@ -1,8 +1,95 @@
 import os
 import re
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple, Union
 
 from app.core.keywords import PATCH_KEYWORDS
+from app.core.keyword_matcher import KeywordMatcher
+
+# parse() 결과 LRU 캐시 크기 ((파일명, 부모 폴더명) 조합 수)
+# 스캐너, auto_matcher, 명확성 판단, 스캔 항목 API가 같은 이름을 반복해서 파싱하므로
+# 한 번 파싱한 결과를 재사용한다. 항목당 수백 바이트 수준이라 메모리 부담은 작다.
+PARSE_CACHE_SIZE = 16384
+
+# ===== 정규식은 import 시점에 한 번만 컴파일 =====
+# (패턴 문자열/플래그는 기존 인라인 re.sub/re.search 호출과 동일하게 유지해야 결과가 같다)
+_EXTENSION_RE = re.compile(r'\.[^.]+$')
+_RELEASE_BY_RE = re.compile(r'\bby\s+\w+', re.IGNORECASE)
+_BRACKET_RE = re.compile(r'\[.*?\]')
+_ARCH_INLINE_RE = re.compile(r'[._\s](x64|x86|32bit|64bit)[._\s]', re.IGNORECASE)
+_ARCH_PAREN_RE = re.compile(r'\((x64|x86|32bit|64bit|win|portable)\)', re.IGNORECASE)
+_BUILD_RE = re.compile(r'\bbuild[_\s]*\d+', re.IGNORECASE)
+_DOMAIN_RE = re.compile(r'\.\w{2,3}($|\s)')
+_SEPARATOR_RE = re.compile(r'[._\-\[\]()]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 버전 패턴 (우선순위 순서 - v 접두사 우선)
+_VERSION_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'v(\d+\.\d+\.\d+\.\d+)',        # v1.2.3.4 (v 접두사 우선)
+    r'v(\d+\.\d+\.\d+)',             # v1.2.3 (v 접두사 우선)
+    r'v(\d+\.\d+)',                  # v1.2 (v 접두사 우선)
+    r'(\d+\.\d+\.\d+\.\d+\.\d+)',    # 1.2.3.4.5 (매우 복잡한 버전)
+    r'(\d+\.\d+\.\d+\.\d+)',         # 1.2.3.4
+    r'(\d+\.\d+\.\d+)',              # 1.2.3
+    r'[\s_](\d+\.\d+)[\s_]',         # 공백/언더스코어로 둘러싸인 1.2
+    # 아래 패턴들은 원래 \b를 썼으나, '_'가 단어 문자로 취급되어
+    # 'v2026'/'_2024_'처럼 문자·언더스코어에 바로 붙은 경우 매치되지
+    # 않는 문제가 있었음. 숫자 경계는 (?<!\d)/(?!\d)로, 'v'/'SP'/'R'
+    # 앞 경계는 영숫자만 배제하는 방식으로 교체.
+    r'(?<!\d)(365|360|2024|2023|2022|2021|2020|2019|2018|2017|2016)(?!\d)',  # Office 365, 2021 등 특수 버전
+    r'(?<!\d)(20\d{2})(?!\d)',       # 2022 (연도 형식 버전)
+    r'(?<![A-Za-z0-9])SP(\d+)(?!\d)',  # SP1, SP2 (Service Pack)
+    r'(?<![A-Za-z0-9])R(\d+)(?!\d)',   # R1, R2 (Release)
+    r'(?<![A-Za-z0-9])v(\d+)(?!\d)',   # v1 (단독)
+))
+
+_YEAR_RE = re.compile(r'(?<!\d)((?:19|20)\d{2})(?!\d)')
+_AI_YEAR_RE = re.compile(r'(?:19|20)\d{2}')
+
+# 포터블 키워드 (영문, 단어 경계 기준) - 하나의 정규식으로 합쳐 한 번에 검사
+_PORTABLE_EN_RE = re.compile('|'.join((
+    r'\bportable\b',
+    r'\bportableapps\b',
+    r'\bgreen\b',           # Green Edition
+    r'\bnoinstall\b',
+    r'\bno[_\-]install\b',
+    r'\bstandalone\b',
+    r'\bstand[_\-]alone\b',
+)))
+
+# 포터블 키워드 (한국어 - 원문 포함 검사)
+_PORTABLE_KO_KEYWORDS = ('포터블', '휴대용', '무설치', '단일실행', '이식가능')
+
+# 분할 압축 파일 패턴 (소문자 파일명에 검사)
+_SPLIT_ARCHIVE_RE = re.compile('|'.join((
+    r'\.part\d+\.rar$',      # .part01.rar, .part001.rar
+    r'\.part\d+$',           # .part01, .part02
+    r'\.z\d{2,3}$',          # .z01, .z02, .z001
+    r'\.r\d{2,3}$',          # .r00, .r01, .r02 (WinRAR old format)
+    r'\.\d{3}$',             # .001, .002, .003
+    r'\.7z\.\d{3}$',         # .7z.001, .7z.002
+)))
+
+
+@lru_cache(maxsize=1024)
+def _version_strip_res(ver: str) -> Tuple[Pattern, Pattern, Pattern]:
+    """소프트웨어 이름에서 버전을 지우는 정규식 (버전 문자열별로 컴파일 결과 재사용)"""
+    escaped = re.escape(ver)
+    return (
+        re.compile(rf'\bv?{escaped}\b', re.IGNORECASE),
+        re.compile(rf'\bSP{escaped}\b', re.IGNORECASE),
+        re.compile(rf'\bR{escaped}\b', re.IGNORECASE),
+    )
+
+
+@lru_cache(maxsize=256)
+def _year_strip_re(year: str) -> Pattern:
+    return re.compile(rf'\b{year}\b')
+
+
+@lru_cache(maxsize=256)
+def _vendor_strip_re(vendor: str) -> Pattern:
+    return re.compile(rf'\b{re.escape(vendor)}\b', re.IGNORECASE)
 
 
 class FilenameParser:
@@ -62,6 +149,62 @@ class FilenameParser:
         """
         파일명 또는 폴더명에서 정보 추출
 
+        같은 (filename, parent_folder) 조합은 LRU 캐시에서 바로 반환한다.
+        호출측이 결과 dict를 수정해도 캐시가 오염되지 않도록 사본을 돌려준다.
+
+        Args:
+            filename: 파일명 또는 폴더명
+            parent_folder: 부모 폴더명 (파일명이 모호한 경우 사용)
+
+        Returns:
+            _parse_uncached()와 동일
+        """
+        return dict(_cached_parse(filename, parent_folder))
+
+    @staticmethod
+    def parse_many(
+        items: Iterable[Union[str, Tuple[str, str]]]
+    ) -> List[Dict[str, Optional[str]]]:
+        """
+        여러 이름을 한 번에 파싱 (입력 순서대로 결과 반환)
+
+        배치 안에서 중복된 이름은 한 번만 파싱하고, 나머지는 parse()와 같은
+        LRU 캐시를 공유한다.
+
+        Args:
+            items: 파일명 문자열 또는 (파일명, 부모 폴더명) 튜플의 목록
+
+        Returns:
+            parse() 결과 dict 목록 (items와 같은 길이/순서)
+        """
+        seen: Dict[Tuple[str, str], Dict[str, Optional[str]]] = {}
+        results = []
+        for item in items:
+            key = (item, "") if isinstance(item, str) else (item[0], item[1])
+            parsed = seen.get(key)
+            if parsed is None:
+                parsed = _cached_parse(*key)
+                seen[key] = parsed
+            results.append(dict(parsed))
+        return results
+
+    @staticmethod
+    def cache_info():
+        """parse() LRU 캐시 통계 (hits, misses, maxsize, currsize)"""
+        return _cached_parse.cache_info()
+
+    @staticmethod
+    def cache_clear():
+        """parse() LRU 캐시 비우기 (NOISE_WORDS 등 키워드 세트를 바꾼 뒤 호출, 단어 매처도 다시 만듦)"""
+        global _WORD_MATCHER
+        _WORD_MATCHER = _build_word_matcher()
+        _cached_parse.cache_clear()
+
+    @staticmethod
+    def _parse_uncached(filename: str, parent_folder: str = "") -> Dict[str, Optional[str]]:
+        """
+        파일명 또는 폴더명에서 정보 추출 (캐시 없이 실제 파싱)
+
         Args:
             filename: 파일명 또는 폴더명
             parent_folder: 부모 폴더명 (파일명이 모호한 경우 사용)
@@ -75,7 +218,7 @@ class FilenameParser:
             }
         """
         # 확장자 제거
-        name_without_ext = re.sub(r'\.[^.]+$', '', filename)
+        name_without_ext = _EXTENSION_RE.sub('', filename)
 
         # 버전 정보를 먼저 추출 (노이즈 제거 전)
         version = FilenameParser._extract_version(name_without_ext)
@@ -84,23 +227,23 @@ class FilenameParser:
         year = FilenameParser._extract_year(name_without_ext)
 
         # 릴리즈 그룹 패턴 제거 (by xxx, [xxx])
-        name_without_ext = re.sub(r'\bby\s+\w+', '', name_without_ext, flags=re.IGNORECASE)
-        name_without_ext = re.sub(r'\[.*?\]', '', name_without_ext)
+        name_without_ext = _RELEASE_BY_RE.sub('', name_without_ext)
+        name_without_ext = _BRACKET_RE.sub('', name_without_ext)
 
         # ===== TOP 2: x64/x86 아키텍처 제거 (빈도: 4.5%) =====
         # 패턴: _x64_, .x86., (x64) 등
-        name_without_ext = re.sub(r'[._\s](x64|x86|32bit|64bit)[._\s]', ' ', name_without_ext, flags=re.IGNORECASE)
-        name_without_ext = re.sub(r'\((x64|x86|32bit|64bit|win|portable)\)', '', name_without_ext, flags=re.IGNORECASE)
+        name_without_ext = _ARCH_INLINE_RE.sub(' ', name_without_ext)
+        name_without_ext = _ARCH_PAREN_RE.sub('', name_without_ext)
 
         # Build 번호 패턴 제거 (빈도: 1.4%)
-        name_without_ext = re.sub(r'\bbuild[_\s]*\d+', '', name_without_ext, flags=re.IGNORECASE)
+        name_without_ext = _BUILD_RE.sub('', name_without_ext)
 
         # 웹사이트 도메인 제거 (.ir, .com 등)
-        name_without_ext = re.sub(r'\.\w{2,3}($|\s)', ' ', name_without_ext)
+        name_without_ext = _DOMAIN_RE.sub(' ', name_without_ext)
 
         # 특수문자를 공백으로 변환
-        cleaned = re.sub(r'[._\-\[\]()]', ' ', name_without_ext)
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _SEPARATOR_RE.sub(' ', name_without_ext)
+        cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
 
         # 소프트웨어 이름 추출 (버전, 연도, 노이즈 제거)
         software_name = FilenameParser._extract_software_name(
@@ -109,7 +252,7 @@ class FilenameParser:
 
         # 소프트웨어 이름이 너무 짧거나 일반적인 경우 부모 폴더명 사용
         if (len(software_name) < 3 or
-            software_name.lower() in FilenameParser.NOISE_WORDS) and parent_folder:
+            "noise" in _WORD_MATCHER.token_groups(software_name.lower())) and parent_folder:
             software_name = parent_folder
 
         # 제조사 추정
@@ -134,40 +277,16 @@ class FilenameParser:
     @staticmethod
     def _extract_version(text: str) -> Optional[str]:
         """버전 정보 추출"""
-        # 버전 패턴 (우선순위 순서 - v 접두사 우선)
-        version_patterns = [
-            r'v(\d+\.\d+\.\d+\.\d+)',        # v1.2.3.4 (v 접두사 우선)
-            r'v(\d+\.\d+\.\d+)',             # v1.2.3 (v 접두사 우선)
-            r'v(\d+\.\d+)',                  # v1.2 (v 접두사 우선)
-            r'(\d+\.\d+\.\d+\.\d+\.\d+)',    # 1.2.3.4.5 (매우 복잡한 버전)
-            r'(\d+\.\d+\.\d+\.\d+)',         # 1.2.3.4
-            r'(\d+\.\d+\.\d+)',              # 1.2.3
-            r'[\s_](\d+\.\d+)[\s_]',         # 공백/언더스코어로 둘러싸인 1.2
-            # 아래 패턴들은 원래 \b를 썼으나, '_'가 단어 문자로 취급되어
-            # 'v2026'/'_2024_'처럼 문자·언더스코어에 바로 붙은 경우 매치되지
-            # 않는 문제가 있었음. 숫자 경계는 (?<!\d)/(?!\d)로, 'v'/'SP'/'R'
-            # 앞 경계는 영숫자만 배제하는 방식으로 교체.
-            r'(?<!\d)(365|360|2024|2023|2022|2021|2020|2019|2018|2017|2016)(?!\d)',  # Office 365, 2021 등 특수 버전
-            r'(?<!\d)(20\d{2})(?!\d)',       # 2022 (연도 형식 버전)
-            r'(?<![A-Za-z0-9])SP(\d+)(?!\d)',  # SP1, SP2 (Service Pack)
-            r'(?<![A-Za-z0-9])R(\d+)(?!\d)',   # R1, R2 (Release)
-            r'(?<![A-Za-z0-9])v(\d+)(?!\d)',   # v1 (단독)
-        ]
-
-        versions = []
-        for pattern in version_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        # 우선순위 순서대로 검사해 처음 매치된 버전만 사용 (_VERSION_RES 참고)
+        for pattern in _VERSION_RES:
+            match = pattern.search(text)
             if match:
                 ver = match.group(1)
                 # 너무 긴 버전은 첫 3-4단계만 사용
                 if ver.count('.') > 3:
                     parts = ver.split('.')
                     ver = '.'.join(parts[:3])
-                versions.append(ver)
-
-        # 여러 버전 정보가 있으면 첫 번째만 사용
-        if versions:
-            return versions[0]
+                return ver
 
         return None
 
@@ -179,7 +298,7 @@ class FilenameParser:
         영문자/언더스코어에 바로 붙어있으면 \b(20\d{2})\b가 매치되지 않는다.
         숫자가 아닌 문자 경계를 직접 확인해 이 문제를 회피한다.
         """
-        match = re.search(r'(?<!\d)((?:19|20)\d{2})(?!\d)', text)
+        match = _YEAR_RE.search(text)
         return match.group(1) if match else None
 
     @staticmethod
@@ -207,7 +326,7 @@ class FilenameParser:
         if value in (None, ''):
             return None
         text = str(value).strip()
-        match = re.fullmatch(r'(?:19|20)\d{2}', text)
+        match = _AI_YEAR_RE.fullmatch(text)
         return int(match.group(0)) if match else None
 
     @staticmethod
@@ -221,14 +340,15 @@ class FilenameParser:
         if version:
             # 공백으로 분리된 버전들 각각 제거
             for ver in version.split():
-                result = re.sub(rf'\bv?{re.escape(ver)}\b', '', result, flags=re.IGNORECASE)
+                plain_re, sp_re, release_re = _version_strip_res(ver)
+                result = plain_re.sub('', result)
                 # SP1, R1 같은 패턴도 제거
-                result = re.sub(rf'\bSP{re.escape(ver)}\b', '', result, flags=re.IGNORECASE)
-                result = re.sub(rf'\bR{re.escape(ver)}\b', '', result, flags=re.IGNORECASE)
+                result = sp_re.sub('', result)
+                result = release_re.sub('', result)
 
         # 연도 제거
         if year:
-            result = re.sub(rf'\b{year}\b', '', result)
+            result = _year_strip_re(year).sub('', result)
 
         # 단어 분리
         words = result.split()
@@ -236,13 +356,13 @@ class FilenameParser:
         # 노이즈 단어 필터링
         filtered_words = []
         for word in words:
-            word_lower = word.lower()
+            groups = _WORD_MATCHER.token_groups(word.lower())
 
             # 에디션 단어는 유지
-            if word_lower in FilenameParser.EDITION_WORDS:
+            if "edition" in groups:
                 filtered_words.append(word)
             # 노이즈 단어가 아니고, 숫자만으로 구성되지 않은 경우
-            elif (word_lower not in FilenameParser.NOISE_WORDS and
+            elif ("noise" not in groups and
                   not word.isdigit() and
                   len(word) > 1):
                 filtered_words.append(word)
@@ -263,21 +383,17 @@ class FilenameParser:
 
         # 전체 이름에서 알려진 제조사 찾기
         name_lower = software_name.lower()
-        for vendor in FilenameParser.KNOWN_VENDORS:
-            if vendor in name_lower:
-                # 실제 단어에서 찾아서 원래 대소문자 유지
-                for word in words:
-                    if word.lower() == vendor:
-                        return word.capitalize()
-                # 못 찾았으면 제조사명 그대로 반환
-                if vendor == 'ds':
-                    return 'Dassault Systemes'
-                return vendor.capitalize()
+        # 대부분의 이름에는 알려진 제조사가 없으므로 매처로 먼저 걸러낸다.
+        # 여러 제조사가 들어 있으면 기존과 같은 순서(KNOWN_VENDORS 순회 순서)로 고른다.
+        if _WORD_MATCHER.matches(name_lower, "vendor"):
+            vendor = FilenameParser._first_known_vendor(name_lower, words)
+            if vendor:
+                return vendor
 
         first_word = words[0].lower()
 
         # 첫 단어가 알려진 제조사인 경우
-        if first_word in FilenameParser.KNOWN_VENDORS:
+        if "vendor" in _WORD_MATCHER.token_groups(first_word):
             if first_word == 'ds':
                 return 'Dassault Systemes'
             return words[0].capitalize()
@@ -287,14 +403,29 @@ class FilenameParser:
         #  이는 검증되지 않은 추측이라 오탐이 많아 제거함)
         return None
 
+    @staticmethod
+    def _first_known_vendor(name_lower: str, words) -> Optional[str]:
+        """이름에 부분 문자열로 들어 있는 첫 번째 알려진 제조사 (원래 대소문자 유지)"""
+        for vendor in FilenameParser.KNOWN_VENDORS:
+            if vendor in name_lower:
+                # 실제 단어에서 찾아서 원래 대소문자 유지
+                for word in words:
+                    if word.lower() == vendor:
+                        return word.capitalize()
+                # 못 찾았으면 제조사명 그대로 반환
+                if vendor == 'ds':
+                    return 'Dassault Systemes'
+                return vendor.capitalize()
+        return None
+
     @staticmethod
     def _remove_vendor_from_name(software_name: str, vendor: str) -> str:
         """
         소프트웨어 이름에서 제조사명을 제거 (중복 방지)
         예: "Autodesk AutoCAD" + vendor "Autodesk" → "AutoCAD"
         """
-        cleaned = re.sub(rf'\b{re.escape(vendor)}\b', '', software_name, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _vendor_strip_re(vendor).sub('', software_name)
+        cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
         # 제조사명이 이름 전체였던 경우(제거 시 빈 문자열)에는 원본 유지
         return cleaned if cleaned else software_name
 
@@ -341,34 +472,12 @@ class FilenameParser:
         Returns:
             포터블이면 True, 아니면 False
         """
-        # 포터블 키워드 패턴 (영문, 단어 경계 기준)
-        portable_patterns_en = [
-            r'\bportable\b',
-            r'\bportableapps\b',
-            r'\bgreen\b',           # Green Edition
-            r'\bnoinstall\b',
-            r'\bno[_\-]install\b',
-            r'\bstandalone\b',
-            r'\bstand[_\-]alone\b',
-        ]
-
-        # 포터블 키워드 (한국어 - 원문 포함 검사)
-        portable_keywords_ko = [
-            '포터블',
-            '휴대용',
-            '무설치',
-            '단일실행',
-            '이식가능',
-        ]
-
         combined = f"{filename} {parent_folder}"
-        combined_lower = combined.lower()
 
-        for pattern in portable_patterns_en:
-            if re.search(pattern, combined_lower):
-                return True
+        if _PORTABLE_EN_RE.search(combined.lower()):
+            return True
 
-        for keyword in portable_keywords_ko:
+        for keyword in _PORTABLE_KO_KEYWORDS:
             if keyword in combined:
                 return True
 
@@ -385,20 +494,21 @@ class FilenameParser:
         Returns:
             분할 압축 파일이면 True, 아니면 False
         """
-        # 분할 압축 파일 패턴
-        split_patterns = [
-            r'\.part\d+\.rar$',      # .part01.rar, .part001.rar
-            r'\.part\d+$',           # .part01, .part02
-            r'\.z\d{2,3}$',          # .z01, .z02, .z001
-            r'\.r\d{2,3}$',          # .r00, .r01, .r02 (WinRAR old format)
-            r'\.\d{3}$',             # .001, .002, .003
-            r'\.7z\.\d{3}$',         # .7z.001, .7z.002
-        ]
-
-        filename_lower = filename.lower()
-        for pattern in split_patterns:
-            if re.search(pattern, filename_lower):
-                return True
+        return _SPLIT_ARCHIVE_RE.search(filename.lower()) is not None
+
+
+
+# (filename, parent_folder) → 파싱 결과 (parse()/parse_many()에서 사본으로 반환)
+_cached_parse = lru_cache(maxsize=PARSE_CACHE_SIZE)(FilenameParser._parse_uncached)
+
+def _build_word_matcher() -> KeywordMatcher:
+    """노이즈/에디션/제조사 단어 매처 (단어 단위 그룹 조회 + 제조사 부분 문자열 검색)"""
+    return KeywordMatcher({
+        "noise": FilenameParser.NOISE_WORDS,
+        "edition": FilenameParser.EDITION_WORDS,
+        "vendor": FilenameParser.KNOWN_VENDORS,
+    })
 
-        return False
 
+# classifier.py와 같은 KeywordMatcher로 단어 분류와 제조사 포함 여부를 검사
+_WORD_MATCHER = _build_word_matcher()
@@ -1,41 +1,275 @@
 """
 Redis 기반 캐시 헬퍼
 API 응답 및 통계 데이터 캐싱용
+
+캐시 키는 네임스페이스(products, detail, search, stats)의 세대 번호를 포함한다.
+  products_list:g{세대}:{파라미터 해시}
+무효화는 네임스페이스 세대 카운터를 INCR 한 번 올리는 것으로 끝나고 (키 SCAN/DELETE 없음),
+이전 세대 키는 더 이상 조회되지 않다가 TTL로 사라진다.
+
+제품 목록/상세/검색 응답은 들어 있는 제품 ID마다 태그 집합(cache_tag:product:{id})에
+키를 등록한다. 제품 하나의 필드만 바뀌는 수정(아이콘, 스크린샷, 설명 등)은
+invalidate_product_cache()로 그 제품이 들어 있는 키만 지우고, 제품 추가/삭제나
+목록 구성이 바뀌는 수정은 invalidate_cache()로 네임스페이스 전체를 무효화한다.
+
+워커마다 프로세스 내부 LRU(L1, local_cache.py)를 Redis(L2) 앞에 둔다.
+- L1 적중 시 Redis 왕복과 json.loads 없이 응답 (네임스페이스 세대 번호도 L1에 보관)
+- 무효화(세대 증가, 태그 키 삭제, 패턴/전체 삭제)는 Redis pub/sub으로 모든 워커에 알려
+  각 워커가 L1 항목을 버린다
+- L1은 pub/sub 구독이 연결된 동안에만 사용 (연결이 끊기면 비우고 L2만 사용)
+- 메시지를 놓쳐도 L1 항목은 CACHE_L1_TTL_SECONDS 안에 만료
+
+cache_response는 같은 키의 동시 미스를 한 번의 실행으로 합친다 (single-flight).
+- 워커 안: 진행 중인 키마다 asyncio Future 하나, 나머지 요청은 그 결과를 기다림
+- 워커 간: 짧은 Redis 잠금(cache_lock:{키})을 잡은 워커만 실행, 나머지는 값이 저장되기를 기다림
+hard_ttl을 지정한 엔드포인트는 ttl(soft)이 지난 값을 hard_ttl까지 그대로 응답하고
+백그라운드에서 한 번만 다시 계산한다 (stale-while-revalidate).
+세대 증가/태그 삭제로 무효화된 값은 조회되지 않으므로 오래된 값 응답은 TTL 만료에만 해당한다.
+
+요청 경로(cache_response)는 redis.asyncio 클라이언트(워커당 연결 풀 하나)를 사용해 이벤트 루프를
+막지 않는다. async 엔드포인트/코루틴의 무효화도 같은 클라이언트를 쓰는 ainvalidate_cache(),
+ainvalidate_product_cache()로 한다. 동기 무효화 헬퍼(invalidate_cache(), invalidate_product_cache())와
+pub/sub 구독 스레드는 파일 감시 스레드와 동기(def) 엔드포인트용으로 동기 클라이언트를 쓴다.
+두 클라이언트 모두 짧은 타임아웃과 차단기를 공유한다.
+- 연속 실패가 REDIS_BREAKER_FAILURE_THRESHOLD번이면 차단기가 열려 캐시 없이 원본 함수만 실행
+- 열린 동안 앱 이벤트 루프의 백그라운드 작업이 REDIS_BREAKER_PROBE_INTERVAL_SECONDS마다 PING
+- 다시 연결되면 닫고, 열린 동안 무효화를 놓쳤으면 모든 네임스페이스 세대를 올린다
+- import 시점에는 연결하지 않는다 (시작 시 Redis가 없어도 나중에 연결되면 캐시 사용)
 """
 import json
+import time
+import asyncio
+import uuid
 import hashlib
 import logging
-from typing import Optional, Any, Callable
+import threading
+from typing import Optional, Any, Callable, Dict, Iterable, Set, Tuple
 from functools import wraps
 import redis
+import redis.asyncio as aioredis
 from app.config import settings
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.local_cache import LocalLRUCache
 
 logger = logging.getLogger(__name__)
 
+# 캐시 프리픽스 → 무효화 네임스페이스 (여기 없는 프리픽스는 프리픽스 자체가 네임스페이스)
+CACHE_NAMESPACES = {
+    "products_list": "products",
+    "products_recent": "products",
+    "products_by_category": "products",
+    "product_detail": "detail",
+    "search_suggestions": "search",
+    "stats_overview": "stats",
+    "stats_categories": "stats",
+    "stats_vendors": "stats",
+}
+
+# 네임스페이스 세대 카운터 키 프리픽스
+GENERATION_KEY_PREFIX = "cache_gen"
+
+# 제품 ID 태그 집합 키 프리픽스와 태그를 기록할 네임스페이스 (stats는 집계값이라 제외)
+PRODUCT_TAG_PREFIX = "cache_tag:product"
+TAGGED_NAMESPACES = {"products", "detail", "search"}
+
+# 제품 무효화 시각 기록 유지 시간 (초)
+# 무효화 전에 시작해 무효화 뒤에 끝난 요청이 옛 데이터를 태그와 함께 저장하지 않도록 확인하는 데 쓴다.
+PRODUCT_TAG_STAMP_TTL = 120
+
+# 워커 간 L1 무효화 메시지 채널
+INVALIDATION_CHANNEL = "cache_invalidation"
+
+# 캐시 채우기 잠금 키 프리픽스 (워커 간 single-flight)
+LOCK_KEY_PREFIX = "cache_lock"
+
+# 잠금 해제 (토큰이 같을 때만 삭제, 만료 후 다른 워커가 잡은 잠금을 지우지 않도록)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# cache_response가 저장하는 값의 신선도 표시 필드 (soft TTL 만료 시각, epoch 초)
+FRESH_UNTIL_FIELD = "__fresh_until__"
+
+
+def cache_namespace(prefix: str) -> str:
+    """캐시 프리픽스가 속한 무효화 네임스페이스"""
+    return CACHE_NAMESPACES.get(prefix, prefix)
+
+
+def extract_product_ids(payload: Any) -> Set[int]:
+    """
+    직렬화된 응답에 들어 있는 제품 ID 목록
+    "id"와 "title"이 있는 dict를 제품으로 보고, 그 안(versions 등)은 더 내려가지 않는다.
+    """
+    product_ids = set()
+    stack = [payload]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            product_id = value.get("id")
+            if isinstance(product_id, int) and "title" in value:
+                product_ids.add(product_id)
+            else:
+                stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return product_ids
+
 
 class RedisCache:
     """Redis 캐시 관리 클래스"""
 
     def __init__(self):
         """Redis 클라이언트 초기화"""
+        # L1 (프로세스 내부) 캐시와 계층별 적중 통계
+        self.local = LocalLRUCache(settings.CACHE_L1_MAX_ENTRIES, settings.CACHE_L1_MAX_BYTES)
+        self.stats = {"l1_hits": 0, "l1_misses": 0, "l2_hits": 0, "l2_misses": 0, "invalidation_messages": 0}
+        # 네임스페이스 → (세대 번호, 읽은 시각)
+        self._local_generations: Dict[str, Tuple[int, float]] = {}
+        # L1 무효화가 일어날 때마다 증가 (L2에서 읽는 동안 무효화되면 L1에 넣지 않음)
+        self._epoch = 0
+        self._instance_id = uuid.uuid4().hex
+        self._listening = False
+        self._listener: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        # 연속 실패 시 캐시 우회, 열린 동안 놓친 무효화가 있으면 다시 연결될 때 전체 세대 증가
+        self.breaker = CircuitBreaker(settings.REDIS_BREAKER_FAILURE_THRESHOLD)
+        self._missed_invalidation = False
+        self._probe_task: Optional[asyncio.Task] = None
+
+        # 비동기 클라이언트는 생성된 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만든다
+        self._aclient: Optional[aioredis.Redis] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._release_lock_script = None
+
         try:
+            # 연결은 처음 명령을 보낼 때 맺는다 (import 시점에 Redis가 없어도 영구 비활성화하지 않음)
             self.client = redis.from_url(
                 settings.REDIS_URL,
                 decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5
+                socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+                max_connections=settings.REDIS_MAX_CONNECTIONS
             )
-            # 연결 테스트
-            self.client.ping()
-            self.enabled = True
-            logger.info(f"Connected to Redis: {settings.REDIS_URL}")
         except Exception as e:
-            logger.error(f"Failed to connect to Redis: {e}", exc_info=True)
+            logger.error(f"Invalid Redis configuration: {e}", exc_info=True)
             logger.warning("Cache will be disabled")
             self.client = None
-            self.enabled = False
 
-    def get(self, key: str) -> Optional[Any]:
+    @property
+    def enabled(self) -> bool:
+        """캐시 사용 여부 (Redis가 설정되어 있고 차단기가 닫혀 있을 때)"""
+        return self.client is not None and self.breaker.closed
+
+    # ------------------------------------------------------------------
+    # 비동기 클라이언트 / 차단기
+    # ------------------------------------------------------------------
+
+    def async_client(self) -> aioredis.Redis:
+        """현재 이벤트 루프의 공유 클라이언트 (연결 풀이 가득 차면 타임아웃까지 빈 연결을 기다림)"""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            # 이전 루프의 연결은 그 루프와 함께 정리되므로 참조만 버린다
+            pool = aioredis.BlockingConnectionPool.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS
+            )
+            self._aclient = aioredis.Redis(connection_pool=pool)
+            self._aclient_loop = loop
+            self._release_lock_script = self._aclient.register_script(_RELEASE_LOCK_SCRIPT)
+        return self._aclient
+
+    def _succeeded(self):
+        self.breaker.record_success()
+
+    def _failed(self, message: str, error: Exception):
+        """Redis 명령 실패 기록 (연속 실패가 임계값에 도달하면 차단기 열림)"""
+        logger.warning(f"{message}: {error}")
+        if self.breaker.record_failure():
+            logger.error(
+                f"Redis cache circuit opened after {self.breaker.failure_threshold} consecutive failures "
+                f"(bypassing cache, probing every {settings.REDIS_BREAKER_PROBE_INTERVAL_SECONDS}s)"
+            )
+
+    def note_missed_invalidation(self):
+        """무효화를 Redis에 반영하지 못함 (다시 연결되면 모든 네임스페이스 세대를 올림)"""
+        if self.client is not None:
+            self._missed_invalidation = True
+
+    async def start(self):
+        """앱 시작 시 연결 확인, 차단기 확인 작업과 L1 무효화 구독 시작"""
+        if self.client is None:
+            return
+        try:
+            await self.async_client().ping()
+            self.breaker.reset()
+            logger.info(f"Connected to Redis: {settings.REDIS_URL}")
+        except Exception as e:
+            self.breaker.trip()
+            logger.warning(f"Redis unavailable at startup ({e}), running without cache until it recovers")
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = asyncio.create_task(self._probe_loop())
+        # 워커 간 L1 캐시 무효화 메시지 구독 (연결되면 프로세스 내부 캐시 사용 시작)
+        self.start_invalidation_listener()
+
+    async def aclose(self):
+        """앱 종료 시 확인 작업, 구독 스레드, 연결 풀 정리"""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
+        self.stop_invalidation_listener()
+        client, self._aclient = self._aclient, None
+        if client is not None:
+            try:
+                await client.aclose(close_connection_pool=True)
+            except Exception as e:
+                logger.debug(f"Redis async client close failed: {e}")
+
+    async def _probe_loop(self):
+        """차단기가 열려 있으면 주기적으로 PING, 성공하면 다시 캐시 사용"""
+        while True:
+            await asyncio.sleep(settings.REDIS_BREAKER_PROBE_INTERVAL_SECONDS)
+            if self.breaker.closed:
+                continue
+            try:
+                await self.async_client().ping()
+            except Exception as e:
+                logger.debug(f"Redis probe failed: {e}")
+                continue
+            try:
+                await self._recover()
+            except Exception as e:
+                logger.warning(f"Redis recovery failed: {e}")
+
+    async def _recover(self):
+        """다시 연결됨: 놓친 무효화가 있으면 모든 네임스페이스 세대를 올린 뒤 차단기 닫기"""
+        if self._missed_invalidation:
+            namespaces = sorted(set(CACHE_NAMESPACES.values()))
+            pipe = self.async_client().pipeline(transaction=False)
+            for namespace in namespaces:
+                pipe.set(self._generation_key(namespace), self._generation_seed(), nx=True)
+                pipe.incr(self._generation_key(namespace))
+            await pipe.execute()
+            self._missed_invalidation = False
+            self._reset_local()
+            await self._apublish({"op": "clear"})
+            logger.info(f"Cache generations bumped after outage: {namespaces}")
+        if self.breaker.reset():
+            logger.info("Redis cache circuit closed (Redis reachable again)")
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장 (요청 경로, 비동기)
+    # ------------------------------------------------------------------
+
+    async def get(self, key: str) -> Optional[Any]:
         """
         캐시에서 값 가져오기
 
@@ -48,16 +282,30 @@ class RedisCache:
         if not self.enabled:
             return None
 
+        if self.l1_active:
+            cached = self.local.get(key)
+            if cached is not None:
+                self.stats["l1_hits"] += 1
+                return cached
+            self.stats["l1_misses"] += 1
+
         try:
-            value = self.client.get(key)
+            epoch = self._epoch
+            value = await self.async_client().get(key)
+            self._succeeded()
             if value:
-                return json.loads(value)
+                parsed = json.loads(value)
+                self.stats["l2_hits"] += 1
+                if epoch == self._epoch:
+                    self._set_local(key, value, settings.CACHE_L1_TTL_SECONDS, parsed)
+                return parsed
+            self.stats["l2_misses"] += 1
             return None
         except Exception as e:
-            logger.error(f"Get error for key '{key}': {e}", exc_info=True)
+            self._failed(f"Get error for key '{key}'", e)
             return None
 
-    def set(self, key: str, value: Any, ttl: int = 300) -> bool:
+    async def set(self, key: str, value: Any, ttl: int = 300) -> bool:
         """
         캐시에 값 저장
 
@@ -75,10 +323,12 @@ class RedisCache:
         try:
             # Pydantic 모델 처리
             serialized = self._serialize_value(value)
-            self.client.setex(key, ttl, serialized)
+            await self.async_client().setex(key, ttl, serialized)
+            self._succeeded()
+            self._set_local(key, serialized, ttl)
             return True
         except Exception as e:
-            logger.error(f"Set error for key '{key}': {e}", exc_info=True)
+            self._failed(f"Set error for key '{key}'", e)
             return False
 
     def _serialize_value(self, value: Any) -> str:
@@ -128,6 +378,138 @@ class RedisCache:
         # 기본값
         return obj
 
+    def _product_tag_key(self, product_id: int) -> str:
+        return f"{PRODUCT_TAG_PREFIX}:{product_id}"
+
+    async def set_tagged(
+        self,
+        key: str,
+        value: Any,
+        ttl: int,
+        product_ids: Iterable[int],
+        started_at: Optional[float] = None
+    ) -> bool:
+        """
+        캐시에 값 저장 + 제품 ID 태그 집합에 키 등록
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: TTL (초)
+            product_ids: 값에 들어 있는 제품 ID
+            started_at: 값을 만들기 시작한 시각 (그 뒤에 무효화된 제품이 있으면 저장하지 않음)
+
+        Returns:
+            저장 여부
+        """
+        if not self.enabled:
+            return False
+
+        tags = [self._product_tag_key(product_id) for product_id in product_ids]
+        if not tags:
+            return await self.set(key, value, ttl)
+
+        try:
+            client = self.async_client()
+            if started_at is not None:
+                stamps = await client.mget([f"{tag}:invalidated_at" for tag in tags])
+                if any(stamp is not None and float(stamp) >= started_at for stamp in stamps):
+                    logger.debug(f"Cache SET skipped (product invalidated while building): {key}")
+                    return False
+
+            serialized = self._serialize_value(value)
+            pipe = client.pipeline(transaction=False)
+            pipe.setex(key, ttl, serialized)
+            for tag in tags:
+                pipe.sadd(tag, key)
+                # 태그 집합은 등록된 키 중 가장 긴 TTL만큼 유지 (새 집합이면 NX, 기존 집합은 GT로 연장)
+                pipe.expire(tag, ttl, nx=True)
+                pipe.expire(tag, ttl, gt=True)
+            await pipe.execute()
+            self._succeeded()
+            self._set_local(key, serialized, ttl)
+            return True
+        except Exception as e:
+            self._failed(f"Tagged set error for key '{key}'", e)
+            return False
+
+    # ------------------------------------------------------------------
+    # 삭제 / 무효화 (동기, 스레드와 동기 엔드포인트에서도 호출)
+    # ------------------------------------------------------------------
+
+    def delete_product_tags(self, product_ids: Iterable[int]) -> int:
+        """
+        제품 ID 태그에 등록된 캐시 키를 모두 삭제
+
+        무효화 시각을 먼저 기록한 뒤 태그 집합을 읽으므로, 그 사이에 저장을 시도한 요청은
+        시각 확인에서 걸러지거나 읽은 태그 집합에 포함된다.
+
+        Returns:
+            삭제된 키 개수
+        """
+        if not self.enabled:
+            return 0
+
+        tags = [self._product_tag_key(product_id) for product_id in set(product_ids)]
+        if not tags:
+            return 0
+
+        try:
+            now = time.time()
+            pipe = self.client.pipeline(transaction=False)
+            for tag in tags:
+                pipe.setex(f"{tag}:invalidated_at", PRODUCT_TAG_STAMP_TTL, now)
+            for tag in tags:
+                pipe.smembers(tag)
+            members = pipe.execute()[len(tags):]
+
+            keys = set().union(*members)
+            pipe = self.client.pipeline(transaction=False)
+            if keys:
+                pipe.delete(*keys)
+            pipe.delete(*tags)
+            results = pipe.execute()
+            self._succeeded()
+            self._drop_local_keys(keys)
+            return results[0] if keys else 0
+        except Exception as e:
+            self._failed(f"Delete product tags error for {tags}", e)
+            self.note_missed_invalidation()
+            return 0
+
+    async def adelete_product_tags(self, product_ids: Iterable[int]) -> int:
+        """delete_product_tags()의 비동기 버전 (이벤트 루프에서 호출하는 쪽용)"""
+        if not self.enabled:
+            return 0
+
+        tags = [self._product_tag_key(product_id) for product_id in set(product_ids)]
+        if not tags:
+            return 0
+
+        try:
+            client = self.async_client()
+            now = time.time()
+            pipe = client.pipeline(transaction=False)
+            for tag in tags:
+                pipe.setex(f"{tag}:invalidated_at", PRODUCT_TAG_STAMP_TTL, now)
+            for tag in tags:
+                pipe.smembers(tag)
+            members = (await pipe.execute())[len(tags):]
+
+            keys = set().union(*members)
+            pipe = client.pipeline(transaction=False)
+            if keys:
+                pipe.delete(*keys)
+            pipe.delete(*tags)
+            results = await pipe.execute()
+            self._succeeded()
+            await self._adrop_local_keys(keys)
+            return results[0] if keys else 0
+        except Exception as e:
+            self._failed(f"Delete product tags error for {tags}", e)
+            self.note_missed_invalidation()
+            return 0
+
     def delete(self, key: str) -> bool:
         """
         캐시에서 값 삭제
@@ -143,9 +525,12 @@ class RedisCache:
 
         try:
             self.client.delete(key)
+            self._succeeded()
+            self._drop_local_keys([key])
             return True
         except Exception as e:
-            logger.error(f"Delete error for key '{key}': {e}", exc_info=True)
+            self._failed(f"Delete error for key '{key}'", e)
+            self.note_missed_invalidation()
             return False
 
     def delete_pattern(self, pattern: str) -> int:
@@ -166,9 +551,35 @@ class RedisCache:
             deleted = 0
             for key in self.client.scan_iter(match=pattern, count=500):
                 deleted += self.client.delete(key)
+            self._succeeded()
+            self._drop_local_all()
             return deleted
         except Exception as e:
-            logger.error(f"Delete pattern error for '{pattern}': {e}", exc_info=True)
+            self._failed(f"Delete pattern error for '{pattern}'", e)
+            self.note_missed_invalidation()
+            return 0
+
+    async def adelete_pattern(self, pattern: str) -> int:
+        """delete_pattern()의 비동기 버전 (SCAN 한 페이지씩 읽어 한 번에 삭제)"""
+        if not self.enabled:
+            return 0
+
+        try:
+            client = self.async_client()
+            deleted = 0
+            cursor = 0
+            while True:
+                cursor, keys = await client.scan(cursor=cursor, match=pattern, count=500)
+                if keys:
+                    deleted += await client.delete(*keys)
+                if cursor == 0:
+                    break
+            self._succeeded()
+            await self._adrop_local_all()
+            return deleted
+        except Exception as e:
+            self._failed(f"Delete pattern error for '{pattern}'", e)
+            self.note_missed_invalidation()
             return 0
 
     def clear_all(self) -> bool:
@@ -183,11 +594,322 @@ class RedisCache:
 
         try:
             self.client.flushdb()
+            self._succeeded()
+            self._drop_local_all()
             return True
         except Exception as e:
-            logger.error(f"Clear all error: {e}", exc_info=True)
+            self._failed("Clear all error", e)
+            self.note_missed_invalidation()
             return False
 
+    # ------------------------------------------------------------------
+    # L1 (프로세스 내부 캐시) / 워커 간 무효화
+    # ------------------------------------------------------------------
+
+    @property
+    def l1_active(self) -> bool:
+        """L1 사용 여부 (무효화 메시지를 받을 수 있을 때만)"""
+        return settings.CACHE_L1_ENABLED and self._listening
+
+    def _set_local(self, key: str, serialized: str, ttl: int, parsed: Any = None):
+        if not self.l1_active:
+            return
+        if parsed is None:
+            parsed = json.loads(serialized)
+        self.local.set(key, parsed, min(ttl, settings.CACHE_L1_TTL_SECONDS), len(serialized))
+
+    def _remember_generation(self, namespace: str, generation: int):
+        """L1에 세대 번호 보관 (세대는 증가만 하므로 이미 더 큰 값을 받았으면 유지)"""
+        if not self.l1_active:
+            return
+        current = self._local_generations.get(namespace)
+        if current is None or generation >= current[0]:
+            self._local_generations[namespace] = (generation, time.monotonic())
+
+    def _drop_local_keys(self, keys: Iterable[str]):
+        keys = list(keys)
+        self._epoch += 1
+        self.local.delete_many(keys)
+        if keys:
+            self._publish({"op": "keys", "keys": keys})
+
+    async def _adrop_local_keys(self, keys: Iterable[str]):
+        keys = list(keys)
+        self._epoch += 1
+        self.local.delete_many(keys)
+        if keys:
+            await self._apublish({"op": "keys", "keys": keys})
+
+    def _drop_local_all(self):
+        self._reset_local()
+        self._publish({"op": "clear"})
+
+    async def _adrop_local_all(self):
+        self._reset_local()
+        await self._apublish({"op": "clear"})
+
+    def _reset_local(self):
+        self._epoch += 1
+        self.local.clear()
+        self._local_generations = {}
+
+    def _publish(self, message: Dict):
+        """다른 워커에 L1 무효화 알림"""
+        try:
+            self.client.publish(INVALIDATION_CHANNEL, json.dumps({**message, "sender": self._instance_id}))
+        except Exception as e:
+            logger.warning(f"Cache invalidation publish failed: {e}")
+
+    async def _apublish(self, message: Dict):
+        try:
+            await self.async_client().publish(
+                INVALIDATION_CHANNEL, json.dumps({**message, "sender": self._instance_id})
+            )
+        except Exception as e:
+            logger.warning(f"Cache invalidation publish failed: {e}")
+
+    def _apply_message(self, data: str):
+        """다른 워커가 보낸 무효화 알림 반영"""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        self.stats["invalidation_messages"] += 1
+        if message.get("sender") == self._instance_id:
+            return
+
+        self._epoch += 1
+        op = message.get("op")
+        if op == "generation":
+            self._remember_generation(message["namespace"], int(message["generation"]))
+        elif op == "keys":
+            self.local.delete_many(message.get("keys") or [])
+        else:
+            self._reset_local()
+
+    def start_invalidation_listener(self):
+        """무효화 채널 구독 스레드 시작 (구독이 연결되면 L1 사용 시작, 끊기면 스스로 재연결)"""
+        if self.client is None or not settings.CACHE_L1_ENABLED:
+            return
+        if self._listener is not None and self._listener.is_alive():
+            return
+        self._stop.clear()
+        self._listener = threading.Thread(target=self._listen, name="cache-invalidation", daemon=True)
+        self._listener.start()
+
+    def stop_invalidation_listener(self):
+        self._stop.set()
+        if self._listener is not None:
+            self._listener.join(timeout=5)
+            self._listener = None
+
+    def _listen(self):
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                # 구독 전에 놓친 메시지가 있을 수 있으므로 비운 상태에서 시작
+                self._reset_local()
+                self._listening = True
+                logger.info("Cache invalidation listener subscribed (L1 cache enabled)")
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._apply_message(message["data"])
+            except Exception as e:
+                if not self._stop.is_set():
+                    logger.warning(f"Cache invalidation listener disconnected: {e}")
+            finally:
+                self._listening = False
+                self._reset_local()
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            # 재연결 전 대기
+            self._stop.wait(5)
+
+    def tier_stats(self) -> Dict:
+        """계층별 적중/미스 통계 (관리자 통계용)"""
+        return {
+            "l1": {
+                "active": self.l1_active,
+                "hits": self.stats["l1_hits"],
+                "misses": self.stats["l1_misses"],
+                "ttl_seconds": settings.CACHE_L1_TTL_SECONDS,
+                **self.local.stats(),
+            },
+            "l2": {
+                "hits": self.stats["l2_hits"],
+                "misses": self.stats["l2_misses"],
+            },
+            "invalidation_messages": self.stats["invalidation_messages"],
+            "breaker": self.breaker.stats(),
+        }
+
+    async def acquire_lock(self, key: str, ttl: int) -> Optional[str]:
+        """
+        캐시 키 채우기 잠금 (SET NX, ttl초 뒤 자동 해제)
+
+        Returns:
+            잠금 토큰 (다른 워커가 잡고 있으면 None, Redis 오류 시에는 잠금 없이 진행하도록 빈 문자열)
+        """
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.async_client().set(f"{LOCK_KEY_PREFIX}:{key}", token, nx=True, ex=ttl)
+            self._succeeded()
+            return token if acquired else None
+        except Exception as e:
+            self._failed(f"Cache lock error for key '{key}'", e)
+            return ""
+
+    async def release_lock(self, key: str, token: str):
+        if not token:
+            return
+        try:
+            self.async_client()
+            await self._release_lock_script(keys=[f"{LOCK_KEY_PREFIX}:{key}"], args=[token])
+        except Exception as e:
+            self._failed(f"Cache unlock error for key '{key}'", e)
+
+    async def poll_fill(self, key: str) -> Tuple[Optional[Any], bool]:
+        """
+        다른 워커가 채우는 중인 키 확인 (값과 잠금을 한 번의 왕복으로 조회)
+
+        Returns:
+            (저장된 값 또는 None, 잠금이 아직 있는지)
+        """
+        try:
+            pipe = self.async_client().pipeline(transaction=False)
+            pipe.get(key)
+            pipe.exists(f"{LOCK_KEY_PREFIX}:{key}")
+            value, locked = await pipe.execute()
+            self._succeeded()
+            return (json.loads(value) if value else None), bool(locked)
+        except Exception as e:
+            self._failed(f"Cache poll error for key '{key}'", e)
+            return None, False
+
+    async def announce_update(self, key: str):
+        """같은 키를 새 값으로 덮어쓴 뒤 다른 워커의 L1 사본 폐기 (자기 L1은 새 값 유지)"""
+        if settings.CACHE_L1_ENABLED:
+            await self._apublish({"op": "keys", "keys": [key]})
+
+    def _generation_key(self, namespace: str) -> str:
+        return f"{GENERATION_KEY_PREFIX}:{namespace}"
+
+    @staticmethod
+    def _generation_seed() -> int:
+        """
+        세대 카운터가 없을 때 만들 초기값 (현재 시각 ms, SET NX로 사용)
+        카운터만 지워지거나(메모리 부족 eviction 등) 재시작되어도 예전 세대 번호와 겹치지 않도록
+        0이 아닌 시각 기반 값에서 시작한다.
+        """
+        return int(time.time() * 1000)
+
+    async def get_generation(self, namespace: str) -> Optional[int]:
+        """
+        네임스페이스의 현재 세대 번호
+
+        Returns:
+            세대 번호 (Redis 오류 시 None)
+        """
+        if not self.enabled:
+            return None
+
+        if self.l1_active:
+            cached = self._local_generations.get(namespace)
+            if cached is not None and time.monotonic() - cached[1] < settings.CACHE_L1_TTL_SECONDS:
+                return cached[0]
+
+        try:
+            client = self.async_client()
+            key = self._generation_key(namespace)
+            value = await client.get(key)
+            if value is None:
+                # 없으면 만들고 다시 읽기를 한 번의 왕복으로
+                pipe = client.pipeline(transaction=False)
+                pipe.set(key, self._generation_seed(), nx=True)
+                pipe.get(key)
+                _, value = await pipe.execute()
+            self._succeeded()
+            generation = int(value)
+            self._remember_generation(namespace, generation)
+            return generation
+        except Exception as e:
+            self._failed(f"Get generation error for namespace '{namespace}'", e)
+            return None
+
+    def bump_generation(self, namespace: str) -> Optional[int]:
+        """
+        네임스페이스 세대 번호 증가 (해당 네임스페이스의 모든 캐시 무효화)
+
+        Returns:
+            새 세대 번호 (Redis 오류 시 None)
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            # 없으면 만든 뒤 증가 (한 번의 왕복)
+            pipe = self.client.pipeline(transaction=False)
+            pipe.set(self._generation_key(namespace), self._generation_seed(), nx=True)
+            pipe.incr(self._generation_key(namespace))
+            generation = pipe.execute()[1]
+            self._succeeded()
+            self._remember_generation(namespace, generation)
+            self._publish({"op": "generation", "namespace": namespace, "generation": generation})
+            return generation
+        except Exception as e:
+            self._failed(f"Bump generation error for namespace '{namespace}'", e)
+            self.note_missed_invalidation()
+            return None
+
+    async def abump_generations(self, namespaces: Iterable[str]) -> Dict[str, Optional[int]]:
+        """
+        여러 네임스페이스 세대 번호를 한 번의 왕복으로 증가 (bump_generation()의 비동기 버전)
+
+        Returns:
+            {네임스페이스: 새 세대 번호} (Redis 오류 시 값이 None)
+        """
+        namespaces = list(dict.fromkeys(namespaces))
+        if not self.enabled:
+            return {namespace: None for namespace in namespaces}
+        if not namespaces:
+            return {}
+
+        try:
+            pipe = self.async_client().pipeline(transaction=False)
+            for namespace in namespaces:
+                pipe.set(self._generation_key(namespace), self._generation_seed(), nx=True)
+                pipe.incr(self._generation_key(namespace))
+            generations = dict(zip(namespaces, (await pipe.execute())[1::2]))
+            self._succeeded()
+        except Exception as e:
+            self._failed(f"Bump generation error for namespaces {namespaces}", e)
+            self.note_missed_invalidation()
+            return {namespace: None for namespace in namespaces}
+
+        for namespace, generation in generations.items():
+            self._remember_generation(namespace, generation)
+            await self._apublish({"op": "generation", "namespace": namespace, "generation": generation})
+        return generations
+
+    async def generations(self) -> Dict[str, Optional[int]]:
+        """알려진 네임스페이스별 현재 세대 번호 (관리자 통계용, MGET 한 번)"""
+        namespaces = sorted(set(CACHE_NAMESPACES.values()))
+        try:
+            values = await self.async_client().mget([self._generation_key(namespace) for namespace in namespaces])
+        except Exception as e:
+            self._failed("Get generations error", e)
+            values = [None] * len(namespaces)
+        return {
+            namespace: int(value) if value is not None else None
+            for namespace, value in zip(namespaces, values)
+        }
+
     def generate_key(self, prefix: str, **kwargs) -> str:
         """
         캐시 키 생성 (파라미터 기반 해싱)
@@ -209,19 +931,194 @@ class RedisCache:
 redis_cache = RedisCache()
 
 
-def cache_response(prefix: str = "api", ttl: int = 300):
+# 워커 안에서 채우는 중인 캐시 키 → 직렬화된 결과 Future (single-flight)
+_inflight: Dict[str, asyncio.Future] = {}
+# 워커 안에서 백그라운드 갱신 중인 캐시 키와 그 작업 (완료 전에 가비지 컬렉션되지 않도록 참조 유지)
+_refreshing: Set[str] = set()
+_refresh_tasks: Set[asyncio.Task] = set()
+
+
+def _unwrap_cached(cached: Any) -> Tuple[Any, bool]:
+    """저장된 값 → (응답 값, soft TTL 이내 여부), 신선도 표시가 없는 값은 신선한 것으로 본다"""
+    if isinstance(cached, dict) and FRESH_UNTIL_FIELD in cached:
+        return cached.get("value"), time.time() < cached[FRESH_UNTIL_FIELD]
+    return cached, True
+
+
+async def _fill_cache(
+    cache_key: str,
+    namespace: str,
+    ttl: int,
+    hard_ttl: int,
+    compute: Callable,
+    overwrite: bool = False
+) -> Tuple[Any, Any]:
+    """
+    원본 함수를 실행해 캐시에 저장
+
+    Returns:
+        (원본 결과, 직렬화된 결과)
+    """
+    started_at = time.time()
+    result = await compute()
+
+    # jsonable_encoder로 SQLAlchemy 객체 → JSON 직렬화 후 캐시 저장
+    from fastapi.encoders import jsonable_encoder
+    serializable = jsonable_encoder(result)
+    try:
+        entry = {FRESH_UNTIL_FIELD: time.time() + ttl, "value": serializable}
+        if namespace in TAGGED_NAMESPACES:
+            # 들어 있는 제품 ID로 태그 (제품 단위 무효화용)
+            stored = await redis_cache.set_tagged(
+                cache_key, entry, hard_ttl, extract_product_ids(serializable), started_at
+            )
+        else:
+            stored = await redis_cache.set(cache_key, entry, hard_ttl)
+        if stored and overwrite:
+            await redis_cache.announce_update(cache_key)
+        logger.debug(f"Cache SET: {cache_key} (TTL: {ttl}s, hard TTL: {hard_ttl}s)")
+    except Exception as e:
+        logger.warning(f"Cache set failed for {cache_key}: {e}")
+
+    return result, serializable
+
+
+async def _wait_for_fill(cache_key: str) -> Optional[Any]:
+    """
+    다른 워커가 채우는 중인 키의 값을 기다린다
+
+    Returns:
+        저장된 값 (잠금이 풀렸는데 값이 없거나 CACHE_LOCK_WAIT_SECONDS가 지나면 None)
+    """
+    deadline = time.monotonic() + settings.CACHE_LOCK_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        await asyncio.sleep(settings.CACHE_LOCK_POLL_INTERVAL_MS / 1000)
+        cached, locked = await redis_cache.poll_fill(cache_key)
+        if cached is not None:
+            return _unwrap_cached(cached)[0]
+        if not locked:
+            return None
+    return None
+
+
+async def _load_single_flight(
+    cache_key: str,
+    namespace: str,
+    ttl: int,
+    hard_ttl: int,
+    compute: Callable
+) -> Any:
+    """
+    캐시 미스 처리: 같은 키의 동시 미스는 워커 안에서 Future 하나, 워커 간 Redis 잠금 하나로 합친다
+
+    먼저 도착한 요청은 원본 결과를, 기다린 요청은 직렬화된 결과(캐시 적중과 같은 형태)를 받는다.
+    원본 함수의 예외(404 등)는 기다리던 요청에도 그대로 전달된다.
+    """
+    future = _inflight.get(cache_key)
+    if future is not None:
+        logger.debug(f"Cache COALESCED: {cache_key}")
+        return await asyncio.shield(future)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = future
+    token = None
+    try:
+        token = await redis_cache.acquire_lock(cache_key, settings.CACHE_LOCK_TTL_SECONDS)
+        if token is None:
+            # 다른 워커가 채우는 중: 저장될 때까지 기다렸다가 사용 (못 받으면 직접 실행)
+            waited = await _wait_for_fill(cache_key)
+            if waited is not None:
+                logger.debug(f"Cache COALESCED (other worker): {cache_key}")
+                future.set_result(waited)
+                return waited
+
+        result, serializable = await _fill_cache(cache_key, namespace, ttl, hard_ttl, compute)
+        future.set_result(serializable)
+        return result
+    except BaseException as e:
+        if not future.done():
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # 기다리는 요청이 없어도 "exception was never retrieved" 경고가 나지 않도록 조회 처리
+                future.exception()
+        raise
+    finally:
+        _inflight.pop(cache_key, None)
+        if token:
+            await redis_cache.release_lock(cache_key, token)
+
+
+def _schedule_refresh(
+    cache_key: str,
+    namespace: str,
+    ttl: int,
+    hard_ttl: int,
+    func: Callable,
+    args: tuple,
+    kwargs: dict
+):
+    """
+    soft TTL이 지난 키를 백그라운드에서 다시 계산 (워커 안/워커 간 각각 한 번만)
+
+    응답이 끝나면 요청의 DB 세션이 닫히므로 갱신 작업은 자기 세션을 열어 사용한다.
+    갱신 중에 값이 hard TTL로 사라져 미스가 나면, 그 요청은 갱신 작업이 잡은 잠금을 보고 결과를 기다린다.
+    """
+    if cache_key in _refreshing:
+        return
+    _refreshing.add(cache_key)
+
+    async def refresh():
+        db = None
+        token = None
+        refresh_kwargs = dict(kwargs)
+        try:
+            token = await redis_cache.acquire_lock(cache_key, settings.CACHE_LOCK_TTL_SECONDS)
+            if token is None:
+                # 다른 워커가 갱신 중
+                return
+            if "db" in kwargs:
+                from app.database import SessionLocal
+                db = SessionLocal()
+                refresh_kwargs["db"] = db
+            await _fill_cache(
+                cache_key, namespace, ttl, hard_ttl,
+                lambda: func(*args, **refresh_kwargs), overwrite=True
+            )
+            logger.debug(f"Cache REFRESHED: {cache_key}")
+        except Exception as e:
+            logger.warning(f"Cache background refresh failed for {cache_key}: {e}")
+        finally:
+            if db is not None:
+                db.close()
+            _refreshing.discard(cache_key)
+            if token:
+                await redis_cache.release_lock(cache_key, token)
+
+    task = asyncio.create_task(refresh())
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+
+
+def cache_response(prefix: str = "api", ttl: int = 300, hard_ttl: Optional[int] = None):
     """
     API 응답 캐싱 데코레이터
 
     Args:
         prefix: 캐시 키 프리픽스
-        ttl: TTL (초), 기본 5분
+        ttl: TTL (초), 기본 5분 - 이 시간이 지나면 다시 계산한다 (soft TTL)
+        hard_ttl: 오래된 값을 응답할 수 있는 최대 시간 (초, ttl보다 커야 함)
+            지정하면 ttl~hard_ttl 사이에는 이전 값을 바로 응답하고 백그라운드에서 갱신한다.
+            지정하지 않으면 ttl이 지난 값은 Redis에서 사라진다.
 
     Example:
-        @cache_response(prefix="products_list", ttl=300)
+        @cache_response(prefix="products_list", ttl=300, hard_ttl=900)
         async def get_products(...):
             ...
     """
+    hard_ttl = max(hard_ttl or ttl, ttl)
+
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -235,46 +1132,132 @@ def cache_response(prefix: str = "api", ttl: int = 300):
                 if k not in ('db', 'current_user') and not k.startswith('_')
             }
 
-            # 캐시 키 생성
-            cache_key = redis_cache.generate_key(prefix, **cache_params)
+            # 캐시 키 생성 (네임스페이스 세대 포함, 세대를 못 읽으면 캐시 없이 실행)
+            namespace = cache_namespace(prefix)
+            generation = await redis_cache.get_generation(namespace)
+            if generation is None:
+                return await func(*args, **kwargs)
+            cache_key = redis_cache.generate_key(f"{prefix}:g{generation}", **cache_params)
 
             # 캐시 히트 확인
-            cached = redis_cache.get(cache_key)
+            cached = await redis_cache.get(cache_key)
             if cached is not None:
-                logger.debug(f"Cache HIT: {cache_key}")
-                return cached
-
-            # 캐시 미스: 원본 함수 실행
-            result = await func(*args, **kwargs)
+                value, fresh = _unwrap_cached(cached)
+                if fresh:
+                    logger.debug(f"Cache HIT: {cache_key}")
+                else:
+                    # soft TTL 만료: 이전 값을 응답하고 백그라운드에서 갱신
+                    logger.debug(f"Cache STALE: {cache_key}")
+                    _schedule_refresh(cache_key, namespace, ttl, hard_ttl, func, args, kwargs)
+                return value
 
-            # jsonable_encoder로 SQLAlchemy 객체 → JSON 직렬화 후 캐시 저장
-            try:
-                from fastapi.encoders import jsonable_encoder
-                serializable = jsonable_encoder(result)
-                redis_cache.set(cache_key, serializable, ttl)
-                logger.debug(f"Cache SET: {cache_key} (TTL: {ttl}s)")
-            except Exception as e:
-                logger.warning(f"Cache set failed for {cache_key}: {e}")
-
-            return result
+            # 캐시 미스: 같은 키의 동시 요청과 합쳐 원본 함수를 한 번만 실행
+            return await _load_single_flight(
+                cache_key, namespace, ttl, hard_ttl, lambda: func(*args, **kwargs)
+            )
 
         return wrapper
     return decorator
 
 
+def _split_invalidation_patterns(patterns: list[str]) -> Tuple[list, list]:
+    """무효화 패턴 → (세대를 올릴 네임스페이스 목록, SCAN으로 삭제할 패턴 목록)"""
+    namespaces = []
+    other_patterns = []
+    for pattern in patterns:
+        if pattern.endswith(":*") and "*" not in pattern[:-2]:
+            namespace = cache_namespace(pattern[:-2])
+            if namespace not in namespaces:
+                namespaces.append(namespace)
+        else:
+            other_patterns.append(pattern)
+    return namespaces, other_patterns
+
+
 def invalidate_cache(patterns: list[str]):
     """
     캐시 무효화 헬퍼
 
+    "프리픽스:*" 패턴은 프리픽스가 속한 네임스페이스의 세대를 올린다 (네임스페이스당 INCR 한 번).
+    같은 네임스페이스의 프리픽스가 여러 개 있어도 한 번만 올리고, 그 밖의 패턴은 SCAN으로 삭제한다.
+
     Args:
-        patterns: 삭제할 캐시 키 패턴 리스트
+        patterns: 무효화할 캐시 키 패턴 리스트 (프리픽스 또는 네임스페이스 이름 + ":*")
 
     Example:
-        invalidate_cache(["products:*", "stats:*"])
+        invalidate_cache(["products_list:*", "stats:*"])
     """
     if not redis_cache.enabled:
+        redis_cache.note_missed_invalidation()
         return
 
-    for pattern in patterns:
+    namespaces, other_patterns = _split_invalidation_patterns(patterns)
+    for pattern in other_patterns:
         deleted = redis_cache.delete_pattern(pattern)
         logger.info(f"Cache INVALIDATE - Pattern '{pattern}': {deleted} keys deleted")
+
+    for namespace in namespaces:
+        generation = redis_cache.bump_generation(namespace)
+        logger.info(f"Cache INVALIDATE - Namespace '{namespace}': generation {generation}")
+
+
+async def ainvalidate_cache(patterns: list[str]):
+    """
+    invalidate_cache()의 비동기 버전 (async 엔드포인트/코루틴에서 사용)
+
+    동기 버전은 파일 감시 스레드와 동기(def) 엔드포인트에서만 사용한다.
+    네임스페이스 세대는 파이프라인 한 번으로 함께 올린다.
+
+    Example:
+        await ainvalidate_cache(["products_list:*", "stats:*"])
+    """
+    if not redis_cache.enabled:
+        redis_cache.note_missed_invalidation()
+        return
+
+    namespaces, other_patterns = _split_invalidation_patterns(patterns)
+    for pattern in other_patterns:
+        deleted = await redis_cache.adelete_pattern(pattern)
+        logger.info(f"Cache INVALIDATE - Pattern '{pattern}': {deleted} keys deleted")
+
+    for namespace, generation in (await redis_cache.abump_generations(namespaces)).items():
+        logger.info(f"Cache INVALIDATE - Namespace '{namespace}': generation {generation}")
+
+
+def invalidate_product_cache(product_ids: Iterable[int]):
+    """
+    제품 단위 캐시 무효화 헬퍼
+
+    해당 제품이 들어 있는 캐시(상세, 그 제품이 포함된 목록/검색 페이지)만 삭제한다.
+    제품 추가/삭제, 목록 정렬·필터·분류에 쓰이는 필드(제목, 제조사, 카테고리 등) 변경처럼
+    제품이 들어가야 할 페이지가 바뀌는 수정에는 invalidate_cache()를 사용한다.
+
+    Args:
+        product_ids: 변경된 제품 ID 목록
+
+    Example:
+        invalidate_product_cache([product.id])
+    """
+    if not redis_cache.enabled:
+        redis_cache.note_missed_invalidation()
+        return
+
+    product_ids = list(product_ids)
+    deleted = redis_cache.delete_product_tags(product_ids)
+    logger.info(f"Cache INVALIDATE - Products {product_ids}: {deleted} keys deleted")
+
+
+async def ainvalidate_product_cache(product_ids: Iterable[int]):
+    """
+    invalidate_product_cache()의 비동기 버전 (async 엔드포인트/코루틴에서 사용)
+
+    Example:
+        await ainvalidate_product_cache([product.id])
+    """
+    if not redis_cache.enabled:
+        redis_cache.note_missed_invalidation()
+        return
+
+    product_ids = list(product_ids)
+    deleted = await redis_cache.adelete_product_tags(product_ids)
+    logger.info(f"Cache INVALIDATE - Products {product_ids}: {deleted} keys deleted")
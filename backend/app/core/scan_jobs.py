@@ -0,0 +1,286 @@
+"""
+백그라운드 스캔 작업 관리
+
+스캔 요청은 작업 ID만 돌려주고 바로 응답한다 (역방향 프록시의 60초 제한 회피).
+진행 상황은 FileScanner의 progress_callback으로 작업 객체에 기록되고,
+/api/scan/jobs/{id}/events가 Server-Sent Events로 스트리밍한다.
+
+작업 목록은 프로세스 메모리에만 보관한다 (재시작하면 사라짐 - 스캔 결과 자체는
+DB와 스캔 히스토리에 남음).
+"""
+import json
+import time
+import uuid
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+FINISHED_STATES = {JOB_COMPLETED, JOB_FAILED, JOB_CANCELLED}
+
+
+class ScanJob:
+    """
+    스캔 작업 하나의 상태
+
+    update_progress()는 스캔 스레드에서, 나머지는 이벤트 루프에서 호출된다.
+    revision은 상태가 바뀔 때마다 증가하며 SSE 스트림이 변경 감지에 사용한다.
+    """
+
+    def __init__(self, kind: str, paths: List[str], params: Optional[dict] = None):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.paths = list(paths)
+        self.params = params or {}
+        self.status = JOB_QUEUED
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+        self.cancel_event = threading.Event()
+        self.revision = 0
+
+        self.progress = {
+            "phase": "queued",
+            "current_path": None,
+            "path_index": 0,
+            "path_count": len(self.paths),
+            "paths_done": 0,
+            "active_paths": [],
+            "folders_done": 0,
+            "files_done": 0,
+            "files_per_sec": 0.0,
+            "eta_seconds": None,
+        }
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._started_monotonic: Optional[float] = None
+        # 경로별 진행 상황 (스케줄 작업은 여러 경로를 동시에 스캔)
+        # 루트 경로 → {"folders": int, "files": int, "expected": int | None, "eta": float | None}
+        self._path_counts: Dict[str, dict] = {}
+        self._active_paths: List[str] = []
+
+    def begin_path(self, index: int, path: str):
+        """여러 경로 중 index번째 경로 스캔 시작"""
+        with self._lock:
+            self._path_counts.setdefault(path, {"folders": 0, "files": 0, "expected": None, "eta": None})
+            if path not in self._active_paths:
+                self._active_paths.append(path)
+            self.progress["path_index"] = index
+            self.progress["current_path"] = path
+            self.progress["active_paths"] = list(self._active_paths)
+            self.progress["phase"] = "walking"
+            self.revision += 1
+
+    def end_path(self, path: str, results: dict):
+        """경로 하나의 스캔 완료 - 최종 결과로 경로별 진행 상황 확정"""
+        with self._lock:
+            folders = results.get("scanned_folders", 0) + results.get("skipped_folders", 0)
+            self._path_counts[path] = {
+                "folders": folders,
+                "files": results.get("scanned_files", 0),
+                "expected": folders,
+                "eta": None,
+            }
+            if path in self._active_paths:
+                self._active_paths.remove(path)
+            self.progress["paths_done"] += 1
+            self.progress["active_paths"] = list(self._active_paths)
+            self._refresh_totals()
+            self.revision += 1
+
+    def _refresh_totals(self):
+        """경로별 진행 상황을 합산 (호출자가 _lock 보유)"""
+        counts = self._path_counts.values()
+        files_done = sum(c["files"] for c in counts)
+        elapsed = time.monotonic() - (self._started_monotonic or time.monotonic())
+        etas = [c["eta"] for c in counts if c["eta"] is not None]
+        expected = [c["expected"] for c in counts]
+        self.progress["folders_done"] = sum(c["folders"] for c in counts)
+        # 첫 스캔이라 전체 폴더 수를 모르는 경로가 있으면 None
+        self.progress["folders_expected"] = sum(expected) if expected and None not in expected else None
+        self.progress["files_done"] = files_done
+        self.progress["files_per_sec"] = round(files_done / elapsed, 1) if elapsed > 0 else 0.0
+        # 동시에 스캔 중인 경로 중 가장 늦게 끝날 경로 기준
+        self.progress["eta_seconds"] = max(etas) if etas else None
+
+    def set_phase(self, phase: str):
+        with self._lock:
+            self.progress["phase"] = phase
+            self.revision += 1
+
+    def update_progress(self, event: Dict):
+        """FileScanner progress_callback (스캔 스레드에서 호출, 여러 스레드에서 동시에 올 수 있음)"""
+        with self._lock:
+            eta = None
+            expected = event.get("folders_expected")
+            path_elapsed = event.get("elapsed_seconds") or 0
+            path_folders = event.get("folders_done", 0)
+            if expected and path_folders and path_elapsed > 0:
+                # 경로별 ETA (직전 스캔에서 기록된 폴더 수를 전체로 가정)
+                rate = path_folders / path_elapsed
+                eta = round(max(expected - path_folders, 0) / rate, 1)
+
+            self._path_counts[event.get("root_path") or ""] = {
+                "folders": path_folders,
+                "files": event.get("files_done", 0),
+                "expected": expected,
+                "eta": eta,
+            }
+            self.progress.update({
+                "phase": event.get("phase", self.progress["phase"]),
+                "current_path": event.get("current_path"),
+            })
+            self._refresh_totals()
+            self.revision += 1
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            elapsed = None
+            if self._started_monotonic is not None:
+                end = self.finished_at or datetime.now()
+                elapsed = round((end - self.started_at).total_seconds(), 1)
+            return {
+                "job_id": self.id,
+                "kind": self.kind,
+                "paths": self.paths,
+                "params": self.params,
+                "status": self.status,
+                "created_at": self.created_at.isoformat(),
+                "started_at": self.started_at.isoformat() if self.started_at else None,
+                "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+                "elapsed_seconds": elapsed,
+                "cancel_requested": self.cancel_event.is_set(),
+                "progress": dict(self.progress),
+                "result": self.result,
+                "error": self.error,
+            }
+
+
+class ScanJobManager:
+    """프로세스 내 스캔 작업 목록 (작업 실행은 이벤트 루프의 asyncio Task)"""
+
+    # 완료된 작업은 최근 것만 보관
+    MAX_FINISHED_JOBS = 20
+
+    def __init__(self):
+        self.jobs: Dict[str, ScanJob] = {}
+
+    def get(self, job_id: str) -> Optional[ScanJob]:
+        return self.jobs.get(job_id)
+
+    def list(self) -> List[dict]:
+        """작업 목록 (최신순)"""
+        return [job.to_dict() for job in sorted(self.jobs.values(), key=lambda j: j.created_at, reverse=True)]
+
+    def find_active(self, paths: List[str]) -> Optional[ScanJob]:
+        """같은 경로를 스캔 중인 작업 (중복 실행 방지용)"""
+        wanted = set(paths)
+        for job in self.jobs.values():
+            if job.status not in FINISHED_STATES and wanted & set(job.paths):
+                return job
+        return None
+
+    def submit(self, kind: str, paths: List[str], worker: Callable[[ScanJob], Awaitable[dict]],
+               params: Optional[dict] = None) -> ScanJob:
+        """
+        작업을 만들고 이벤트 루프에서 바로 실행
+
+        Args:
+            kind: 'scan' (경로 하나 수동 스캔) 또는 'scheduled' (스케줄러 경로 전체)
+            paths: 스캔 경로 목록
+            worker: 작업을 받아 결과 딕셔너리를 반환하는 코루틴 함수
+            params: 요청 파라미터 (조회용으로만 보관)
+        """
+        job = ScanJob(kind, paths, params)
+        self.jobs[job.id] = job
+        job._task = asyncio.create_task(self._run(job, worker))
+        self._prune()
+        logger.info(f"Scan job {job.id} submitted ({kind}): {paths}")
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        작업 취소 요청
+
+        스캔 단계는 폴더 단위로 취소를 확인하고 그때까지의 결과를 저장한다.
+        자동 매칭(AI 호출) 단계는 Task를 바로 취소한다.
+        """
+        job = self.jobs.get(job_id)
+        if job is None or job.status in FINISHED_STATES:
+            return False
+
+        job.cancel_event.set()
+        if job.progress.get("phase") == "matching" and job._task is not None:
+            job._task.cancel()
+        with job._lock:
+            job.revision += 1
+        logger.info(f"Scan job {job_id} cancellation requested")
+        return True
+
+    async def _run(self, job: ScanJob, worker: Callable[[ScanJob], Awaitable[dict]]):
+        job.status = JOB_RUNNING
+        job.started_at = datetime.now()
+        job._started_monotonic = time.monotonic()
+        job.set_phase("walking")
+        try:
+            job.result = await worker(job)
+            job.status = JOB_CANCELLED if job.cancel_event.is_set() else JOB_COMPLETED
+        except asyncio.CancelledError:
+            job.status = JOB_CANCELLED
+        except Exception as e:
+            logger.error(f"Scan job {job.id} failed: {e}", exc_info=True)
+            job.status = JOB_FAILED
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.now()
+            job.set_phase("done")
+            logger.info(f"Scan job {job.id} finished: {job.status}")
+
+    def _prune(self):
+        finished = sorted(
+            (job for job in self.jobs.values() if job.status in FINISHED_STATES),
+            key=lambda j: j.created_at
+        )
+        for job in finished[:-self.MAX_FINISHED_JOBS]:
+            self.jobs.pop(job.id, None)
+
+    async def stream(self, job: ScanJob, interval: float = 0.5, heartbeat: float = 15.0):
+        """
+        작업 상태를 Server-Sent Events 형식으로 스트리밍
+
+        상태가 바뀔 때마다 'progress' 이벤트를, 작업이 끝나면 'done' 이벤트를
+        보내고 종료한다. 변화가 없어도 heartbeat마다 주석 줄을 보내 프록시가
+        연결을 끊지 않도록 한다.
+        """
+        last_revision = -1
+        last_sent = time.monotonic()
+        while True:
+            finished = job.status in FINISHED_STATES
+            if job.revision != last_revision or finished:
+                last_revision = job.revision
+                payload = json.dumps(job.to_dict(), ensure_ascii=False, default=str)
+                event = "done" if finished else "progress"
+                yield f"event: {event}\ndata: {payload}\n\n"
+                last_sent = time.monotonic()
+                if finished:
+                    return
+            elif time.monotonic() - last_sent >= heartbeat:
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+            await asyncio.sleep(interval)
+
+
+# 전역 스캔 작업 관리자
+scan_jobs = ScanJobManager()
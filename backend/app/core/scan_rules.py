@@ -0,0 +1,93 @@
+"""
+스캔 예외 규칙 엔진
+
+scan_exclusions 파일의 규칙을 스캔마다 한 번만 컴파일해 두고 폴더/파일마다
+거의 비용 없이 판정한다.
+
+- folders: 폴더 이름 (대소문자 무시) → frozenset 조회. 같은 이름의 파일도 제외
+- patterns: 파일 이름 glob (대소문자 무시) → 모든 패턴을 합친 정규식 하나
+- paths: 절대 경로 (해당 경로와 그 아래 전체) → 경로 구성요소 트라이
+
+폴더 판정은 워커가 하위 폴더를 읽기 전에 호출하므로 제외된 하위 트리는
+목록 조회 자체가 일어나지 않는다.
+"""
+import os
+import re
+import fnmatch
+from typing import Dict, Iterable, Optional, Pattern
+
+# 트라이 노드에서 "이 경로까지가 예외 경로"를 표시하는 키 (경로 구성요소와 겹치지 않음)
+_TERMINAL = ""
+
+
+class ExclusionRules:
+    """컴파일된 스캔 예외 규칙 (읽기 전용이므로 워커 스레드에서 공유해도 안전)"""
+
+    def __init__(
+        self,
+        folders: Iterable[str] = (),
+        patterns: Iterable[str] = (),
+        paths: Iterable[str] = (),
+        excluded_extensions: Iterable[str] = ()
+    ):
+        self.folder_names = frozenset(name.strip().lower() for name in folders if name and name.strip())
+        self.excluded_extensions = frozenset(ext.lower() for ext in excluded_extensions)
+        self.pattern_regex = self._compile_patterns(patterns)
+        self.path_trie = self._build_trie(paths)
+
+    @staticmethod
+    def _compile_patterns(patterns: Iterable[str]) -> Optional[Pattern]:
+        """glob 패턴들을 대안(|)으로 합친 정규식 하나로 컴파일 (소문자 이름에 매칭)"""
+        translated = [
+            f"(?:{fnmatch.translate(pattern.strip().lower())})"
+            for pattern in patterns if pattern and pattern.strip()
+        ]
+        if not translated:
+            return None
+        return re.compile("|".join(translated))
+
+    @staticmethod
+    def _split(path: str):
+        return [part for part in os.path.normpath(path).split(os.sep) if part]
+
+    def _build_trie(self, paths: Iterable[str]) -> Dict:
+        trie: Dict = {}
+        for path in paths:
+            if not path or not path.strip():
+                continue
+            node = trie
+            for part in self._split(path.strip()):
+                node = node.setdefault(part, {})
+            node[_TERMINAL] = True
+        return trie
+
+    def is_excluded_folder_name(self, folder_name: str) -> bool:
+        """폴더 이름이 예외 목록에 있는지"""
+        return folder_name.lower() in self.folder_names
+
+    def is_excluded_path(self, path: str) -> bool:
+        """path가 예외 경로 자체이거나 그 아래에 있는지 (구성요소 단위, '/lib/a'는 '/lib/ab'와 무관)"""
+        node = self.path_trie
+        if not node:
+            return False
+        for part in self._split(path):
+            node = node.get(part)
+            if node is None:
+                return False
+            if _TERMINAL in node:
+                return True
+        return False
+
+    def is_excluded_dir(self, dir_path: str) -> bool:
+        """폴더 전체 경로 기준 판정 (이름 규칙 + 경로 규칙)"""
+        name = os.path.basename(dir_path.rstrip(os.sep)) or dir_path
+        return self.is_excluded_folder_name(name) or self.is_excluded_path(dir_path)
+
+    def is_excluded_file(self, file_name: str) -> bool:
+        """파일 이름 기준 판정 (비소프트웨어 확장자, 예외 이름, glob 패턴)"""
+        file_name_lower = file_name.lower()
+        if os.path.splitext(file_name_lower)[1] in self.excluded_extensions:
+            return True
+        if file_name_lower in self.folder_names:
+            return True
+        return self.pattern_regex is not None and self.pattern_regex.match(file_name_lower) is not None
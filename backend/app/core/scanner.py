@@ -1,8 +1,16 @@
 import os
 import re
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime, timedelta, timezone
+from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 import logging
 logger = logging.getLogger(__name__)
 
@@ -10,12 +18,15 @@ logger = logging.getLogger(__name__)
 from app.models.product import Product
 from app.models.version import Version
 from app.models.filename_violation import FilenameViolation
-from app.models.attachment import Attachment
-from app.models.favorite import Favorite
+from app.models.scan_directory_state import ScanDirectoryState
+from app.models.scan_checkpoint import ScanCheckpoint, ScanCheckpointDir
 from app.core.metadata_enricher import MetadataEnricher
 from app.core.icon_cache import IconCache
 from app.core.parser import FilenameParser
 from app.core.classifier import classify_file
+from app.core.dir_walker import ParallelDirectoryWalker, content_fingerprint
+from app.core.scan_rules import ExclusionRules
+from app.core.file_reconciler import reconcile_versions, reconcile_unmatched_items, reconcile_unmatched_files
 from app.config import settings
 import logging
 logger = logging.getLogger(__name__)
@@ -28,7 +39,10 @@ class FileScanner:
     Supports AI-powered metadata generation
     """
 
-    def __init__(self, db: Session, use_ai: bool = True, ai_provider: str = "openai"):
+    def __init__(self, db: Session, use_ai: bool = True, ai_provider: str = "openai",
+                 walk_workers: Optional[int] = None,
+                 progress_callback: Optional[Callable[[Dict], None]] = None,
+                 cancel_event: Optional[threading.Event] = None):
         """
         Initialize scanner
 
@@ -36,9 +50,15 @@ class FileScanner:
             db: Database session
             use_ai: Enable AI metadata generation (requires API key)
             ai_provider: AI provider ('openai' or 'gemini')
+            walk_workers: 폴더 목록을 동시에 조회할 스레드 수 (None이면 SCAN_WALK_WORKERS)
+            progress_callback: 진행 상황 딕셔너리를 받는 콜백 (스캔 스레드에서 호출됨)
+            cancel_event: set()되면 폴더 순회를 멈추고 그때까지 처리한 항목만 저장
         """
         self.db = db
         self.use_ai = use_ai
+        self.walk_workers = walk_workers or settings.SCAN_WALK_WORKERS
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event
         self.enricher = MetadataEnricher(ai_provider=ai_provider, use_ai=use_ai) if use_ai else None
         self.icon_cache = IconCache()
         self.parser = FilenameParser()
@@ -46,6 +66,13 @@ class FileScanner:
         self.scan_exclusions = exclusions_data.get("folders", [])
         self.scan_patterns = exclusions_data.get("patterns", [])
         self.scan_paths = exclusions_data.get("paths", [])
+        # 스캐너(스캔)마다 한 번 컴파일
+        self.exclusion_rules = ExclusionRules(
+            folders=self.scan_exclusions,
+            patterns=self.scan_patterns,
+            paths=self.scan_paths,
+            excluded_extensions=self.EXCLUDED_EXTENSIONS,
+        )
 
     def _load_scan_exclusions(self) -> dict:
         """파일에서 스캔 예외 목록 로드"""
@@ -99,10 +126,6 @@ class FileScanner:
             logger.error(f"Failed to load scan exclusions: {e}")
             return {"folders": [], "patterns": [], "paths": []}
 
-    def _is_excluded(self, folder_name: str) -> bool:
-        """폴더가 스캔 예외 목록에 있는지 확인"""
-        return folder_name.lower() in [ex.lower() for ex in self.scan_exclusions]
-
     # 이미지 및 비소프트웨어 확장자 (항상 제외)
     EXCLUDED_EXTENSIONS = {
         # 이미지 파일
@@ -112,45 +135,43 @@ class FileScanner:
         '.reg',
     }
 
-    def _is_excluded_file(self, file_name: str) -> bool:
-        """파일이 스캔 예외 목록에 있는지 확인 (와일드카드 패턴 지원)"""
-        import fnmatch
-
-        file_name_lower = file_name.lower()
-
-        # 이미지/레지스트리 등 비소프트웨어 확장자 제외
-        ext = os.path.splitext(file_name_lower)[1]
-        if ext in self.EXCLUDED_EXTENSIONS:
-            logger.debug(f"File {file_name} excluded by extension: {ext}")
-            return True
-
-        # 정확한 파일명 매칭 (폴더 예외 목록에서)
-        if file_name_lower in [ex.lower() for ex in self.scan_exclusions]:
-            logger.info(f"File {file_name} excluded by exact match in folders list")
-            return True
+    def _is_excluded(self, folder_name: str) -> bool:
+        """폴더 이름이 스캔 예외 목록에 있는지 확인"""
+        return self.exclusion_rules.is_excluded_folder_name(folder_name)
 
-        # 와일드카드 패턴 매칭
-        for pattern in self.scan_patterns:
-            pattern_lower = pattern.lower()
-            if fnmatch.fnmatch(file_name_lower, pattern_lower):
-                logger.info(f"File {file_name} excluded by pattern match: {pattern}")
-                return True
+    def _is_excluded_dir(self, dir_path: str) -> bool:
+        """폴더가 예외 이름이거나 예외 경로(paths) 아래에 있는지 확인 (워커가 내려가기 전에 호출)"""
+        return self.exclusion_rules.is_excluded_dir(dir_path)
 
-        return False
+    def _is_excluded_file(self, file_name: str) -> bool:
+        """파일이 스캔 예외 목록에 있는지 확인 (비소프트웨어 확장자, 예외 이름, 와일드카드 패턴)"""
+        return self.exclusion_rules.is_excluded_file(file_name)
 
-    def scan_directory(self, base_path: str) -> Dict:
+    def scan_directory(self, base_path: str, full_rescan: bool = False) -> Dict:
         """
         Scan a directory for software files recursively
 
         이벤트 루프를 블로킹하지 않도록 호출부(scan.py, scheduler.py)에서
         asyncio.to_thread()로 감싸서 실행해야 함
 
+        기본은 증분 스캔: ScanDirectoryState에 저장된 폴더 상태(mtime, 항목 수,
+        하위 항목 해시)가 그대로인 폴더는 파일 처리/rename 감지/삭제 정리에서
+        모두 제외된다. full_rescan=True면 저장된 상태를 무시하고 모든 폴더를
+        다시 처리한 뒤 상태를 새로 기록한다.
+
+        순회 중에는 SCAN_CHECKPOINT_INTERVAL_* 주기로 스캔 항목을 커밋하고
+        ScanCheckpoint에 진행 위치를 기록한다. 같은 경로의 이전 스캔이 중간에
+        끝났으면(재시작/실패/취소) 남은 폴더부터 이어서 순회하며, rename 감지와
+        삭제 정리는 트리 전체를 다 본 뒤에만 실행한다.
+
         Args:
             base_path: Root path to scan
+            full_rescan: 디렉토리 상태 인덱스를 무시하고 전체 재스캔
 
         Returns:
             Dictionary with scan results
         """
+        started = time.monotonic()
         base_path = Path(base_path)
 
         if not base_path.exists():
@@ -165,37 +186,114 @@ class FileScanner:
             "deleted_violations": 0,
             "renamed_files": 0,
             "scanned_folders": 0,
+            "skipped_folders": 0,
             "scanned_files": 0,
+            "incremental": not full_rescan,
+            "cancelled": False,
+            "resumed": False,
+            "resumed_folders": 0,
+            "duration_seconds": 0.0,
             "errors": []
         }
 
+        root_path = str(base_path.absolute())
+        self._root_path = root_path
+
+        # 증분 스캔 상태 (스캔마다 초기화)
+        self._rules_hash = self._compute_rules_hash()
+        self._dir_states = self._load_directory_states(root_path)
+        # 워커 스레드는 이 스냅샷만 읽음 (세션은 스레드 간 공유 불가)
+        self._dir_snapshot = {
+            dir_path: (row["mtime"], row["rules_hash"], list(row["subdirs"] or []))
+            for dir_path, row in self._dir_states.items()
+        }
+        self._use_dir_states = not full_rescan
+        self._visited_dirs = set()
+        self._skipped_dirs = set()
+        self._pending_states = {}
+
+        # 체크포인트 (중단된 스캔 이어가기)
+        self._checkpoint_id = None
+        self._checkpoint_full_rescan = full_rescan
+        # 부모 폴더는 처리했지만 아직 처리하지 않은 폴더 (재개 시 여기서부터 순회)
+        self._frontier = {root_path}
+        # 마지막 체크포인트 이후 처리를 마친 폴더 [(경로, 건너뜀 여부)]
+        self._completed_since_checkpoint = []
+        self._last_checkpoint = started
+        # 이전 실행에서 처리를 마친 폴더 (이번 실행에서는 파일 목록을 읽지 않음)
+        self._resumed_dirs = set()
+        start_dirs = None
+        if settings.SCAN_CHECKPOINT_ENABLED:
+            checkpoint = self._load_checkpoint(root_path, full_rescan)
+            if checkpoint is not None:
+                start_dirs = self._restore_checkpoint(checkpoint, results)
+                if checkpoint.full_rescan:
+                    # 전체 재스캔으로 시작된 스캔은 전체 재스캔으로 마무리
+                    self._use_dir_states = False
+                    self._checkpoint_full_rescan = True
+                    results["incremental"] = False
+        # 롤백이 발생하면 처리 결과가 일부 사라지므로 상태를 저장하지 않음
+        # (저장하면 다음 증분 스캔에서 해당 폴더를 건너뛰어 항목이 누락됨)
+        states_valid = True
+
         # 스캔 경로 내의 기존 파일들 추적
         scanned_files = set()
 
-        # 재귀적으로 모든 하위 폴더 스캔
-        self._scan_folder_recursive(base_path, results, scanned_files)
+        # 기존 스캔 항목/버전 경로를 한 번에 로드 (파일마다 SELECT 2회 → 스캔당 2회)
+        self._preload_existing_items(root_path)
+
+        # 모든 하위 폴더 스캔 (목록 조회는 병렬, DB 처리는 이 스레드에서만)
+        self._scan_started = started
+        self._expected_folders = len(self._dir_states) or None
+        self._scan_tree(root_path, results, scanned_files, start_dirs)
+        self._flush_scan_items(results, scanned_files)
+
+        if self._is_cancelled():
+            # 순회하지 못한 폴더가 있으므로 rename/삭제 정리와 폴더 상태 저장은 생략
+            # (전부 본 것처럼 처리하면 남은 폴더의 항목이 삭제로 오인됨)
+            results["cancelled"] = True
+            states_valid = False
+            logger.info(f"Scan cancelled: {root_path}")
+            # 다음 스캔이 취소 지점부터 이어서 진행
+            if settings.SCAN_CHECKPOINT_ENABLED:
+                self._write_checkpoint(root_path, results, scanned_files)
+        else:
+            self._report_progress(results, phase="reconciling", current_path=root_path)
 
-        # 파일명 변경 감지 및 업데이트 (삭제 전에 먼저 실행)
-        try:
-            self._detect_renamed_files(str(base_path.absolute()), scanned_files, results)
-        except Exception as e:
-            logger.error(f"Error detecting renamed files: {e}")
-            results["errors"].append(f"Rename detection error: {str(e)}")
+            # 파일명 변경 감지 및 업데이트 (삭제 전에 먼저 실행)
             try:
-                self.db.rollback()
-            except Exception:
-                pass
+                self._detect_renamed_files(root_path, scanned_files, results)
+            except Exception as e:
+                logger.error(f"Error detecting renamed files: {e}")
+                results["errors"].append(f"Rename detection error: {str(e)}")
+                states_valid = False
+                try:
+                    self.db.rollback()
+                except Exception:
+                    pass
 
-        # 삭제된 파일 정리
-        try:
-            self._cleanup_deleted_files(str(base_path.absolute()), scanned_files, results)
-        except Exception as e:
-            logger.error(f"Error cleaning up deleted files: {e}")
-            results["errors"].append(f"Cleanup error: {str(e)}")
+            # 삭제된 파일 정리
             try:
-                self.db.rollback()
-            except Exception:
-                pass
+                self._cleanup_deleted_files(root_path, scanned_files, results)
+            except Exception as e:
+                logger.error(f"Error cleaning up deleted files: {e}")
+                results["errors"].append(f"Cleanup error: {str(e)}")
+                states_valid = False
+                try:
+                    self.db.rollback()
+                except Exception:
+                    pass
+
+        if states_valid:
+            try:
+                with self.db.begin_nested():
+                    self._save_directory_states(root_path)
+            except Exception as e:
+                logger.warning(f"Failed to save directory states: {e}")
+
+        if not results["cancelled"] and self._checkpoint_id is not None:
+            # 트리 전체를 다 봤으므로 다음 스캔은 처음부터
+            self._discard_checkpoint(self._checkpoint_id)
 
         try:
             self.db.commit()
@@ -203,44 +301,585 @@ class FileScanner:
             logger.error(f"Error committing scan results: {e}")
             self.db.rollback()
             results["errors"].append(f"Commit error: {str(e)}")
+
+        results["duration_seconds"] = round(time.monotonic() - started, 2)
+        logger.info(
+            f"Scan finished: {root_path} ({'incremental' if not full_rescan else 'full'}) - "
+            f"{results['scanned_folders']} scanned, {results['skipped_folders']} skipped, "
+            f"{results['duration_seconds']}s"
+        )
+        return results
+
+    def apply_file_changes(
+        self,
+        created: Optional[List[str]] = None,
+        deleted: Optional[List[str]] = None,
+        renamed: Optional[List[tuple]] = None,
+        deleted_dirs: Optional[List[str]] = None,
+        renamed_dirs: Optional[List[tuple]] = None
+    ) -> Dict:
+        """
+        파일 감시(inotify)로 모은 변경 사항을 전체 순회 없이 DB에 반영
+
+        새 파일은 스캔과 같은 _add_scanned_file()/_flush_scan_items() 경로로,
+        삭제는 file_reconciler로 처리한다. 새로 생긴 폴더는 호출자가
+        scan_directory()로 따로 스캔한다.
+
+        Args:
+            created: 새로 생겼거나 다시 쓰여진 파일 경로 목록
+            deleted: 사라진 파일 경로 목록
+            renamed: (이전 경로, 새 경로) 파일 목록
+            deleted_dirs: 사라진 폴더 경로 목록 (하위 항목 전체 정리)
+            renamed_dirs: (이전 경로, 새 경로) 폴더 목록
+
+        Returns:
+            scan_directory()와 같은 형식의 결과 딕셔너리
+        """
+        results = {
+            "new_products": 0,
+            "new_versions": 0,
+            "deleted_versions": 0,
+            "deleted_products": 0,
+            "deleted_violations": 0,
+            "renamed_files": 0,
+            "scanned_files": 0,
+            "errors": []
+        }
+        created = list(dict.fromkeys(created or []))
+        deleted = list(dict.fromkeys(deleted or []))
+
+        # 이번 호출에는 증분 스캔 상태가 없음 (모든 경로를 확인 대상으로 취급)
+        self._skipped_dirs = set()
+        self._pending_states = {}
+
+        try:
+            for old_dir, new_dir in renamed_dirs or []:
+                self._rename_folder_records(old_dir, new_dir)
+                results["renamed_files"] += 1
+
+            for old_path, new_path in renamed or []:
+                if not self._rename_file_record(old_path, new_path, results):
+                    # DB에 이전 경로 기록이 없으면 삭제 + 생성으로 처리
+                    deleted.append(old_path)
+                    created.append(new_path)
+            self.db.flush()
+
+            if deleted or deleted_dirs:
+                self._apply_deletions(deleted, deleted_dirs or [], results)
+
+            files = [
+                path for path in dict.fromkeys(created)
+                if os.path.isfile(path) and not self._is_excluded_file(os.path.basename(path))
+            ]
+            if files:
+                self._index_existing_items(
+                    [
+                        FilenameViolation.folder_path.in_({os.path.dirname(path) for path in files}),
+                        FilenameViolation.file_name.in_({os.path.basename(path) for path in files}),
+                    ],
+                    [Version.file_path.in_(files)],
+                )
+                for path in files:
+                    results["scanned_files"] += 1
+                    try:
+                        self._add_scanned_file(Path(path), os.path.dirname(path), results)
+                    except Exception as e:
+                        logger.warning(f"Failed to scan file {os.path.basename(path)}: {e}")
+                        results["errors"].append(f"File error {os.path.basename(path)}: {str(e)}")
+                self._flush_scan_items(results, set(files))
+
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error applying file changes: {e}")
+            results["errors"].append(f"Watch apply error: {str(e)}")
+
         return results
 
-    def _scan_folder_recursive(self, folder: Path, results: Dict, scanned_files: set):
+    def _rename_file_record(self, old_path: str, new_path: str, results: Dict) -> bool:
+        """
+        파일 하나의 이름/위치 변경을 Version과 스캔 항목에 반영
+
+        Returns:
+            이전 경로의 레코드가 있어 갱신했으면 True
+        """
+        old_folder, old_name = os.path.split(old_path)
+        new_folder, new_name = os.path.split(new_path)
+
+        if self._is_excluded_file(new_name):
+            return False
+
+        version = self.db.query(Version).filter(Version.file_path == old_path).first()
+        violations = self.db.query(FilenameViolation).filter(
+            FilenameViolation.folder_path == old_folder,
+            FilenameViolation.file_name == old_name
+        ).all()
+        if version is None and not violations:
+            return False
+
+        # 새 경로에 이미 있는 미매칭 항목 제거 ((folder_path, file_name) 중복 방지)
+        self.db.query(FilenameViolation).filter(
+            FilenameViolation.folder_path == new_folder,
+            FilenameViolation.file_name == new_name,
+            FilenameViolation.product_id.is_(None)
+        ).delete(synchronize_session=False)
+
+        if version is not None:
+            version.file_name = new_name
+            version.file_path = new_path
+
+        for violation in violations:
+            violation.folder_path = new_folder
+            violation.file_name = new_name
+            violation.suggestion = new_name
+
+        logger.info(f"Renamed file detected: {old_path} → {new_path}")
+        results["renamed_files"] += 1
+        return True
+
+    def _rename_folder_records(self, old_dir: str, new_dir: str):
+        """폴더 이름/위치 변경을 하위 Product/Version/스캔 항목 경로에 반영"""
+        def moved(path: Optional[str]) -> Optional[str]:
+            if path is None:
+                return path
+            if path == old_dir:
+                return new_dir
+            if path.startswith(old_dir + os.sep):
+                return new_dir + path[len(old_dir):]
+            return path
+
+        prefix = f"{old_dir}{os.sep}%"
+        for product in self.db.query(Product).filter(
+            (Product.folder_path == old_dir) | Product.folder_path.like(prefix)
+        ):
+            product.folder_path = moved(product.folder_path)
+        for version in self.db.query(Version).filter(Version.file_path.like(prefix)):
+            version.file_path = moved(version.file_path)
+        for violation in self.db.query(FilenameViolation).filter(
+            (FilenameViolation.folder_path == old_dir) | FilenameViolation.folder_path.like(prefix)
+        ):
+            violation.folder_path = moved(violation.folder_path)
+
+        # 폴더 상태는 다음 증분 스캔에서 새 경로로 다시 기록됨
+        self.db.query(ScanDirectoryState).filter(
+            (ScanDirectoryState.dir_path == old_dir) | ScanDirectoryState.dir_path.like(prefix)
+        ).delete(synchronize_session=False)
+
+        logger.info(f"Renamed folder detected: {old_dir} → {new_dir}")
+
+    def _apply_deletions(self, deleted: List[str], deleted_dirs: List[str], results: Dict):
+        """사라진 파일/폴더의 Version·Product·미매칭 스캔 항목 정리 (실제로 없는 경로만)"""
+        version_query = self.db.query(Version.id, Version.product_id, Version.file_path)
+        version_rows = []
+        if deleted:
+            version_rows.extend(version_query.filter(Version.file_path.in_(deleted)).all())
+        for dir_path in deleted_dirs:
+            version_rows.extend(version_query.filter(Version.file_path.like(f"{dir_path}{os.sep}%")).all())
+
+        deleted_versions, deleted_product_ids = reconcile_versions(
+            self.db,
+            [(row.id, row.product_id, row.file_path) for row in version_rows],
+            max_workers=self.walk_workers,
+        )
+        results["deleted_versions"] += deleted_versions
+        results["deleted_products"] += len(deleted_product_ids)
+
+        if deleted:
+            results["deleted_violations"] += reconcile_unmatched_files(
+                self.db, deleted, max_workers=self.walk_workers
+            )
+        for dir_path in deleted_dirs:
+            results["deleted_violations"] += reconcile_unmatched_items(
+                self.db, dir_path, max_workers=self.walk_workers
+            )
+
+    def _compute_rules_hash(self) -> str:
+        """스캔 예외 규칙 해시 (규칙이 바뀌면 저장된 폴더 상태를 무효화)"""
+        rules = {
+            "folders": sorted(self.scan_exclusions),
+            "patterns": sorted(self.scan_patterns),
+            "paths": sorted(self.scan_paths),
+            "extensions": sorted(self.EXCLUDED_EXTENSIONS),
+        }
+        return hashlib.sha1(json.dumps(rules, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _compute_child_hash(subdir_names: List[str], file_names: List[str]) -> str:
+        """폴더 직계 항목(이름 + 종류)으로 해시 생성"""
+        entries = sorted(
+            [f"d:{name}" for name in subdir_names] + [f"f:{name}" for name in file_names]
+        )
+        return hashlib.sha1("\n".join(entries).encode('utf-8', 'surrogateescape')).hexdigest()
+
+    def _load_directory_states(self, root_path: str) -> Dict[str, Dict]:
+        """
+        스캔 경로 아래의 저장된 폴더 상태를 한 번에 로드
+
+        ORM 객체 대신 컬럼 값 딕셔너리로 보관한다 (체크포인트 커밋마다 ORM
+        객체가 만료되어 폴더마다 다시 SELECT되는 것을 방지).
+        """
+        prefix = root_path.rstrip(os.sep) + os.sep
+        try:
+            rows = self.db.query(
+                ScanDirectoryState.id,
+                ScanDirectoryState.dir_path,
+                ScanDirectoryState.mtime,
+                ScanDirectoryState.entry_count,
+                ScanDirectoryState.child_hash,
+                ScanDirectoryState.subdirs,
+                ScanDirectoryState.rules_hash,
+            ).filter(
+                ScanDirectoryState.dir_path.like(f"{root_path}%")
+            ).all()
+        except Exception as e:
+            logger.warning(f"Failed to load directory states, falling back to full scan: {e}")
+            self.db.rollback()
+            return {}
+        # LIKE는 '/lib'로 '/lib2'까지 잡으므로 실제 하위 경로만 남김
+        return {
+            row.dir_path: row._asdict() for row in rows
+            if row.dir_path == root_path or row.dir_path.startswith(prefix)
+        }
+
+    def _save_directory_states(self, root_path: str):
+        """이번 스캔에서 처리한 폴더 상태를 기록하고 사라진 폴더 상태는 삭제"""
+        inserts = []
+        updates = []
+        for dir_path, state in self._pending_states.items():
+            values = {
+                "mtime": state["mtime"],
+                "entry_count": state["entry_count"],
+                "child_hash": state["child_hash"],
+                "subdirs": state["subdirs"],
+                "rules_hash": self._rules_hash,
+            }
+            row = self._dir_states.get(dir_path)
+            if row is None:
+                inserts.append({"dir_path": dir_path, **values})
+            else:
+                updates.append({"id": row["id"], **values})
+
+        if inserts:
+            self.db.bulk_insert_mappings(ScanDirectoryState, inserts)
+        if updates:
+            self.db.bulk_update_mappings(ScanDirectoryState, updates)
+
+        stale_ids = [
+            row["id"] for dir_path, row in self._dir_states.items()
+            if dir_path not in self._visited_dirs
+        ]
+        if stale_ids:
+            self.db.query(ScanDirectoryState).filter(
+                ScanDirectoryState.id.in_(stale_ids)
+            ).delete(synchronize_session=False)
+            logger.debug(f"Removed {len(stale_ids)} stale directory states under {root_path}")
+
+    def _is_skipped_folder(self, folder_path: str) -> bool:
+        """증분 스캔에서 변경 없음으로 건너뛴 폴더인지 확인"""
+        return folder_path in getattr(self, '_skipped_dirs', ())
+
+    def _unchanged_subdirs(self, dir_path: str, mtime: float) -> Optional[List[str]]:
+        """
+        증분 스캔용 skip_check (워커 스레드에서 호출됨)
+
+        폴더 mtime이 저장된 상태와 같으면 직계 항목이 바뀌지 않은 것이므로
+        파일 목록을 읽지 않고 저장된 하위 폴더 목록을 반환한다.
+        """
+        snapshot = self._dir_snapshot.get(dir_path)
+        if snapshot is None:
+            return None
+        stored_mtime, rules_hash, subdirs = snapshot
+        if stored_mtime == mtime and rules_hash == self._rules_hash:
+            return subdirs
+        return None
+
+    def _scan_tree(self, root_path: str, results: Dict, scanned_files: set,
+                   start_dirs: Optional[List[str]] = None):
         """
-        재귀적으로 폴더를 스캔 (하위 폴더 포함)
+        스캔 경로 아래의 모든 폴더를 병렬 워커로 읽고 순서대로 처리
 
         Args:
-            folder: 스캔할 폴더
+            root_path: 스캔할 루트 폴더 (절대 경로)
             results: 결과 딕셔너리
             scanned_files: 스캔된 파일 경로 추적용 Set
+            start_dirs: 체크포인트에서 재개할 때 남은 폴더 목록 (None이면 root_path부터)
+        """
+        walker = ParallelDirectoryWalker(
+            max_workers=self.walk_workers,
+            is_excluded_dir=self._is_excluded_dir,
+            skip_check=self._unchanged_subdirs if self._use_dir_states else None,
+        )
+        for listing in walker.walk(root_path, start_dirs):
+            self._handle_listing(listing, results, scanned_files)
+            self._track_frontier(listing)
+            if settings.SCAN_CHECKPOINT_ENABLED and self._checkpoint_due():
+                self._write_checkpoint(root_path, results, scanned_files)
+            elif len(self._pending_items) >= self.INSERT_CHUNK_SIZE:
+                self._flush_scan_items(results, scanned_files)
+            self._report_progress(results, phase="walking", current_path=listing["path"])
+            if self._is_cancelled():
+                break
+
+    # ── 체크포인트 ─────────────────────────────────────────────
+
+    # 체크포인트에 저장해 재개한 스캔의 결과에 합산하는 카운터
+    CHECKPOINT_COUNTERS = ("new_products", "new_versions", "scanned_folders", "skipped_folders", "scanned_files")
+
+    def _track_frontier(self, listing: Dict):
+        """
+        처리한 폴더를 남은 폴더 목록에서 빼고 하위 폴더를 추가
+
+        목록 조회에 실패한 폴더는 남겨 두어 재개한 스캔이 다시 시도하게 한다.
         """
-        # 스캔 예외 목록에 있는 폴더는 건너뛰기
-        if self._is_excluded(folder.name):
-            logger.debug(f"Skipping excluded folder: {folder.name}")
+        folder_path_str = listing["path"]
+        if listing["error"] is not None:
             return
+        self._frontier.discard(folder_path_str)
+        for name in listing["subdirs"]:
+            child = os.path.join(folder_path_str, name)
+            if not self._is_excluded_dir(child):
+                self._frontier.add(child)
+        self._completed_since_checkpoint.append(
+            (folder_path_str, folder_path_str in self._skipped_dirs)
+        )
 
+    def _checkpoint_due(self) -> bool:
+        if len(self._completed_since_checkpoint) >= settings.SCAN_CHECKPOINT_INTERVAL_FOLDERS:
+            return True
+        return bool(self._completed_since_checkpoint) and (
+            time.monotonic() - self._last_checkpoint >= settings.SCAN_CHECKPOINT_INTERVAL_SECONDS
+        )
+
+    def _load_checkpoint(self, root_path: str, full_rescan: bool) -> Optional[ScanCheckpoint]:
+        """이어서 진행할 수 있는 체크포인트 조회 (조건이 맞지 않으면 삭제하고 None)"""
         try:
-            logger.info(f"Scanning folder: {folder}")
-            results["scanned_folders"] += 1
+            checkpoint = self.db.query(ScanCheckpoint).filter(
+                ScanCheckpoint.root_path == root_path
+            ).first()
+        except Exception as e:
+            logger.warning(f"Failed to load scan checkpoint, starting from scratch: {e}")
+            self.db.rollback()
+            return None
+        if checkpoint is None:
+            return None
+
+        updated_at = checkpoint.updated_at or checkpoint.started_at
+        if updated_at is not None and updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        max_age = timedelta(hours=settings.SCAN_CHECKPOINT_MAX_AGE_HOURS)
+
+        reason = None
+        if checkpoint.rules_hash != self._rules_hash:
+            reason = "scan exclusion rules changed"
+        elif full_rescan and not checkpoint.full_rescan:
+            reason = "full rescan requested"
+        elif updated_at is not None and datetime.now(timezone.utc) - updated_at > max_age:
+            reason = "checkpoint expired"
+
+        if reason:
+            logger.info(f"Discarding scan checkpoint for {root_path}: {reason}")
+            self._discard_checkpoint(checkpoint.id)
+            self.db.commit()
+            return None
+        return checkpoint
+
+    def _restore_checkpoint(self, checkpoint: ScanCheckpoint, results: Dict) -> List[str]:
+        """
+        체크포인트의 완료 폴더/결과 카운터를 복원하고 남은 폴더 목록 반환
 
-            # 현재 폴더의 파일들 처리
-            self._process_folder(folder, results, scanned_files)
+        완료 폴더의 파일은 scanned_files에 넣지 않는다 (정리 단계가 stat으로
+        직접 확인하므로 이전 실행 이후 삭제된 파일도 정확히 정리됨).
+        """
+        self._checkpoint_id = checkpoint.id
+        rows = self.db.query(
+            ScanCheckpointDir.dir_path,
+            ScanCheckpointDir.skipped,
+            ScanCheckpointDir.state,
+        ).filter(ScanCheckpointDir.checkpoint_id == checkpoint.id).all()
+
+        for row in rows:
+            self._visited_dirs.add(row.dir_path)
+            if row.skipped:
+                self._skipped_dirs.add(row.dir_path)
+            else:
+                self._resumed_dirs.add(row.dir_path)
+            if row.state:
+                self._pending_states[row.dir_path] = row.state
+
+        saved = checkpoint.results or {}
+        for key in self.CHECKPOINT_COUNTERS:
+            results[key] = saved.get(key, 0)
+        results["resumed"] = True
+        results["resumed_folders"] = len(rows)
+
+        pending_dirs = list(checkpoint.pending_dirs or [])
+        self._frontier = set(pending_dirs)
+        logger.info(
+            f"Resuming scan of {checkpoint.root_path} from checkpoint: "
+            f"{len(rows)} folders done, {len(pending_dirs)} pending"
+        )
+        return pending_dirs
+
+    def _write_checkpoint(self, root_path: str, results: Dict, scanned_files: set):
+        """
+        버퍼의 스캔 항목과 함께 진행 위치를 커밋
 
-            # 하위 폴더 재귀 스캔
-            for subfolder in folder.iterdir():
-                if subfolder.is_dir():
-                    self._scan_folder_recursive(subfolder, results, scanned_files)
+        체크포인트 기록은 세이브포인트 안에서 실행하므로 실패해도 이미 저장한
+        스캔 항목은 그대로 커밋되고, 완료 폴더 목록은 다음 체크포인트에 다시 포함된다.
+        """
+        self._flush_scan_items(results, scanned_files)
+        created = False
+        try:
+            with self.db.begin_nested():
+                if self._checkpoint_id is None:
+                    inserted = self.db.execute(insert(ScanCheckpoint.__table__).values(
+                        root_path=root_path,
+                        full_rescan=self._checkpoint_full_rescan,
+                        rules_hash=self._rules_hash,
+                        pending_dirs=[],
+                        results={},
+                    ))
+                    self._checkpoint_id = inserted.inserted_primary_key[0]
+                    created = True
+
+                self.db.query(ScanCheckpoint).filter(
+                    ScanCheckpoint.id == self._checkpoint_id
+                ).update({
+                    "pending_dirs": sorted(self._frontier),
+                    "results": {key: results[key] for key in self.CHECKPOINT_COUNTERS},
+                }, synchronize_session=False)
 
-        except PermissionError as e:
-            error_msg = f"Permission denied: {folder} - {str(e)}"
-            logger.warning(error_msg)
+                # 폴더 상태는 flush 이후에 읽음 (INSERT에 실패한 폴더는 상태가 빠짐)
+                rows = [
+                    {
+                        "checkpoint_id": self._checkpoint_id,
+                        "dir_path": dir_path,
+                        "skipped": skipped,
+                        "state": self._pending_states.get(dir_path),
+                    }
+                    for dir_path, skipped in self._completed_since_checkpoint
+                ]
+                if rows:
+                    self.db.bulk_insert_mappings(ScanCheckpointDir, rows)
+            self.db.commit()
+            self._completed_since_checkpoint = []
+            logger.debug(f"Scan checkpoint saved for {root_path}: {len(self._frontier)} folders pending")
+        except Exception as e:
+            logger.warning(f"Failed to save scan checkpoint for {root_path}: {e}")
+            if created:
+                # 세이브포인트와 함께 롤백된 행 (다음 체크포인트에서 다시 생성)
+                self._checkpoint_id = None
+            try:
+                # 스캔 항목은 세이브포인트 밖에서 이미 flush되었으므로 커밋
+                self.db.commit()
+            except Exception as commit_error:
+                logger.error(f"Error committing scan items: {commit_error}")
+                self.db.rollback()
+        self._last_checkpoint = time.monotonic()
+
+    def _discard_checkpoint(self, checkpoint_id: int):
+        """체크포인트 삭제 (커밋은 호출자 책임)"""
+        self.db.query(ScanCheckpointDir).filter(
+            ScanCheckpointDir.checkpoint_id == checkpoint_id
+        ).delete(synchronize_session=False)
+        self.db.query(ScanCheckpoint).filter(
+            ScanCheckpoint.id == checkpoint_id
+        ).delete(synchronize_session=False)
+
+    def _is_cancelled(self) -> bool:
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def _report_progress(self, results: Dict, phase: str, current_path: str):
+        """progress_callback으로 현재 진행 상황 전달 (콜백 오류는 스캔에 영향 없음)"""
+        if self.progress_callback is None:
+            return
+        try:
+            self.progress_callback({
+                "phase": phase,
+                "root_path": self._root_path,
+                "current_path": current_path,
+                "folders_done": results["scanned_folders"] + results["skipped_folders"],
+                # 직전 스캔에서 기록된 폴더 수 (첫 스캔이면 None → ETA 계산 불가)
+                "folders_expected": self._expected_folders,
+                "files_done": results["scanned_files"],
+                "elapsed_seconds": time.monotonic() - self._scan_started,
+            })
+        except Exception as e:
+            logger.debug(f"Progress callback failed: {e}")
+
+    def _handle_listing(self, listing: Dict, results: Dict, scanned_files: set):
+        """
+        워커가 읽은 폴더 하나를 처리
+
+        mtime이 같아 워커가 목록 조회를 생략한 폴더는 그대로 건너뛴다. mtime은
+        바뀌었지만 항목 구성(해시)이 같으면 파일 처리만 건너뛴다.
+
+        Args:
+            listing: ParallelDirectoryWalker.walk()가 반환한 폴더 목록
+            results: 결과 딕셔너리
+            scanned_files: 스캔된 파일 경로 추적용 Set
+        """
+        folder_path_str = listing["path"]
+        folder = Path(folder_path_str)
+        self._visited_dirs.add(folder_path_str)
+
+        if listing["error"] is not None:
+            error = listing["error"]
+            if isinstance(error, PermissionError):
+                error_msg = f"Permission denied: {folder} - {str(error)}"
+                logger.warning(error_msg)
+            else:
+                error_msg = f"Error processing {folder}: {str(error)}"
+                logger.error(error_msg)
             results["errors"].append(error_msg)
+            return
+
+        if listing["skipped"]:
+            logger.debug(f"Skipping unchanged folder: {folder}")
+            results["skipped_folders"] += 1
+            self._skipped_dirs.add(folder_path_str)
+            return
+
+        try:
+            subdir_names = listing["subdirs"]
+            file_names = listing["files"]
+            entry_count = len(subdir_names) + len(file_names)
+            child_hash = self._compute_child_hash(subdir_names, file_names)
+
+            previous = self._dir_states.get(folder_path_str) if self._use_dir_states else None
+            if (previous is not None
+                    and previous["rules_hash"] == self._rules_hash
+                    and previous["entry_count"] == entry_count
+                    and previous["child_hash"] == child_hash):
+                # mtime만 바뀌고 항목 구성은 동일 (touch 등) → 파일 처리 생략
+                logger.debug(f"Skipping folder with unchanged entries: {folder}")
+                results["skipped_folders"] += 1
+                self._skipped_dirs.add(folder_path_str)
+                processed = True
+            else:
+                logger.info(f"Scanning folder: {folder}")
+                results["scanned_folders"] += 1
+
+                # 현재 폴더의 파일들 처리
+                files = [folder / name for name in file_names]
+                processed = self._process_folder(folder, results, scanned_files, files)
+
+            # 오류 없이 처리된 폴더만 상태 기록 (실패한 폴더는 다음 스캔에서 재시도)
+            if processed:
+                self._pending_states[folder_path_str] = {
+                    "mtime": listing["mtime"],
+                    "entry_count": entry_count,
+                    "child_hash": child_hash,
+                    "subdirs": sorted(subdir_names),
+                }
+
         except Exception as e:
             error_msg = f"Error processing {folder}: {str(e)}"
             logger.error(error_msg)
             results["errors"].append(error_msg)
 
-    def _process_folder(self, folder: Path, results: Dict, scanned_files: set):
+    def _process_folder(self, folder: Path, results: Dict, scanned_files: set,
+                        files: Optional[List[Path]] = None) -> bool:
         """
         Process a single folder - add all files to FilenameViolation as "scanned"
         (Product will be created later when user clicks AI matching)
@@ -249,40 +888,97 @@ class FileScanner:
             folder: Path to the product folder
             results: Results dictionary to update
             scanned_files: Set to track scanned file paths
+            files: 이미 조회한 폴더 내 파일 목록 (None이면 직접 조회)
+
+        Returns:
+            모든 파일이 오류 없이 처리되었으면 True
         """
         folder_path_str = str(folder.absolute())
 
+        if files is None:
+            files = [file_path for file_path in folder.iterdir() if file_path.is_file()]
+
         # 유효한 파일만 수집 (제외 대상 건너뛰기)
         valid_files = []
-        for file_path in folder.iterdir():
-            if file_path.is_file():
-                if self._is_excluded_file(file_path.name):
-                    logger.debug(f"Skipping excluded file: {file_path.name}")
-                    continue
-                valid_files.append(file_path)
+        for file_path in files:
+            if self._is_excluded_file(file_path.name):
+                logger.debug(f"Skipping excluded file: {file_path.name}")
+                continue
+            valid_files.append(file_path)
 
         # 유효한 파일이 없으면 폴더 건너뛰기
         if not valid_files:
             logger.debug(f"Skipping empty folder (no valid files): {folder}")
-            return
+            return True
 
+        processed = True
         for file_path in valid_files:
             logger.debug(f"Processing file: {file_path.name}")
             results["scanned_files"] += 1
             try:
-                with self.db.begin_nested():
-                    self._add_scanned_file(file_path, folder_path_str, results)
+                self._add_scanned_file(file_path, folder_path_str, results)
                 scanned_files.add(str(file_path.absolute()))
             except Exception as e:
                 logger.warning(f"Failed to scan file {file_path.name}: {e}")
                 results["errors"].append(f"File error {file_path.name}: {str(e)}")
+                processed = False
+
+        return processed
 
+    # 스캔 항목 INSERT 한 번에 묶을 행 수
+    INSERT_CHUNK_SIZE = 1000
+
+    def _preload_existing_items(self, root_path: str):
+        """
+        스캔 경로 아래의 기존 FilenameViolation 키와 Version 경로를 메모리에 로드
+
+        파일마다 (folder_path, file_name)과 file_path로 SELECT하던 것을
+        스캔 시작 시 두 번의 조회로 대체한다.
+        """
+        self._index_existing_items(
+            [FilenameViolation.folder_path.like(f"{root_path}%")],
+            [Version.file_path.like(f"{root_path}%")],
+        )
+        logger.debug(
+            f"Preloaded {len(self._known_items)} scan items and "
+            f"{len(self._known_versions)} versions under {root_path}"
+        )
+
+    def _index_existing_items(self, violation_filters: List, version_filters: List):
+        """조건에 맞는 기존 스캔 항목/Version을 조회해 _add_scanned_file()용 인덱스 구성"""
+        self._known_items = set()
+        # resolved 상태지만 product/version 연결이 끊긴 항목 (재스캔 시 리셋 대상)
+        self._orphaned_items = {}
+        self._reset_item_ids = []
+        self._pending_items = []
+
+        violation_rows = self.db.query(
+            FilenameViolation.id,
+            FilenameViolation.folder_path,
+            FilenameViolation.file_name,
+            FilenameViolation.is_resolved,
+            FilenameViolation.product_id,
+            FilenameViolation.version_id,
+        ).filter(*violation_filters).all()
+
+        for row in violation_rows:
+            key = (row.folder_path, row.file_name)
+            self._known_items.add(key)
+            if row.is_resolved and row.product_id is None and row.version_id is None:
+                self._orphaned_items[key] = row.id
+
+        self._known_versions = {
+            row.file_path: (row.id, row.product_id)
+            for row in self.db.query(Version.id, Version.product_id, Version.file_path).filter(*version_filters)
+        }
 
     def _add_scanned_file(self, file_path: Path, folder_path_str: str, results: Dict):
         """
         Add scanned file to FilenameViolation table as "scanned" type
         (Will be converted to Product later when user clicks AI matching)
 
+        실제 INSERT는 _flush_scan_items()에서 INSERT_CHUNK_SIZE 단위로 묶어서 실행한다.
+
         Args:
             file_path: Path to the file
             folder_path_str: Parent folder path
@@ -290,152 +986,228 @@ class FileScanner:
         """
         file_name = file_path.name
         file_path_str = str(file_path.absolute())
+        key = (folder_path_str, file_name)
 
         # Check if already exists in FilenameViolation
-        existing_violation = self.db.query(FilenameViolation).filter(
-            FilenameViolation.folder_path == folder_path_str,
-            FilenameViolation.file_name == file_name
-        ).first()
-
-        if existing_violation:
+        if key in self._known_items:
             # 기존 violation이 resolved 상태이지만 연결된 product/version이 없으면 리셋
             # (product 삭제 시 CASCADE SET NULL로 product_id가 NULL이 되었지만 is_resolved가 True로 남은 경우)
-            if existing_violation.is_resolved and existing_violation.product_id is None and existing_violation.version_id is None:
-                existing_violation.is_resolved = False
-                existing_violation.violation_details = "스캔된 파일 (AI 매칭 대기중)"
+            orphaned_id = self._orphaned_items.pop(key, None)
+            if orphaned_id is not None:
+                self._reset_item_ids.append(orphaned_id)
             return  # Skip creating a new violation record
 
         # Check if Version already exists (이미 매칭된 파일)
-        existing_version = self.db.query(Version).filter(
-            Version.file_path == file_path_str
-        ).first()
+        existing_version = self._known_versions.get(file_path_str)
 
         # 파일명 + 폴더명으로 자동 분류
         folder_name = Path(folder_path_str).name
         classification = classify_file(file_name, folder_name)
 
         # 파일명 규칙 검사 없이 모두 "scanned" 타입으로 추가 (스캔 예외 규칙만 적용됨)
-        violation = FilenameViolation(
-            folder_path=folder_path_str,
-            file_name=file_name,
-            violation_type="scanned",
-            violation_details="스캔된 파일 (AI 매칭 대기중)",
-            suggestion=file_name,
-            is_resolved=False,
-            classification=classification,
-            classification_auto=True,
-        )
+        item = {
+            "folder_path": folder_path_str,
+            "file_name": file_name,
+            "violation_type": "scanned",
+            "violation_details": "스캔된 파일 (AI 매칭 대기중)",
+            "suggestion": file_name,
+            "is_resolved": False,
+            "classification": classification,
+            "classification_auto": True,
+            "product_id": None,
+            "version_id": None,
+        }
 
         # If Version exists, link it automatically and mark as resolved
         if existing_version:
-            violation.product_id = existing_version.product_id
-            violation.version_id = existing_version.id
-            violation.is_resolved = True
-            violation.violation_details = "이미 스토어에 등록된 파일"
-            self.db.add(violation)
-            results["new_versions"] += 1  # Already registered version file
-        else:
-            self.db.add(violation)
-            results["new_products"] += 1  # New unresolved scan item
+            item["version_id"], item["product_id"] = existing_version
+            item["is_resolved"] = True
+            item["violation_details"] = "이미 스토어에 등록된 파일"
+
+        self._pending_items.append(item)
+        self._known_items.add(key)
+
+    def _flush_scan_items(self, results: Dict, scanned_files: set):
+        """
+        버퍼에 쌓인 스캔 항목을 INSERT ... ON CONFLICT DO NOTHING으로 일괄 저장
+
+        일괄 INSERT가 실패하면 해당 청크만 한 행씩 다시 시도해, 실패한 파일을
+        기존처럼 results["errors"]에 파일 단위로 기록한다.
+        """
+        if self._reset_item_ids:
+            reset_ids, self._reset_item_ids = self._reset_item_ids, []
+            for i in range(0, len(reset_ids), self.INSERT_CHUNK_SIZE):
+                self.db.query(FilenameViolation).filter(
+                    FilenameViolation.id.in_(reset_ids[i:i + self.INSERT_CHUNK_SIZE])
+                ).update({
+                    "is_resolved": False,
+                    "violation_details": "스캔된 파일 (AI 매칭 대기중)"
+                }, synchronize_session=False)
+
+        items, self._pending_items = self._pending_items, []
+        for i in range(0, len(items), self.INSERT_CHUNK_SIZE):
+            chunk = items[i:i + self.INSERT_CHUNK_SIZE]
+            try:
+                with self.db.begin_nested():
+                    self._insert_scan_items(chunk, results)
+            except Exception as e:
+                logger.warning(f"Bulk insert of {len(chunk)} scan items failed, retrying one by one: {e}")
+                for item in chunk:
+                    try:
+                        with self.db.begin_nested():
+                            self._insert_scan_items([item], results)
+                    except Exception as item_error:
+                        file_name = item["file_name"]
+                        logger.warning(f"Failed to scan file {file_name}: {item_error}")
+                        results["errors"].append(f"File error {file_name}: {str(item_error)}")
+                        scanned_files.discard(os.path.join(item["folder_path"], file_name))
+                        self._known_items.discard((item["folder_path"], file_name))
+                        # 실패한 파일이 있는 폴더는 다음 증분 스캔에서 다시 처리
+                        self._pending_states.pop(item["folder_path"], None)
+
+    def _insert_scan_items(self, items: List[Dict], results: Dict):
+        """스캔 항목 INSERT (동시 스캔과 겹친 행은 ON CONFLICT로 건너뜀)"""
+        stmt = pg_insert(FilenameViolation.__table__).values(items).on_conflict_do_nothing()
+        stmt = stmt.returning(FilenameViolation.__table__.c.version_id)
+        inserted = self.db.execute(stmt).fetchall()
+
+        for row in inserted:
+            if row.version_id is not None:
+                results["new_versions"] += 1  # Already registered version file
+            else:
+                results["new_products"] += 1  # New unresolved scan item
 
     def _detect_renamed_files(self, base_path: str, scanned_files: set, results: Dict):
         """
         파일명이 변경된 파일을 감지하고 업데이트
 
-        같은 폴더 내에서 파일 크기와 수정 시간이 동일한 파일을 찾아서
-        Version과 FilenameViolation 레코드를 업데이트
+        스캔 결과에 없고 실제로도 사라진 Version마다, 같은 폴더에서 크기가 같은
+        새 파일을 찾아 Version과 FilenameViolation 레코드를 업데이트한다.
+        후보는 (폴더, 크기) → 경로 목록 인덱스로 찾으므로 Version 수와 파일 수에
+        선형이며, 같은 크기 후보가 여럿이면 저장된 내용 지문(없으면 파일명
+        유사도)으로 구분한다.
 
         Args:
             base_path: 스캔 경로
-            scanned_files: 스캔된 파일 경로 Set (딕셔너리로 변경 필요)
+            scanned_files: 스캔된 파일 경로 Set
             results: 결과 딕셔너리
         """
         try:
-            # 스캔된 파일들의 메타데이터 수집 (경로, 크기, 수정 시간)
-            scanned_file_info = {}
-            for file_path in scanned_files:
-                if os.path.isfile(file_path):
-                    try:
-                        stat = os.stat(file_path)
-                        folder = str(Path(file_path).parent)
-                        scanned_file_info[file_path] = {
-                            'folder': folder,
-                            'size': stat.st_size,
-                            'mtime': int(stat.st_mtime),
-                            'name': Path(file_path).name
-                        }
-                    except Exception as e:
-                        logger.warning(f"Could not get file info for {file_path}: {e}")
-
             # DB에 있는 모든 Version 조회
             versions = self.db.query(Version).join(Product).filter(
                 Product.folder_path.like(f"{base_path}%")
             ).all()
 
-            renamed_count = 0
+            # 이미 Version으로 등록된 경로 (이름 변경 대상 후보에서 제외)
+            known_paths = set(self._known_versions)
+            known_paths.update(version.file_path for version in versions)
 
+            # 파일이 스캔 결과에 없음 - 삭제되었거나 이름이 변경됨
+            missing = []
             for version in versions:
-                if version.file_path not in scanned_files:
-                    # 파일이 스캔 결과에 없음 - 삭제되었거나 이름이 변경됨
-                    old_path = version.file_path
+                if version.file_path in scanned_files or not version.file_size:
+                    continue
+
+                old_folder = os.path.dirname(version.file_path)
+
+                # 증분 스캔에서 변경 없이 건너뛴 폴더는 확인할 필요 없음
+                if self._is_skipped_folder(old_folder):
+                    continue
+
+                if os.path.isfile(version.file_path):
+                    # 파일이 여전히 존재 - 스캔 대상이 아님
+                    continue
+
+                missing.append((version, old_folder))
+
+            if not missing:
+                return
 
-                    # 같은 폴더 내에서 크기가 같은 파일 찾기
-                    old_folder = str(Path(old_path).parent)
+            # 사라진 Version이 있는 폴더의 새 파일만 stat하여 (폴더, 크기) 인덱스 구성
+            target_folders = {old_folder for _, old_folder in missing}
+            candidates = {}
+            for file_path in scanned_files:
+                folder = os.path.dirname(file_path)
+                if folder not in target_folders or file_path in known_paths:
+                    continue
+                try:
+                    size = os.stat(file_path).st_size
+                except OSError as e:
+                    logger.warning(f"Could not get file info for {file_path}: {e}")
+                    continue
+                candidates.setdefault((folder, size), []).append(file_path)
+
+            # 체크포인트에서 재개한 경우 이전 실행에서 처리한 폴더의 파일은
+            # scanned_files에 없으므로 해당 폴더만 직접 목록을 읽음
+            for folder in target_folders & self._resumed_dirs:
+                try:
+                    with os.scandir(folder) as it:
+                        for entry in it:
+                            if (not entry.is_file() or entry.path in known_paths
+                                    or entry.path in scanned_files
+                                    or self._is_excluded_file(entry.name)):
+                                continue
+                            candidates.setdefault((folder, entry.stat().st_size), []).append(entry.path)
+                except OSError as e:
+                    logger.warning(f"Could not list {folder} for rename detection: {e}")
+
+            # 지문이 저장된 Version이 먼저 후보를 차지하도록 정렬
+            missing.sort(key=lambda item: item[0].content_fingerprint is None)
+
+            fingerprints = {}
+            renamed_count = 0
 
-                    if os.path.isfile(old_path):
-                        # 파일이 여전히 존재 - 스캔 대상이 아님
+            for version, old_folder in missing:
+                bucket = candidates.get((old_folder, version.file_size))
+                if not bucket:
+                    continue
+
+                try:
+                    matched_new_file = self._pick_rename_candidate(version, bucket, fingerprints)
+                    if matched_new_file is None:
                         continue
+                    bucket.remove(matched_new_file)
 
-                    try:
-                        # 기존 파일 정보가 있다면 사용
-                        if version.file_size:
-                            old_size = version.file_size
-                        else:
-                            continue
-
-                        # 같은 폴더 내에서 같은 크기의 새 파일 찾기
-                        matched_new_file = None
-                        for new_path, info in scanned_file_info.items():
-                            if (info['folder'] == old_folder and
-                                info['size'] == old_size):
-                                # DB에 이미 있는지 확인
-                                existing = self.db.query(Version).filter(
-                                    Version.file_path == new_path
-                                ).first()
-
-                                if not existing:
-                                    matched_new_file = new_path
-                                    break
-
-                        if matched_new_file:
-                            # 파일명 변경 감지됨 - Version 업데이트
-                            old_filename = version.file_name
-                            new_filename = Path(matched_new_file).name
-
-                            logger.info(f"Renamed file detected: {old_filename} → {new_filename}")
-
-                            version.file_name = new_filename
-                            version.file_path = matched_new_file
-
-                            # FilenameViolation도 업데이트
-                            violations = self.db.query(FilenameViolation).filter(
-                                FilenameViolation.folder_path == old_folder,
-                                FilenameViolation.file_name == old_filename
-                            ).all()
-
-                            for violation in violations:
-                                violation.file_name = new_filename
-                                violation.suggestion = new_filename
-
-                            renamed_count += 1
-
-                            # scanned_files에서 제거하여 중복 처리 방지
-                            scanned_files.discard(matched_new_file)
+                    # 파일명 변경 감지됨 - Version 업데이트
+                    old_filename = version.file_name
+                    new_filename = os.path.basename(matched_new_file)
 
-                    except Exception as e:
-                        logger.warning(f"Error detecting rename for {old_path}: {e}")
+                    logger.info(f"Renamed file detected: {old_filename} → {new_filename}")
+
+                    version.file_name = new_filename
+                    version.file_path = matched_new_file
+                    if fingerprints.get(matched_new_file):
+                        version.content_fingerprint = fingerprints[matched_new_file]
+
+                    # 이번 스캔에서 새 이름으로 추가된 미매칭 항목 제거
+                    # (기존 항목의 이름을 바꾸므로 (folder_path, file_name) 중복 방지)
+                    removed = self.db.query(FilenameViolation).filter(
+                        FilenameViolation.folder_path == old_folder,
+                        FilenameViolation.file_name == new_filename,
+                        FilenameViolation.product_id.is_(None)
+                    ).delete(synchronize_session=False)
+                    results["new_products"] = max(0, results["new_products"] - removed)
+
+                    # FilenameViolation도 업데이트
+                    violations = self.db.query(FilenameViolation).filter(
+                        FilenameViolation.folder_path == old_folder,
+                        FilenameViolation.file_name == old_filename
+                    ).all()
+
+                    for violation in violations:
+                        violation.file_name = new_filename
+                        violation.suggestion = new_filename
+
+                    # 새 경로는 scanned_files에 그대로 둔다 (빼면 정리 단계에서
+                    # 방금 갱신한 Version이 삭제됨). 중복 매칭은 bucket에서 제거해 방지.
+                    renamed_count += 1
+
+                except Exception as e:
+                    logger.warning(f"Error detecting rename for {version.file_path}: {e}")
 
             if renamed_count > 0:
+                # 정리 단계는 컬럼 단위로 다시 조회하므로 변경된 경로를 먼저 반영
+                self.db.flush()
                 results["renamed_files"] = renamed_count
                 logger.info(f"Updated {renamed_count} renamed files")
 
@@ -443,87 +1215,91 @@ class FileScanner:
             logger.error(f"Error detecting renamed files: {e}")
             results["errors"].append(f"Rename detection error: {str(e)}")
 
+    def _pick_rename_candidate(self, version: Version, bucket: List[str],
+                               fingerprints: Dict[str, Optional[str]]) -> Optional[str]:
+        """
+        같은 폴더/같은 크기 후보 중 version의 새 파일을 선택
+
+        - 지문이 저장된 Version: 지문이 일치하는 후보만 인정 (없으면 None)
+        - 지문이 없는 Version: 후보가 하나면 그대로, 여럿이면 파일명이 가장 비슷한 후보
+
+        Args:
+            version: 사라진 Version
+            bucket: 후보 파일 경로 목록
+            fingerprints: 경로 → 지문 캐시 (같은 스캔에서 재사용)
+        """
+        if settings.SCAN_RENAME_FINGERPRINT and version.content_fingerprint:
+            for path in sorted(bucket):
+                if path not in fingerprints:
+                    fingerprints[path] = content_fingerprint(path)
+                if fingerprints[path] == version.content_fingerprint:
+                    return path
+            return None
+
+        if len(bucket) == 1:
+            return bucket[0]
+
+        old_name = version.file_name.lower()
+        return max(
+            sorted(bucket),
+            key=lambda path: SequenceMatcher(None, old_name, os.path.basename(path).lower()).ratio()
+        )
+
     def _cleanup_deleted_files(self, base_path: str, scanned_files: set, results: Dict):
         """
         스캔 경로 내에서 삭제된 파일의 Version과 Product를 DB에서 제거
 
+        워커가 이번 스캔에서 확인한 경로(scanned_files)는 stat 없이 존재로 보고,
+        나머지 경로만 병렬로 stat하여 실제로 사라진 파일을 정리한다.
+
         Args:
             base_path: 스캔 경로
             scanned_files: 스캔된 파일 경로 Set
             results: 결과 딕셔너리
         """
         try:
-            # 스캔 경로 내의 모든 Version 조회
-            versions = self.db.query(Version).join(Product).filter(
-                Product.folder_path.like(f"{base_path}%")
-            ).all()
-
-            deleted_version_ids = []
-            product_ids_to_check = set()
-
-            # 파일이 존재하지 않는 Version 찾기
-            # scanned_files 체크와 실제 파일 존재 여부 모두 확인
-            for version in versions:
-                # 1. scanned_files에 없거나
-                # 2. 실제로 파일이 존재하지 않으면 삭제
-                file_exists = os.path.exists(version.file_path)
-
-                if version.file_path not in scanned_files or not file_exists:
-                    logger.info(f"Deleted file detected: {version.file_path} (exists: {file_exists})")
-                    deleted_version_ids.append(version.id)
-                    product_ids_to_check.add(version.product_id)
-
-            # Version 삭제
-            if deleted_version_ids:
-                self.db.query(Version).filter(Version.id.in_(deleted_version_ids)).delete(synchronize_session=False)
-                results["deleted_versions"] = len(deleted_version_ids)
-                logger.info(f"Deleted {len(deleted_version_ids)} versions")
-
-            # Version이 없는 Product 삭제
-            deleted_product_ids = []
-            for product_id in product_ids_to_check:
-                version_count = self.db.query(Version).filter(Version.product_id == product_id).count()
-                if version_count == 0:
-                    deleted_product_ids.append(product_id)
+            # 증분 스캔에서 변경 없이 건너뛴 폴더의 파일은 scanned_files에
+            # 없지만 그대로 존재하므로 확인 대상이 아님
+            def is_skipped(file_path: str) -> bool:
+                return self._is_skipped_folder(os.path.dirname(file_path))
+
+            # 스캔 경로 내의 모든 Version (ORM 객체 대신 필요한 컬럼만)
+            version_rows = [
+                (row.id, row.product_id, row.file_path)
+                for row in self.db.query(Version.id, Version.product_id, Version.file_path).join(Product).filter(
+                    Product.folder_path.like(f"{base_path}%")
+                )
+            ]
+
+            deleted_versions, deleted_product_ids = reconcile_versions(
+                self.db,
+                version_rows,
+                seen_paths=scanned_files,
+                is_skipped=is_skipped,
+                max_workers=self.walk_workers,
+            )
+
+            if deleted_versions:
+                results["deleted_versions"] = deleted_versions
+                logger.info(f"Deleted {deleted_versions} versions")
 
             if deleted_product_ids:
-                # FilenameViolation 리셋 (재스캔 가능하도록)
-                self.db.query(FilenameViolation).filter(
-                    FilenameViolation.product_id.in_(deleted_product_ids)
-                ).update({
-                    "is_resolved": False,
-                    "product_id": None,
-                    "version_id": None,
-                    "violation_details": "스캔된 파일 (AI 매칭 대기중)"
-                }, synchronize_session=False)
-                # 외래키 제약 조건이 있는 관련 레코드 먼저 삭제
-                self.db.query(Attachment).filter(Attachment.product_id.in_(deleted_product_ids)).delete(synchronize_session=False)
-                self.db.query(Favorite).filter(Favorite.product_id.in_(deleted_product_ids)).delete(synchronize_session=False)
-                # Product 삭제 (ProductVideo, ShareLink는 ondelete=CASCADE로 자동 처리)
-                self.db.query(Product).filter(Product.id.in_(deleted_product_ids)).delete(synchronize_session=False)
                 results["deleted_products"] = len(deleted_product_ids)
                 logger.info(f"Deleted {len(deleted_product_ids)} products with no versions")
 
             # product_id가 NULL인 FilenameViolation 중 실제 파일이 없는 것 삭제
             # (AI 매칭 전 상태인 "scanned" 항목으로, 파일이 삭제된 경우)
-            unmatched_violations = self.db.query(FilenameViolation).filter(
-                FilenameViolation.product_id.is_(None),
-                FilenameViolation.folder_path.like(f"{base_path}%")
-            ).all()
-
-            deleted_violation_ids = []
-            for violation in unmatched_violations:
-                full_path = os.path.join(violation.folder_path, violation.file_name)
-                if not os.path.exists(full_path):
-                    deleted_violation_ids.append(violation.id)
-                    logger.info(f"Deleted unmatched violation (file gone): {full_path}")
-
-            if deleted_violation_ids:
-                self.db.query(FilenameViolation).filter(
-                    FilenameViolation.id.in_(deleted_violation_ids)
-                ).delete(synchronize_session=False)
-                results["deleted_violations"] = len(deleted_violation_ids)
-                logger.info(f"Deleted {len(deleted_violation_ids)} unmatched violations")
+            deleted_violations = reconcile_unmatched_items(
+                self.db,
+                base_path,
+                seen_paths=scanned_files,
+                is_skipped=is_skipped,
+                max_workers=self.walk_workers,
+            )
+
+            if deleted_violations:
+                results["deleted_violations"] = deleted_violations
+                logger.info(f"Deleted {deleted_violations} unmatched violations")
 
         except Exception as e:
             logger.error(f"Error cleaning up deleted files: {e}")
@@ -1,11 +1,14 @@
+import os
+import time
 import asyncio
 import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 from apscheduler.jobstores.memory import MemoryJobStore
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
 
 from app.database import SessionLocal
 from app.core.scanner import FileScanner
@@ -119,14 +122,25 @@ class ScanScheduler:
         self.scan_history = []
         self._save_history()
 
-    async def _run_scheduled_scan(self, scan_type: str = "auto"):
+    async def _run_scheduled_scan(self, scan_type: str = "auto", full_rescan: bool = False, job=None):
         """
         스케줄된 스캔 실행
+
+        설정된 경로들을 SCAN_MAX_CONCURRENT_ROOTS개까지 동시에 스캔한다. 경로마다
+        DB 세션과 스캔 스레드를 따로 쓰므로 전체 시간은 가장 큰 볼륨의 스캔
+        시간에 가까워진다. 같은 장치(st_dev)에 있는 경로끼리는 디스크 탐색이
+        겹치지 않도록 순서대로 스캔한다.
+
+        Args:
+            scan_type: 'auto' (cron), 'manual' 또는 'watcher' (파일 감시 재동기화)
+            full_rescan: True면 증분 스캔 대신 전체 재스캔
+            job: 백그라운드 작업(ScanJob)으로 실행 중이면 진행 상황 기록/취소 확인에 사용
         """
+        from app.config import settings as app_settings
+
         started_at = datetime.now()
         logger.info(f"Starting scheduled scan at {started_at}")
 
-        db = SessionLocal()
         all_results = {
             "new_products": 0,
             "new_versions": 0,
@@ -135,75 +149,200 @@ class ScanScheduler:
             "icons_cached": 0,
             "scanned_files": 0,
             "scanned_folders": 0,
+            "skipped_folders": 0,
             "new_scan_items": 0,
             "deleted_violations": 0,
             "errors": [],
-            "scanned_paths": []
+            "scanned_paths": [],
+            # 체크포인트에서 이어서 스캔한 경로
+            "resumed_paths": [],
+            "cancelled": False
         }
 
-        try:
-            # 모든 경로 스캔
-            for path in self.scan_paths:
+        scan_paths = list(self.scan_paths)
+        semaphore = asyncio.Semaphore(max(1, app_settings.SCAN_MAX_CONCURRENT_ROOTS))
+        # 네트워크 마운트가 응답하지 않을 수 있으므로 stat도 스레드에서
+        device_keys = await asyncio.to_thread(self._device_keys, scan_paths)
+        device_locks = {key: asyncio.Lock() for key in set(device_keys.values())}
+
+        async def scan_root(index: int, path: str) -> dict:
+            """경로 하나 스캔 (자체 세션 사용) - 경로별 결과와 소요 시간 반환"""
+            outcome = {"path": path, "results": None, "error": None, "started_at": None, "duration_seconds": 0.0}
+            # 장치 잠금을 먼저 잡아야 같은 볼륨에서 대기하는 경로가 동시 실행 슬롯을 차지하지 않는다
+            async with device_locks[device_keys[path]], semaphore:
+                if job and job.cancel_event.is_set():
+                    return outcome
+
+                outcome["started_at"] = datetime.now()
+                root_started = time.monotonic()
+                db = SessionLocal()
                 try:
-                    scanner = FileScanner(db, use_ai=self.use_ai)
+                    if job:
+                        job.begin_path(index, path)
+                    scanner = FileScanner(
+                        db,
+                        use_ai=self.use_ai,
+                        progress_callback=job.update_progress if job else None,
+                        cancel_event=job.cancel_event if job else None,
+                    )
 
                     # 스캔은 동기 파일시스템 I/O이므로 스레드로 실행해 이벤트
                     # 루프를 블로킹하지 않도록 함 (자동 스캔 중에도 API 응답 가능)
-                    results = await asyncio.to_thread(scanner.scan_directory, path)
-
-                    # 결과 집계
-                    all_results["new_products"] += results.get("new_products", 0)
-                    all_results["new_versions"] += results.get("new_versions", 0)
-                    all_results["updated_products"] += results.get("updated_products", 0)
-                    all_results["ai_generated"] += results.get("ai_generated", 0)
-                    all_results["icons_cached"] += results.get("icons_cached", 0)
-                    all_results["scanned_files"] += results.get("scanned_files", 0)
-                    all_results["scanned_folders"] += results.get("scanned_folders", 0)
-                    # new_products in scanner = new unresolved scan items added
-                    all_results["new_scan_items"] += results.get("new_products", 0)
-                    all_results["deleted_violations"] += results.get("deleted_violations", 0)
-                    all_results["errors"].extend(results.get("errors", []))
-                    all_results["scanned_paths"].append(path)
-
-                    logger.info(f"  ✓ Scanned: {path}")
-
+                    outcome["results"] = await asyncio.to_thread(scanner.scan_directory, path, full_rescan)
+                    if job:
+                        job.end_path(path, outcome["results"])
                 except Exception as e:
-                    error_msg = f"Failed to scan {path}: {str(e)}"
-                    all_results["errors"].append(error_msg)
-                    logger.error(f"  ✗ {error_msg}", exc_info=True)
-
-            self.last_scan_time = datetime.now()
-            self.last_scan_result = all_results
-
-            # 히스토리 기록
-            elapsed = (self.last_scan_time - started_at).total_seconds()
-            history_entry = {
-                "started_at": started_at.isoformat(),
-                "finished_at": self.last_scan_time.isoformat(),
-                "duration_seconds": round(elapsed, 1),
-                "scan_type": scan_type,
-                "scanned_files": all_results["scanned_files"],
-                "new_scan_items": all_results["new_scan_items"],
-                "new_versions": all_results["new_versions"],
-                "deleted_violations": all_results["deleted_violations"],
-                "errors_count": len(all_results["errors"]),
-                "scanned_paths": all_results["scanned_paths"],
-            }
-            self.scan_history.append(history_entry)
-            if len(self.scan_history) > self.MAX_HISTORY:
-                self.scan_history = self.scan_history[-self.MAX_HISTORY:]
-            self._save_history()
-
-            logger.info(f"Scheduled scan completed at {self.last_scan_time}:")
-            logger.info(f"  - Scanned files: {all_results['scanned_files']}")
-            logger.info(f"  - New scan items: {all_results['new_scan_items']}")
-            logger.info(f"  - New versions: {all_results['new_versions']}")
-            logger.info(f"  - AI generated: {all_results['ai_generated']}")
-            if all_results['errors']:
-                logger.warning(f"  - Errors: {len(all_results['errors'])}")
-
-        finally:
-            db.close()
+                    outcome["error"] = f"Failed to scan {path}: {str(e)}"
+                    logger.error(f"  ✗ {outcome['error']}", exc_info=True)
+                    if job:
+                        job.end_path(path, {})
+                finally:
+                    db.close()
+                    outcome["duration_seconds"] = round(time.monotonic() - root_started, 1)
+            return outcome
+
+        outcomes = await asyncio.gather(*(scan_root(index, path) for index, path in enumerate(scan_paths)))
+
+        # 결과 집계 (설정된 경로 순서대로)
+        path_entries = []
+        for outcome in outcomes:
+            path = outcome["path"]
+            results = outcome["results"]
+
+            if outcome["error"]:
+                all_results["errors"].append(outcome["error"])
+                path_entries.append({
+                    "path": path,
+                    "started_at": outcome["started_at"].isoformat() if outcome["started_at"] else None,
+                    "duration_seconds": outcome["duration_seconds"],
+                    "error": outcome["error"],
+                })
+                continue
+
+            if results is None:
+                # 취소되어 시작하지 못한 경로
+                all_results["cancelled"] = True
+                logger.info(f"  ✗ Not started (cancelled): {path}")
+                continue
+
+            all_results["new_products"] += results.get("new_products", 0)
+            all_results["new_versions"] += results.get("new_versions", 0)
+            all_results["updated_products"] += results.get("updated_products", 0)
+            all_results["ai_generated"] += results.get("ai_generated", 0)
+            all_results["icons_cached"] += results.get("icons_cached", 0)
+            all_results["scanned_files"] += results.get("scanned_files", 0)
+            all_results["scanned_folders"] += results.get("scanned_folders", 0)
+            all_results["skipped_folders"] += results.get("skipped_folders", 0)
+            # new_products in scanner = new unresolved scan items added
+            all_results["new_scan_items"] += results.get("new_products", 0)
+            all_results["deleted_violations"] += results.get("deleted_violations", 0)
+            all_results["errors"].extend(results.get("errors", []))
+            all_results["scanned_paths"].append(path)
+            if results.get("resumed"):
+                all_results["resumed_paths"].append(path)
+            if results.get("cancelled"):
+                all_results["cancelled"] = True
+                logger.info(f"  ✗ Cancelled: {path}")
+            else:
+                logger.info(f"  ✓ Scanned: {path} ({outcome['duration_seconds']}s)")
+
+            path_entries.append({
+                "path": path,
+                "started_at": outcome["started_at"].isoformat(),
+                "duration_seconds": outcome["duration_seconds"],
+                "scanned_files": results.get("scanned_files", 0),
+                "scanned_folders": results.get("scanned_folders", 0),
+                "skipped_folders": results.get("skipped_folders", 0),
+                "new_scan_items": results.get("new_products", 0),
+                "new_versions": results.get("new_versions", 0),
+                "deleted_violations": results.get("deleted_violations", 0),
+                "errors_count": len(results.get("errors", [])),
+                "cancelled": results.get("cancelled", False),
+                "resumed": results.get("resumed", False),
+            })
+
+        all_results["paths"] = path_entries
+
+        self.last_scan_time = datetime.now()
+        self.last_scan_result = all_results
+
+        # 히스토리 기록
+        elapsed = (self.last_scan_time - started_at).total_seconds()
+        history_entry = {
+            "started_at": started_at.isoformat(),
+            "finished_at": self.last_scan_time.isoformat(),
+            "duration_seconds": round(elapsed, 1),
+            # 경로별 소요 시간 합 (동시 스캔으로 줄어든 시간 비교용)
+            "paths_duration_seconds": round(sum(entry["duration_seconds"] for entry in path_entries), 1),
+            "max_concurrency": app_settings.SCAN_MAX_CONCURRENT_ROOTS,
+            "scan_type": scan_type,
+            "full_rescan": full_rescan,
+            "cancelled": all_results["cancelled"],
+            "scanned_files": all_results["scanned_files"],
+            "scanned_folders": all_results["scanned_folders"],
+            "skipped_folders": all_results["skipped_folders"],
+            "new_scan_items": all_results["new_scan_items"],
+            "new_versions": all_results["new_versions"],
+            "deleted_violations": all_results["deleted_violations"],
+            "errors_count": len(all_results["errors"]),
+            "scanned_paths": all_results["scanned_paths"],
+            "resumed_paths": all_results["resumed_paths"],
+            "paths": path_entries,
+        }
+        self.scan_history.append(history_entry)
+        if len(self.scan_history) > self.MAX_HISTORY:
+            self.scan_history = self.scan_history[-self.MAX_HISTORY:]
+        self._save_history()
+
+        logger.info(f"Scheduled scan completed at {self.last_scan_time}:")
+        logger.info(f"  - Scanned files: {all_results['scanned_files']}")
+        logger.info(f"  - Skipped folders (unchanged): {all_results['skipped_folders']}")
+        logger.info(f"  - New scan items: {all_results['new_scan_items']}")
+        logger.info(f"  - New versions: {all_results['new_versions']}")
+        logger.info(f"  - AI generated: {all_results['ai_generated']}")
+        logger.info(f"  - Wall time: {history_entry['duration_seconds']}s "
+                    f"(sum of paths: {history_entry['paths_duration_seconds']}s)")
+        if all_results['errors']:
+            logger.warning(f"  - Errors: {len(all_results['errors'])}")
+
+    @staticmethod
+    def _device_keys(paths: List[str]) -> Dict[str, object]:
+        """
+        경로별 장치 키 (같은 키의 경로는 순서대로 스캔)
+
+        stat에 실패한 경로는 경로 자체를 키로 써서 다른 경로와 묶지 않는다
+        (스캔에서 ValueError로 보고됨).
+        """
+        keys = {}
+        for path in paths:
+            try:
+                keys[path] = os.stat(path).st_dev
+            except OSError:
+                keys[path] = path
+        return keys
+
+    def schedule_resync_scan(self, reason: str = "watcher overflow"):
+        """
+        파일 감시가 이벤트를 놓쳤을 때 증분 스캔을 한 번 예약
+
+        감시 스레드에서 호출되며, 이미 예약된 재동기화가 있으면 시각만 갱신한다.
+        """
+        from app.config import settings as app_settings
+
+        if not self.scheduler.running:
+            logger.warning(f"Resync scan not scheduled ({reason}): scheduler is not running")
+            return
+
+        run_at = datetime.now() + timedelta(seconds=app_settings.SCAN_WATCH_RESYNC_DELAY_SECONDS)
+        self.scheduler.add_job(
+            self._run_scheduled_scan,
+            DateTrigger(run_date=run_at),
+            kwargs={"scan_type": "watcher"},
+            id='watcher_resync',
+            name='File Watcher Resync Scan',
+            replace_existing=True
+        )
+        logger.info(f"✓ Resync scan scheduled at {run_at.isoformat()} ({reason})")
 
     def get_status(self) -> dict:
         """
@@ -228,15 +367,19 @@ class ScanScheduler:
             "last_scan_result": self.last_scan_result
         }
 
-    async def run_manual_scan(self) -> dict:
+    async def run_manual_scan(self, full_rescan: bool = False, job=None) -> dict:
         """
         수동으로 즉시 스캔 실행
 
+        Args:
+            full_rescan: True면 증분 스캔 대신 전체 재스캔
+            job: 백그라운드 작업(ScanJob)으로 실행할 때 전달
+
         Returns:
             스캔 결과
         """
         logger.info("Starting manual scheduled scan...")
-        await self._run_scheduled_scan(scan_type="manual")
+        await self._run_scheduled_scan(scan_type="manual", full_rescan=full_rescan, job=job)
         return self.last_scan_result or {}
 
     def load_settings_from_db(self):
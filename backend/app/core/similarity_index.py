@@ -0,0 +1,301 @@
+"""
+제품 제목 유사도 후보 인덱스
+
+auto_matcher.find_similar_product는 예전에 폴더 그룹마다 전체 Product를 읽어
+difflib.SequenceMatcher로 모든 제목과 비교했다 (제품 수 × 새 폴더 수).
+이 모듈은 정규화된 제목의 길이, 문자 구성, 문자 bigram 역색인을 메모리에 두고,
+값싼 조건부터 차례로 적용해 임계값 r에 도달할 수 없는 제품을 걸러낸다.
+(M: 일치 문자 수, T = la + lb, ratio = 2M / T)
+
+- 길이 (real_quick_ratio와 동일): 2*min(la, lb) / T >= r → 길이 구간만 조회
+- 공통 bigram 수 (역색인으로 계산): 일치 블록이 K개면 블록 안의 bigram M - K개가
+  양쪽에 공통으로 있고, 인접 블록 사이에는 어느 한쪽에 불일치 문자가 최소 1개 있으므로
+  K - 1 <= T - 2M. 따라서 공통 bigram >= 3M - T - 1 >= (1.5r - 1)T - 1
+- 문자 구성 (quick_ratio와 동일): 2*Σmin(ca[c], cb[c]) / T >= r
+- 남은 제품만 실제 SequenceMatcher.ratio() 계산
+
+상한으로 걸러진 제품은 실제 점수로도 임계값을 넘을 수 없으므로 후보 목록이 짧아질 뿐
+매칭 결과는 전체 비교와 같다. 최종 점수 계산(제조사 보너스 포함)과 버전/연도 가드는
+DB에서 다시 읽은 후보 Product에만 적용한다.
+
+인덱스는 프로세스마다 하나씩 유지된다.
+- 같은 프로세스의 ORM 쓰기(생성/수정/삭제)는 매퍼 이벤트로 즉시 반영
+- 다른 워커 프로세스의 생성/삭제나 벌크 DELETE는 (개수, 최대 id) 비교로 감지해 재구축
+- 다른 프로세스의 제목 수정은 SIMILARITY_INDEX_MAX_AGE_SECONDS가 지나면 재구축으로 반영
+"""
+import re
+import time
+import bisect
+import logging
+import threading
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session, object_session
+
+from app.models.product import Product
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD_PATTERN = re.compile(r'[^\w\s가-힣]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def _bigram_counts(text: str) -> Counter:
+    return Counter(text[i:i + 2] for i in range(len(text) - 1))
+
+
+# 커밋 전에 인덱스에 반영한 Product 쓰기가 있는 세션 표시 (롤백 시 인덱스 무효화)
+_SESSION_FLAG = "product_similarity_index_dirty"
+
+
+def normalize_title(title: str) -> str:
+    """
+    제품 타이틀을 정규화하여 비교 가능하도록 만듦
+
+    Args:
+        title: 원본 타이틀
+
+    Returns:
+        정규화된 타이틀 (소문자, 불필요한 공백/특수문자 제거)
+    """
+    if not title:
+        return ""
+
+    # 소문자 변환
+    normalized = title.lower()
+
+    # 특수문자 제거 (단어 구분을 위한 공백은 유지)
+    normalized = _NON_WORD_PATTERN.sub(' ', normalized)
+
+    # 여러 공백을 하나로
+    normalized = _WHITESPACE_PATTERN.sub(' ', normalized).strip()
+
+    return normalized
+
+
+class ProductSimilarityIndex:
+    """정규화 제목 길이/문자 구성/bigram 기반 유사 제품 후보 인덱스 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # product_id → (정규화 제목, 길이, 문자별 개수)
+        self._entries: Dict[int, Tuple[str, int, Counter]] = {}
+        # 정규화 제목 길이 → product_id 집합 (길이 범위 조회용)
+        self._by_length: Dict[int, set] = {}
+        self._lengths: List[int] = []
+        # bigram → {product_id: 제목 안의 개수}
+        self._bigrams: Dict[str, Dict[int, int]] = {}
+        self._max_id = 0
+        self._built_at: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # 구축 / 갱신
+    # ------------------------------------------------------------------
+
+    def _add(self, product_id: int, title: Optional[str]):
+        self._remove(product_id)
+        normalized = normalize_title(title)
+        length = len(normalized)
+        self._entries[product_id] = (normalized, length, Counter(normalized))
+        bucket = self._by_length.get(length)
+        if bucket is None:
+            bucket = self._by_length[length] = set()
+            bisect.insort(self._lengths, length)
+        bucket.add(product_id)
+        for bigram, n in _bigram_counts(normalized).items():
+            self._bigrams.setdefault(bigram, {})[product_id] = n
+        if product_id > self._max_id:
+            self._max_id = product_id
+
+    def _remove(self, product_id: int):
+        entry = self._entries.pop(product_id, None)
+        if entry is None:
+            return
+        length = entry[1]
+        bucket = self._by_length.get(length)
+        if bucket is not None:
+            bucket.discard(product_id)
+            if not bucket:
+                del self._by_length[length]
+                self._lengths.remove(length)
+        for bigram in _bigram_counts(entry[0]):
+            postings = self._bigrams.get(bigram)
+            if postings is not None:
+                postings.pop(product_id, None)
+                if not postings:
+                    del self._bigrams[bigram]
+        if product_id == self._max_id:
+            self._max_id = max(self._entries, default=0)
+
+    def rebuild(self, db: Session):
+        """DB의 전체 제품 제목으로 인덱스를 다시 만든다 (id, title 컬럼만 조회)"""
+        started = time.time()
+        rows = db.query(Product.id, Product.title).all()
+        with self._lock:
+            self._entries = {}
+            self._by_length = {}
+            self._lengths = []
+            self._bigrams = {}
+            self._max_id = 0
+            for product_id, title in rows:
+                self._add(product_id, title)
+            self._built_at = time.time()
+        logger.info(f"Product similarity index rebuilt: {len(rows)} products in {time.time() - started:.2f}s")
+
+    def invalidate(self):
+        """다음 조회 때 전체 재구축"""
+        with self._lock:
+            self._built_at = None
+
+    def upsert(self, product_id: int, title: Optional[str]):
+        with self._lock:
+            if self._built_at is not None:
+                self._add(product_id, title)
+
+    def remove(self, product_id: int):
+        with self._lock:
+            if self._built_at is not None:
+                self._remove(product_id)
+
+    def _ensure_fresh(self, db: Session):
+        """인덱스가 없거나 오래됐거나 DB와 (개수, 최대 id)가 다르면 재구축"""
+        count, max_id = db.query(func.count(Product.id), func.max(Product.id)).one()
+        with self._lock:
+            fresh = (
+                self._built_at is not None
+                and time.time() - self._built_at < settings.SIMILARITY_INDEX_MAX_AGE_SECONDS
+                and len(self._entries) == count
+                and self._max_id == (max_id or 0)
+            )
+        if not fresh:
+            self.rebuild(db)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def candidates(self, db: Session, normalized_title: str, min_ratio: float) -> List[int]:
+        """
+        SequenceMatcher(None, normalized_title, 제품 정규화 제목).ratio()가
+        min_ratio 이상인 제품 id 목록 (id 오름차순)
+
+        Args:
+            db: Database session (인덱스 신선도 확인/재구축용)
+            normalized_title: normalize_title()을 거친 검색 제목
+            min_ratio: 후보가 되기 위한 최소 유사도
+        """
+        self._ensure_fresh(db)
+
+        query_length = len(normalized_title)
+        query_counts = Counter(normalized_title)
+        # 부동소수점 오차로 경계값의 제품이 빠지지 않도록 약간 낮춰서 비교
+        min_ratio = max(0.0, min_ratio - 1e-9)
+        bigram_factor = 1.5 * min_ratio - 1
+
+        # 길이 조건: 2*min(la, lb)/(la+lb) >= r  →  lb ∈ [la*r/(2-r), la*(2-r)/r]
+        if min_ratio > 0:
+            low = query_length * min_ratio / (2 - min_ratio)
+            high = query_length * (2 - min_ratio) / min_ratio
+        else:
+            low, high = 0, float("inf")
+
+        # 문자 구성 조건까지 통과한 제품 (잠금은 인덱스를 읽는 동안만 유지)
+        survivors = []
+        with self._lock:
+            # 공통 bigram 수 (중복 포함 교집합 크기)
+            shared: Dict[int, int] = {}
+            for bigram, n in _bigram_counts(normalized_title).items():
+                for product_id, m in self._bigrams.get(bigram, {}).items():
+                    shared[product_id] = shared.get(product_id, 0) + (n if n < m else m)
+
+            start = bisect.bisect_left(self._lengths, low)
+            end = bisect.bisect_right(self._lengths, high)
+            for length in self._lengths[start:end]:
+                total = query_length + length
+                required_bigrams = bigram_factor * total - 1
+                if required_bigrams > 0:
+                    # 공통 bigram이 하나도 없는 제품은 볼 필요가 없음
+                    bucket = [pid for pid in self._by_length[length] if shared.get(pid, 0) >= required_bigrams]
+                else:
+                    # 아주 짧은 제목은 bigram 조건이 의미가 없으므로 길이 구간 전체를 검사
+                    bucket = self._by_length[length]
+
+                # 이 길이에서 필요한 최소 공통 문자 수
+                required_chars = min_ratio * total / 2.0
+                for product_id in bucket:
+                    normalized, _, counts = self._entries[product_id]
+                    matches = 0
+                    for ch, n in query_counts.items():
+                        m = counts.get(ch)
+                        if m:
+                            matches += n if n < m else m
+                    if matches >= required_chars:
+                        survivors.append((product_id, normalized))
+
+        # 실제 유사도 (find_similar_product의 calculate_similarity와 같은 인자 순서)
+        matcher = SequenceMatcher(None, normalized_title, "")
+        result = []
+        for product_id, normalized in survivors:
+            matcher.set_seq2(normalized)
+            if matcher.ratio() >= min_ratio:
+                result.append(product_id)
+
+        result.sort()
+        return result
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "products": len(self._entries),
+                "distinct_lengths": len(self._lengths),
+                "built_at": self._built_at,
+            }
+
+
+# 전역 인덱스 인스턴스
+product_similarity_index = ProductSimilarityIndex()
+
+
+# ------------------------------------------------------------------
+# 같은 프로세스의 ORM 쓰기를 인덱스에 반영
+# flush 시점에 바로 반영하고, 그 트랜잭션이 롤백되면 인덱스를 무효화한다.
+# 후보는 DB에서 다시 읽어 점수를 계산하므로 인덱스에 남은 가짜 항목은 결과에 영향이 없다.
+# ------------------------------------------------------------------
+
+def _mark_session(target):
+    session = object_session(target)
+    if session is not None:
+        session.info[_SESSION_FLAG] = True
+
+
+@event.listens_for(Product, "after_insert")
+def _on_product_insert(mapper, connection, target):
+    product_similarity_index.upsert(target.id, target.title)
+    _mark_session(target)
+
+
+@event.listens_for(Product, "after_update")
+def _on_product_update(mapper, connection, target):
+    product_similarity_index.upsert(target.id, target.title)
+    _mark_session(target)
+
+
+@event.listens_for(Product, "after_delete")
+def _on_product_delete(mapper, connection, target):
+    product_similarity_index.remove(target.id)
+    _mark_session(target)
+
+
+@event.listens_for(Session, "after_commit")
+def _on_session_commit(session):
+    session.info.pop(_SESSION_FLAG, None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_session_rollback(session):
+    if session.info.pop(_SESSION_FLAG, None):
+        product_similarity_index.invalidate()
@@ -3,12 +3,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
 import os
+import asyncio
 from pathlib import Path
 import logging
 
 from app.database import engine, Base
 from app.api import auth, products, users, scan, download, scheduler, filesystem, favorites, scraps, config, metadata, posts, invitations, images, filename_violations, version, comments, cache, attachments, share, product_videos, backup, activity_log
 from app.core.scheduler import scan_scheduler
+from app.core.fs_watcher import file_watcher
 from app.config import settings
 
 # 로깅 시스템 초기화 (FastAPI app 생성 전에 실행)
@@ -85,6 +87,18 @@ try:
 except Exception as _e4:
     logger.info(f"products.release_year column: {_e4}")
 
+# ── versions.content_fingerprint 컬럼 보장 (스캔 시 파일명 변경 감지용) ──
+try:
+    from sqlalchemy import text as _text5
+    with engine.connect() as _conn5:
+        _conn5.execute(_text5(
+            "ALTER TABLE versions ADD COLUMN IF NOT EXISTS content_fingerprint VARCHAR(40)"
+        ))
+        _conn5.commit()
+    logger.info("✓ versions.content_fingerprint column verified")
+except Exception as _e5:
+    logger.info(f"versions.content_fingerprint column: {_e5}")
+
 # Ensure required directories exist before app initialization
 required_directories = [
     settings.ICON_CACHE_DIR,
@@ -323,12 +337,18 @@ async def startup_event():
     logger.debug(f"CORS_ORIGINS = {settings.get_cors_origins()}")
     logger.debug(f"REDIS_URL = {settings.REDIS_URL}")
 
-    # Redis 캐시 초기화 테스트
+    # Redis 캐시 연결 확인 (연결되지 않아도 백그라운드 확인이 성공하면 캐시 사용 시작)
     from app.core.redis_cache import redis_cache
+    await redis_cache.start()
     if redis_cache.enabled:
         logger.info("✓ Redis cache connected successfully")
     else:
-        logger.warning("Redis cache disabled (will run without caching)")
+        logger.warning("Redis cache unavailable (will run without caching until it recovers)")
+
+    # AI 제공자 HTTP 연결 풀 (요청마다 새 연결을 만들지 않도록 앱 수명 동안 유지)
+    from app.core.ai_transport import ai_transport, log_slow_request
+    await ai_transport.start()
+    ai_transport.add_latency_hook(log_slow_request)
 
     # 데이터베이스에서 스케줄러 설정 로드
     try:
@@ -344,6 +364,16 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Failed to initialize scheduler: {e}", exc_info=True)
 
+    # 실시간 파일 감시 (선택) - 이벤트를 놓치면 스케줄러가 증분 스캔으로 보완
+    if settings.SCAN_WATCH_ENABLED and scan_scheduler.scan_paths:
+        try:
+            file_watcher.debounce_seconds = settings.SCAN_WATCH_DEBOUNCE_SECONDS
+            file_watcher.on_overflow = scan_scheduler.schedule_resync_scan
+            # 라이브러리 전체 디렉터리를 훑으며 감시를 등록하므로 이벤트 루프 밖에서 실행
+            await asyncio.to_thread(file_watcher.start, scan_scheduler.scan_paths)
+        except Exception as e:
+            logger.error(f"Failed to start file watcher: {e}", exc_info=True)
+
     logger.info("=" * 50)
 
 
@@ -353,9 +383,17 @@ async def shutdown_event():
     애플리케이션 종료 시 실행
     """
     logger.info("Shutting down MyApp Store API...")
+    file_watcher.stop()
     scan_scheduler.stop()
     logger.info("✓ Scheduler stopped")
 
+    from app.core.ai_transport import ai_transport, log_slow_request
+    ai_transport.remove_latency_hook(log_slow_request)
+    await ai_transport.aclose()
+
+    from app.core.redis_cache import redis_cache
+    await redis_cache.aclose()
+
 
 @app.get("/")
 async def root():
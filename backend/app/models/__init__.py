@@ -13,6 +13,8 @@ from app.models.invitation import Invitation
 from app.models.metadata_cache import MetadataCache
 from app.models.share_link import ShareLink
 from app.models.product_video import ProductVideo
+from app.models.scan_directory_state import ScanDirectoryState
+from app.models.scan_checkpoint import ScanCheckpoint, ScanCheckpointDir
 
 __all__ = [
     "User",
@@ -31,4 +33,7 @@ __all__ = [
     "MetadataCache",
     "ShareLink",
     "ProductVideo",
+    "ScanDirectoryState",
+    "ScanCheckpoint",
+    "ScanCheckpointDir",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -15,6 +15,10 @@ class FilenameViolation(Base):
       - update        : 업데이트, 서비스팩
     """
     __tablename__ = "filename_violations"
+    __table_args__ = (
+        # 스캐너의 일괄 INSERT ... ON CONFLICT DO NOTHING 대상
+        Index("uq_filename_violations_folder_file", "folder_path", "file_name", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     folder_path = Column(String(500), nullable=False, index=True)
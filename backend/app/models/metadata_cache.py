@@ -2,6 +2,7 @@
 메타데이터 캐시 모델
 
 동일한 소프트웨어에 대한 메타데이터를 캐시하여 중복 AI API 호출 방지
+(조회/저장은 app.core.ai_metadata_cache)
 """
 from sqlalchemy import Column, Integer, String, Float, DateTime, JSON
 from datetime import datetime
@@ -14,8 +15,19 @@ class MetadataCache(Base):
 
     id = Column(Integer, primary_key=True, index=True)
 
-    # 정규화된 소프트웨어 이름 (검색 키)
-    software_name = Column(String, unique=True, index=True, nullable=False)
+    # 캐시 키: 정규화 이름 + 버전 + 제공자/모델 + 프롬프트 해시의 SHA-256
+    cache_key = Column(String(64), unique=True, index=True, nullable=True)
+
+    # 정규화된 소프트웨어 이름 (같은 이름이 제공자/모델/프롬프트별로 여러 행일 수 있음)
+    software_name = Column(String, index=True, nullable=False)
+
+    # 파일명에서 파싱한 버전/연도 ("버전|연도")
+    version = Column(String, nullable=True)
+
+    # 생성에 사용한 AI 제공자/모델과 프롬프트 해시
+    provider = Column(String(50), nullable=True)
+    model = Column(String(100), nullable=True)
+    prompt_hash = Column(String(64), nullable=True)
 
     # 캐시된 메타데이터 (JSON)
     metadata_json = Column(JSON, nullable=False)
@@ -23,7 +35,7 @@ class MetadataCache(Base):
     # 정확도 점수 (0.0 ~ 1.0)
     confidence_score = Column(Float, nullable=False, default=0.0)
 
-    # 메타데이터 출처 ("ai", "manual", "web")
+    # 메타데이터 출처 ("ai", "manual", "web", "source": 사용자 제공 원문 기반 AI 생성)
     source = Column(String, nullable=False, default="ai")
 
     # 타임스탬프
@@ -32,6 +44,7 @@ class MetadataCache(Base):
 
     # 재사용 횟수 (캐시 히트 카운트)
     hit_count = Column(Integer, default=0, nullable=False)
+    last_hit_at = Column(DateTime, nullable=True)
 
     def __repr__(self):
         return f"<MetadataCache(name='{self.software_name}', score={self.confidence_score}, hits={self.hit_count})>"
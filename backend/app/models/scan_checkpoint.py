@@ -0,0 +1,51 @@
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON, ForeignKey
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ScanCheckpoint(Base):
+    """
+    진행 중인 스캔의 재개 지점 (스캔 경로당 한 행)
+
+    스캔은 주기적으로 그때까지 처리한 스캔 항목을 커밋하면서 완료한 폴더
+    (ScanCheckpointDir)와 아직 내려가지 않은 폴더 목록(pending_dirs)을
+    함께 기록한다. 프로세스가 재시작되거나 스캔이 중간에 실패/취소되면 같은
+    경로의 다음 스캔이 pending_dirs부터 이어서 순회한다. 트리 전체를 다
+    본 스캔이 정리 단계를 마치면 행이 삭제된다.
+    """
+    __tablename__ = "scan_checkpoints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    root_path = Column(String, unique=True, nullable=False, index=True)
+
+    # 전체 재스캔으로 시작된 스캔인지 (증분 스캔 체크포인트로 전체 재스캔을 이어가지 않음)
+    full_rescan = Column(Boolean, nullable=False, default=False)
+    # 스캔 예외 규칙 해시 (규칙이 바뀌면 체크포인트를 버리고 처음부터)
+    rules_hash = Column(String(64), nullable=True)
+    # 부모 폴더는 처리했지만 아직 처리하지 않은 폴더 경로 목록
+    pending_dirs = Column(JSON, nullable=False, default=list)
+    # 지금까지의 결과 카운터 (재개한 스캔의 최종 결과에 합산)
+    results = Column(JSON, nullable=False, default=dict)
+
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    dirs = relationship("ScanCheckpointDir", cascade="all, delete-orphan", passive_deletes=True)
+
+
+class ScanCheckpointDir(Base):
+    """
+    체크포인트 시점까지 처리를 마친 폴더
+
+    state는 스캔이 끝났을 때 ScanDirectoryState로 저장할 폴더 상태이며,
+    파일 처리에 실패한 폴더는 NULL이다 (다음 증분 스캔에서 다시 처리).
+    """
+    __tablename__ = "scan_checkpoint_dirs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    checkpoint_id = Column(Integer, ForeignKey("scan_checkpoints.id", ondelete="CASCADE"), nullable=False, index=True)
+    dir_path = Column(String, nullable=False)
+    # 증분 스캔에서 변경 없음으로 건너뛴 폴더 (rename/삭제 정리 대상에서 제외)
+    skipped = Column(Boolean, nullable=False, default=False)
+    state = Column(JSON, nullable=True)
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, Float, DateTime, JSON
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ScanDirectoryState(Base):
+    """
+    증분 스캔용 디렉토리 상태 인덱스
+
+    스캔이 성공적으로 처리한 폴더마다 한 행씩 저장한다. 다음 스캔에서
+    폴더의 mtime/항목 수/하위 항목 해시가 그대로면 해당 폴더는 파일 목록
+    조회와 DB 조회 없이 건너뛰고, 저장된 하위 폴더 목록(subdirs)으로만
+    계속 내려간다.
+    """
+    __tablename__ = "scan_directory_states"
+
+    id = Column(Integer, primary_key=True, index=True)
+    dir_path = Column(String, unique=True, nullable=False, index=True)
+
+    # 디렉토리 자체의 stat 정보 (항목 추가/삭제/이름 변경 시 mtime이 바뀜)
+    mtime = Column(Float, nullable=False)
+    entry_count = Column(Integer, nullable=False, default=0)
+    # 직계 항목(파일/폴더 이름과 종류)을 정렬해 만든 해시
+    child_hash = Column(String(64), nullable=False)
+    # 하위 폴더 이름 목록 (건너뛴 폴더에서 listdir 없이 내려가기 위함)
+    subdirs = Column(JSON, nullable=False, default=list)
+    # 스캔 예외 규칙 해시 (규칙이 바뀌면 전체 폴더를 다시 처리)
+    rules_hash = Column(String(64), nullable=True)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
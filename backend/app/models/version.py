@@ -13,6 +13,8 @@ class Version(Base):
     file_name = Column(String, nullable=False)
     file_path = Column(String, unique=True, nullable=False)
     file_size = Column(BigInteger)
+    # 파일 크기 + 앞/뒤 8KB의 SHA-1 (스캔 시 파일명 변경 감지용)
+    content_fingerprint = Column(String(40), nullable=True)
     release_date = Column(DateTime(timezone=True), server_default=func.now())
     is_portable = Column(Boolean, default=False)  # 포터블 여부
 
@@ -0,0 +1,188 @@
+"""
+FilenameParser 처리량 벤치마크 (DB 불필요)
+- synthetic_library.release_name()으로 같은 seed의 파일명 코퍼스를 만들고
+  (실제 라이브러리처럼 같은 이름이 반복되도록 unique 이름에서 복원 추출) 아래를 측정한다.
+    uncached     캐시 없이 한 건씩 파싱 (_parse_uncached, 정규식 사전 컴파일 효과만)
+    parse_cold   빈 LRU 캐시에서 parse() 한 건씩
+    parse_warm   같은 코퍼스를 parse()로 다시 (캐시 적중)
+    parse_many   빈 캐시에서 parse_many()로 한 번에
+    baseline     --baseline 지정 시 이전 커밋의 parser.py (비교 기준)
+- --baseline을 지정하면 이전 구현과 결과가 완전히 같은지(JSON 직렬화 기준)도 확인한다.
+  test_office_parsing.py의 케이스는 항상 코퍼스에 포함된다.
+- 결과는 JSON으로 출력한다 (--output으로 파일 저장, 실행 간 비교용).
+
+실행: python3 scripts/benchmark_parser.py --names 50000 --unique 5000 --baseline HEAD~1 --output parser_bench.json
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import importlib.util
+import json
+import platform
+import random
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+
+from app.core.parser import FilenameParser
+from synthetic_library import VENDORS, release_name
+
+# test_office_parsing.py와 동일한 케이스
+OFFICE_CASES = [
+    ("MS Office 2021 LTSC", ""),
+    ("MS Office 365", ""),
+    ("Microsoft Office 2021 Professional Plus", ""),
+    ("Microsoft Office LTSC Professional Plus 2021", ""),
+    ("Office 365 ProPlus", ""),
+    ("setup.exe", "MS Office 2021 LTSC"),
+    ("setup.exe", "MS Office 365"),
+    ("Microsoft.Office.2021.LTSC.Professional.Plus.v2108.16.0.14332.20447.x64.iso", ""),
+    ("Microsoft.Office.365.ProPlus.v2312.Build.17126.20132.x64.iso", ""),
+]
+
+# 모호한 파일명 (부모 폴더명으로 대체되는 경로)
+GENERIC_FILES = ["setup.exe", "install.msi", "installer.exe", "crack.zip", "keygen.exe", "patch.rar"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="FilenameParser throughput benchmark")
+    parser.add_argument("--names", type=int, default=50000, help="파싱할 전체 이름 수")
+    parser.add_argument("--unique", type=int, default=5000, help="서로 다른 이름 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", help="비교할 이전 구현의 git revision (예: HEAD~1) 또는 parser.py 경로")
+    parser.add_argument("--output", help="결과 JSON을 저장할 파일")
+    return parser.parse_args()
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL,
+        ).decode().strip()
+    except Exception:
+        return None
+
+
+def build_corpus(total: int, unique: int, seed: int) -> list:
+    """(파일명, 부모 폴더명) 목록: unique개의 이름에서 total개를 복원 추출"""
+    rng = random.Random(seed)
+    pool = list(OFFICE_CASES)
+    while len(pool) < unique:
+        vendor, products = VENDORS[rng.randrange(len(VENDORS))]
+        product = rng.choice(products)
+        folder = f"{vendor} {product} {rng.randint(2015, 2025)}"
+        if rng.random() < 0.15:
+            pool.append((rng.choice(GENERIC_FILES), folder))
+        else:
+            name, ext = release_name(rng, vendor, product)
+            pool.append((f"{name}{ext}", folder if rng.random() < 0.5 else ""))
+
+    corpus = list(OFFICE_CASES)
+    corpus.extend(rng.choice(pool) for _ in range(max(0, total - len(corpus))))
+    return corpus
+
+
+def load_baseline(spec: str):
+    """이전 구현의 FilenameParser 클래스를 별도 모듈로 로드"""
+    temporary = not os.path.isfile(spec)
+    if not temporary:
+        path = spec
+    else:
+        source = subprocess.check_output(
+            ["git", "show", f"{spec}:backend/app/core/parser.py"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        handle, path = tempfile.mkstemp(prefix="parser_baseline_", suffix=".py")
+        with os.fdopen(handle, "wb") as f:
+            f.write(source)
+
+    module_spec = importlib.util.spec_from_file_location("parser_baseline", path)
+    module = importlib.util.module_from_spec(module_spec)
+    try:
+        module_spec.loader.exec_module(module)
+    finally:
+        if temporary:
+            os.remove(path)
+    return module.FilenameParser
+
+
+def measure(name: str, corpus: list, func) -> dict:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    return {
+        "phase": name,
+        "seconds": round(elapsed, 4),
+        "names_per_sec": round(len(corpus) / elapsed) if elapsed > 0 else None,
+    }
+
+
+def main():
+    args = parse_args()
+    corpus = build_corpus(args.names, args.unique, args.seed)
+
+    report = {
+        "benchmark": "filename_parser",
+        "timestamp": datetime.now().isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "params": {
+            "names": len(corpus),
+            "unique": len(set(corpus)),
+            "seed": args.seed,
+            "baseline": args.baseline,
+        },
+        "phases": [],
+        "checks": {},
+    }
+
+    phases = report["phases"]
+    phases.append(measure("uncached", corpus, lambda: [FilenameParser._parse_uncached(f, p) for f, p in corpus]))
+
+    FilenameParser.cache_clear()
+    phases.append(measure("parse_cold", corpus, lambda: [FilenameParser.parse(f, p) for f, p in corpus]))
+    phases.append(measure("parse_warm", corpus, lambda: [FilenameParser.parse(f, p) for f, p in corpus]))
+    report["checks"]["cache"] = FilenameParser.cache_info()._asdict()
+
+    FilenameParser.cache_clear()
+    results = []
+    phases.append(measure("parse_many", corpus, lambda: results.extend(FilenameParser.parse_many(corpus))))
+
+    if args.baseline:
+        baseline_parser = load_baseline(args.baseline)
+        expected = []
+        phases.append(measure("baseline", corpus, lambda: expected.extend(
+            baseline_parser.parse(f, p) for f, p in corpus)))
+
+        mismatches = [
+            {"filename": f, "parent_folder": p, "baseline": e, "current": r}
+            for (f, p), e, r in zip(corpus, expected, results)
+            if json.dumps(e, ensure_ascii=False) != json.dumps(r, ensure_ascii=False)
+        ]
+        report["checks"]["identical_to_baseline"] = not mismatches
+        report["checks"]["mismatches"] = mismatches[:20]
+
+        base_seconds = phases[-1]["seconds"]
+        report["speedup_vs_baseline"] = {
+            phase["phase"]: round(base_seconds / phase["seconds"], 2)
+            for phase in phases[:-1] if phase["seconds"] > 0
+        }
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+
+    if args.baseline and not report["checks"]["identical_to_baseline"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
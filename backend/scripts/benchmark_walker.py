@@ -0,0 +1,123 @@
+"""
+디렉토리 워커 벤치마크
+- 합성 라이브러리 트리를 만들고, 기존 방식(Path.iterdir + is_dir/is_file 직렬 재귀)과
+  ParallelDirectoryWalker(os.scandir + 스레드 풀)의 순회 시간을 비교한다.
+- DB는 사용하지 않는다 (순수 파일시스템 순회 비용만 측정).
+- 로컬 디스크는 페이지 캐시 때문에 차이가 작으므로, --latency-ms로 폴더당
+  네트워크 왕복 지연(SMB/NFS)을 흉내낼 수 있다.
+
+실행: python3 scripts/benchmark_walker.py --depth 3 --fanout 8 --files 10 --latency-ms 5 --workers 1,4,8,16
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from app.core import dir_walker
+from app.core.dir_walker import ParallelDirectoryWalker
+
+
+def build_tree(root: Path, depth: int, fanout: int, files_per_dir: int) -> int:
+    """depth 단계, 단계마다 fanout개의 하위 폴더와 files_per_dir개의 빈 파일 생성"""
+    folder_count = 0
+    level = [root]
+    root.mkdir(parents=True, exist_ok=True)
+    for d in range(depth + 1):
+        next_level = []
+        for folder in level:
+            folder_count += 1
+            for i in range(files_per_dir):
+                (folder / f"Software_{d}_{i}_v1.{i}.0_x64.exe").touch()
+            if d < depth:
+                for i in range(fanout):
+                    child = folder / f"Folder {d}-{i}"
+                    child.mkdir(exist_ok=True)
+                    next_level.append(child)
+        level = next_level
+    return folder_count
+
+
+def serial_walk(folder: Path, latency: float, counts: dict):
+    """기존 FileScanner._scan_folder_recursive와 같은 순회 방식"""
+    if latency:
+        time.sleep(latency)
+    counts["folders"] += 1
+    for item in folder.iterdir():
+        if item.is_file():
+            counts["files"] += 1
+    for item in folder.iterdir():
+        if item.is_dir():
+            serial_walk(item, latency, counts)
+
+
+def parallel_walk(root: Path, workers: int, counts: dict):
+    walker = ParallelDirectoryWalker(max_workers=workers)
+    for listing in walker.walk(str(root)):
+        counts["folders"] += 1
+        counts["files"] += len(listing["files"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Directory walker benchmark")
+    parser.add_argument("--path", help="기존 폴더를 사용 (지정하지 않으면 임시 합성 트리 생성)")
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--fanout", type=int, default=6)
+    parser.add_argument("--files", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="폴더 목록 조회당 인위적 지연 (ms)")
+    parser.add_argument("--workers", default="1,4,8,16", help="쉼표로 구분한 워커 수 목록")
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000.0
+    temp_dir = None
+    if args.path:
+        root = Path(args.path).absolute()
+    else:
+        temp_dir = tempfile.mkdtemp(prefix="walker_bench_")
+        root = Path(temp_dir) / "library"
+        build_tree(root, args.depth, args.fanout, args.files)
+
+    if latency:
+        original = dir_walker.list_directory
+
+        def delayed_list_directory(dir_path, skip_check=None):
+            time.sleep(latency)
+            return original(dir_path, skip_check)
+
+        dir_walker.list_directory = delayed_list_directory
+
+    report = {"root": str(root), "latency_ms": args.latency_ms, "runs": []}
+    try:
+        counts = {"folders": 0, "files": 0}
+        started = time.perf_counter()
+        serial_walk(root, latency, counts)
+        baseline = time.perf_counter() - started
+        report["runs"].append({"walker": "serial_iterdir", "workers": 1, "seconds": round(baseline, 4), **counts})
+
+        for workers in [int(w) for w in args.workers.split(",") if w.strip()]:
+            counts = {"folders": 0, "files": 0}
+            started = time.perf_counter()
+            parallel_walk(root, workers, counts)
+            elapsed = time.perf_counter() - started
+            report["runs"].append({
+                "walker": "parallel_scandir",
+                "workers": workers,
+                "seconds": round(elapsed, 4),
+                "speedup": round(baseline / elapsed, 2) if elapsed else None,
+                **counts,
+            })
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
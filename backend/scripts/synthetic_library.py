@@ -0,0 +1,249 @@
+"""
+합성 소프트웨어 라이브러리 생성기 (벤치마크/테스트용)
+- 같은 seed로 실행하면 항상 같은 트리를 만든다 (실행 간 결과 비교 가능).
+- 실제 라이브러리와 비슷하게 분류/제작사/제품 폴더, 릴리스 형식 파일명
+  (Vendor.Product.2024.v1.2.0.x64.zip, Product_1.2_Win64.exe ...), 분할 압축
+  (.part1.rar, .7z.001), 스캔 예외 대상(readme.txt, *.nfo, 이미지, @eaDir 등)을 섞는다.
+- 파일은 앞부분 16바이트만 쓰고 나머지는 sparse로 늘리므로 디스크를 거의 쓰지 않는다.
+
+단독 실행: python3 scripts/synthetic_library.py /tmp/library --depth 3 --fanout 6 --files 8 --seed 42
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+CATEGORIES = [
+    "Graphics", "Development", "Office", "Utilities", "Multimedia",
+    "Security", "Network", "CAD", "Education", "System",
+]
+
+# (제작사, [제품])
+VENDORS = [
+    ("Adobe", ["Photoshop", "Illustrator", "Premiere Pro", "Acrobat Pro"]),
+    ("Autodesk", ["AutoCAD", "3ds Max", "Revit", "Maya"]),
+    ("Microsoft", ["Office Professional Plus", "Visual Studio", "SQL Server"]),
+    ("JetBrains", ["IntelliJ IDEA", "PyCharm", "WebStorm"]),
+    ("VMware", ["Workstation Pro", "vSphere Client"]),
+    ("Corel", ["CorelDRAW Graphics Suite", "VideoStudio"]),
+    ("Hancom", ["Hancom Office", "HWP Viewer"]),
+    ("Bandisoft", ["Bandizip", "Bandicam"]),
+    ("Piriform", ["CCleaner", "Recuva"]),
+    ("Parallels", ["Desktop"]),
+]
+
+EXTENSIONS = [".exe", ".msi", ".zip", ".iso", ".7z", ".dmg", ".pkg", ".rar"]
+ARCHES = ["x64", "x86", "Win64", "ARM64", "macOS"]
+EDITIONS = ["", "Multilingual", "Portable", "Pro", "Enterprise", "Retail"]
+
+# 스캔 예외 규칙(기본값)에 걸리는 항목
+NOISE_FILES = ["readme.txt", "install.log", "release.nfo", "checksums.sfv", "Thumbs.db", "cover.jpg", "screenshot.png"]
+EXCLUDED_FOLDERS = ["@eaDir", "#recycle", ".git", "_MACOSX"]
+
+
+def release_name(rng: random.Random, vendor: str, product: str) -> Tuple[str, str]:
+    """릴리스 형식 파일 이름 (확장자 제외)과 확장자"""
+    year = rng.randint(2015, 2025)
+    version = f"{rng.randint(1, 30)}.{rng.randint(0, 9)}.{rng.randint(0, 99)}"
+    arch = rng.choice(ARCHES)
+    edition = rng.choice(EDITIONS)
+    ext = rng.choice(EXTENSIONS)
+
+    style = rng.randrange(4)
+    if style == 0:
+        parts = [vendor, product, str(year), f"v{version}", arch, edition]
+        name = ".".join(p.replace(" ", ".") for p in parts if p)
+    elif style == 1:
+        name = "_".join(p.replace(" ", "_") for p in [product, version, arch] if p)
+    elif style == 2:
+        name = f"{vendor} {product} {year} ({arch})" + (f" {edition}" if edition else "")
+    else:
+        name = f"{product.replace(' ', '')}-{version}-{arch.lower()}"
+    return name, ext
+
+
+def _write_file(path: Path, rng: random.Random, size: int):
+    """앞 16바이트만 임의 값으로 쓰고 size까지 sparse로 확장 (지문이 파일마다 다르도록)"""
+    with open(path, "wb") as f:
+        f.write(rng.getrandbits(128).to_bytes(16, "little"))
+        f.truncate(max(size, 16))
+
+
+def _folder_name(rng: random.Random, depth: int, index: int) -> str:
+    if depth == 0:
+        return f"{CATEGORIES[index % len(CATEGORIES)]}" + (f" {index // len(CATEGORIES) + 1}" if index >= len(CATEGORIES) else "")
+    vendor, products = VENDORS[rng.randrange(len(VENDORS))]
+    if depth == 1:
+        return f"{vendor} {rng.choice(products)} {rng.randint(2015, 2025)} #{index}"
+    return f"v{rng.randint(1, 30)}.{rng.randint(0, 9)} build {index}"
+
+
+def generate_library(
+    root: str,
+    depth: int = 3,
+    fanout: int = 6,
+    files_per_folder: int = 8,
+    seed: int = 42,
+    split_ratio: float = 0.1,
+    noise_ratio: float = 0.3,
+    excluded_ratio: float = 0.05,
+    min_size: int = 64 * 1024,
+    max_size: int = 64 * 1024 * 1024,
+) -> Dict:
+    """
+    합성 라이브러리 트리 생성
+
+    Args:
+        root: 생성할 루트 폴더 (없으면 생성)
+        depth: 루트 아래 폴더 단계 수
+        fanout: 폴더마다 하위 폴더 수
+        files_per_folder: 폴더마다 릴리스 파일 수 (분할 압축은 한 세트를 1개로 셈)
+        seed: 난수 seed (같으면 같은 트리)
+        split_ratio: 릴리스 파일이 분할 압축 세트일 확률
+        noise_ratio: 폴더에 스캔 예외 파일(readme.txt 등)이 섞일 확률
+        excluded_ratio: 폴더에 예외 폴더(@eaDir 등)가 생길 확률
+        min_size, max_size: 파일 크기 범위 (sparse 파일이므로 실제 디스크 사용량은 작음)
+
+    Returns:
+        생성 통계와 스캔 대상 파일 경로 목록 ("release_files")
+    """
+    rng = random.Random(seed)
+    root_path = Path(root).absolute()
+    root_path.mkdir(parents=True, exist_ok=True)
+
+    manifest = {
+        "root": str(root_path),
+        "seed": seed,
+        "depth": depth,
+        "fanout": fanout,
+        "files_per_folder": files_per_folder,
+        "folders": 0,
+        "files": 0,
+        "split_archive_sets": 0,
+        "split_archive_parts": 0,
+        "noise_files": 0,
+        "excluded_folders": 0,
+        "excluded_files": 0,
+        "apparent_bytes": 0,
+        "release_files": [],
+    }
+
+    level = [root_path]
+    for d in range(depth + 1):
+        next_level = []
+        for folder in level:
+            manifest["folders"] += 1
+            vendor, products = VENDORS[rng.randrange(len(VENDORS))]
+            product = rng.choice(products)
+            used = set()
+
+            for _ in range(files_per_folder):
+                name, ext = release_name(rng, vendor, product)
+                if name in used:
+                    continue
+                used.add(name)
+                size = rng.randint(min_size, max_size)
+
+                if rng.random() < split_ratio:
+                    parts = rng.randint(2, 6)
+                    manifest["split_archive_sets"] += 1
+                    rar_style = rng.random() < 0.5
+                    for part in range(1, parts + 1):
+                        part_name = f"{name}.part{part}.rar" if rar_style else f"{name}.7z.{part:03d}"
+                        path = folder / part_name
+                        _write_file(path, rng, size)
+                        manifest["split_archive_parts"] += 1
+                        manifest["files"] += 1
+                        manifest["apparent_bytes"] += size
+                        manifest["release_files"].append(str(path))
+                else:
+                    path = folder / f"{name}{ext}"
+                    _write_file(path, rng, size)
+                    manifest["files"] += 1
+                    manifest["apparent_bytes"] += size
+                    manifest["release_files"].append(str(path))
+
+            if rng.random() < noise_ratio:
+                for noise in rng.sample(NOISE_FILES, rng.randint(1, 3)):
+                    (folder / noise).write_bytes(b"noise")
+                    manifest["noise_files"] += 1
+
+            if rng.random() < excluded_ratio:
+                excluded = folder / rng.choice(EXCLUDED_FOLDERS)
+                excluded.mkdir(exist_ok=True)
+                manifest["excluded_folders"] += 1
+                for i in range(3):
+                    _write_file(excluded / f"cache_{i}.bin", rng, 1024)
+                    manifest["excluded_files"] += 1
+
+            if d < depth:
+                for i in range(fanout):
+                    child = folder / _folder_name(rng, d, i)
+                    child.mkdir(exist_ok=True)
+                    next_level.append(child)
+        level = next_level
+
+    return manifest
+
+
+def rename_files(paths: List[str], count: int, seed: int = 0) -> List[Tuple[str, str]]:
+    """
+    같은 폴더 안에서 파일 이름만 변경 (크기/내용 유지 → rename 감지 대상)
+
+    Returns:
+        [(이전 경로, 새 경로)]
+    """
+    rng = random.Random(seed)
+    renamed = []
+    for old_path in rng.sample(paths, min(count, len(paths))):
+        folder, name = os.path.split(old_path)
+        stem, ext = os.path.splitext(name)
+        new_path = os.path.join(folder, f"{stem}.renamed{rng.randint(0, 9999)}{ext}")
+        os.rename(old_path, new_path)
+        renamed.append((old_path, new_path))
+    return renamed
+
+
+def delete_files(paths: List[str], count: int, seed: int = 0) -> List[str]:
+    """임의의 파일 count개 삭제"""
+    rng = random.Random(seed)
+    deleted = rng.sample(paths, min(count, len(paths)))
+    for path in deleted:
+        os.remove(path)
+    return deleted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic software library generator")
+    parser.add_argument("root", help="생성할 루트 폴더")
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--fanout", type=int, default=6)
+    parser.add_argument("--files", type=int, default=8, help="폴더당 릴리스 파일 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--split-ratio", type=float, default=0.1)
+    parser.add_argument("--noise-ratio", type=float, default=0.3)
+    parser.add_argument("--excluded-ratio", type=float, default=0.05)
+    args = parser.parse_args()
+
+    manifest = generate_library(
+        args.root,
+        depth=args.depth,
+        fanout=args.fanout,
+        files_per_folder=args.files,
+        seed=args.seed,
+        split_ratio=args.split_ratio,
+        noise_ratio=args.noise_ratio,
+        excluded_ratio=args.excluded_ratio,
+    )
+    manifest.pop("release_files")
+    print(json.dumps(manifest, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 import apiClient from './client'
 
 export const scanApi = {
-  async startScan(path, useAI = true) {
-    return apiClient.post('scan/start', { path, use_ai: useAI })
+  async startScan(path, useAI = true, fullRescan = false) {
+    return apiClient.post('scan/start', { path, use_ai: useAI, full_rescan: fullRescan })
   },
 
   async regenerateMetadata(productId) {
@@ -31,5 +31,80 @@ export const scanApi = {
 
   async testAiApi() {
     return apiClient.get('scan/test-api')
+  },
+
+  // 백그라운드 스캔 작업
+  async startScanJob(path, useAI = true, fullRescan = false) {
+    return apiClient.post('scan/jobs', { path, use_ai: useAI, full_rescan: fullRescan })
+  },
+
+  async listScanJobs() {
+    return apiClient.get('scan/jobs')
+  },
+
+  async getScanJob(jobId) {
+    return apiClient.get(`scan/jobs/${jobId}`)
+  },
+
+  async cancelScanJob(jobId) {
+    return apiClient.post(`scan/jobs/${jobId}/cancel`)
+  },
+
+  /**
+   * 스캔 작업 진행 상황 구독 (Server-Sent Events)
+   * EventSource는 Authorization 헤더를 보낼 수 없으므로 fetch 스트림으로 읽는다.
+   * 스트림이 끊기면 작업 상태를 한 번 조회해 마지막 상태를 돌려준다.
+   *
+   * @param {string} jobId
+   * @param {(job: object) => void} onProgress - 상태가 바뀔 때마다 호출
+   * @returns {{ done: Promise<object>, close: () => void }} done은 종료된 작업 상태로 resolve
+   */
+  subscribeScanJob(jobId, onProgress) {
+    const controller = new AbortController()
+    const token = localStorage.getItem('access_token') || sessionStorage.getItem('access_token')
+    const baseUrl = apiClient.defaults.baseURL.replace(/\/$/, '')
+
+    const done = (async () => {
+      let lastJob = null
+      try {
+        const response = await fetch(`${baseUrl}/scan/jobs/${jobId}/events`, {
+          headers: token ? { Authorization: `Bearer ${token}` } : {},
+          signal: controller.signal
+        })
+        if (!response.ok || !response.body) {
+          throw new Error(`Stream failed: ${response.status}`)
+        }
+
+        const reader = response.body.getReader()
+        const decoder = new TextDecoder()
+        let buffer = ''
+        for (;;) {
+          const { value, done: streamDone } = await reader.read()
+          if (streamDone) break
+          buffer += decoder.decode(value, { stream: true })
+
+          let boundary
+          while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const chunk = buffer.slice(0, boundary)
+            buffer = buffer.slice(boundary + 2)
+            const dataLine = chunk.split('\n').find(line => line.startsWith('data: '))
+            if (!dataLine) continue // keep-alive 주석
+            lastJob = JSON.parse(dataLine.slice(6))
+            onProgress?.(lastJob)
+          }
+        }
+      } catch (error) {
+        if (error.name === 'AbortError') return lastJob
+        console.warn('Scan job stream interrupted:', error)
+      }
+
+      if (lastJob && ['completed', 'failed', 'cancelled'].includes(lastJob.status)) {
+        return lastJob
+      }
+      const response = await this.getScanJob(jobId)
+      return response.data
+    })()
+
+    return { done, close: () => controller.abort() }
   }
 }
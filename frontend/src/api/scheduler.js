@@ -13,8 +13,8 @@ export const schedulerApi = {
     return apiClient.post('/scheduler/stop')
   },
 
-  async runNow() {
-    return apiClient.post('/scheduler/run-now')
+  async runNow(fullRescan = false, background = false) {
+    return apiClient.post('/scheduler/run-now', null, { params: { full_rescan: fullRescan, background } })
   },
 
   async getConfig() {
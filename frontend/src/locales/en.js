@@ -495,6 +495,14 @@ export default {
       runNow: 'Run Scan Now',
       scanComplete: 'Scan Complete!',
       scanFailed: 'Scan Failed',
+      scanCancelled: 'Scan cancelled. Results up to the cancellation point were saved.',
+      progressTitle: 'Scan in progress',
+      cancelScan: 'Cancel',
+      cancelling: 'Cancelling...',
+      foldersDone: 'Folders',
+      filesDone: 'Files',
+      filesPerSec: 'Files/sec',
+      eta: 'ETA',
       // Config modal
       configTitle: 'Scheduler Configuration',
       scheduleType: 'Schedule Type',
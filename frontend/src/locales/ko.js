@@ -497,6 +497,14 @@ export default {
       runNow: '지금 즉시 스캔 실행',
       scanComplete: '스캔 완료!',
       scanFailed: '스캔 실행 실패',
+      scanCancelled: '스캔이 취소되었습니다. 취소 시점까지의 결과는 저장되었습니다.',
+      progressTitle: '스캔 진행 중',
+      cancelScan: '취소',
+      cancelling: '취소 중...',
+      foldersDone: '폴더',
+      filesDone: '파일',
+      filesPerSec: '초당 파일',
+      eta: '남은 시간',
       // Config modal
       configTitle: '스케줄러 설정',
       scheduleType: '스케줄 유형',